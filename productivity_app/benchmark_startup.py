@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - time to first paint and the imports that pay for it
+
+Runs the application startup sequence (QApplication, config, theme,
+AppContext, MainWindow.show()) in a fresh interpreter under
+`python -X importtime`, stops at the main window's first paint, and reports:
+- time to first paint (in-process) and process wall time
+- the slowest imports by cumulative time
+- heavy libraries (pandas, numpy, openpyxl, ...) imported before first paint
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--top 15]
+
+Uses a separate config directory (productivity_app_benchmark) so runs do not
+touch the user's settings.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Libraries that should only load when a tab needs them, not before first paint
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'xlrd', 'docx', 'PyPDF2', 'fitz')
+
+# Startup sequence of main.main(), ending at the first paint of the window
+STARTUP_SCRIPT = r'''
+import time
+started = time.perf_counter()
+import sys
+from PySide6.QtCore import QObject, QEvent, QTimer
+from PySide6.QtWidgets import QApplication
+from productivity_app.productivity_core.core.config import APP_SETTINGS, set_app_name
+set_app_name('productivity_app_benchmark')
+from productivity_app.productivity_core.core.config_manager import ConfigManager
+from productivity_app.productivity_core.core.theme_manager import ThemeManager
+from productivity_app.productivity_core.core.app_context import AppContext
+from productivity_app.productivity_core.tabs.main_window import MainWindow
+imported = time.perf_counter()
+
+qt_app = QApplication(sys.argv)
+ConfigManager.initialize()
+ThemeManager.initialize_theme(qt_app, theme_mode=APP_SETTINGS.get('theme_mode', 'dark'))
+app = AppContext()
+window = MainWindow(app)
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            painted = time.perf_counter()
+            print(f"IMPORT_MS={(imported - started) * 1000:.1f}", flush=True)
+            print(f"FIRST_PAINT_MS={(painted - started) * 1000:.1f}", flush=True)
+            print(f"LOADED={','.join(sys.modules)}", flush=True)
+            obj.removeEventFilter(self)
+            QTimer.singleShot(0, qt_app.quit)
+        return False
+
+
+first_paint = FirstPaint()
+window.installEventFilter(first_paint)
+window.show()
+qt_app.exec()
+app.task_scheduler.shutdown()
+app.async_bridge.shutdown()
+'''
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def run_once():
+    """Run the startup script once
+
+    Returns:
+        (metrics dict, list of (self_us, cumulative_us, depth, module)) -
+        imports cover the whole run, metrics['loaded'] the modules loaded
+        at first paint
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        filter(None, [str(Path(__file__).parent), env.get('PYTHONPATH')]))
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    wall_start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT],
+        capture_output=True, text=True, env=env, timeout=120)
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+
+    metrics = {'wall_ms': wall_ms, 'loaded': set()}
+    for line in proc.stdout.splitlines():
+        if line.startswith('LOADED='):
+            metrics['loaded'] = set(line.split('=', 1)[1].split(','))
+        for key in ('IMPORT_MS', 'FIRST_PAINT_MS'):
+            if line.startswith(key + '='):
+                metrics[key.lower()] = float(line.split('=', 1)[1])
+    if 'first_paint_ms' not in metrics:
+        tail = '\n'.join(proc.stderr.splitlines()[-20:])
+        raise RuntimeError(f"Startup did not reach first paint:\n{tail}")
+
+    imports = []
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((int(self_us), int(cumulative_us),
+                            len(indent) // 2, module))
+    return metrics, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Number of startups to time (default 5)')
+    parser.add_argument('--top', type=int, default=15,
+                        help='Number of slowest imports to list (default 15)')
+    args = parser.parse_args()
+
+    runs = []
+    imports = []
+    for i in range(args.runs):
+        metrics, imports = run_once()
+        runs.append(metrics)
+        print(f"[Benchmark] Run {i + 1}/{args.runs}: first paint "
+              f"{metrics['first_paint_ms']:.0f} ms (wall {metrics['wall_ms']:.0f} ms)")
+
+    print()
+    print("[Benchmark] Median over", args.runs, "runs:")
+    for key, label in (('import_ms', 'Startup imports'),
+                       ('first_paint_ms', 'Time to first paint'),
+                       ('wall_ms', 'Process wall time (to exit)')):
+        print(f"  {label:<28} {statistics.median(r[key] for r in runs):8.1f} ms")
+
+    # Import breakdown from the last run
+    print()
+    print("[Benchmark] Slowest imports (cumulative, whole of last run):")
+    top_level = [entry for entry in imports if entry[2] <= 1]
+    for self_us, cumulative_us, _, module in sorted(
+            top_level, key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f})  {module}")
+
+    heavy = [name for name in HEAVY_MODULES if name in runs[-1]['loaded']]
+    print()
+    if heavy:
+        print(f"[Benchmark] ⚠️ Imported before first paint: {', '.join(heavy)}")
+    else:
+        print("[Benchmark] ✓ No heavy libraries imported before first paint")
+
+
+if __name__ == '__main__':
+    main()
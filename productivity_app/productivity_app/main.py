@@ -8,6 +8,7 @@ from .productivity_core.core.config import APP_SETTINGS, set_app_name
 from .productivity_core.core.theme_manager import ThemeManager
 from .productivity_core.core.config_manager import ConfigManager
 from .productivity_core.core.app_context import AppContext
+from .productivity_core.core.app_logging import configure_logging
 from PySide6.QtWidgets import QApplication
 import sys
 import os
@@ -125,8 +126,14 @@ def main(*args, app_name=None, **kwargs):
     # Initialize configuration manager (creates .tool_config directory)
     ConfigManager.initialize()
 
-    # Clear start page closed flag on app startup (so it shows again)
+    # Leveled logging (PRODUCTIVITY_APP_LOG / 'log_levels' setting), with a
+    # JSON-lines copy in the config directory when 'log_to_file' is set
     from .productivity_core.core.config_manager import AppSettingsConfig
+    from .productivity_core.core import config
+    configure_logging(json_file=config.CONFIG_DIR / 'logs' / 'app.jsonl'
+                      if AppSettingsConfig.get_setting('log_to_file', False) else None)
+
+    # Clear start page closed flag on app startup (so it shows again)
     AppSettingsConfig.set_setting('start_page_closed', False)
 
     # Initialize consistent theming BEFORE any widgets are created
@@ -136,6 +143,12 @@ def main(*args, app_name=None, **kwargs):
     # Initialize application context
     app = AppContext()
 
+    # Cancel background tasks and coroutines and let them return before exit
+    qt_app.aboutToQuit.connect(app.task_scheduler.shutdown)
+    qt_app.aboutToQuit.connect(app.async_bridge.shutdown)
+    # Write settings still waiting in the write-behind queue
+    qt_app.aboutToQuit.connect(ConfigManager.flush)
+
     # Create and show main window
     window = MainWindow(app)
     window.show()
@@ -6,8 +6,13 @@ from PySide6.QtWidgets import QFileDialog
 from .view import CheckMultipleConnectorView
 from .config import OPERATION_RESULT_COLUMNS
 from ...e3 import E3Model
+from ...core.app_logging import get_logger, fields, sample
+from ...core.excel_reader import read_excel_sheet
 import pandas as pd
 from pathlib import Path
+from typing import Dict, List, Tuple
+
+logger = get_logger(__name__)
 
 
 class CheckMultipleConnectorPresenter(QObject):
@@ -62,7 +67,9 @@ class CheckMultipleConnectorPresenter(QObject):
             if path.suffix.lower() == '.csv':
                 self.imported_df = pd.read_csv(file_path)
             elif path.suffix.lower() == '.xlsx':
-                self.imported_df = pd.read_excel(file_path)
+                # Only the search and context columns are kept
+                self.imported_df = read_excel_sheet(
+                    file_path, usecols=[search_column] + list(context_columns))
             elif path.suffix.lower() == '.txt':
                 self.imported_df = pd.read_csv(
                     file_path, sep=None, engine='python')
@@ -236,50 +243,65 @@ class CheckMultipleConnectorPresenter(QObject):
 
         return df
 
+    def _find_connectors(self, term) -> Tuple[List[Dict], str]:
+        """Connectors for a search term, and the Status to report them with
+
+        Terms are first searched as text. Part numbers written differently
+        (D38999-26WA35PN for D38999/26WA35PN) or with a typo are then
+        matched through the connector model's part number index.
+
+        Returns:
+            (connectors, 'Found' or 'Close Match')
+        """
+        matches = self.model.filter_connectors({'search_text': str(term)})
+        if matches or not hasattr(self.model, 'match_part_number'):
+            return matches, 'Found'
+
+        part_matches = self.model.match_part_number(str(term))
+        status = 'Found' if all(distance == 0 for _, distance in part_matches) else 'Close Match'
+        return [connector for connector, _ in part_matches], status
+
     def _batch_lookup(self, search_terms: list) -> pd.DataFrame:
         """Lookup connectors for all search terms - returns ALL connector details"""
-        print(f"Batch lookup for {len(search_terms)} terms")
+        logger.info("Batch lookup", extra=fields(terms=len(search_terms)))
         results = []
 
         for term in search_terms:
-            print(f"DEBUG: Searching for term: '{term}'")
             # Use the model to search for the connector
-            matches = self.model.filter_connectors({'search_text': str(term)})
-            print(f"DEBUG: Found {len(matches)} matches for '{term}'")
+            matches, status = self._find_connectors(term)
+            logger.debug("Found %d matches for '%s'", len(matches), term,
+                         extra=sample(100))
 
             if matches:
                 # Add all matching connectors with full details
                 for match in matches:
-                    result_record = {'Search Term': term, 'Status': 'Found'}
+                    result_record = {'Search Term': term, 'Status': status}
                     # Add ALL fields from the connector
                     result_record.update(match)
                     results.append(result_record)
-                    print(
-                        f"DEBUG: Added result with keys: {list(result_record.keys())}")
             else:
                 # No matches found - add empty row with just Search Term and Status
                 results.append({'Search Term': term, 'Status': 'Not Found'})
-                print(f"DEBUG: No matches for '{term}'")
 
         df = pd.DataFrame(results) if results else pd.DataFrame()
         if not df.empty:
-            print(f"DEBUG: Result DataFrame columns: {df.columns.tolist()}")
-            print(f"DEBUG: Result DataFrame shape: {df.shape}")
+            logger.debug("Batch lookup result: %d rows, columns %s",
+                         len(df), df.columns.tolist())
         return df
 
     def _batch_get_material(self, search_terms: list) -> pd.DataFrame:
         """Get material information for all search terms - returns ALL connector details"""
-        print(f"Batch get material for {len(search_terms)} terms")
+        logger.info("Batch get material", extra=fields(terms=len(search_terms)))
         results = []
 
         for term in search_terms:
             # Use the model to search for the connector
-            matches = self.model.filter_connectors({'search_text': str(term)})
+            matches, status = self._find_connectors(term)
 
             if matches:
                 # Add all matching connectors with full details
                 for match in matches:
-                    result_record = {'Search Term': term, 'Status': 'Found'}
+                    result_record = {'Search Term': term, 'Status': status}
                     # Add ALL fields from the connector
                     result_record.update(match)
                     results.append(result_record)
@@ -291,17 +313,17 @@ class CheckMultipleConnectorPresenter(QObject):
 
     def _batch_check_status(self, search_terms: list) -> pd.DataFrame:
         """Check database status for all search terms - returns ALL connector details"""
-        print(f"Batch check status for {len(search_terms)} terms")
+        logger.info("Batch check status", extra=fields(terms=len(search_terms)))
         results = []
 
         for term in search_terms:
             # Use the model to search for the connector
-            matches = self.model.filter_connectors({'search_text': str(term)})
+            matches, status = self._find_connectors(term)
 
             if matches:
                 # Add all matching connectors with full details
                 for match in matches:
-                    result_record = {'Search Term': term, 'Status': 'Found'}
+                    result_record = {'Search Term': term, 'Status': status}
                     # Add ALL fields from the connector
                     result_record.update(match)
                     results.append(result_record)
@@ -643,13 +665,11 @@ class CheckMultipleConnectorPresenter(QObject):
 
                 # Strategy 2: If no results, try getting all connectors and filter manually
                 if not results:
-                    all_connectors = self.model.get_connectors()
-                    print(
-                        f"DEBUG PRESENTER: Got {len(all_connectors)} total connectors, filtering manually")
+                    print("DEBUG PRESENTER: Scanning all connectors, filtering manually")
 
                     # Search in Part Number and Part Code fields
                     term_lower = str(term).lower()
-                    for conn in all_connectors:
+                    for conn in self.model.iter_connectors():
                         part_num = str(conn.get('Part Number', '')).lower()
                         part_code = str(conn.get('Part Code', '')).lower()
 
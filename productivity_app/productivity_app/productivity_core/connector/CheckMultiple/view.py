@@ -19,6 +19,7 @@ from ..Lookup.config import (
 )
 import pandas as pd
 from pathlib import Path
+from ...core.excel_reader import read_excel_sheet
 
 
 class ClickableHeaderView(QHeaderView):
@@ -406,7 +407,7 @@ class FileUploadDialog(QDialog):
             if path.suffix.lower() == '.csv':
                 self.df = pd.read_csv(file_path)
             elif path.suffix.lower() == '.xlsx':
-                self.df = pd.read_excel(file_path)
+                self.df = read_excel_sheet(file_path)
             elif path.suffix.lower() == '.txt':
                 # Try to detect delimiter
                 self.df = pd.read_csv(file_path, sep=None, engine='python')
@@ -7,6 +7,8 @@ Qt threading dependencies.
 """
 import pandas as pd
 from typing import Dict, List, Any, Optional
+from ...core.profiler import profiled
+from ...core.search_query import compile_query
 
 
 def apply_text_search(df: pd.DataFrame, search_text: str) -> pd.DataFrame:
@@ -16,6 +18,8 @@ def apply_text_search(df: pd.DataFrame, search_text: str) -> pd.DataFrame:
     Supports:
     - Single term: searches all columns for the term
     - Comma-separated terms: OR logic (matches any term)
+    - Query syntax: AND/OR/NOT, quoted phrases, Column:term and /regex/
+      (see core.search_query)
 
     Args:
         df: Source dataframe to filter
@@ -27,37 +31,7 @@ def apply_text_search(df: pd.DataFrame, search_text: str) -> pd.DataFrame:
     if not search_text or not search_text.strip():
         return df
 
-    search_text = search_text.strip()
-
-    # Check if comma-separated (multiple search terms)
-    if ',' in search_text:
-        # Split by comma and trim each term
-        search_terms = [term.strip().lower()
-                        for term in search_text.split(',') if term.strip()]
-
-        if not search_terms:
-            return df
-
-        # Create OR condition - match any term
-        mask = pd.Series([False] * len(df), index=df.index)
-        for term in search_terms:
-            term_mask = df.apply(
-                lambda row: row.astype(str).str.lower(
-                ).str.contains(term, regex=False).any(),
-                axis=1
-            )
-            mask = mask | term_mask
-
-        return df[mask]
-    else:
-        # Single search term
-        search_text_lower = search_text.lower()
-        mask = df.apply(
-            lambda row: row.astype(str).str.lower().str.contains(
-                search_text_lower, regex=False).any(),
-            axis=1
-        )
-        return df[mask]
+    return compile_query(search_text, comma_or=True).filter(df)
 
 
 def apply_column_filter(df: pd.DataFrame, column_name: str, values: List[str]) -> pd.DataFrame:
@@ -87,6 +61,7 @@ def apply_column_filter(df: pd.DataFrame, column_name: str, values: List[str]) -
     return df[df[column_name].isin(clean_values)]
 
 
+@profiled('connector.filter', 'filter')
 def apply_all_filters(df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
     """
     Apply all connector filters to a dataframe.
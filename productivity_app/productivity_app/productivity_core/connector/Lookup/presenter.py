@@ -1,24 +1,47 @@
 """
 Connector Lookup Presenter - Mediates between model and view
 """
-from PySide6.QtCore import QObject, Signal, QSortFilterProxyModel, Qt, QTimer, QThread
+from PySide6.QtCore import QObject, Signal, QTimer
 from .view import LookupConnectorView
 from .config import DEFAULT_VISIBLE_COLUMNS
 from .filter_redux import ConnectorFilterRedux, FilterCommand, FilterState
 from ...presenters.pandas_table_model import PandasTableModel
+from ...presenters.index_proxy_model import IndexProxyModel
+from ...core.task_scheduler import TaskCancelled, TaskPriority, TaskScheduler
+from ...core.search_query import TextColumns, compile_query
+from ..connector_model import ConnectorModel
 import pandas as pd
 
 
+def connector_text(df: pd.DataFrame) -> TextColumns:
+    """Searchable column text of a connector frame
+
+    Part number columns also match other spellings of a term
+    (D38999-26WA35PN finds D38999/26WA35PN).
+    """
+    return TextColumns(df, key_columns=ConnectorModel.PART_NUMBER_COLUMNS)
+
+
 class SearchWorker(QObject):
-    """Worker class for performing searches in a background thread"""
+    """Worker class for performing searches on a task scheduler thread"""
 
     finished = Signal(object)  # filtered DataFrame
     error = Signal(str)  # error message
 
-    def __init__(self, df, filters):
+    def __init__(self, df, filters, text: TextColumns = None, rows=None):
+        """Initialize the worker
+
+        Args:
+            df: Loaded connector frame
+            filters: Filters from the view
+            text: Column text of df, kept between searches (built if None)
+            rows: Positions of the rows to check (None for every row)
+        """
         super().__init__()
         self.df = df
         self.filters = filters
+        self.text = text
+        self.rows = rows
         self._is_cancelled = False
 
     def cancel(self):
@@ -32,33 +55,21 @@ class SearchWorker(QObject):
                 return
 
             # Apply filters to dataframe
-            filtered_df = self.df.copy()
+            filtered_df = (self.df.copy() if self.rows is None
+                           else self.df.iloc[self.rows])
 
-            # Text search filter - supports comma-separated terms
+            # Text search filter - comma-separated terms and query syntax
+            # (AND/OR/NOT, "phrases", Column:term, /regex/)
             if self.filters.get('search_text'):
-                search_text = self.filters['search_text'].strip()
-
-                # Check if comma-separated (multiple search terms)
-                if ',' in search_text:
-                    # Split by comma and trim each term
-                    search_terms = [term.strip().lower()
-                                    for term in search_text.split(',') if term.strip()]
-
-                    # Create OR condition - match any term
-                    mask = pd.Series([False] * len(filtered_df),
-                                     index=filtered_df.index)
-                    for term in search_terms:
-                        term_mask = filtered_df.apply(lambda row: row.astype(
-                            str).str.lower().str.contains(term, regex=False).any(), axis=1)
-                        mask = mask | term_mask
-
-                    filtered_df = filtered_df[mask]
-                else:
-                    # Single search term
-                    search_text = search_text.lower()
-                    mask = filtered_df.apply(lambda row: row.astype(
-                        str).str.lower().str.contains(search_text, regex=False).any(), axis=1)
-                    filtered_df = filtered_df[mask]
+                query = compile_query(self.filters['search_text'], comma_or=True)
+                text = self.text
+                if text is None:
+                    text = connector_text(self.df)
+                try:
+                    mask = query.mask(text, rows=self.rows, token=self)
+                except TaskCancelled:
+                    return
+                filtered_df = filtered_df[mask]
 
             # Standard (Family) filter - multiple selections
             if self.filters.get('standard'):
@@ -121,9 +132,21 @@ class SearchWorker(QObject):
         except Exception as e:
             self.error.emit(f"Search failed: {str(e)}")
 
+    def raise_if_cancelled(self):
+        """Stop a query between terms once cancelled (CancellationToken API)"""
+        if self._is_cancelled:
+            raise TaskCancelled()
+
 
 class LookupConnectorPresenter(QObject):
-    """Presenter for connector lookup functionality"""
+    """Presenter for connector lookup functionality
+
+    Searches run when requested (Enter / Search button / recent search) and,
+    with the 'search_as_you_type' flag on, while typing (debounced by the
+    view). Each search replaces (cancels) the one in progress; a search whose
+    text extends the previous one with the same filters only re-checks the
+    previous result rows. Typed searches are not added to recent searches.
+    """
 
     # Signals
     loading_started = Signal()
@@ -140,6 +163,7 @@ class LookupConnectorPresenter(QObject):
 
         # Data storage
         self.df = None
+        self._df_text = None  # Column text of df, reused by every search
         self.filtered_df = None
         self.is_loading = False
         self.current_filters = {}  # Track current search filters
@@ -149,7 +173,10 @@ class LookupConnectorPresenter(QObject):
 
         # Search threading
         self._search_worker = None
-        self._search_thread = None
+        # (source frame, filters, result) of the last completed search
+        self._last_search = None
+        self._scheduler = (context.get('task_scheduler') if context is not None
+                           else None) or TaskScheduler.shared()
 
         # UI Components
         self.table_model = None
@@ -160,6 +187,7 @@ class LookupConnectorPresenter(QObject):
 
         # Connect view signals
         self.view.search_requested.connect(self.on_search)
+        self.view.live_search_requested.connect(self.on_live_search)
         self.view.standards_changed.connect(self.on_standards_changed)
         self.view.clear_filters_requested.connect(self.on_clear_filters)
         self.view.refresh_requested.connect(self.on_refresh)
@@ -204,6 +232,7 @@ class LookupConnectorPresenter(QObject):
         """Handle data loaded from model"""
         print("Connector data loaded from model")
         self.df = self._convert_to_dataframe(data)
+        self._df_text = connector_text(self.df)
         self.data_loaded.emit(self.df)
 
     def _on_model_loading_progress(self, percent: int, message: str):
@@ -216,10 +245,8 @@ class LookupConnectorPresenter(QObject):
 
     def _setup_ui_components(self):
         """Setup UI components"""
-        # Create proxy model for sorting/filtering
-        self.proxy = QSortFilterProxyModel()
-        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy.setFilterKeyColumn(-1)
+        # Create index-array proxy model for sorting/filtering
+        self.proxy = IndexProxyModel()
 
         # Configure table view
         self.view.table.setModel(self.proxy)
@@ -274,8 +301,12 @@ class LookupConnectorPresenter(QObject):
         # Connectors is now a list of dictionaries
         return pd.DataFrame(limited_connectors)
 
-    def start_loading(self):
-        """Start loading connector data"""
+    def start_loading(self, reload: bool = False):
+        """Start loading connector data
+
+        Args:
+            reload: Reload from source even if the model already has data
+        """
         if self.is_loading:
             return
 
@@ -283,7 +314,9 @@ class LookupConnectorPresenter(QObject):
         self.loading_started.emit()
 
         # Trigger model to load data
-        if hasattr(self.model, 'load_async'):
+        if reload and hasattr(self.model, 'refresh_data'):
+            self.model.refresh_data()
+        elif hasattr(self.model, 'load_async'):
             self.model.load_async()
         else:
             # Fallback
@@ -334,39 +367,87 @@ class LookupConnectorPresenter(QObject):
         # Dark release: Sync to Redux
         self._sync_redux_from_view_filters(filters, FilterCommand.SEARCH_BOX)
 
-        # Cancel any existing search
-        if self._search_worker is not None:
-            self._search_worker.cancel()
-            if self._search_thread is not None and self._search_thread.isRunning():
-                self._search_thread.quit()
-                self._search_thread.wait()
-
-        # Create worker and thread for async search
-        self._search_worker = SearchWorker(self.df, filters)
-        self._search_thread = QThread()
-
-        # Move worker to thread
-        self._search_worker.moveToThread(self._search_thread)
-
-        # Connect signals
-        self._search_thread.started.connect(self._search_worker.run)
-        self._search_worker.finished.connect(self._on_search_finished)
-        self._search_worker.error.connect(self._on_search_error)
-        self._search_worker.finished.connect(self._search_thread.quit)
-        self._search_worker.error.connect(self._search_thread.quit)
+        self._start_search(filters, add_to_history=True)
 
-        # Start search
-        self._search_thread.start()
+    def on_live_search(self, filters: dict):
+        """Search while typing (debounced by the view, not added to history)"""
+        if self.df is None:
+            return
+        self._start_search(filters, add_to_history=False)
+
+    def _start_search(self, filters: dict, add_to_history: bool):
+        """Run a search on the task scheduler, replacing any in progress"""
+        source = self.df
+        rows = self._search_base(filters)
+
+        # Create worker for async search
+        worker = SearchWorker(source, filters, text=self._df_text, rows=rows)
+        self._search_worker = worker
+
+        # Connect signals (results of a superseded search are ignored)
+        worker.finished.connect(
+            lambda filtered_df, worker=worker: self._on_search_finished(
+                filtered_df, worker=worker, source=source,
+                add_to_history=add_to_history))
+        worker.error.connect(self._on_search_error)
+
+        # Start search, replacing (cancelling) any search still in progress
+        self._scheduler.submit_worker(
+            worker, name='connector_search', key='connector_search',
+            replace=True, priority=TaskPriority.INTERACTIVE)
+
+    def _search_base(self, filters: dict):
+        """Rows a search has to check: the last result's if it narrows that
+        search, otherwise every row (None)
+
+        A search narrows the last one when its filters are the same and both
+        search texts are plain (no query syntax), the new one containing
+        the last one. Part number columns also match other spellings of a
+        term that looks like a part number, so such a term only narrows a
+        last one that was matched that way too.
 
-    def _on_search_finished(self, filtered_df):
+        Returns:
+            Row positions in df, or None
+        """
+        if self._last_search is None:
+            return None
+        source, last_filters, last_result = self._last_search
+        if source is not self.df or filters.get('_special_action'):
+            return None
+
+        def others(f):
+            return {k: v for k, v in f.items() if k != 'search_text'}
+
+        last_term = compile_query(last_filters.get('search_text', ''), comma_or=True).single_term
+        term = compile_query(filters.get('search_text', ''), comma_or=True).single_term
+        if (others(filters) != others(last_filters) or last_term is None or term is None
+                or last_term.regex or term.regex or last_term.value not in term.value):
+            return None
+        if term.part_number_key and not last_term.part_number_key:
+            return None
+        return self.df.index.get_indexer(last_result.index)
+
+    def _on_search_finished(self, filtered_df, worker=None, source=None,
+                            add_to_history: bool = True):
         """Handle search completion"""
+        if worker is not None:
+            if worker is not self._search_worker:
+                return
+            self._last_search = (source, dict(worker.filters), filtered_df)
+
         self.filtered_df = filtered_df
         if self.table_model:
             self.table_model.update(filtered_df)
             self._update_stats()
+            result_count = len(filtered_df)
+
+            if result_count == 0 and hasattr(self.model, 'match_part_number'):
+                self._suggest_part_numbers(worker.filters if worker else self.current_filters)
+
+            if not add_to_history:
+                return
 
             # Add to search history with first result info
-            result_count = len(filtered_df)
             first_result = None
             if result_count > 0:
                 # Get first row data
@@ -379,6 +460,17 @@ class LookupConnectorPresenter(QObject):
             self.view.add_search_to_history(
                 self.current_filters, result_count, first_result)
 
+    def _suggest_part_numbers(self, filters: dict):
+        """Offer close part numbers when a search found nothing"""
+        search_text = filters.get('search_text', '').strip()
+        if compile_query(search_text, comma_or=True).plain_text is None:
+            return
+        suggestions = [connector.get('Part Number', '') for connector, distance
+                       in self.model.match_part_number(search_text) if distance][:3]
+        if suggestions:
+            self.view.record_count_label.setText(
+                f"No connectors found - did you mean {', '.join(suggestions)}?")
+
     def _on_search_error(self, error_message: str):
         """Handle search error"""
         self.view.show_error(error_message)
@@ -411,7 +503,7 @@ class LookupConnectorPresenter(QObject):
 
     def on_refresh(self):
         """Handle refresh request"""
-        self.start_loading()
+        self.start_loading(reload=True)
 
     def on_export(self):
         """Handle export request"""
@@ -423,9 +515,9 @@ class LookupConnectorPresenter(QObject):
         if not selected.indexes():
             return
 
-        # Get selected row
+        # Get selected row (in source order - the view shows sorted rows)
         index = selected.indexes()[0]
-        row = index.row()
+        row = self.proxy.mapToSource(index).row()
 
         # Get data from model
         if self.table_model:
@@ -3,15 +3,16 @@ Connector Lookup View - Search and filter connectors
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                                QTableView, QListWidget, QGridLayout, QFrame, QSizePolicy,
-                               QComboBox, QLineEdit, QMenu, QListWidgetItem)
-from PySide6.QtCore import Signal, Qt, QSize
+                               QComboBox, QLineEdit, QMenu, QListWidgetItem, QMessageBox)
+from PySide6.QtCore import Signal, Qt, QSize, QTimer
 from PySide6.QtGui import QCursor, QPixmap
 from typing import Optional
 from ...ui.base_sub_tab_view import BaseTabView
 from ...ui.components.label import StandardLabel, TextStyle
 from ...ui.table_context_menu_mixin import TableContextMenuMixin
-from ...core.config import UI_COLORS, UI_STYLES
+from ...core.config import UI_COLORS, UI_STYLES, SEARCH_AS_YOU_TYPE
 from ...core.app_context import AppContext
+from ...core.search_history import SearchHistoryStore, normalize_term
 from .config import (
     FAMILIES, SHELL_TYPES, SHELL_SIZES, INSERT_ARRANGEMENTS,
     SOCKET_TYPES, KEYINGS, MATERIALS
@@ -26,6 +27,7 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
 
     # Signals
     search_requested = Signal(dict)  # filter criteria
+    live_search_requested = Signal(dict)  # filter criteria, after a pause in typing
     standards_changed = Signal(list)  # selected standards changed
     refresh_requested = Signal()
     export_requested = Signal()
@@ -34,6 +36,9 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
     find_alternative_requested = Signal(str)  # part_code
     find_opposite_requested = Signal(str)  # part_code
 
+    # Scope of this tab's entries in the shared search history
+    HISTORY_SCOPE = 'connector_lookup'
+
     def __init__(self, context: Optional[AppContext] = None, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.context = context
@@ -52,6 +57,9 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         # Flag to allow updating most recent search
         self._most_recent_search_open_for_modification = False
         self._most_recent_search_timestamp = None  # Timestamp of most recent search
+        # Recent searches are kept across sessions in the shared history store
+        self.search_history = (context.get('search_history') if context else None) \
+            or SearchHistoryStore.shared()
 
         # Calculate expanded height based on number of filter rows
         # With 4 columns, we now have 2 rows (7 filters: 2, 2, 2, 1)
@@ -71,6 +79,7 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         self._setup_context_area()  # New method for enhanced context area
         self._setup_footer()
         self._setup_context_menu()
+        self._load_recent_searches()
 
     def _setup_help_content(self):
         """Set up help content specific to Connector Lookup"""
@@ -81,6 +90,8 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         <ul>
             <li><b>Text Search:</b> Enter part code, number, alias, or property in the search box</li>
             <li><b>Multi-term Search:</b> Separate multiple search terms with commas (e.g., "D38999, VG95234")</li>
+            <li><b>Query Syntax:</b> Combine terms with AND, OR and NOT (then also -term), group with ( ), quote "exact phrases",
+                limit a term to a column with Column:term (e.g., Material:aluminum, "Shell Type":plug) and use /regex/</li>
             <li><b>Advanced Filters:</b> Click "▶ Advanced Search" to show/hide filter options</li>
             <li><b>Standard Filter:</b> Selecting standards dynamically updates other filter options</li>
         </ul>
@@ -128,6 +139,7 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
             <li><b>Ctrl + Click Filter:</b> Select all items in that filter</li>
             <li><b>Click Recent Search:</b> Restore previous search (moves to top of history)</li>
             <li><b>Right-Click Recent Search:</b> Delete from history</li>
+            <li><b>Clear History:</b> Forget all recent searches (asks for confirmation)</li>
         </ul>
         
         <h3>📋 Table Features</h3>
@@ -141,7 +153,7 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         <h3>🔄 Smart Features</h3>
         <ul>
             <li><b>Smart Clear:</b> First click clears filters, second click clears text</li>
-            <li><b>Search History:</b> Recent searches saved automatically (max 35, shows 15 before scrolling)</li>
+            <li><b>Search History:</b> Recent searches saved automatically and kept between sessions (max 35, shows 15 before scrolling)</li>
             <li><b>Search Debouncing:</b> Rapid filter changes within 10 seconds update the same history entry</li>
             <li><b>Dynamic Filters:</b> Filter options update based on selected standards</li>
             <li><b>No Empty Searches:</b> Searches with 0 results are not saved to history</li>
@@ -168,7 +180,7 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
             <li>Use comma-separated searches to find multiple parts: "D38999, VG95234, MIL"</li>
             <li>Recent searches show first result's Part Number and Part Code</li>
             <li>Filters are synchronized - left and right columns scroll together</li>
-            <li>Search history persists during session (resets on restart)</li>
+            <li>Reset clears the current search only; recent searches are kept until you clear the history</li>
         </ul>
         """
         self.set_help_content(help_html)
@@ -424,6 +436,13 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
             "part code, number, alias or property (comma-separated for multiple)")
         self.search_input.setMinimumHeight(30)  # Match SearchEpd height
         self.search_input.returnPressed.connect(self._on_search_clicked)
+        self.search_input.textEdited.connect(self._on_search_text_edited)
+
+        # Restarted on every edit, so a search starts once typing pauses
+        self._live_search_timer = QTimer(self)
+        self._live_search_timer.setSingleShot(True)
+        self._live_search_timer.setInterval(SEARCH_AS_YOU_TYPE["delay_ms"])
+        self._live_search_timer.timeout.connect(self._on_live_search_timeout)
 
         self.search_btn = QPushButton("Search")
         self.search_btn.setMinimumHeight(30)
@@ -501,6 +520,11 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
             )
             # Set initial state
             self._update_advanced_search_availability()
+            self.feature_flags.subscribe(
+                'connectors',
+                'search_as_you_type',
+                self._on_search_as_you_type_flag_changed
+            )
 
         # === Collapsible Filter Section ===
         self.filter_container = QFrame()
@@ -826,8 +850,14 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         if self.footer_box.layout():
             QWidget().setLayout(self.footer_box.layout())
 
+        self.clear_history_btn = QPushButton("Clear History")
+        self.clear_history_btn.setToolTip(
+            "Forget all recent searches of this tab (also those of earlier sessions)")
+        self.clear_history_btn.clicked.connect(self._on_clear_history_clicked)
+
         footer_layout.addWidget(recent_label)
         footer_layout.addWidget(self.recent_searches_combo)
+        footer_layout.addWidget(self.clear_history_btn)
         footer_layout.addStretch()
 
         self.footer_box.setLayout(footer_layout)
@@ -914,8 +944,28 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         """Called when advanced search feature flag changes"""
         self._update_advanced_search_availability()
 
+    def _search_as_you_type_enabled(self) -> bool:
+        return bool(self.feature_flags and
+                    self.feature_flags.get('connectors', 'search_as_you_type'))
+
+    def _on_search_as_you_type_flag_changed(self, enabled: bool):
+        """Called when search-as-you-type feature flag changes"""
+        if not enabled:
+            self._live_search_timer.stop()
+
+    def _on_search_text_edited(self, text: str):
+        if self._search_as_you_type_enabled():
+            self._live_search_timer.start()
+
+    def _on_live_search_timeout(self):
+        """Search for the typed text (not added to recent searches)"""
+        filters = self._get_selected_filters()
+        if len(filters['search_text']) >= SEARCH_AS_YOU_TYPE["min_chars"]:
+            self.live_search_requested.emit(filters)
+
     def _on_search_clicked(self):
         """Emit search signal with selected filters and close modification window"""
+        self._live_search_timer.stop()
         # Close modification window for most recent search
         self._close_modification_window()
 
@@ -987,7 +1037,10 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         )
 
     def _on_reset_clicked(self):
-        """Reset the tab to initial state - clear all filters, search text, results, and history"""
+        """Reset the tab to initial state - clear all filters, search text and results
+
+        Recent searches are kept; they are only removed by Clear History.
+        """
         # Close modification window
         self._close_modification_window()
 
@@ -1010,19 +1063,32 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         self.keying_list_left.clearSelection()
         self.keying_list_right.clearSelection()
 
-        # Clear recent searches history
-        self.recent_searches.clear()
-        self.recent_searches_data.clear()
-        self.recent_searches_timestamps.clear()
-        self.recent_searches_results.clear()
-        self._update_recent_searches_combo()
-
         # Clear context display
         self.context_box.clear()
 
         # Emit reset signal to presenter to clear table
         self.reset_requested.emit()
 
+    def _on_clear_history_clicked(self):
+        """Forget all recent searches of this tab after confirmation"""
+        reply = QMessageBox.question(
+            self,
+            "Clear History",
+            "Remove all recent searches? This also removes searches from earlier sessions.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        self._close_modification_window()
+        self.search_history.clear(self.HISTORY_SCOPE)
+        self.recent_searches.clear()
+        self.recent_searches_data.clear()
+        self.recent_searches_timestamps.clear()
+        self.recent_searches_results.clear()
+        self._update_recent_searches_combo()
+
     def _add_to_recent_searches(self, filters: dict, result_count: int, first_result: dict = None):
         """Add search to recent searches history with debouncing
 
@@ -1060,72 +1126,27 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
             if time_diff < timedelta(seconds=10):
                 should_update_recent = True
 
-        # Create a human-readable description of the search
-        # Check if this is a special action (Find Alternative/Opposite)
-        is_special_action = filters.get('_special_action') in [
-            'find_alternative', 'find_opposite']
-
-        if is_special_action:
-            # For special actions, use the search_text directly (e.g., "Alternative to ABC123")
-            search_type = filters.get('search_text', 'Unknown Action')
-        else:
-            # Normal search - build description from filters
-            # NOTE: Exclude 'standard' (Family) from the summary as requested
-            advanced_filter_parts = []
-            # if filters.get('standard'):  # EXCLUDED from summary
-            #     advanced_filter_parts.extend(filters['standard'])
-            if filters.get('shell_type'):
-                advanced_filter_parts.extend(filters['shell_type'])
-            if filters.get('material'):
-                advanced_filter_parts.extend(filters['material'])
-            if filters.get('shell_size'):
-                advanced_filter_parts.extend(filters['shell_size'])
-            if filters.get('insert_arrangement'):
-                advanced_filter_parts.extend(filters['insert_arrangement'])
-            if filters.get('socket_type'):
-                advanced_filter_parts.extend(filters['socket_type'])
-            if filters.get('keying'):
-                advanced_filter_parts.extend(filters['keying'])
-
-            # Build search description
-            if advanced_filter_parts:
-                # For advanced search: show comma-separated filter values
-                search_type = ", ".join(advanced_filter_parts)
-                # Add search text if present
-                if filters.get('search_text'):
-                    search_type = f"{filters['search_text']} + {search_type}"
-            else:
-                # For simple text search: just show the search text
-                search_type = filters.get('search_text', 'All Results')
-
-        # Add first result info if available
-        result_info = ""
-        if first_result and result_count > 0:
-            part_num = first_result.get('Part Number', '')
-            part_code = first_result.get('Part Code', '')
-            if part_num or part_code:
-                result_info = f" | {part_num} - {part_code}" if part_num and part_code else f" | {part_num or part_code}"
-
-        # Format: "D38999, Aluminum (25 results) | PART123 - ABC"
-        search_description = f"{search_type} ({result_count} result{'s' if result_count != 1 else ''}){result_info}"
+        # Store the query itself in the history; the dropdown shows it with
+        # the result count and first result
+        search_term = self._history_term(filters)
+        search_description = self._describe_search(search_term, result_count, first_result)
 
         if should_update_recent:
             # UPDATE the most recent search instead of adding new one
-            # Get the first (most recent) item
             most_recent_key = self.recent_searches[0]
-
-            # Remove old entry from all tracking structures
-            self.recent_searches.remove(most_recent_key)
-            if most_recent_key in self.recent_searches_data:
-                del self.recent_searches_data[most_recent_key]
-            if most_recent_key in self.recent_searches_timestamps:
-                del self.recent_searches_timestamps[most_recent_key]
-            if most_recent_key in self.recent_searches_results:
-                del self.recent_searches_results[most_recent_key]
-        else:
-            # Not updating - this is a new search, so remove duplicate if it exists
-            if search_description in self.recent_searches:
-                self.recent_searches.remove(search_description)
+            old_filters = self.recent_searches_data.get(most_recent_key)
+            if (old_filters is not None and
+                    normalize_term(self._history_term(old_filters)) != normalize_term(search_term)):
+                self.search_history.remove(
+                    self.HISTORY_SCOPE, self._history_term(old_filters))
+            self._forget_recent_search(most_recent_key)
+
+        # The same query may be listed with an older result count
+        for description in list(self.recent_searches):
+            filters_of = self.recent_searches_data.get(description)
+            if (filters_of is not None and
+                    normalize_term(self._history_term(filters_of)) == normalize_term(search_term)):
+                self._forget_recent_search(description)
 
         # Store the filters data, timestamp, and first result for this search
         self.recent_searches_data[search_description] = filters.copy()
@@ -1136,6 +1157,7 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
 
         # Add to front of deque
         self.recent_searches.appendleft(search_description)
+        self._save_recent_search(search_description, result_count)
 
         # Mark this search as open for modification
         self._most_recent_search_open_for_modification = True
@@ -1144,6 +1166,90 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
         # Update combo box
         self._update_recent_searches_combo()
 
+    @staticmethod
+    def _history_term(filters: dict) -> str:
+        """Query text a search is recorded under in the history store
+
+        Args:
+            filters: The filter dict from the search
+
+        Returns:
+            Search text followed by the selected filter values (Family excluded),
+            e.g. "D38999 + Aluminum, Plug"
+        """
+        # Special actions (Find Alternative/Opposite) carry their own text
+        if filters.get('_special_action') in ['find_alternative', 'find_opposite']:
+            return filters.get('search_text', 'Unknown Action')
+
+        # NOTE: Exclude 'standard' (Family) from the summary as requested
+        advanced_filter_parts = []
+        for key in ('shell_type', 'material', 'shell_size', 'insert_arrangement',
+                    'socket_type', 'keying'):
+            advanced_filter_parts.extend(filters.get(key) or [])
+
+        search_text = ' '.join(str(filters.get('search_text') or '').split())
+        if advanced_filter_parts:
+            # For advanced search: show comma-separated filter values
+            term = ", ".join(advanced_filter_parts)
+            return f"{search_text} + {term}" if search_text else term
+        # For simple text search: just the search text
+        return search_text or 'All Results'
+
+    @staticmethod
+    def _describe_search(search_term: str, result_count: Optional[int] = None,
+                         first_result: dict = None) -> str:
+        """Dropdown text of a recent search
+
+        Format: "D38999, Aluminum (25 results) | PART123 - ABC"
+        """
+        description = search_term
+        if result_count is not None:
+            description += f" ({result_count} result{'s' if result_count != 1 else ''})"
+        if first_result and result_count:
+            part_num = first_result.get('Part Number', '')
+            part_code = first_result.get('Part Code', '')
+            if part_num or part_code:
+                description += f" | {part_num} - {part_code}" if part_num and part_code else f" | {part_num or part_code}"
+        return description
+
+    def _forget_recent_search(self, search_description: str):
+        """Remove a search from the dropdown's tracking structures (not from the store)"""
+        if search_description in self.recent_searches:
+            self.recent_searches.remove(search_description)
+        self.recent_searches_data.pop(search_description, None)
+        self.recent_searches_timestamps.pop(search_description, None)
+        self.recent_searches_results.pop(search_description, None)
+
+    def _save_recent_search(self, search_description: str, result_count: Optional[int] = None):
+        """Record a recent search (with what is needed to restore it) in the history store"""
+        filters = self.recent_searches_data.get(search_description, {})
+        self.search_history.record(
+            self.HISTORY_SCOPE, self._history_term(filters), result_count,
+            payload={
+                'filters': filters,
+                'first_result': self.recent_searches_results.get(search_description),
+            })
+
+    def _load_recent_searches(self):
+        """Fill the recent searches dropdown from earlier sessions"""
+        entries = self.search_history.recent(
+            self.HISTORY_SCOPE, self.recent_searches.maxlen)
+        for entry in entries:
+            filters = entry.payload.get('filters')
+            if not filters:
+                continue
+            first_result = entry.payload.get('first_result')
+            description = self._describe_search(
+                self._history_term(filters), entry.result_count, first_result)
+            if description in self.recent_searches_data:
+                continue
+            self.recent_searches.append(description)
+            self.recent_searches_data[description] = filters
+            self.recent_searches_timestamps[description] = entry.last_used_at
+            if first_result:
+                self.recent_searches_results[description] = first_result
+        self._update_recent_searches_combo()
+
     def _update_recent_searches_combo(self):
         """Update the recent searches combo box"""
         self.recent_searches_combo.blockSignals(True)
@@ -1170,6 +1276,7 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
 
             # Re-add to top (front of deque)
             self.recent_searches.appendleft(search_text)
+            self._save_recent_search(search_text)
 
             # Update combo box to reflect new order
             self._update_recent_searches_combo()
@@ -1585,16 +1692,11 @@ class LookupConnectorView(BaseTabView, TableContextMenuMixin):
             search_text: The search description to delete
         """
         if search_text in self.recent_searches:
-            # Remove from deque
-            self.recent_searches.remove(search_text)
-
-            # Remove from data dictionaries
-            if search_text in self.recent_searches_data:
-                del self.recent_searches_data[search_text]
-            if search_text in self.recent_searches_timestamps:
-                del self.recent_searches_timestamps[search_text]
-            if search_text in self.recent_searches_results:
-                del self.recent_searches_results[search_text]
+            filters = self.recent_searches_data.get(search_text)
+            if filters is not None:
+                self.search_history.remove(
+                    self.HISTORY_SCOPE, self._history_term(filters))
+            self._forget_recent_search(search_text)
 
             # Update combo box
             self._update_recent_searches_combo()
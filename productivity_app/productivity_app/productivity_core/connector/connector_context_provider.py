@@ -9,22 +9,61 @@ For example, if a part number is found, the Connector tab could provide:
 - Current stock levels
 etc.
 """
+import re
+import threading
+from collections import OrderedDict
 from typing import List
 from ..document_scanner.context_provider import ContextProvider
 from ..document_scanner.search_result import SearchResult, Context
+from ..core.app_logging import get_logger, sample
+
+logger = get_logger(__name__)
 
 
 class ConnectorContextProvider(ContextProvider):
     """Provides connector-related context to search results"""
 
-    def __init__(self, connector_model=None):
+    # Values must contain letters and digits to be tried as close matches
+    _PART_NUMBER_LIKE = re.compile(r'(?=.*[A-Za-z])(?=.*\d)')
+
+    # Lookup results kept (least recently used are dropped first)
+    LOOKUP_CACHE_SIZE = 4096
+
+    def __init__(self, connector_model=None, context=None):
         """Initialize with connector model/data
 
         Args:
             connector_model: Reference to connector data/model (optional)
+            context: AppContext to take the 'connector_model' service from
+                when no model is given (it is registered when the Connector
+                tab loads, possibly after this provider is created)
         """
         self.connector_model = connector_model
+        self.context = context
         self.enabled = True
+        # Lookup results per value, for the part number index they came from
+        self._lookup_cache = OrderedDict()
+        self._lookup_cache_index = None
+        self._lookup_cache_lock = threading.Lock()
+        self._watched_model = None
+
+    def _model(self):
+        if self.connector_model is None and self.context is not None:
+            self.connector_model = self.context.get('connector_model')
+        if self.connector_model is not None and self._watched_model is not self.connector_model:
+            # Reloaded connectors invalidate every cached lookup
+            self._watched_model = self.connector_model
+            self.connector_model.data_loaded.connect(self._on_data_loaded)
+        return self.connector_model
+
+    def _on_data_loaded(self, _data):
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Forget all cached lookups"""
+        with self._lookup_cache_lock:
+            self._lookup_cache.clear()
+            self._lookup_cache_index = None
 
     def get_context_name(self) -> str:
         """Get the name of this context provider"""
@@ -46,7 +85,7 @@ class ConnectorContextProvider(ContextProvider):
 
         # Look for part numbers in the result data
         # Check each value in the result to see if it's a connector part number
-        for column, value in result.matched_row_data.items():
+        for column, value in result.items():
             # Skip empty values
             if not value or str(value).strip() == "" or str(value).lower() == "nan":
                 continue
@@ -55,8 +94,8 @@ class ConnectorContextProvider(ContextProvider):
             connector_info = self._lookup_connector(str(value).strip())
 
             if connector_info:
-                print(
-                    f"  ✓ Found connector match for '{value}' in column '{column}'")
+                logger.debug("Found connector match for '%s' in column '%s'",
+                             value, column, extra=sample(50))
                 context = Context(
                     term=str(value),
                     context_owner="Connector",
@@ -95,53 +134,65 @@ class ConnectorContextProvider(ContextProvider):
     def _lookup_connector(self, part_number: str) -> dict:
         """Look up connector information by part number
 
+        Punctuation and case are ignored (D38999-26WA35PN finds
+        D38999/26WA35PN). Values that look like part numbers but match none
+        exactly are matched to the connector one edit away, if there is
+        exactly one.
+
         Args:
             part_number: The part number to look up
 
         Returns:
             Dictionary of connector data, or None if not found
         """
-        if not self.connector_model:
+        model = self._model()
+        if not model:
             return None
 
-        # Get all connectors from model
-        connectors = self.connector_model.get_connectors()
-
-        if not connectors:
-            return None
-
-        # Search for part number (try exact match first, then partial)
         part_number_clean = str(part_number).strip()
-
-        # Try exact match on Part Number, Part Code, or Minified Part Code
-        for connector in connectors:
-            part_num = connector.get('Part Number', '').strip()
-            part_code = connector.get('Part Code', '').strip()
-            mini_code = connector.get('Minified Part Code', '').strip()
-
-            # Case-insensitive exact match
-            if (part_num.lower() == part_number_clean.lower() or
-                part_code.lower() == part_number_clean.lower() or
-                    mini_code.lower() == part_number_clean.lower()):
-
-                print(f"    → Exact match found: {part_num}")
-                # Return relevant connector details
-                return {
-                    'Part Number': connector.get('Part Number', 'N/A'),
-                    'Family': connector.get('Family', 'N/A'),
-                    'Shell Type': connector.get('Shell Type', 'N/A'),
-                    'Shell Size': connector.get('Shell Size', 'N/A'),
-                    'Insert Arrangement': connector.get('Insert Arrangement', 'N/A'),
-                    'Material': connector.get('Material', 'N/A'),
-                    'Socket Type': connector.get('Socket Type', 'N/A'),
-                    'Keying': connector.get('Keying', 'N/A'),
-                    'Status': connector.get('Database Status', 'N/A')
-                }
-
-        # No exact match found - don't use partial matching as it's too unreliable
-        # Partial matching would return wrong connectors (e.g., "D38999" matches all D38999 connectors)
-        print(f"    → No exact match found for '{part_number_clean}'")
-        return None
+        index = model.part_number_index()
+        with self._lookup_cache_lock:
+            if self._lookup_cache_index is not index:
+                self._lookup_cache.clear()
+                self._lookup_cache_index = index
+            if part_number_clean in self._lookup_cache:
+                self._lookup_cache.move_to_end(part_number_clean)
+                return self._lookup_cache[part_number_clean]
+
+        fuzzy = bool(self._PART_NUMBER_LIKE.match(part_number_clean))
+        matches = model.match_part_number(part_number_clean, fuzzy=fuzzy)
+
+        # Partial matching is not used as it's too unreliable (e.g. "D38999"
+        # would match all D38999 connectors); ambiguous close matches neither
+        info = None
+        if len(matches) == 1 or (matches and matches[0][1] == 0):
+            connector, distance = matches[0]
+            logger.debug("%s match found: %s", "Exact" if distance == 0 else "Close",
+                         connector.get('Part Number', ''), extra=sample(100))
+            # Return relevant connector details
+            info = {
+                'Part Number': connector.get('Part Number', 'N/A'),
+                'Family': connector.get('Family', 'N/A'),
+                'Shell Type': connector.get('Shell Type', 'N/A'),
+                'Shell Size': connector.get('Shell Size', 'N/A'),
+                'Insert Arrangement': connector.get('Insert Arrangement', 'N/A'),
+                'Material': connector.get('Material', 'N/A'),
+                'Socket Type': connector.get('Socket Type', 'N/A'),
+                'Keying': connector.get('Keying', 'N/A'),
+                'Status': connector.get('Database Status', 'N/A')
+            }
+            if distance:
+                info['Match'] = f"Close match ({distance} edit{'s' if distance > 1 else ''})"
+        else:
+            logger.debug("No exact match found for '%s'", part_number_clean,
+                         extra=sample(100))
+
+        with self._lookup_cache_lock:
+            if self._lookup_cache_index is index:
+                self._lookup_cache[part_number_clean] = info
+                if len(self._lookup_cache) > self.LOOKUP_CACHE_SIZE:
+                    self._lookup_cache.popitem(last=False)
+        return info
 
     def is_enabled(self) -> bool:
         """Check if this context provider is enabled"""
@@ -1,15 +1,30 @@
 """
 Connector Model - Data management for connector lookups with threading support
 """
-from typing import Dict, List, Any, Optional
-from PySide6.QtCore import Signal, QThread, QMutex, QMutexLocker
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from PySide6.QtCore import Signal, QMutex, QMutexLocker
 from ..core.base_model import BaseModel
 from ..core.base_data_worker import BaseDataWorker
+from ..core.task_scheduler import TaskPriority, TaskScheduler
+from ..core.profiler import profile_span
+from ..core.part_number_index import PartNumberIndex
+import threading
 import time
 
 
 class ConnectorDataWorker(BaseDataWorker):
-    """Worker class for loading connector data in a separate thread"""
+    """Worker class for loading connector data in a separate thread
+
+    When given a local data store, the loaded rows are also written to it
+    here, so the write (and its full-text indexing) stays off the UI thread.
+    """
+
+    def __init__(self, store=None, table: str = 'connectors',
+                 facet_columns: Optional[List[str]] = None):
+        super().__init__()
+        self._store = store
+        self._table = table
+        self._facet_columns = facet_columns
 
     def run(self):
         """Execute the data loading in background thread"""
@@ -32,6 +47,11 @@ class ConnectorDataWorker(BaseDataWorker):
             data = self._load_connector_data()
             time.sleep(0.2)
 
+            if self._store is not None:
+                if not self.emit_progress(90, "Saving connector data..."):
+                    return
+                self._save(data)
+
             # Complete
             if not self.emit_progress(100, "Connector data loaded successfully"):
                 return
@@ -40,6 +60,15 @@ class ConnectorDataWorker(BaseDataWorker):
         except Exception as e:
             self.error.emit(f"Data loading failed: {str(e)}")
 
+    def _save(self, data: Dict):
+        """Write the connector rows to the store (option lists as metadata)"""
+        metadata = {k: v for k, v in data.items() if k != 'connectors'}
+        self._store.replace_table(
+            self._table,
+            data.get('connectors', []),
+            facet_columns=self._facet_columns,
+            metadata=metadata)
+
     def _load_connector_data(self) -> Dict:
         """Load connector data (private method)"""
         # In real life, this would load from a database or file
@@ -185,7 +214,37 @@ class ConnectorDataWorker(BaseDataWorker):
 
 
 class ConnectorModel(BaseModel):
-    """Model for managing connector data with thread-safe async loading"""
+    """Model for managing connector data with thread-safe async loading
+
+    When a local data store is registered in the context, connector rows live
+    in the store and are queried on demand. Only the small option lists
+    (families, shell types, ...) are kept in memory.
+    """
+
+    # Store table holding connector rows
+    STORE_TABLE = 'connectors'
+
+    # Columns indexed for exact-match filtering in the store
+    FACET_COLUMNS = [
+        'Family', 'Shell Type', 'Material', 'Shell Size',
+        'Insert Arrangement', 'Socket Type', 'Keying', 'Database Status'
+    ]
+
+    # Connectors included when data read back from the store is published
+    # (the Lookup table shows the first 100; iter_connectors() streams all)
+    PUBLISHED_ROWS = 100
+
+    # Columns holding spellings of a connector's part number
+    PART_NUMBER_COLUMNS = ['Part Number', 'Part Code', 'Minified Part Code']
+
+    # filter_connectors() keys -> connector columns
+    FILTER_COLUMNS = {
+        'family': 'Family',
+        'shell_type': 'Shell Type',
+        'insert_arrangement': 'Insert Arrangement',
+        'socket_type': 'Socket Type',
+        'keying': 'Keying',
+    }
 
     # Additional signals for loading process
     loading_progress = Signal(int, str)  # progress_percent, status_message
@@ -195,37 +254,78 @@ class ConnectorModel(BaseModel):
     def __init__(self, context):
         super().__init__(context)
         self.data = None
+        self.is_loading = False
+        self._load_complete = False
         self._data_mutex = QMutex()
         self._worker = None
-        self._thread = None
+        self._load_span = None
+        self._scheduler = (context.get('task_scheduler') if context is not None
+                           else None) or TaskScheduler.shared()
+        self._store = context.get('data_store') if context is not None else None
+        # Part number index, built from the connectors on first use
+        self._part_index = None
+        self._part_index_generation = 0
+        self._part_index_lock = threading.Lock()
+        # Held while building, so concurrent callers wait for one build
+        self._part_index_build_lock = threading.Lock()
+
+    def _use_store(self) -> bool:
+        """Check if connector rows are available from the local data store"""
+        return self._store is not None and self._store.has_table(self.STORE_TABLE)
 
     def load_async(self):
-        """Load connector data asynchronously in a background thread"""
-        with QMutexLocker(self._data_mutex):
-            # Cancel any existing load operation
-            if self._worker is not None:
-                self._worker.cancel()
-                if self._thread is not None and self._thread.isRunning():
-                    self._thread.quit()
-                    self._thread.wait()
+        """Load connector data asynchronously on the task scheduler
+
+        If the local data store already holds connectors from a previous
+        session, they are published immediately and the background load
+        refreshes them. Once a load has completed (e.g. a preload started by
+        TabLoader), the data is republished for late subscribers instead of
+        being loaded again - use refresh_data() to reload.
+        """
+        if self._load_complete:
+            self.data_loaded.emit(self.get_all(limit=self.PUBLISHED_ROWS))
+            return
 
-            # Create worker and thread
-            self._worker = ConnectorDataWorker()
-            self._thread = QThread()
+        if self.is_loading:
+            return
 
-            # Move worker to thread
-            self._worker.moveToThread(self._thread)
+        self._load_from_store()
+        self.is_loading = True
+        self._load_span = profile_span('connector.load', 'model')
+
+        with QMutexLocker(self._data_mutex):
+            # Create worker (it also writes the rows to the store)
+            self._worker = ConnectorDataWorker(
+                self._store, self.STORE_TABLE, self.FACET_COLUMNS)
 
             # Connect signals
-            self._thread.started.connect(self._worker.run)
             self._worker.progress.connect(self._on_loading_progress)
             self._worker.finished.connect(self._on_loading_finished)
             self._worker.error.connect(self._on_loading_error)
-            self._worker.finished.connect(self._thread.quit)
-            self._worker.error.connect(self._thread.quit)
 
-            # Start thread
-            self._thread.start()
+            # Replaces (cancels) any load still queued or running
+            self._scheduler.submit_worker(
+                self._worker, name='connector_load', key='connector_load',
+                replace=True, priority=TaskPriority.BACKGROUND)
+
+    def refresh_data(self):
+        """Reload connector data from source, replacing any load in progress"""
+        self._load_complete = False
+        self.is_loading = False
+        self.load_async()
+
+    def _load_from_store(self):
+        """Publish connector data persisted by a previous session (warm start)"""
+        if self.data is not None or not self._use_store():
+            return
+
+        with QMutexLocker(self._data_mutex):
+            self.data = self._store.get_metadata(self.STORE_TABLE)
+        self._reset_part_index()
+
+        print(
+            f"Connector model: warm start from local store ({self._store.count(self.STORE_TABLE)} connectors)")
+        self.data_loaded.emit(self.get_all(limit=self.PUBLISHED_ROWS))
 
     def _on_loading_progress(self, percent: int, message: str):
         """Handle loading progress updates"""
@@ -233,18 +333,41 @@ class ConnectorModel(BaseModel):
 
     def _on_loading_finished(self, data: Dict):
         """Handle successful data loading"""
+        self.is_loading = False
+        self._load_complete = True
         with QMutexLocker(self._data_mutex):
-            self.data = data
+            if self._store is not None:
+                # The worker wrote the rows to the store; keep only the
+                # option lists in memory
+                self.data = {k: v for k, v in data.items() if k != 'connectors'}
+            else:
+                self.data = data
+            self._reset_part_index()
             self.data_loaded.emit(data)
+        self._load_span.finish(rows=len(data.get('connectors', [])))
 
     def _on_loading_error(self, error_message: str):
         """Handle loading errors"""
+        self.is_loading = False
         self.loading_failed.emit(error_message)
+        self._load_span.finish(error=error_message)
 
-    def get_all(self) -> Optional[Dict]:
-        """Get all connector data (thread-safe)"""
+    def get_all(self, limit: Optional[int] = None) -> Optional[Dict]:
+        """Get connector data (thread-safe)
+
+        Args:
+            limit: Maximum number of connectors to include (None = all)
+        """
         with QMutexLocker(self._data_mutex):
-            return self.data.copy() if self.data else None
+            if not self.data:
+                return None
+            data = self.data.copy()
+
+        if self._use_store():
+            data['connectors'] = self._store.query(self.STORE_TABLE, limit=limit)
+        elif limit is not None:
+            data['connectors'] = data.get('connectors', [])[:limit]
+        return data
 
     def get_families(self) -> List[str]:
         """Get list of available families (thread-safe)"""
@@ -282,11 +405,25 @@ class ConnectorModel(BaseModel):
             return []
 
     def get_connectors(self) -> List[Dict]:
-        """Get all connectors as list (thread-safe)"""
+        """Get all connectors as list (thread-safe)
+
+        Prefer iter_connectors() to scan them; this reads every row at once.
+        """
+        return list(self.iter_connectors())
+
+    def iter_connectors(self) -> Iterator[Dict]:
+        """Stream all connectors (thread-safe)
+
+        Rows from the store are read a page at a time, so scanning every
+        connector never holds them all in memory.
+        """
+        if self._use_store():
+            yield from self._store.iter_rows(self.STORE_TABLE)
+            return
+
         with QMutexLocker(self._data_mutex):
-            if self.data:
-                return self.data.get('connectors', [])
-            return []
+            connectors = self.data.get('connectors', []) if self.data else []
+        yield from connectors
 
     def get_available_filter_options(self, selected_standards: List[str] = None) -> Dict[str, List[str]]:
         """Get available filter options based on selected standards (thread-safe)
@@ -298,16 +435,29 @@ class ConnectorModel(BaseModel):
         Returns:
             Dict with keys: shell_types, materials, shell_sizes, insert_arrangements, socket_types, keyings
         """
+        option_columns = {
+            'shell_types': 'Shell Type',
+            'materials': 'Material',
+            'shell_sizes': 'Shell Size',
+            'insert_arrangements': 'Insert Arrangement',
+            'socket_types': 'Socket Type',
+            'keyings': 'Keying'
+        }
+
+        if self._use_store():
+            facets = {'Family': selected_standards or []}
+            options = {
+                key: [str(v) for v in self._store.distinct_values(
+                    self.STORE_TABLE, column, facets)]
+                for key, column in option_columns.items()
+            }
+            options['shell_sizes'].sort(
+                key=lambda x: int(x) if x.isdigit() else 0)
+            return options
+
         with QMutexLocker(self._data_mutex):
             if not self.data:
-                return {
-                    'shell_types': [],
-                    'materials': [],
-                    'shell_sizes': [],
-                    'insert_arrangements': [],
-                    'socket_types': [],
-                    'keyings': []
-                }
+                return {key: [] for key in option_columns}
 
             connectors = self.data.get('connectors', [])
 
@@ -322,44 +472,16 @@ class ConnectorModel(BaseModel):
                 ]
 
             # Extract unique values for each filter from the filtered connectors
-            shell_types = sorted(set(
-                conn.get('Shell Type') for conn in filtered_connectors
-                if conn.get('Shell Type')
-            ))
-
-            materials = sorted(set(
-                conn.get('Material') for conn in filtered_connectors
-                if conn.get('Material')
-            ))
-
-            shell_sizes = sorted(set(
-                conn.get('Shell Size') for conn in filtered_connectors
-                if conn.get('Shell Size')
-            ), key=lambda x: int(x) if x.isdigit() else 0)
-
-            insert_arrangements = sorted(set(
-                conn.get('Insert Arrangement') for conn in filtered_connectors
-                if conn.get('Insert Arrangement')
-            ))
-
-            socket_types = sorted(set(
-                conn.get('Socket Type') for conn in filtered_connectors
-                if conn.get('Socket Type')
-            ))
-
-            keyings = sorted(set(
-                conn.get('Keying') for conn in filtered_connectors
-                if conn.get('Keying')
-            ))
-
-            return {
-                'shell_types': shell_types,
-                'materials': materials,
-                'shell_sizes': shell_sizes,
-                'insert_arrangements': insert_arrangements,
-                'socket_types': socket_types,
-                'keyings': keyings
+            options = {
+                key: sorted(set(
+                    conn.get(column) for conn in filtered_connectors
+                    if conn.get(column)
+                ))
+                for key, column in option_columns.items()
             }
+            options['shell_sizes'].sort(
+                key=lambda x: int(x) if x.isdigit() else 0)
+            return options
 
     def find_alternative(self, part_code: str) -> List[Dict[str, Any]]:
         """Find alternative connectors for a given part code
@@ -414,8 +536,84 @@ class ConnectorModel(BaseModel):
 
             return dummy_opposite
 
+    def _reset_part_index(self):
+        """Drop the part number index and rebuild it in the background"""
+        with self._part_index_lock:
+            self._part_index = None
+            self._part_index_generation += 1
+        self._scheduler.submit(
+            lambda: self.part_number_index().prepare(),
+            name='connector_part_index', key='connector_part_index',
+            replace=True, priority=TaskPriority.BACKGROUND)
+
+    def part_number_index(self) -> PartNumberIndex:
+        """Index of all part number spellings (thread-safe)
+
+        Values are the connector records; each connector is added under its
+        Part Number, Part Code and Minified Part Code.
+        """
+        with self._part_index_lock:
+            if self._part_index is not None:
+                return self._part_index
+
+        with self._part_index_build_lock:
+            with self._part_index_lock:
+                # Built by another caller while we waited
+                if self._part_index is not None:
+                    return self._part_index
+                generation = self._part_index_generation
+
+            # Built outside _part_index_lock: reading connectors may wait
+            # for a load, which resets the index under that lock
+            index = PartNumberIndex()
+            for connector in self.iter_connectors():
+                for column in self.PART_NUMBER_COLUMNS:
+                    index.add(connector.get(column), connector)
+
+            with self._part_index_lock:
+                # Keep it only if the connectors were not reloaded meanwhile
+                if generation == self._part_index_generation:
+                    self._part_index = index
+        return index
+
+    def match_part_number(self, part_number: str, fuzzy: bool = True) -> List[Tuple[Dict, int]]:
+        """Find connectors by part number, ignoring punctuation and case
+
+        Args:
+            part_number: Part number in any spelling (D38999/26WA35PN,
+                D38999-26WA35PN, d3899926wa35pn)
+            fuzzy: Fall back to the closest spellings (one edit away) when
+                there is no exact match
+
+        Returns:
+            (connector, edit distance) pairs; distance 0 for exact matches
+        """
+        index = self.part_number_index()
+        matches = index.match(part_number) if fuzzy else [
+            m for m in [index.exact(part_number)] if m]
+
+        results, seen = [], set()
+        for match in matches:
+            for connector in match.values:
+                if id(connector) not in seen:
+                    seen.add(id(connector))
+                    results.append((connector, match.distance))
+        return results
+
     def filter_connectors(self, filters: Dict) -> List[Dict]:
         """Filter connectors based on criteria (thread-safe)"""
+        if self._use_store():
+            # None, empty or 'Any' means wildcard
+            facets = {
+                column: [filters[key]]
+                for key, column in self.FILTER_COLUMNS.items()
+                if filters.get(key) and filters[key] != 'Any'
+            }
+            return self._store.query(
+                self.STORE_TABLE,
+                search_text=filters.get('search_text', ''),
+                facets=facets)
+
         with QMutexLocker(self._data_mutex):
             if not self.data:
                 return []
@@ -427,25 +625,10 @@ class ConnectorModel(BaseModel):
                 match = True
 
                 # Apply filters (None or empty means "Any" - wildcard)
-                if filters.get('family') and filters['family'] != 'Any':
-                    if conn_data.get('Family') != filters['family']:
-                        match = False
-
-                if filters.get('shell_type') and filters['shell_type'] != 'Any':
-                    if conn_data.get('Shell Type') != filters['shell_type']:
-                        match = False
-
-                if filters.get('insert_arrangement') and filters['insert_arrangement'] != 'Any':
-                    if conn_data.get('Insert Arrangement') != filters['insert_arrangement']:
-                        match = False
-
-                if filters.get('socket_type') and filters['socket_type'] != 'Any':
-                    if conn_data.get('Socket Type') != filters['socket_type']:
-                        match = False
-
-                if filters.get('keying') and filters['keying'] != 'Any':
-                    if conn_data.get('Keying') != filters['keying']:
-                        match = False
+                for key, column in self.FILTER_COLUMNS.items():
+                    if filters.get(key) and filters[key] != 'Any':
+                        if conn_data.get(column) != filters[key]:
+                            match = False
 
                 # Text search across all fields
                 if filters.get('search_text'):
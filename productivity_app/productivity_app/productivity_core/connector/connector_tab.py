@@ -3,40 +3,14 @@ Connector Module - Connector configuration and lookup interface with multiple su
 """
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
 from PySide6.QtCore import QTimer
+from ..tabs.tab_ids import ConnectorTabs
 
 
-class ConnectorModuleView(QWidget):
+class ConnectorModuleView(QWidget, ConnectorTabs):
     """Main Connector module containing Lookup and Check Multiple tabs"""
 
-    # ========================================================================
-    # MODULE IDENTIFIER - Single source of truth for this module
-    # ========================================================================
-    # Used for tab registration and sub-tab visibility management
-    # ========================================================================
-
-    MODULE_ID = 'connectors'
-
-    # ========================================================================
-    # SUB-TAB IDENTIFIERS - Single source of truth
-    # ========================================================================
-    # All code that references sub-tabs should use these constants
-    # When renaming: update here and everything else auto-updates
-    # ========================================================================
-
-    SUB_TAB_LOOKUP = 'lookup'
-    SUB_TAB_CHECK_MULTIPLE = 'check_multiple'
-
-    # Ordered list of all sub-tabs (used for iteration)
-    SUB_TAB_ORDER = [
-        SUB_TAB_LOOKUP,
-        SUB_TAB_CHECK_MULTIPLE,
-    ]
-
-    # Display names (for UI labels)
-    SUB_TAB_LABELS = {
-        SUB_TAB_LOOKUP: 'Lookup',
-        SUB_TAB_CHECK_MULTIPLE: 'Check Multiple',
-    }
+    # Module and sub-tab identifiers (MODULE_ID, SUB_TAB_*) come from
+    # ConnectorTabs in tabs/tab_ids.py
 
     def __init__(self, context, connector_model):
         super().__init__()
@@ -6,6 +6,11 @@ from typing import Dict, Any, Optional, TypeVar, Type, TYPE_CHECKING
 if TYPE_CHECKING:
     from ..tabs.tab_visibility_service import TabVisibilityService
     from .feature_flags_manager import FeatureFlagsManager
+    from .local_data_store import LocalDataStore
+    from .task_scheduler import TaskScheduler
+    from .async_bridge import AsyncBridge
+    from .profiler import Profiler
+    from .search_history import SearchHistoryStore
 
 T = TypeVar('T')
 
@@ -48,9 +53,24 @@ class AppContext:
         # Register global managers
         from .feature_flags_manager import FeatureFlagsManager
         from ..tabs.tab_visibility_service import TabVisibilityService
+        from .local_data_store import LocalDataStore
+        from .task_scheduler import TaskScheduler
+        from .async_bridge import AsyncBridge
+        from .profiler import Profiler
+        from .search_history import SearchHistoryStore
 
         self.register('feature_flags', FeatureFlagsManager())
         self.register('tab_visibility', TabVisibilityService())
+        # Connection opens lazily, so this is free until a model uses it
+        self.register('data_store', LocalDataStore())
+        # One bounded pool for all background work
+        self.register('task_scheduler', TaskScheduler.shared())
+        # One asyncio loop for network-bound work (thread starts on first use)
+        self.register('async_bridge', AsyncBridge.shared())
+        # Opt-in operation timings (Settings > Performance)
+        self.register('profiler', Profiler.shared())
+        # Search history for all search features (opens on first use)
+        self.register('search_history', SearchHistoryStore.shared())
 
     @property
     def tab_visibility(self) -> 'TabVisibilityService':
@@ -64,6 +84,36 @@ class AppContext:
         from .feature_flags_manager import FeatureFlagsManager
         return self.get('feature_flags', FeatureFlagsManager)
 
+    @property
+    def data_store(self) -> 'LocalDataStore':
+        """Get the shared local data store with full type hints"""
+        from .local_data_store import LocalDataStore
+        return self.get('data_store', LocalDataStore)
+
+    @property
+    def task_scheduler(self) -> 'TaskScheduler':
+        """Get the shared background task scheduler with full type hints"""
+        from .task_scheduler import TaskScheduler
+        return self.get('task_scheduler', TaskScheduler)
+
+    @property
+    def async_bridge(self) -> 'AsyncBridge':
+        """Get the shared asyncio bridge with full type hints"""
+        from .async_bridge import AsyncBridge
+        return self.get('async_bridge', AsyncBridge)
+
+    @property
+    def profiler(self) -> 'Profiler':
+        """Get the shared profiler with full type hints"""
+        from .profiler import Profiler
+        return self.get('profiler', Profiler)
+
+    @property
+    def search_history(self) -> 'SearchHistoryStore':
+        """Get the shared search history store with full type hints"""
+        from .search_history import SearchHistoryStore
+        return self.get('search_history', SearchHistoryStore)
+
     def register(self, name: str, service: Any) -> 'AppContext':
         """Register a service with the context
 
@@ -0,0 +1,262 @@
+"""
+App Logging - Leveled, structured logging with per-module levels
+
+Replaces per-item print() calls on hot paths (searching, context enrichment,
+config reads). Messages go through the standard logging module:
+- Levels are set per module, so debug output can be turned on for one area
+  while disabled messages cost only a level check (use %-style arguments so
+  nothing is formatted unless the message is emitted)
+- Emitting is non-blocking: loggers put records on a queue and a listener
+  thread writes them to the console (and optionally a JSON-lines file)
+- Hot-path messages can be sampled: 1 in N records per call site is kept
+
+Levels come from (first found):
+- configure_logging(spec=...)
+- the PRODUCTIVITY_APP_LOG environment variable
+- the 'log_levels' app setting
+A spec is a default level followed by module overrides, with modules named
+relative to productivity_core:  "INFO,document_scanner=DEBUG,connector=WARNING"
+
+Usage:
+    from ..core.app_logging import get_logger, fields, sample
+
+    logger = get_logger(__name__)
+    logger.info("Search complete", extra=fields(results=len(results)))
+    logger.debug("Found %d match(es) in '%s'", len(matches), column)
+
+    # Inside a per-item loop: keep 1 in 100
+    logger.debug("Added context for '%s'", term, extra=sample(100))
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Logger that all application loggers live under
+ROOT_LOGGER = 'productivity_app'
+
+# Package that module names in level specs are relative to
+CORE_PACKAGE = 'productivity_app.productivity_core'
+
+# Environment variable holding a level spec
+LOG_ENV_VAR = 'PRODUCTIVITY_APP_LOG'
+
+# App setting holding a level spec
+SETTING_KEY = 'log_levels'
+
+DEFAULT_LEVEL = logging.INFO
+
+# JSON-lines log file rotation
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 2
+
+_LEVEL_ICONS = {
+    logging.WARNING: '⚠️ ',
+    logging.ERROR: '❌ ',
+    logging.CRITICAL: '❌ ',
+}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module (pass __name__)
+
+    Names outside the application package (e.g. modules imported from
+    their own directory) are placed under it so levels and handlers apply.
+    """
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + '.'):
+        name = f"{CORE_PACKAGE}.{name}"
+    return logging.getLogger(name)
+
+
+def fields(**values) -> Dict[str, Any]:
+    """extra= argument attaching structured fields to a record"""
+    return {'fields': values}
+
+
+def sample(every: int, **values) -> Dict[str, Any]:
+    """extra= argument keeping only 1 in `every` records from a call site
+
+    Args:
+        every: Keep the first record and then every Nth
+        **values: Structured fields, as for fields()
+    """
+    return {'fields': values, 'sample_every': every}
+
+
+class SamplingFilter(logging.Filter):
+    """Drops all but 1 in N records of sampled call sites
+
+    Runs in the logging thread before the record is queued, so dropped
+    records cost no formatting or I/O. Kept records get a 'sampled' field.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = getattr(record, 'sample_every', 1)
+        if every <= 1:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        if count % every:
+            return False
+        record.fields = dict(getattr(record, 'fields', {}), sampled=every)
+        return True
+
+
+class ConsoleFormatter(logging.Formatter):
+    """[module] message  key=value ... (matches the app's print style)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        module = record.name.rsplit('.', 1)[-1]
+        text = f"[{module}] {_LEVEL_ICONS.get(record.levelno, '')}{record.getMessage()}"
+        record_fields = getattr(record, 'fields', None)
+        if record_fields:
+            text += '  ' + ' '.join(f"{k}={v}" for k, v in record_fields.items())
+        if record.exc_info:
+            text += '\n' + self.formatException(record.exc_info)
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, thread, fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def parse_level_spec(spec: str) -> Tuple[Optional[int], Dict[str, int]]:
+    """Parse "INFO,document_scanner=DEBUG" into (default level, {logger: level})
+
+    Unknown level names are ignored.
+    """
+    default = None
+    modules: Dict[str, int] = {}
+    for part in (spec or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        module, _, level_name = part.rpartition('=')
+        level = logging.getLevelName(level_name.strip().upper())
+        if not isinstance(level, int):
+            print(f"[Logging] ⚠️ Unknown log level '{level_name}' in '{part}'")
+            continue
+        if module:
+            modules[_logger_name(module.strip())] = level
+        else:
+            default = level
+    return default, modules
+
+
+def _logger_name(module: str) -> str:
+    if module.startswith(ROOT_LOGGER):
+        return module
+    return f"{CORE_PACKAGE}.{module}"
+
+
+class _LoggingState:
+    listener: Optional[logging.handlers.QueueListener] = None
+    handler: Optional[logging.handlers.QueueHandler] = None
+    module_levels: Dict[str, int] = {}
+
+
+def configure_logging(spec: Optional[str] = None,
+                      json_file: Optional[Union[str, Path]] = None) -> logging.Logger:
+    """Install the queue handler and apply levels (safe to call again)
+
+    Args:
+        spec: Level spec (defaults to the environment variable, then the
+            'log_levels' app setting, then INFO)
+        json_file: Also write records as JSON lines to this file
+
+    Returns:
+        The application root logger
+    """
+    root = logging.getLogger(ROOT_LOGGER)
+
+    if spec is None:
+        spec = os.environ.get(LOG_ENV_VAR)
+    if spec is None:
+        from .config_manager import AppSettingsConfig
+        spec = AppSettingsConfig.get_setting(SETTING_KEY, '')
+    default, modules = parse_level_spec(spec)
+
+    # Reset previous overrides so a new spec fully replaces the old one
+    for name in _LoggingState.module_levels:
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    for name, level in modules.items():
+        logging.getLogger(name).setLevel(level)
+    _LoggingState.module_levels = modules
+    root.setLevel(default if default is not None else DEFAULT_LEVEL)
+
+    if _LoggingState.listener is None:
+        console = logging.StreamHandler()
+        console.setFormatter(ConsoleFormatter())
+        handlers = [console]
+        if json_file is not None:
+            Path(json_file).parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                json_file, maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(record_queue)
+        queue_handler.addFilter(SamplingFilter())
+        listener = logging.handlers.QueueListener(
+            record_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(shutdown_logging)
+
+        root.addHandler(queue_handler)
+        root.propagate = False
+        _LoggingState.listener = listener
+        _LoggingState.handler = queue_handler
+
+    return root
+
+
+def set_module_level(module: str, level: Union[int, str]):
+    """Change one module's level at runtime
+
+    Args:
+        module: Module name relative to productivity_core (or a full name)
+        level: Level number or name ('DEBUG', 'INFO', ...)
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    name = _logger_name(module)
+    logging.getLogger(name).setLevel(level)
+    _LoggingState.module_levels[name] = level
+
+
+def shutdown_logging():
+    """Write out queued records and stop the listener thread"""
+    listener, handler = _LoggingState.listener, _LoggingState.handler
+    if listener is None:
+        return
+    _LoggingState.listener = _LoggingState.handler = None
+    logging.getLogger(ROOT_LOGGER).removeHandler(handler)
+    logging.getLogger(ROOT_LOGGER).propagate = True
+    listener.stop()
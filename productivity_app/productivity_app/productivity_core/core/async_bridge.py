@@ -0,0 +1,221 @@
+"""
+Async Bridge - One asyncio event loop shared by all network-bound work
+
+Network operations (remote document transfers, DevOps queries) spend their
+time waiting, so they run as coroutines on a single asyncio loop instead of
+a thread each. The loop lives on one dedicated thread next to the Qt event
+loop; results come back to the UI thread through Qt signals, the same way
+TaskHandle results do.
+
+Usage:
+    bridge = context.get('async_bridge')
+
+    task = bridge.submit(client.list_documents(), name='list_documents')
+    task.finished.connect(on_documents)
+    task.error.connect(on_error)
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any, Coroutine, Dict, Optional
+
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
+from .app_logging import fields, get_logger, sample
+
+logger = get_logger(__name__)
+
+# Seconds shutdown() waits for cancelled coroutines to unwind
+SHUTDOWN_TIMEOUT = 3.0
+
+# Completed coroutines logged (1 in N); failures are always logged
+LOG_SAMPLE_EVERY = 20
+
+
+class AsyncTask(QObject):
+    """A coroutine submitted to the bridge
+
+    finished/error/cancelled are emitted in the thread that submitted the
+    coroutine once control returns to its event loop, so connecting right
+    after submit() never misses them (even if the coroutine is already done).
+    """
+
+    finished = Signal(object)  # return value
+    error = Signal(str)  # error_message
+    cancelled = Signal()
+
+    # Final status and payload, emitted on the loop thread and queued to the
+    # task's own thread (see _deliver)
+    _completed = Signal(str, object)
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+        self.status = 'running'
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+        self._future: Optional[concurrent.futures.Future] = None
+        self._keep_alive: Optional['AsyncTask'] = None
+        self._completed.connect(self._deliver, Qt.QueuedConnection)
+
+    def cancel(self):
+        """Cancel the coroutine (it sees CancelledError at its next await)"""
+        if self._future is not None:
+            self._future.cancel()
+
+    def is_active(self) -> bool:
+        return self.status == 'running'
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Block until the coroutine returns (for tests and scripts)"""
+        return self._future.result(timeout)
+
+    @property
+    def run_ms(self) -> float:
+        return ((self.finished_at or time.perf_counter()) - self.started_at) * 1000
+
+    def _on_done(self, future: concurrent.futures.Future):
+        """Record the outcome (on the loop thread) and queue its signal"""
+        self.finished_at = time.perf_counter()
+        payload = None
+        if future.cancelled():
+            self.status = 'cancelled'
+        elif future.exception() is not None:
+            exc = future.exception()
+            self.status = 'error'
+            logger.exception("Coroutine %s raised", self.name, exc_info=exc)
+            payload = str(exc) or type(exc).__name__
+        else:
+            self.status = 'finished'
+            payload = future.result()
+        # Stay alive until delivered even if the submitter dropped the task
+        self._keep_alive = self
+        self._completed.emit(self.status, payload)
+
+    @Slot(str, object)
+    def _deliver(self, status: str, payload: Any):
+        self._keep_alive = None
+        if status == 'finished':
+            self.finished.emit(payload)
+        elif status == 'error':
+            self.error.emit(payload)
+        else:
+            self.cancelled.emit()
+
+
+class AsyncBridge(QObject):
+    """Runs coroutines on a shared asyncio loop and reports back via signals
+
+    The loop thread starts on first use. Register one instance in AppContext
+    as 'async_bridge'; code without a context can use AsyncBridge.shared().
+    """
+
+    _shared: Optional['AsyncBridge'] = None
+
+    def __init__(self):
+        super().__init__()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._tasks: Dict[int, AsyncTask] = {}
+
+    @classmethod
+    def shared(cls) -> 'AsyncBridge':
+        """Process-wide bridge (created on first use)"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The bridge's event loop, starting its thread if needed"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start_loop()
+            return self._loop
+
+    def _start_loop(self):
+        ready = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name='AsyncBridge', daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+
+    def submit(self, coro: Coroutine, name: Optional[str] = None) -> AsyncTask:
+        """Schedule a coroutine on the loop
+
+        Args:
+            coro: Coroutine object to run
+            name: Name used in log output (defaults to the coroutine's name)
+
+        Returns:
+            AsyncTask whose finished/error/cancelled signals report the outcome
+        """
+        task = AsyncTask(name or getattr(coro, '__name__', 'coroutine'))
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        task._future = future
+        with self._lock:
+            self._tasks[id(task)] = task
+        future.add_done_callback(lambda f: self._task_done(task, f))
+        return task
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block for its result
+
+        For synchronous callers off the UI thread (pool tasks, scripts).
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def _task_done(self, task: AsyncTask, future: concurrent.futures.Future):
+        with self._lock:
+            self._tasks.pop(id(task), None)
+        task._on_done(future)
+        values = dict(task=task.name, status=task.status, run_ms=round(task.run_ms))
+        if task.status == 'error':
+            logger.debug("Coroutine %s failed after %.0f ms", task.name, task.run_ms,
+                         extra=fields(**values))
+        else:
+            logger.debug("Coroutine %s %s in %.0f ms", task.name, task.status,
+                         task.run_ms, extra=sample(LOG_SAMPLE_EVERY, **values))
+
+    def active_count(self) -> int:
+        """Number of coroutines still running"""
+        with self._lock:
+            return len(self._tasks)
+
+    def cancel_all(self):
+        """Cancel every running coroutine"""
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT):
+        """Cancel running coroutines and stop the loop thread"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+
+        async def drain():
+            pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for pending_task in pending:
+                pending_task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(drain(), loop).result(timeout)
+        except (concurrent.futures.TimeoutError, RuntimeError):
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
@@ -0,0 +1,268 @@
+"""
+Async HTTP - Minimal HTTP/1.1 client on asyncio streams
+
+Enough HTTP for the remote services (JSON APIs and file transfers) without
+adding a client library dependency. Runs on the AsyncBridge loop, so any
+number of requests can be in flight without a thread each.
+
+Usage:
+    data = await get_json("https://example.com/api/items")
+    await download("https://example.com/file.xlsx", "file.xlsx",
+                   progress=lambda done, total: print(done, total))
+"""
+import asyncio
+import json
+import re
+import ssl
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import quote, urlsplit
+
+# Default timeout in seconds for connecting and for each read or write (a
+# transfer may take longer as long as data keeps moving)
+DEFAULT_TIMEOUT = 30.0
+
+# Bytes read per chunk when streaming a response body
+READ_CHUNK_SIZE = 64 * 1024
+
+# Header names are RFC 9110 tokens
+_HEADER_NAME = re.compile(r"[!#$%&'*+.^_`|~0-9A-Za-z-]+")
+
+# Printable ASCII left as is by header_value() ('%' is encoded)
+_HEADER_SAFE = ''.join(chr(c) for c in range(0x20, 0x7f) if chr(c) != '%')
+
+
+class HttpError(Exception):
+    """Non-2xx response (or a malformed one, with status 0)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}" if status else message)
+        self.status = status
+
+
+@dataclass
+class HttpResponse:
+    """Status, lower-cased headers and body of a response"""
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode('utf-8')) if self.body else None
+
+    def raise_for_status(self):
+        if not 200 <= self.status < 300:
+            detail = self.body[:200].decode('utf-8', errors='replace')
+            raise HttpError(self.status, detail or self.reason)
+
+
+def header_value(text: str) -> str:
+    """Text as a header value: non-ASCII and control characters (CR/LF
+    included) and '%' are percent-encoded as UTF-8, so the service unquotes
+    it to get the text back"""
+    return quote(text, safe=_HEADER_SAFE)
+
+
+def _header_line(name: str, value: Any) -> str:
+    """Validated "name: value" line (ValueError for names or values that
+    would break the request, e.g. with CR/LF)"""
+    value = str(value)
+    if not _HEADER_NAME.fullmatch(name):
+        raise ValueError(f"Invalid header name: {name!r}")
+    if any(char in value for char in '\r\n\0'):
+        raise ValueError(f"Header {name} contains a line break")
+    try:
+        value.encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError(
+            f"Header {name} is not ASCII (encode it with header_value())") from None
+    return f"{name}: {value}"
+
+
+async def request(method: str, url: str, body: Optional[bytes] = None,
+                  headers: Optional[Dict[str, str]] = None,
+                  timeout: float = DEFAULT_TIMEOUT,
+                  on_chunk: Optional[Callable[[bytes, Optional[int]], None]] = None) -> HttpResponse:
+    """Send one request and read the whole response
+
+    Args:
+        method: HTTP method
+        url: http:// or https:// URL
+        body: Request body
+        headers: Extra request headers (ASCII values; see header_value())
+        timeout: Seconds allowed for connecting and for each read or write,
+            so large bodies are not cut off while data keeps arriving
+        on_chunk: Called with each body chunk and the total length (if
+            known) instead of buffering the body in the response
+
+    Returns:
+        HttpResponse (body is empty when on_chunk is given)
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https'):
+        raise ValueError(f"Unsupported URL scheme: {url}")
+    secure = parts.scheme == 'https'
+    port = parts.port or (443 if secure else 80)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+
+    lines = [f"{method} {target} HTTP/1.1",
+             f"Host: {parts.netloc}",
+             "Connection: close",
+             "Accept-Encoding: identity"]
+    if body is not None:
+        lines.append(f"Content-Length: {len(body)}")
+    lines.extend(_header_line(name, value) for name, value in (headers or {}).items())
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(
+        parts.hostname, port, ssl=ssl.create_default_context() if secure else None),
+        timeout)
+    reader = _TimedReader(reader, timeout)
+    try:
+        writer.write(head)
+        if body:
+            writer.write(body)
+        await asyncio.wait_for(writer.drain(), timeout)
+
+        status, reason, response_headers = await _read_head(reader)
+        if method == 'HEAD' or status in (204, 304):
+            content = b''
+        elif response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            content = await _read_chunked(reader, on_chunk)
+        else:
+            length = response_headers.get('content-length')
+            content = await _read_body(
+                reader, int(length) if length is not None else None, on_chunk)
+        return HttpResponse(status, reason, response_headers, content)
+    finally:
+        writer.close()
+
+
+class _TimedReader:
+    """StreamReader whose reads each time out separately"""
+
+    def __init__(self, reader: asyncio.StreamReader, timeout: float):
+        self._reader = reader
+        self._timeout = timeout
+
+    async def readline(self) -> bytes:
+        return await asyncio.wait_for(self._reader.readline(), self._timeout)
+
+    async def read(self, size: int) -> bytes:
+        return await asyncio.wait_for(self._reader.read(size), self._timeout)
+
+    async def readexactly(self, size: int) -> bytes:
+        return await asyncio.wait_for(self._reader.readexactly(size), self._timeout)
+
+
+async def _read_head(reader):
+    status_line = (await reader.readline()).decode('latin-1').strip()
+    try:
+        _, status, *reason = status_line.split(' ', 2)
+        status = int(status)
+    except ValueError:
+        raise HttpError(0, f"Malformed status line: {status_line!r}")
+
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode('latin-1')
+        if line in ('\r\n', '\n', ''):
+            break
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return status, reason[0] if reason else '', headers
+
+
+async def _read_body(reader, length, on_chunk) -> bytes:
+    chunks = []
+    remaining = length
+    while remaining is None or remaining > 0:
+        size = READ_CHUNK_SIZE if remaining is None else min(READ_CHUNK_SIZE, remaining)
+        chunk = await reader.read(size)
+        if not chunk:
+            if remaining:
+                raise HttpError(0, "Connection closed before the body was complete")
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk, length)
+        else:
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+async def _read_chunked(reader, on_chunk) -> bytes:
+    chunks = []
+    while True:
+        size_line = (await reader.readline()).decode('latin-1').strip()
+        size = int(size_line.split(';')[0] or '0', 16)
+        if size == 0:
+            # Skip trailers
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            break
+        chunk = await reader.readexactly(size)
+        await reader.readexactly(2)  # CRLF after each chunk
+        if on_chunk is not None:
+            on_chunk(chunk, None)
+        else:
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+async def get_json(url: str, headers: Optional[Dict[str, str]] = None,
+                   timeout: float = DEFAULT_TIMEOUT) -> Any:
+    """GET a URL and decode its JSON body (raises HttpError on failure)"""
+    response = await request(
+        'GET', url, headers={'Accept': 'application/json', **(headers or {})},
+        timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+async def post_json(url: str, payload: Any, headers: Optional[Dict[str, str]] = None,
+                    timeout: float = DEFAULT_TIMEOUT) -> Any:
+    """POST a JSON payload and decode the JSON response"""
+    response = await request(
+        'POST', url, body=json.dumps(payload).encode('utf-8'),
+        headers={'Content-Type': 'application/json',
+                 'Accept': 'application/json', **(headers or {})},
+        timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+async def download(url: str, path: str, headers: Optional[Dict[str, str]] = None,
+                   progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                   timeout: float = DEFAULT_TIMEOUT) -> int:
+    """Stream a URL's body to a file
+
+    Args:
+        url: Source URL
+        path: Destination file path
+        headers: Extra request headers
+        progress: Called with (bytes received, total bytes or None)
+        timeout: Seconds allowed for connecting and for each read (not for
+            the whole transfer)
+
+    Returns:
+        Number of bytes written
+    """
+    received = 0
+    with open(path, 'wb') as file:
+        def write_chunk(chunk: bytes, total: Optional[int]):
+            nonlocal received
+            file.write(chunk)
+            received += len(chunk)
+            if progress is not None:
+                progress(received, total)
+
+        response = await request('GET', url, headers=headers, timeout=timeout,
+                                 on_chunk=write_chunk)
+    if not 200 <= response.status < 300:
+        raise HttpError(response.status, response.reason)
+    return received
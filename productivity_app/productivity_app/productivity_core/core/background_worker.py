@@ -1,12 +1,15 @@
 """
 Generic Background Worker - Reusable threading for background tasks
+
+Workers run on the shared TaskScheduler pool rather than a thread each.
 """
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, Signal
 from typing import Callable, Any, Optional
+from .task_scheduler import TaskHandle, TaskPriority, TaskScheduler
 
 
-class BackgroundWorker(QThread):
-    """Generic worker for executing functions in background threads
+class BackgroundWorker(QObject):
+    """Generic worker for executing functions on the shared task pool
 
     Usage:
         def my_task(arg1, arg2):
@@ -16,7 +19,7 @@ class BackgroundWorker(QThread):
         worker = BackgroundWorker(my_task, arg1, arg2)
         worker.finished.connect(lambda result: print(f"Done: {result}"))
         worker.error.connect(lambda err: print(f"Error: {err}"))
-        worker.start()
+        worker.start(priority=TaskPriority.INTERACTIVE)
     """
 
     # Signals
@@ -37,10 +40,34 @@ class BackgroundWorker(QThread):
         self.args = args
         self.kwargs = kwargs
         self._is_cancelled = False
+        self._task: Optional[TaskHandle] = None
+        self._scheduler: Optional[TaskScheduler] = None
+
+    def start(self, priority: TaskPriority = TaskPriority.NORMAL,
+              scheduler: Optional[TaskScheduler] = None) -> TaskHandle:
+        """Queue the work on the task scheduler
+
+        Args:
+            priority: Pool priority
+            scheduler: Scheduler to use (defaults to the shared one)
+
+        Returns:
+            TaskHandle for timing and cancellation
+        """
+        self._scheduler = scheduler or TaskScheduler.shared()
+        self._task = self._scheduler.submit_worker(
+            self, name=getattr(self.work_func, '__name__', None), priority=priority)
+        return self._task
+
+    def is_running(self) -> bool:
+        """Check if the work is queued or running"""
+        return self._task is not None and self._task.is_active()
 
     def cancel(self):
         """Request cancellation of the background task"""
         self._is_cancelled = True
+        if self._task is not None and not self._task.is_cancelled:
+            self._scheduler.cancel(self._task)
 
     def is_cancelled(self) -> bool:
         """Check if cancellation was requested"""
@@ -63,7 +90,7 @@ class BackgroundWorker(QThread):
                 traceback.print_exc()
 
 
-class ProgressiveBackgroundWorker(QThread):
+class ProgressiveBackgroundWorker(BackgroundWorker):
     """Background worker with built-in progress reporting
 
     The work function should accept a progress_callback parameter:
@@ -82,33 +109,6 @@ class ProgressiveBackgroundWorker(QThread):
         worker.start()
     """
 
-    # Signals
-    progress = Signal(int, str)  # progress_percent, status_message
-    finished = Signal(object)  # result data
-    error = Signal(str)  # error_message
-
-    def __init__(self, work_func: Callable, *args, **kwargs):
-        """Initialize progressive background worker
-
-        Args:
-            work_func: Function to execute (must accept progress_callback parameter)
-            *args: Positional arguments to pass to work_func
-            **kwargs: Keyword arguments to pass to work_func
-        """
-        super().__init__()
-        self.work_func = work_func
-        self.args = args
-        self.kwargs = kwargs
-        self._is_cancelled = False
-
-    def cancel(self):
-        """Request cancellation of the background task"""
-        self._is_cancelled = True
-
-    def is_cancelled(self) -> bool:
-        """Check if cancellation was requested"""
-        return self._is_cancelled
-
     def _progress_callback(self, percent: int, message: str):
         """Internal progress callback that emits signal"""
         if not self._is_cancelled:
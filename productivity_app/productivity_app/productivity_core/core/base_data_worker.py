@@ -38,6 +38,7 @@ class BaseDataWorker(QObject):
     progress = Signal(int, str)  # progress_percent, status_message
     finished = Signal(object)  # loaded data (any type)
     error = Signal(str)  # error_message
+    cancelled = Signal()  # stopped before finishing (see TaskScheduler.submit_worker)
 
     def __init__(self):
         super().__init__()
@@ -87,6 +87,12 @@ UI_STYLES = {
     }
 }
 
+# Search-as-you-type timing (Document Scanner and Connector Lookup)
+SEARCH_AS_YOU_TYPE = {
+    "delay_ms": 300,   # Pause in typing before a search starts
+    "min_chars": 2,    # Shorter text is not searched while typing
+}
+
 # Application Settings
 APP_SETTINGS = {
     "window_title": "Swiss Army Tool",
@@ -99,6 +105,8 @@ APP_SETTINGS = {
 CONFIG_FILES = {
     "document_scanner": "document_scanner.json",
     "app_settings": "app_settings.json",
+    "local_data_store": "local_data_store.sqlite3",
+    "search_history": "search_history.sqlite3",
 }
 
 # Configuration Directory Path Configuration
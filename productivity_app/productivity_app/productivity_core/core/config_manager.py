@@ -2,14 +2,35 @@
 Centralized Configuration Manager
 
 Handles all persistent configuration storage in configurable directory.
-Implements in-memory caching to reduce file I/O overhead.
+
+Write-behind persistence:
+- The in-memory copy of each config file is authoritative once loaded;
+  reads never touch the disk unless the file was changed by someone else
+  (detected by its modification time)
+- save_config() updates memory and returns; a background writer thread
+  flushes changed files after a short debounce, so bursts of saves become
+  one write and the UI thread never waits on disk I/O
+- Files are written to a temporary file and renamed over the original, so
+  a crash mid-write never leaves a truncated config
+- Subscribers are called with the changed top-level keys whenever a
+  config changes (through save_config or an external edit)
+
+Call ConfigManager.flush() before exit (also registered with atexit).
 """
+import atexit
+import copy
 import json
+import os
+import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set
 from . import config
 from .config import CONFIG_FILES
+from .app_logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class ConfigManager:
@@ -19,10 +40,34 @@ class ConfigManager:
     DOCUMENT_SCANNER_CONFIG = CONFIG_FILES["document_scanner"]
     APP_SETTINGS_CONFIG = CONFIG_FILES["app_settings"]
 
-    # In-memory cache to reduce file I/O
-    # Format: {config_name: (timestamp, data)}
-    _cache: Dict[str, Tuple[float, Any]] = {}
-    _cache_ttl = 2.0  # Cache TTL in seconds (2 second cache)
+    # Seconds between the last save of a burst and the background write
+    FLUSH_DELAY = 0.5
+
+    # Attempts at replacing a file that is briefly locked (e.g. by a virus
+    # scanner on Windows)
+    REPLACE_ATTEMPTS = 3
+
+    # config_name -> authoritative data
+    _state: Dict[str, Any] = {}
+    # config_name -> JSON text of the last saved/loaded data (change detection)
+    _snapshots: Dict[str, str] = {}
+    # config_name -> file mtime (ns) when last read/written, None if no file
+    _mtimes: Dict[str, Optional[int]] = {}
+    # config_name -> save counter, and the last counter written to disk
+    _versions: Dict[str, int] = {}
+    _written_versions: Dict[str, int] = {}
+    # Configs saved but not yet written
+    _dirty: Set[str] = set()
+    _pending: Set[str] = set()
+    _last_save = 0.0
+
+    _subscribers: Dict[str, List[Callable[[Set[str]], None]]] = {}
+
+    _lock = threading.RLock()
+    _cond = threading.Condition(_lock)
+    _io_lock = threading.Lock()
+    _writer: Optional[threading.Thread] = None
+    _flush_now = False
 
     @classmethod
     def _get_config_dir(cls) -> Path:
@@ -55,87 +100,293 @@ class ConfigManager:
         """
         return cls._get_config_dir() / config_name
 
+    # ------------------------------------------------------------------
+    # Reading and writing
+    # ------------------------------------------------------------------
+
     @classmethod
     def save_config(cls, config_name: str, data: Any) -> bool:
-        """Save configuration data to file and invalidate cache
+        """Save configuration data (written to disk in the background)
 
         Args:
             config_name: Name of the config file
             data: Data to save (must be JSON-serializable)
 
         Returns:
-            True if successful, False otherwise
+            True if the data was accepted, False if it is not serializable
         """
         try:
-            config_path = cls.get_config_path(config_name)
-            print(f"📝 Saving to: {config_path.absolute()}")
-            print(f"📝 Data type: {type(data)}")
-            if isinstance(data, dict) and 'documents' in data:
-                print(f"📝 Number of documents: {len(data['documents'])}")
-
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-
-            # Invalidate cache after successful save
-            cls._cache.pop(config_name, None)
-            print(f"✓ Saved configuration: {config_path}")
-            return True
-        except Exception as e:
-            print(f"❌ ERROR saving configuration '{config_name}': {e}")
-            import traceback
-            traceback.print_exc()
+            text = json.dumps(data, indent=2)
+        except (TypeError, ValueError) as e:
+            logger.error("Configuration '%s' is not JSON-serializable: %s", config_name, e)
             return False
 
+        with cls._lock:
+            old_text = cls._snapshots.get(config_name)
+            cls._state[config_name] = copy.deepcopy(data)
+            if text == old_text:
+                return True
+            cls._snapshots[config_name] = text
+            cls._versions[config_name] = cls._versions.get(config_name, 0) + 1
+            cls._dirty.add(config_name)
+            cls._pending.add(config_name)
+            cls._last_save = time.monotonic()
+            cls._ensure_writer()
+            cls._cond.notify_all()
+
+        logger.debug("Queued write of %s", config_name)
+        cls._publish(config_name, old_text, data)
+        return True
+
     @classmethod
     def load_config(cls, config_name: str, default: Any = None) -> Any:
-        """Load configuration data from file with caching
+        """Load configuration data (from memory unless changed on disk)
 
         Args:
             config_name: Name of the config file
             default: Default value to return if file doesn't exist
 
         Returns:
-            Loaded data or default value
+            Copy of the loaded data (changes take effect through save_config),
+            or default value
         """
+        with cls._lock:
+            if config_name in cls._state and (
+                    config_name in cls._pending or cls._unchanged_on_disk(config_name)):
+                logger.debug("Cache hit for: %s", config_name)
+                state = cls._state[config_name]
+                return default if state is None else copy.deepcopy(state)
+            had_state = config_name in cls._state
+            old_text = cls._snapshots.get(config_name)
+
+        config_path = cls.get_config_path(config_name)
+        logger.debug("Looking for config at: %s", config_path.absolute())
         try:
-            config_path = cls.get_config_path(config_name)
+            mtime = cls._file_mtime(config_name)
+            if mtime is None:
+                logger.debug("Configuration file %s not found, using default", config_name)
+                data, text = None, None
+            else:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                data = json.loads(text)
+                logger.debug("Loaded configuration: %s", config_path)
+        except Exception as e:
+            logger.exception("Error loading configuration '%s': %s", config_name, e)
+            return default
 
-            # Check cache first (avoids file I/O)
-            if config_name in cls._cache:
-                timestamp, cached_data = cls._cache[config_name]
-                if time.time() - timestamp < cls._cache_ttl:
-                    print(f"📖 Cache hit for: {config_name}")
-                    return cached_data
+        with cls._lock:
+            if config_name in cls._pending:
+                # Saved while we were reading - memory wins
+                state = cls._state[config_name]
+                return default if state is None else copy.deepcopy(state)
+            cls._state[config_name] = copy.deepcopy(data)
+            cls._mtimes[config_name] = mtime
+            new_text = None if text is None else json.dumps(data, indent=2)
+            if new_text is None:
+                cls._snapshots.pop(config_name, None)
+            else:
+                cls._snapshots[config_name] = new_text
+
+        if had_state and new_text != old_text:
+            # Changed by another process or an editor
+            logger.info("Configuration %s changed on disk, reloaded", config_name)
+            cls._publish(config_name, old_text, data)
+        return default if data is None else data
 
-            print(f"📖 Looking for config at: {config_path.absolute()}")
-            print(f"📖 File exists: {config_path.exists()}")
+    @classmethod
+    def _file_mtime(cls, config_name: str) -> Optional[int]:
+        try:
+            return os.stat(cls.get_config_path(config_name)).st_mtime_ns
+        except FileNotFoundError:
+            return None
 
-            if not config_path.exists():
-                print(f"ℹ️  Configuration file not found, using default")
-                # Cache the default value too
-                cls._cache[config_name] = (time.time(), default)
-                return default
+    @classmethod
+    def _unchanged_on_disk(cls, config_name: str) -> bool:
+        return cls._file_mtime(config_name) == cls._mtimes.get(config_name)
 
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    # ------------------------------------------------------------------
+    # Background writer
+    # ------------------------------------------------------------------
 
-            # Store in cache
-            cls._cache[config_name] = (time.time(), data)
+    @classmethod
+    def _ensure_writer(cls):
+        """Start the writer thread (caller holds _lock)"""
+        if cls._writer is None or not cls._writer.is_alive():
+            cls._writer = threading.Thread(
+                target=cls._writer_loop, name='ConfigWriter', daemon=True)
+            cls._writer.start()
+            atexit.register(cls.flush)
 
-            print(f"✓ Loaded configuration: {config_path}")
-            if isinstance(data, dict) and 'documents' in data:
-                print(f"✓ Loaded {len(data['documents'])} document(s)")
-            return data
+    @classmethod
+    def _writer_loop(cls):
+        while True:
+            with cls._cond:
+                while not cls._dirty:
+                    cls._cond.wait()
+                # Debounce: wait until saves have been quiet for FLUSH_DELAY
+                while not cls._flush_now:
+                    remaining = cls._last_save + cls.FLUSH_DELAY - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cls._cond.wait(remaining)
+                batch = cls._take_dirty()
+            cls._write_batch(batch)
 
-        except Exception as e:
-            print(f"❌ ERROR loading configuration '{config_name}': {e}")
-            import traceback
-            traceback.print_exc()
-            return default
+    @classmethod
+    def _take_dirty(cls) -> Dict[str, tuple]:
+        """Snapshots to write, as {name: (text, version)} (caller holds _lock)"""
+        batch = {name: (cls._snapshots.get(name), cls._versions[name])
+                 for name in cls._dirty}
+        cls._dirty.clear()
+        return batch
+
+    @classmethod
+    def _write_batch(cls, batch: Dict[str, tuple]):
+        for config_name, (text, version) in batch.items():
+            with cls._io_lock:
+                if version <= cls._written_versions.get(config_name, 0):
+                    continue  # A newer version was already written
+                try:
+                    if text is None:
+                        mtime = cls._delete_file(config_name)
+                    else:
+                        mtime = cls._write_file(config_name, text)
+                except Exception as e:
+                    logger.exception("Error saving configuration '%s': %s", config_name, e)
+                    with cls._lock:
+                        cls._pending.discard(config_name)
+                    continue
+                cls._written_versions[config_name] = version
+
+            with cls._lock:
+                cls._mtimes[config_name] = mtime
+                if cls._versions.get(config_name) == version:
+                    cls._pending.discard(config_name)
+                cls._cond.notify_all()
+
+    @classmethod
+    def _write_file(cls, config_name: str, text: str) -> int:
+        """Write text atomically (temp file + rename), returning the new mtime"""
+        config_path = cls.get_config_path(config_name)
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=config_path.parent, prefix=f".{config_name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            for attempt in range(cls.REPLACE_ATTEMPTS):
+                try:
+                    os.replace(temp_path, config_path)
+                    break
+                except PermissionError:
+                    if attempt == cls.REPLACE_ATTEMPTS - 1:
+                        raise
+                    time.sleep(0.05)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        logger.info("✓ Saved configuration: %s", config_path)
+        return os.stat(config_path).st_mtime_ns
+
+    @classmethod
+    def _delete_file(cls, config_name: str) -> None:
+        config_path = cls.get_config_path(config_name)
+        if config_path.exists():
+            config_path.unlink()
+            logger.info("✓ Deleted configuration: %s", config_path)
+        return None
+
+    @classmethod
+    def flush(cls, timeout: float = 5.0) -> bool:
+        """Write all pending changes now
+
+        Args:
+            timeout: Seconds to wait for a write already in progress
+
+        Returns:
+            True if nothing is left to write
+        """
+        with cls._lock:
+            batch = cls._take_dirty()
+        cls._write_batch(batch)
+
+        deadline = time.monotonic() + timeout
+        with cls._cond:
+            # A batch the writer thread took before us may still be in flight
+            while cls._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                cls._cond.wait(remaining)
+        return True
+
+    # ------------------------------------------------------------------
+    # Change notifications
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def subscribe(cls, config_name: str, callback: Callable[[Set[str]], None]):
+        """Call callback(changed_keys) whenever a config changes
+
+        changed_keys holds the top-level keys whose values changed (for
+        configs that are not dicts, it is empty). Callbacks run on the
+        thread that saved or reloaded the config.
+
+        Args:
+            config_name: Name of the config file
+            callback: Function receiving the set of changed keys
+        """
+        with cls._lock:
+            cls._subscribers.setdefault(config_name, []).append(callback)
+
+    @classmethod
+    def unsubscribe(cls, config_name: str, callback: Callable) -> bool:
+        """Remove a callback added with subscribe()
+
+        Returns:
+            True if the callback was removed
+        """
+        with cls._lock:
+            callbacks = cls._subscribers.get(config_name, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+                return True
+        return False
+
+    @classmethod
+    def _publish(cls, config_name: str, old_text: Optional[str], new: Any):
+        """Call subscribers with the keys that differ between old_text and new"""
+        with cls._lock:
+            callbacks = list(cls._subscribers.get(config_name, []))
+        if not callbacks:
+            return
+        old = json.loads(old_text) if old_text else None
+        if isinstance(old, dict) and isinstance(new, dict):
+            changed = {key for key in old.keys() | new.keys()
+                       if old.get(key) != new.get(key)}
+        elif isinstance(new, dict):
+            changed = set(new)
+        elif isinstance(old, dict):
+            changed = set(old)
+        else:
+            changed = set()
+        for callback in callbacks:
+            try:
+                callback(changed)
+            except Exception as e:
+                logger.exception("Error in config subscriber for %s: %s", config_name, e)
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
 
     @classmethod
     def config_exists(cls, config_name: str) -> bool:
-        """Check if a configuration file exists
+        """Check if a configuration exists (saved, possibly not yet written)
 
         Args:
             config_name: Name of the config file
@@ -143,73 +394,76 @@ class ConfigManager:
         Returns:
             True if file exists, False otherwise
         """
+        with cls._lock:
+            if config_name in cls._pending:
+                return cls._snapshots.get(config_name) is not None
         return cls.get_config_path(config_name).exists()
 
     @classmethod
     def delete_config(cls, config_name: str) -> bool:
-        """Delete a configuration file and invalidate cache
+        """Delete a configuration (the file is removed in the background)
 
         Args:
             config_name: Name of the config file
 
         Returns:
-            True if successful, False otherwise
+            True if the configuration existed, False otherwise
         """
-        try:
-            config_path = cls.get_config_path(config_name)
-            if config_path.exists():
-                config_path.unlink()
-                # Invalidate cache
-                cls._cache.pop(config_name, None)
-                print(f"✓ Deleted configuration: {config_path}")
-                return True
-            return False
-        except Exception as e:
-            print(f"❌ ERROR deleting configuration '{config_name}': {e}")
+        if not cls.config_exists(config_name):
             return False
+        with cls._lock:
+            old_text = cls._snapshots.pop(config_name, None)
+            cls._state[config_name] = None
+            cls._versions[config_name] = cls._versions.get(config_name, 0) + 1
+            cls._dirty.add(config_name)
+            cls._pending.add(config_name)
+            cls._last_save = time.monotonic()
+            cls._ensure_writer()
+            cls._cond.notify_all()
+        cls._publish(config_name, old_text, None)
+        return True
 
     @classmethod
     def clear_cache(cls, config_name: str = None) -> None:
-        """Clear cache for one or all config files
+        """Drop in-memory copies so the next load reads the file
+
+        Configs with changes not yet written are kept.
 
         Args:
-            config_name: Optional specific config to clear. If None, clears all cache.
+            config_name: Optional specific config to clear. If None, clears all.
         """
-        if config_name:
-            if config_name in cls._cache:
-                cls._cache.pop(config_name)
-                print(f"✓ Cleared cache for: {config_name}")
-        else:
-            cache_size = len(cls._cache)
-            cls._cache.clear()
-            print(f"✓ Cleared cache for all {cache_size} config file(s)")
+        with cls._lock:
+            names = [config_name] if config_name else list(cls._state)
+            cleared = 0
+            for name in names:
+                if name in cls._state and name not in cls._pending:
+                    del cls._state[name]
+                    cls._snapshots.pop(name, None)
+                    cls._mtimes.pop(name, None)
+                    cleared += 1
+        logger.debug("Cleared %d cached config file(s)", cleared)
 
     @classmethod
     def get_cache_stats(cls) -> Dict[str, Any]:
-        """Get cache statistics for debugging
+        """Get in-memory state statistics for debugging
 
         Returns:
             Dict with cache info
         """
-        now = time.time()
-        stats = {
-            'cached_files': len(cls._cache),
-            'cache_ttl_seconds': cls._cache_ttl,
-            'files': {}
-        }
-
-        for config_name, (timestamp, data) in cls._cache.items():
-            age = now - timestamp
-            is_valid = age < cls._cache_ttl
-            stats['files'][config_name] = {
-                'age_seconds': round(age, 2),
-                'is_valid': is_valid,
-                'data_type': type(data).__name__,
-                'size_bytes': len(json.dumps(data)) if data else 0
+        with cls._lock:
+            return {
+                'cached_files': len(cls._state),
+                'pending_writes': sorted(cls._pending),
+                'files': {
+                    name: {
+                        'pending': name in cls._pending,
+                        'data_type': type(data).__name__,
+                        'size_bytes': len(cls._snapshots.get(name) or ''),
+                    }
+                    for name, data in cls._state.items()
+                },
             }
 
-        return stats
-
 
 class DocumentScannerConfig:
     """Helper class for Document Scanner configuration"""
@@ -252,28 +506,21 @@ class DocumentScannerConfig:
         return cls.save_documents([])
 
     @classmethod
-    def save_search_history(cls, history: List[str]) -> bool:
-        """Save search history
-
-        Args:
-            history: List of search terms (most recent first)
-
-        Returns:
-            True if successful, False otherwise
-        """
-        config_data = ConfigManager.load_config(cls.CONFIG_NAME, default={})
-        config_data["search_history"] = history
-        return ConfigManager.save_config(cls.CONFIG_NAME, config_data)
+    def take_search_history(cls) -> List[str]:
+        """Remove and return the search history stored in this config
 
-    @classmethod
-    def load_search_history(cls) -> List[str]:
-        """Load search history
+        Search history now lives in the shared SearchHistoryStore; this is
+        used once to move an older history list across.
 
         Returns:
             List of search terms (most recent first), or empty list if none exist
         """
         config_data = ConfigManager.load_config(cls.CONFIG_NAME, default={})
-        return config_data.get("search_history", [])
+        history = config_data.pop("search_history", None)
+        if history is None:
+            return []
+        ConfigManager.save_config(cls.CONFIG_NAME, config_data)
+        return history
 
 
 class AppSettingsConfig:
@@ -0,0 +1,261 @@
+"""
+Excel Reader - Streams worksheets into compact DataFrames
+
+pd.read_excel() loads the whole workbook through openpyxl and builds a
+grid of every cell before the DataFrame is made, so a large sheet needs
+several times its final size in memory. read_excel_sheet() instead:
+- Uses the calamine engine when python-calamine is installed (much faster)
+- Otherwise streams rows with openpyxl in read-only mode, keeping only the
+  wanted columns after the header row, one value list per column
+- Optionally stores the result with compact dtypes (small integers,
+  categories for repetitive text)
+- Reports progress every PROGRESS_ROWS rows
+
+The frame matches what pd.read_excel(path, sheet_name, header=header)
+returns (Unnamed/duplicate column names, empty and "NA" cells as NaN,
+whole floats as ints, trailing empty rows dropped).
+
+Usage:
+    df = read_excel_sheet('parts.xlsx', header=2,
+                          usecols=['Part Number', 'Description'],
+                          compact=True)
+"""
+import importlib.util
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .app_logging import get_logger
+from .profiler import profile_span
+
+logger = get_logger(__name__)
+
+# Rows between progress reports
+PROGRESS_ROWS = 10_000
+
+# Text columns with at most this share of distinct values become categories
+CATEGORY_RATIO = 0.5
+
+# Cell text read as missing (pandas' default na_values)
+_NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+})
+
+# Suffixes openpyxl can stream
+_OPENPYXL_SUFFIXES = {'.xlsx', '.xlsm', '.xltx', '.xltm'}
+
+# progress(rows read, total rows or None if unknown)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def calamine_available() -> bool:
+    """True if the calamine engine (python-calamine) is installed"""
+    return importlib.util.find_spec('python_calamine') is not None
+
+
+def read_excel_sheet(path: Union[str, Path], sheet_name: Union[str, int, None] = 0,
+                     header: Optional[int] = 0, usecols: Optional[Iterable[str]] = None,
+                     nrows: Optional[int] = None, compact: bool = False,
+                     progress: Optional[ProgressCallback] = None,
+                     engine: Optional[str] = None) -> pd.DataFrame:
+    """Read one worksheet into a DataFrame
+
+    Args:
+        path: Workbook path (.xlsx/.xlsm stream; .xls uses pandas' reader)
+        sheet_name: Sheet name or position (None for the first sheet)
+        header: Sheet row (0-based) holding the column names, None for none
+        usecols: Column names to keep (missing names are ignored; all
+            columns if None). Needs a header row.
+        nrows: Stop after this many data rows
+        compact: Store with compact dtypes (see compact_dtypes)
+        progress: Called every PROGRESS_ROWS rows and at the end
+        engine: 'calamine', 'openpyxl' or None to pick the fastest available
+
+    Returns:
+        DataFrame of the sheet
+    """
+    path = Path(path)
+    sheet_name = 0 if sheet_name is None else sheet_name
+    if engine is None:
+        if calamine_available():
+            engine = 'calamine'
+        elif path.suffix.lower() in _OPENPYXL_SUFFIXES:
+            engine = 'openpyxl'
+
+    with profile_span('excel.read', 'io', file=path.name, engine=engine or 'pandas') as span:
+        if engine == 'openpyxl':
+            df = _stream_openpyxl(path, sheet_name, header, usecols, nrows, progress)
+        else:
+            wanted = set(usecols) if usecols is not None else None
+            df = pd.read_excel(
+                path, sheet_name=sheet_name, header=header, nrows=nrows, engine=engine,
+                usecols=(lambda column: column in wanted) if wanted is not None else None)
+            if progress is not None:
+                progress(len(df), len(df))
+        if compact:
+            df = compact_dtypes(df)
+        span.finish(rows=len(df), columns=len(df.columns))
+    logger.debug("Read %s: %d rows, %d columns (%s)", path.name, len(df),
+                 len(df.columns), engine or 'pandas')
+    return df
+
+
+def sheet_names(path: Union[str, Path]) -> List[str]:
+    """Worksheet names of a workbook, in order (without reading any cells)
+
+    For .xlsx files only the workbook part is parsed; even openpyxl's
+    read-only mode loads every shared string first.
+    """
+    path = Path(path)
+    if path.suffix.lower() in _OPENPYXL_SUFFIXES:
+        import zipfile
+        from xml.etree import ElementTree
+        with zipfile.ZipFile(path) as archive:
+            root = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        return [sheet.get('name') for sheet in root.iter()
+                if sheet.tag.rsplit('}', 1)[-1] == 'sheet']
+    with pd.ExcelFile(path) as workbook:
+        return list(workbook.sheet_names)
+
+
+def compact_dtypes(df: pd.DataFrame, category_ratio: float = CATEGORY_RATIO) -> pd.DataFrame:
+    """Store columns in smaller dtypes (in place; the frame is returned)
+
+    - Integer columns use the smallest integer type holding their values
+    - Text columns with few distinct values (at most category_ratio of the
+      rows) become categoricals, so repeated text is stored once
+    """
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            df[column] = pd.to_numeric(series, downcast='integer')
+        elif series.dtype == object and len(series) > 0:
+            values = series.dropna()
+            if (len(values) > 0 and values.nunique() <= category_ratio * len(series)
+                    and all(isinstance(value, str) for value in values)):
+                df[column] = series.astype('category')
+    return df
+
+
+def _cell(value: Any) -> Any:
+    """Cell value as pandas' openpyxl reader gives it"""
+    if value is None:
+        return np.nan
+    if type(value) is str:
+        return np.nan if value in _NA_VALUES else value
+    if type(value) is float and value.is_integer():
+        return int(value)
+    return value
+
+
+def column_names(cells: Iterable[Any]) -> List[Any]:
+    """Header cells -> column names, as pd.read_excel names them
+
+    Empty cells become 'Unnamed: <position>'; repeated names get '.1',
+    '.2', ... suffixes.
+    """
+    names, seen = [], {}
+    for position, value in enumerate(cells):
+        if value is None or value != value or (type(value) is str and value == ''):
+            name = f'Unnamed: {position}'
+        elif isinstance(value, float) and value.is_integer():
+            name = int(value)
+        else:
+            name = _cell(value)
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _width(cells: tuple) -> int:
+    """Number of cells up to the last non-empty one"""
+    width = len(cells)
+    while width and cells[width - 1] is None:
+        width -= 1
+    return width
+
+
+def _stream_openpyxl(path: Path, sheet_name: Union[str, int], header: Optional[int],
+                     usecols: Optional[Iterable[str]], nrows: Optional[int],
+                     progress: Optional[ProgressCallback]) -> pd.DataFrame:
+    """Read a sheet row by row with openpyxl in read-only mode"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = (workbook.worksheets[sheet_name] if isinstance(sheet_name, int)
+                 else workbook[sheet_name])
+        total = sheet.max_row
+        if total is not None and header is not None:
+            total = max(total - header - 1, 0)
+        if total is not None and nrows is not None:
+            total = min(total, nrows)
+
+        rows = sheet.iter_rows(values_only=True)
+        names: Optional[List[Any]] = None
+        if header is not None:
+            for _ in range(header):
+                next(rows, None)
+            header_cells = next(rows, ())
+            names = column_names(header_cells[:_width(header_cells)])
+
+        # Positions to keep (None: every position, growing with the data)
+        keep: Optional[List[int]] = None
+        if usecols is not None:
+            if names is None:
+                raise ValueError("usecols needs a header row")
+            wanted = set(usecols)
+            keep = [i for i, name in enumerate(names) if name in wanted]
+        columns: List[List[Any]] = [[] for _ in (keep if keep is not None else names or [])]
+
+        count = 0  # Data rows read
+        filled = 0  # Rows up to the last non-empty one
+        for cells in rows:
+            if nrows is not None and count >= nrows:
+                break
+            width = _width(cells)
+            if keep is not None:
+                for values, position in zip(columns, keep):
+                    values.append(_cell(cells[position]) if position < width else np.nan)
+            else:
+                while len(columns) < width:
+                    columns.append([np.nan] * count)
+                for position, values in enumerate(columns):
+                    values.append(_cell(cells[position]) if position < width else np.nan)
+            count += 1
+            if width:
+                filled = count
+            if progress is not None and count % PROGRESS_ROWS == 0:
+                progress(count, total)
+    finally:
+        workbook.close()
+
+    if keep is not None:
+        labels = [names[position] for position in keep]
+    else:
+        labels = list(names or [])
+        labels += [f'Unnamed: {position}' if names is not None else position
+                   for position in range(len(labels), len(columns))]
+        # Header cells past the data still name (empty) columns
+        while len(columns) < len(labels):
+            columns.append([np.nan] * count)
+
+    data = {}
+    for label, values in zip(labels, columns):
+        # Drop the value lists as they are converted to keep peak memory low
+        data[label] = pd.Series(values[:filled])
+        values.clear()
+    df = pd.DataFrame(data, columns=labels)
+    if not data:
+        df = df.iloc[:filled]
+    if progress is not None:
+        progress(filled, filled)
+    return df
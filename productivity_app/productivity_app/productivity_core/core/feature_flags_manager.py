@@ -20,7 +20,7 @@ Usage:
 """
 from typing import Dict, Callable, Optional, Any
 from PySide6.QtCore import QObject, Signal
-from .config_manager import AppSettingsConfig
+from .config_manager import AppSettingsConfig, ConfigManager
 
 
 class FeatureFlagsManager(QObject):
@@ -42,9 +42,23 @@ class FeatureFlagsManager(QObject):
                 'Enable advanced search capabilities in Connector module',
                 False
             ),
+            'search_as_you_type': (
+                'Search As You Type',
+                'Update Connector Lookup results while typing in the search box',
+                True
+            ),
         },
         'document_scanner': {
-            # Add document scanner feature flags here
+            'search_as_you_type': (
+                'Search As You Type',
+                'Search documents while typing in the search box',
+                True
+            ),
+            'normalized_part_numbers': (
+                'Match Part Number Spellings',
+                'Find part numbers regardless of punctuation and case (D38999-26 finds D38999/26)',
+                True
+            ),
         },
         'epd': {
             # Add EPD feature flags here
@@ -67,6 +81,10 @@ class FeatureFlagsManager(QObject):
         self._cache: Dict[str, Dict[str, bool]] = {}
         self._initialize_cache()
 
+        # Flags changed elsewhere (legacy settings code, another instance or
+        # an edited settings file) are picked up without re-reading storage
+        ConfigManager.subscribe(AppSettingsConfig.CONFIG_NAME, self._on_settings_changed)
+
     def _initialize_cache(self):
         """Load all feature flags from storage into cache"""
         storage = AppSettingsConfig.get_setting('feature_flags', {})
@@ -80,6 +98,20 @@ class FeatureFlagsManager(QObject):
                 value = module_storage.get(flag_id, default)
                 self._cache[module_id][flag_id] = value
 
+    def _on_settings_changed(self, changed_keys):
+        """Apply stored flag values that differ from the cache"""
+        if 'feature_flags' not in changed_keys:
+            return
+        storage = AppSettingsConfig.get_setting('feature_flags', {})
+        for module_id, flags_dict in self.FEATURE_FLAGS_SCHEMA.items():
+            module_storage = storage.get(module_id, {})
+            for flag_id, (name, desc, default) in flags_dict.items():
+                value = module_storage.get(flag_id, default)
+                if self._cache[module_id].get(flag_id) != value:
+                    self._cache[module_id][flag_id] = value
+                    self.flag_changed.emit(module_id, flag_id, value)
+                    self._notify_subscribers(module_id, flag_id, value)
+
     def get(self, module_id: str, flag_id: str) -> bool:
         """Get feature flag value
         
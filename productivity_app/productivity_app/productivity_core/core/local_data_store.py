@@ -0,0 +1,556 @@
+"""
+Local Data Store - Embedded SQLite store shared by the data models
+
+Holds the connector, EPD and E3 datasets in a single on-disk SQLite database
+so models can query indexed tables instead of keeping every record in memory.
+
+Each logical table gets:
+- A row table with one column per field (facet columns are indexed)
+- An FTS5 index over the configured search columns for free-text search
+- A metadata entry (column order, search/facet columns, extra JSON payload)
+
+FTS5 is used with the trigram tokenizer when available so free-text search
+keeps the existing case-insensitive "contains" semantics. When the SQLite
+build has no FTS5 support the store falls back to LIKE scans.
+"""
+import json
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from . import config
+from .config import CONFIG_FILES
+
+# Suffix for the FTS5 index table belonging to a row table
+FTS_SUFFIX = "__fts"
+
+# Rows read per page by iter_rows()
+ROW_BATCH_SIZE = 1000
+
+# Separator placed between column values in the FTS body so matches
+# cannot span two columns
+_FTS_SEPARATOR = "\n"
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier (column names contain spaces)"""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _to_sql_value(value: Any) -> Any:
+    """Convert a Python/NumPy value into something sqlite3 can bind"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (str, int, float, bytes)):
+        return value
+    # NumPy / pandas scalars expose .item()
+    if hasattr(value, 'item'):
+        try:
+            return _to_sql_value(value.item())
+        except (ValueError, TypeError):
+            pass
+    return str(value)
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user text is matched literally"""
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _detect_fts_tokenizer() -> Optional[str]:
+    """Detect the best available FTS5 tokenizer
+
+    Returns:
+        'trigram', 'unicode61', or None if FTS5 is not compiled in
+    """
+    probe = sqlite3.connect(':memory:')
+    try:
+        for tokenizer in ('trigram', 'unicode61'):
+            try:
+                probe.execute(
+                    f"CREATE VIRTUAL TABLE probe_{tokenizer} USING fts5(body, tokenize='{tokenizer}')")
+                return tokenizer
+            except sqlite3.OperationalError:
+                continue
+        return None
+    finally:
+        probe.close()
+
+
+class LocalDataStore:
+    """Embedded SQLite store with full-text search and facet indexes
+
+    Usage:
+        store = LocalDataStore()
+        store.replace_table(
+            'connectors', records,
+            search_columns=['Part Number', 'Part Code'],
+            facet_columns=['Family', 'Material'])
+
+        rows = store.query('connectors', search_text='d38999',
+                           facets={'Material': ['Aluminum']})
+        families = store.distinct_values('connectors', 'Family')
+
+    The connection is opened lazily on first use, so constructing the store
+    (e.g. when AppContext starts) costs nothing. All methods are thread-safe.
+    """
+
+    META_TABLE = "_store_tables"
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """Initialize the store
+
+        Args:
+            db_path: Path to the SQLite file, ':memory:' for an in-memory
+                     store, or None to use the configuration directory
+        """
+        self._db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._tokenizer: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _resolve_path(self) -> str:
+        """Resolve the database path (config dir may change at startup)"""
+        if self._db_path is None:
+            path = config.CONFIG_DIR / CONFIG_FILES["local_data_store"]
+        elif str(self._db_path) == ':memory:':
+            return ':memory:'
+        else:
+            path = Path(self._db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return str(path)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the open connection, opening it on first use"""
+        if self._conn is None:
+            path = self._resolve_path()
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            if path != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.META_TABLE} ("
+                "name TEXT PRIMARY KEY, columns TEXT, search_columns TEXT, "
+                "facet_columns TEXT, metadata TEXT, updated REAL)")
+            self._conn.commit()
+            self._tokenizer = _detect_fts_tokenizer()
+            if self._tokenizer is None:
+                print("[LocalDataStore] FTS5 not available, using LIKE scans")
+        return self._conn
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def path(self) -> str:
+        """Resolved database path"""
+        return self._resolve_path()
+
+    # ------------------------------------------------------------------
+    # Table metadata
+    # ------------------------------------------------------------------
+
+    def _table_info(self, table: str) -> Optional[Dict[str, Any]]:
+        """Read metadata for a table, or None if it doesn't exist"""
+        row = self._connection().execute(
+            f"SELECT columns, search_columns, facet_columns, metadata, updated "
+            f"FROM {self.META_TABLE} WHERE name = ?", (table,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'columns': json.loads(row[0]),
+            'search_columns': json.loads(row[1]),
+            'facet_columns': json.loads(row[2]),
+            'metadata': json.loads(row[3]) if row[3] else {},
+            'updated': row[4],
+            'fts': self._has_fts(table),
+        }
+
+    def _has_fts(self, table: str) -> bool:
+        """Check whether the FTS index exists for a table"""
+        row = self._connection().execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?",
+            (table + FTS_SUFFIX,)).fetchone()
+        return row is not None
+
+    def has_table(self, table: str) -> bool:
+        """Check if a table has been written to the store"""
+        with self._lock:
+            return self._table_info(table) is not None
+
+    def columns(self, table: str) -> List[str]:
+        """Get column names of a table in their original order"""
+        with self._lock:
+            info = self._table_info(table)
+            return info['columns'] if info else []
+
+    def get_metadata(self, table: str) -> Dict[str, Any]:
+        """Get the extra JSON metadata stored alongside a table"""
+        with self._lock:
+            info = self._table_info(table)
+            return info['metadata'] if info else {}
+
+    def last_updated(self, table: str) -> Optional[float]:
+        """Get the time (epoch seconds) a table was last written"""
+        with self._lock:
+            info = self._table_info(table)
+            return info['updated'] if info else None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def replace_table(self, table: str, records: Iterable[Dict[str, Any]],
+                      search_columns: Optional[List[str]] = None,
+                      facet_columns: Optional[List[str]] = None,
+                      metadata: Optional[Dict[str, Any]] = None) -> int:
+        """Replace the contents of a table with new records
+
+        Args:
+            table: Logical table name
+            records: Row dictionaries (all rows should share the same keys)
+            search_columns: Columns indexed for free-text search
+                            (None = all columns)
+            facet_columns: Columns that get a B-tree index for exact filters
+            metadata: Extra JSON-serializable data to keep with the table
+
+        Returns:
+            Number of rows written
+        """
+        records = list(records)
+        columns: List[str] = []
+        for record in records:
+            for key in record.keys():
+                if key not in columns:
+                    columns.append(key)
+
+        search_columns = [c for c in (search_columns or columns) if c in columns]
+        facet_columns = [c for c in (facet_columns or []) if c in columns]
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._drop_table(table)
+
+                column_sql = ", ".join(_quote(c) for c in columns)
+                conn.execute(f"CREATE TABLE {_quote(table)} ({column_sql})")
+                for column in facet_columns:
+                    conn.execute(
+                        f"CREATE INDEX {_quote(f'ix_{table}_{column}')} "
+                        f"ON {_quote(table)} ({_quote(column)})")
+
+                if self._tokenizer and search_columns:
+                    conn.execute(
+                        f"CREATE VIRTUAL TABLE {_quote(table + FTS_SUFFIX)} "
+                        f"USING fts5(body, tokenize='{self._tokenizer}')")
+
+                self._insert_rows(table, columns, search_columns, records)
+
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.META_TABLE} VALUES (?, ?, ?, ?, ?, ?)",
+                    (table, json.dumps(columns), json.dumps(search_columns),
+                     json.dumps(facet_columns), json.dumps(metadata or {}),
+                     time.time()))
+
+        return len(records)
+
+    def append_rows(self, table: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Append records to an existing table
+
+        Keys not present in the table's columns are ignored.
+
+        Args:
+            table: Logical table name (must exist)
+            records: Row dictionaries
+
+        Returns:
+            Number of rows written
+        """
+        records = list(records)
+        with self._lock:
+            info = self._table_info(table)
+            if info is None:
+                raise KeyError(f"Table '{table}' does not exist in the store")
+            conn = self._connection()
+            with conn:
+                self._insert_rows(table, info['columns'],
+                                  info['search_columns'], records)
+                conn.execute(
+                    f"UPDATE {self.META_TABLE} SET updated = ? WHERE name = ?",
+                    (time.time(), table))
+        return len(records)
+
+    def delete_rows(self, table: str, column: str, values: List[Any]) -> int:
+        """Delete rows whose column value is in values
+
+        Args:
+            table: Logical table name
+            column: Column to match on
+            values: Values to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        if not values:
+            return 0
+        with self._lock:
+            info = self._table_info(table)
+            if info is None or column not in info['columns']:
+                return 0
+            conn = self._connection()
+            with conn:
+                deleted = self._delete_rows(table, info, column, values)
+                conn.execute(
+                    f"UPDATE {self.META_TABLE} SET updated = ? WHERE name = ?",
+                    (time.time(), table))
+            return deleted
+
+    def replace_rows(self, table: str, column: str, values: List[Any],
+                     records: Iterable[Dict[str, Any]],
+                     search_columns: Optional[List[str]] = None,
+                     facet_columns: Optional[List[str]] = None) -> int:
+        """Replace the rows whose column value is in values with records
+
+        Deleting and inserting happen in one transaction, so a failure
+        leaves the previous rows in place. A table that does not exist yet
+        is created as replace_table() would (search_columns and
+        facet_columns only apply then).
+
+        Args:
+            table: Logical table name
+            column: Column to match on (e.g. the project a row came from)
+            values: Values whose rows are replaced
+            records: New row dictionaries (keys not in the table are ignored)
+
+        Returns:
+            Number of rows written
+        """
+        records = list(records)
+        with self._lock:
+            info = self._table_info(table)
+            if info is None:
+                return self.replace_table(table, records, search_columns=search_columns,
+                                          facet_columns=facet_columns)
+            conn = self._connection()
+            with conn:
+                if values and column in info['columns']:
+                    self._delete_rows(table, info, column, values)
+                self._insert_rows(table, info['columns'],
+                                  info['search_columns'], records)
+                conn.execute(
+                    f"UPDATE {self.META_TABLE} SET updated = ? WHERE name = ?",
+                    (time.time(), table))
+        return len(records)
+
+    def drop_table(self, table: str):
+        """Remove a table and its indexes from the store"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._drop_table(table)
+
+    def _drop_table(self, table: str):
+        """Drop a table without locking/committing (caller handles both)"""
+        conn = self._connection()
+        conn.execute(f"DROP TABLE IF EXISTS {_quote(table + FTS_SUFFIX)}")
+        conn.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+        conn.execute(f"DELETE FROM {self.META_TABLE} WHERE name = ?", (table,))
+
+    def _delete_rows(self, table: str, info: Dict[str, Any], column: str,
+                     values: List[Any]) -> int:
+        """Delete rows and their FTS bodies (caller holds lock/transaction)"""
+        conn = self._connection()
+        placeholders = ", ".join("?" for _ in values)
+        params = [_to_sql_value(v) for v in values]
+        if info['fts']:
+            conn.execute(
+                f"DELETE FROM {_quote(table + FTS_SUFFIX)} WHERE rowid IN ("
+                f"SELECT rowid FROM {_quote(table)} "
+                f"WHERE {_quote(column)} IN ({placeholders}))", params)
+        cursor = conn.execute(
+            f"DELETE FROM {_quote(table)} WHERE {_quote(column)} IN ({placeholders})",
+            params)
+        return cursor.rowcount
+
+    def _insert_rows(self, table: str, columns: List[str],
+                     search_columns: List[str], records: List[Dict[str, Any]]):
+        """Insert rows and their FTS bodies (caller holds lock/transaction)"""
+        if not records or not columns:
+            return
+        conn = self._connection()
+        placeholders = ", ".join("?" for _ in columns)
+        column_sql = ", ".join(_quote(c) for c in columns)
+        has_fts = self._has_fts(table)
+
+        insert_sql = f"INSERT INTO {_quote(table)} ({column_sql}) VALUES ({placeholders})"
+        fts_sql = f"INSERT INTO {_quote(table + FTS_SUFFIX)} (rowid, body) VALUES (?, ?)"
+
+        for record in records:
+            values = [_to_sql_value(record.get(c)) for c in columns]
+            cursor = conn.execute(insert_sql, values)
+            if has_fts:
+                body = _FTS_SEPARATOR.join(
+                    str(record.get(c)) for c in search_columns
+                    if _to_sql_value(record.get(c)) is not None)
+                conn.execute(fts_sql, (cursor.lastrowid, body.lower()))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def count(self, table: str) -> int:
+        """Count rows in a table (0 if it doesn't exist)"""
+        with self._lock:
+            if self._table_info(table) is None:
+                return 0
+            return self._connection().execute(
+                f"SELECT COUNT(*) FROM {_quote(table)}").fetchone()[0]
+
+    def fetch_all(self, table: str) -> List[Dict[str, Any]]:
+        """Fetch every row of a table as dictionaries"""
+        return self.query(table)
+
+    def iter_rows(self, table: str, columns: Optional[List[str]] = None,
+                  batch_size: int = ROW_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """Stream the rows of a table as dictionaries, one page at a time
+
+        Only one page is held in memory, and the lock is held only while a
+        page is read, so writers are not blocked for the whole iteration.
+
+        Args:
+            table: Logical table name
+            columns: Columns to read (None = all; unknown names are ignored)
+            batch_size: Rows read per page
+
+        Yields:
+            Row dictionaries in insertion order
+        """
+        last = 0
+        while True:
+            with self._lock:
+                info = self._table_info(table)
+                if info is None:
+                    return
+                names = [c for c in (columns or info['columns']) if c in info['columns']]
+                if not names:
+                    return
+                rows = self._connection().execute(
+                    f"SELECT rowid, {', '.join(_quote(c) for c in names)} "
+                    f"FROM {_quote(table)} WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last, int(batch_size))).fetchall()
+            for row in rows:
+                yield dict(zip(names, row[1:]))
+            if len(rows) < batch_size:
+                return
+            last = rows[-1][0]
+
+    def query(self, table: str, search_text: str = "",
+              facets: Optional[Dict[str, List[Any]]] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Query a table with free-text search and facet filters
+
+        Args:
+            table: Logical table name
+            search_text: Case-insensitive substring matched against the
+                         search columns (empty = no text filter)
+            facets: Mapping of column -> accepted values (empty lists ignored)
+            limit: Optional maximum number of rows
+
+        Returns:
+            List of row dictionaries in insertion order
+        """
+        with self._lock:
+            info = self._table_info(table)
+            if info is None:
+                return []
+
+            columns = info['columns']
+            where, params = self._build_where(table, info, search_text, facets)
+            sql = (f"SELECT {', '.join(_quote(c) for c in columns)} "
+                   f"FROM {_quote(table)}{where} ORDER BY rowid")
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(int(limit))
+
+            rows = self._connection().execute(sql, params).fetchall()
+            return [dict(zip(columns, row)) for row in rows]
+
+    def query_frame(self, table: str, search_text: str = "",
+                    facets: Optional[Dict[str, List[Any]]] = None,
+                    limit: Optional[int] = None):
+        """Same as query() but returns a pandas DataFrame"""
+        import pandas as pd
+        rows = self.query(table, search_text, facets, limit)
+        return pd.DataFrame(rows, columns=self.columns(table))
+
+    def distinct_values(self, table: str, column: str,
+                        facets: Optional[Dict[str, List[Any]]] = None) -> List[Any]:
+        """Get sorted distinct non-empty values of a column
+
+        Args:
+            table: Logical table name
+            column: Column to read
+            facets: Optional facet filters restricting the rows considered
+
+        Returns:
+            Sorted list of distinct values
+        """
+        with self._lock:
+            info = self._table_info(table)
+            if info is None or column not in info['columns']:
+                return []
+            where, params = self._build_where(table, info, "", facets)
+            null_filter = f"{_quote(column)} IS NOT NULL AND {_quote(column)} != ''"
+            where = f"{where} AND {null_filter}" if where else f" WHERE {null_filter}"
+            rows = self._connection().execute(
+                f"SELECT DISTINCT {_quote(column)} FROM {_quote(table)}{where} "
+                f"ORDER BY {_quote(column)}", params).fetchall()
+            return [row[0] for row in rows]
+
+    def _build_where(self, table: str, info: Dict[str, Any], search_text: str,
+                     facets: Optional[Dict[str, List[Any]]]):
+        """Build a WHERE clause for text search + facets
+
+        Returns:
+            Tuple of (sql_fragment, params) - fragment is '' when unfiltered
+        """
+        clauses = []
+        params: List[Any] = []
+
+        for column, values in (facets or {}).items():
+            values = [v for v in (values or []) if v is not None and str(v).strip()]
+            if not values or column not in info['columns']:
+                continue
+            clauses.append(
+                f"{_quote(column)} IN ({', '.join('?' for _ in values)})")
+            params.extend(_to_sql_value(v) for v in values)
+
+        search_text = (search_text or "").strip().lower()
+        if search_text:
+            pattern = f"%{_escape_like(search_text)}%"
+            if info['fts']:
+                clauses.append(
+                    f"rowid IN (SELECT rowid FROM {_quote(table + FTS_SUFFIX)} "
+                    f"WHERE body LIKE ? ESCAPE '\\')")
+            else:
+                concat = " || char(10) || ".join(
+                    f"coalesce({_quote(c)}, '')" for c in info['search_columns']) or "''"
+                clauses.append(f"lower({concat}) LIKE ? ESCAPE '\\'")
+            params.append(pattern)
+
+        if not clauses:
+            return "", params
+        return " WHERE " + " AND ".join(clauses), params
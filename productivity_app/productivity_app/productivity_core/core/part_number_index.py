@@ -0,0 +1,273 @@
+"""
+Part Number Index - Normalized and fuzzy part number matching
+
+Part numbers arrive in many spellings (D38999/26WA35PN, D38999-26WA35PN,
+d3899926wa35pn). Every spelling is reduced to a canonical key - letters
+and digits only, case-folded - so they all match each other exactly.
+
+Close matches (typos, a missing or swapped character) are found with a
+SymSpell-style delete index: every key is stored under all strings made by
+deleting up to `max_distance` characters from it. Two keys within that edit
+distance always share one of these strings, so a query only has to look up
+its own deletes and check the few candidates found with a real edit
+distance, instead of comparing against every key in the catalogue.
+
+The delete strings are stored as their hashes in two sorted NumPy arrays
+(hash, key id) so a 100k part catalogue takes tens of MB rather than the
+hundreds a dict of strings would. A hash collision only adds a candidate,
+which the edit distance check then rejects.
+
+Usage:
+    index = PartNumberIndex()
+    index.add('D38999/26WA35PN', connector)
+    index.match('d38999-26wa35pn')   # exact (distance 0)
+    index.match('D38999/26WA36PN')   # close match (distance 1)
+"""
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+# Everything that is not a letter or digit
+_NOT_ALNUM = re.compile(r'[\W_]+')
+
+
+def canonical_part_number(text: Any) -> str:
+    """Key a part number is matched under (punctuation and case ignored)"""
+    if text is None:
+        return ''
+    return _NOT_ALNUM.sub('', str(text)).casefold()
+
+
+def canonical_part_numbers(values):
+    """canonical_part_number() for a whole pandas Series of strings"""
+    return values.astype(str).str.replace(_NOT_ALNUM, '', regex=True).str.casefold()
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """Edit distance counting adjacent transpositions as one edit
+
+    (optimal string alignment distance)
+
+    Args:
+        a, b: Strings to compare
+        max_distance: Stop early once the distance is known to exceed this;
+            max_distance + 1 is returned in that case
+
+    Returns:
+        Number of insertions, deletions, substitutions and transpositions
+    """
+    if a == b:
+        return 0
+    limit = max(len(a), len(b)) if max_distance is None else max_distance
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and j > 1 and a[i - 1] == b[j - 2]
+                    and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def _deletes(key: str, distance: int) -> Set[str]:
+    """key and every string made by deleting up to `distance` characters"""
+    result = {key}
+    frontier = {key}
+    for _ in range(distance):
+        frontier = {word[:i] + word[i + 1:]
+                    for word in frontier if len(word) > 1
+                    for i in range(len(word))}
+        result |= frontier
+    return result
+
+
+@dataclass
+class PartNumberMatch:
+    """A catalogue key matching a query"""
+    key: str  # Canonical key
+    text: str  # Spelling the key was first added with
+    distance: int  # 0 for an exact (normalized) match
+    values: List[Any] = field(default_factory=list)
+
+    @property
+    def exact(self) -> bool:
+        return self.distance == 0
+
+
+class PartNumberIndex:
+    """Canonical-key and edit-distance index over part numbers
+
+    Keys are added with any number of values (e.g. the connector records
+    the spelling belongs to). Exact lookups use a dict; the delete index for
+    close matches is built on the first fuzzy query after keys were added.
+    All methods are thread-safe.
+    """
+
+    def __init__(self, max_distance: int = 1, min_fuzzy_length: int = 6):
+        """Initialize the index
+
+        Args:
+            max_distance: Largest edit distance found by fuzzy queries.
+                Each extra edit multiplies the delete index size by roughly
+                the key length, so keep this at 1 or 2.
+            min_fuzzy_length: Shorter canonical queries are only matched
+                exactly (short keys are a few edits away from too many parts)
+        """
+        self.max_distance = max_distance
+        self.min_fuzzy_length = min_fuzzy_length
+        self._keys: List[str] = []
+        self._texts: List[str] = []
+        self._values: List[List[Any]] = []
+        self._key_ids: Dict[str, int] = {}
+        self._delete_hashes: Optional[np.ndarray] = None
+        self._delete_key_ids: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, text: Any) -> bool:
+        return canonical_part_number(text) in self._key_ids
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add(self, text: Any, value: Any = None) -> bool:
+        """Add a part number spelling
+
+        Args:
+            text: Part number in any spelling
+            value: Returned with matches of the key (None adds the key only)
+
+        Returns:
+            False if the spelling has no letters or digits
+        """
+        key = canonical_part_number(text)
+        if not key:
+            return False
+        with self._lock:
+            key_id = self._key_ids.get(key)
+            if key_id is None:
+                key_id = len(self._keys)
+                self._key_ids[key] = key_id
+                self._keys.append(key)
+                self._texts.append(str(text).strip())
+                self._values.append([])
+                self._delete_hashes = self._delete_key_ids = None
+            if value is not None:
+                self._values[key_id].append(value)
+        return True
+
+    def add_many(self, texts: Iterable[Any], values: Iterable[Any]) -> int:
+        """Add spellings paired with values; returns the number added"""
+        return sum(self.add(text, value) for text, value in zip(texts, values))
+
+    def prepare(self):
+        """Build the delete index now (e.g. on a background thread)"""
+        with self._lock:
+            self._ensure_delete_index()
+
+    def _ensure_delete_index(self):
+        """Build the delete index (caller holds the lock)"""
+        if self._delete_hashes is not None:
+            return
+        hashes: List[int] = []
+        key_ids: List[int] = []
+        for key_id, key in enumerate(self._keys):
+            deletes = _deletes(key, self.max_distance)
+            hashes.extend(hash(delete) for delete in deletes)
+            key_ids.extend([key_id] * len(deletes))
+        hash_array = np.fromiter(hashes, dtype=np.int64, count=len(hashes))
+        key_array = np.fromiter(key_ids, dtype=np.int32, count=len(key_ids))
+        order = np.argsort(hash_array, kind='stable')
+        self._delete_hashes = hash_array[order]
+        self._delete_key_ids = key_array[order]
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def _match(self, key_id: int, distance: int) -> PartNumberMatch:
+        return PartNumberMatch(key=self._keys[key_id], text=self._texts[key_id],
+                               distance=distance, values=list(self._values[key_id]))
+
+    def exact(self, text: Any) -> Optional[PartNumberMatch]:
+        """Key with the same canonical form as `text`, if any"""
+        with self._lock:
+            key_id = self._key_ids.get(canonical_part_number(text))
+            return self._match(key_id, 0) if key_id is not None else None
+
+    def fuzzy(self, text: Any, max_distance: Optional[int] = None,
+              limit: Optional[int] = None) -> List[PartNumberMatch]:
+        """Keys within `max_distance` edits of `text`, closest first
+
+        Includes the exact match (distance 0) when there is one.
+        """
+        query = canonical_part_number(text)
+        if not query:
+            return []
+        distance = self.max_distance if max_distance is None else min(
+            max_distance, self.max_distance)
+        if len(query) < self.min_fuzzy_length:
+            match = self.exact(query)
+            return [match] if match else []
+
+        query_hashes = np.array([hash(d) for d in _deletes(query, distance)],
+                                dtype=np.int64)
+        with self._lock:
+            self._ensure_delete_index()
+            starts = np.searchsorted(self._delete_hashes, query_hashes, side='left')
+            ends = np.searchsorted(self._delete_hashes, query_hashes, side='right')
+            candidates = set()
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                if start < end:
+                    candidates.update(self._delete_key_ids[start:end].tolist())
+
+            matches = []
+            for key_id in candidates:
+                found = edit_distance(query, self._keys[key_id], distance)
+                if found <= distance:
+                    matches.append(self._match(key_id, found))
+
+        matches.sort(key=lambda m: (m.distance, m.key))
+        return matches[:limit] if limit is not None else matches
+
+    def match(self, text: Any, max_distance: Optional[int] = None) -> List[PartNumberMatch]:
+        """The exact match if there is one, otherwise the closest matches
+
+        Only the matches at the smallest distance found are returned, so
+        more than one match means the spelling is ambiguous.
+        """
+        exact = self.exact(text)
+        if exact is not None:
+            return [exact]
+        matches = self.fuzzy(text, max_distance)
+        if not matches:
+            return []
+        return [m for m in matches if m.distance == matches[0].distance]
+
+    def match_many(self, texts: Iterable[Any],
+                   max_distance: Optional[int] = None) -> Dict[Any, List[PartNumberMatch]]:
+        """match() for a batch of spellings (each canonical form queried once)"""
+        by_key: Dict[str, List[PartNumberMatch]] = {}
+        results = {}
+        for text in texts:
+            key = canonical_part_number(text)
+            if key not in by_key:
+                by_key[key] = self.match(key, max_distance) if key else []
+            results[text] = by_key[key]
+        return results
@@ -0,0 +1,264 @@
+"""
+Profiler - Opt-in timing of named operations
+
+Spans (name, category, start, duration, thread) are kept in an in-memory
+ring buffer, so recording costs one append and old entries drop off on
+their own. Recording is off unless enabled (Settings > Performance, stored
+as the 'profiling_enabled' app setting); while off, span() returns a
+shared no-op.
+
+The buffer can be exported as Chrome trace JSON and opened in
+chrome://tracing or https://ui.perfetto.dev.
+
+Usage:
+    from ..core.profiler import profile_span, profiled
+
+    with profile_span('epd.filter', 'filter', rows=len(df)):
+        ...
+
+    @profiled('document.search', 'search')
+    def search(self, term): ...
+
+    # Spans that end in a callback
+    span = profile_span('epd.load', 'model')
+    ...
+    span.finish(rows=len(data))
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .config_manager import AppSettingsConfig
+
+# Number of spans kept in the ring buffer
+DEFAULT_CAPACITY = 5000
+
+# App setting that turns recording on
+SETTING_KEY = 'profiling_enabled'
+
+
+@dataclass
+class SpanRecord:
+    """One finished span"""
+    name: str
+    category: str
+    start_us: float  # Since the profiler was created
+    duration_us: float
+    thread_id: int
+    thread_name: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_us / 1000
+
+
+class Span:
+    """A running span: use as a context manager or call finish()"""
+
+    __slots__ = ('_profiler', 'name', 'category', 'args', '_started', '_finished')
+
+    def __init__(self, profiler: 'Profiler', name: str, category: str,
+                 args: Dict[str, Any]):
+        self._profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self._started = time.perf_counter()
+        self._finished = False
+
+    def finish(self, **args):
+        """End the span (later calls are ignored)
+
+        Args:
+            **args: Extra values shown with the span (e.g. row counts)
+        """
+        if self._finished:
+            return
+        self._finished = True
+        if args:
+            self.args.update(args)
+        self._profiler._record(self, time.perf_counter())
+
+    def __enter__(self) -> 'Span':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.finish()
+        return False
+
+
+class _NullSpan:
+    """Span returned while recording is off"""
+
+    __slots__ = ()
+
+    def finish(self, **args):
+        pass
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """Records spans into a ring buffer
+
+    Register one instance in AppContext as 'profiler'; code without a
+    context uses Profiler.shared() (or the module-level profile_span and
+    profiled helpers, which do).
+    """
+
+    _shared: Optional['Profiler'] = None
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        self._spans: Deque[SpanRecord] = deque(maxlen=capacity)
+        self._origin = time.perf_counter()
+        self.enabled = enabled
+
+    @classmethod
+    def shared(cls) -> 'Profiler':
+        """Process-wide profiler (enabled from app settings on first use)"""
+        if cls._shared is None:
+            cls._shared = cls(enabled=bool(
+                AppSettingsConfig.get_setting(SETTING_KEY, False)))
+        return cls._shared
+
+    @property
+    def capacity(self) -> int:
+        return self._spans.maxlen
+
+    def set_enabled(self, enabled: bool, persist: bool = True):
+        """Turn recording on or off
+
+        Args:
+            enabled: Record spans from now on
+            persist: Store the choice so the next launch (and its startup)
+                is profiled too
+        """
+        self.enabled = enabled
+        if persist:
+            AppSettingsConfig.set_setting(SETTING_KEY, enabled)
+        print(f"[Profiler] {'✓ Recording' if enabled else 'Stopped recording'} spans")
+
+    def span(self, name: str, category: str = 'app', **args) -> Any:
+        """Start a span
+
+        Args:
+            name: Operation name (e.g. 'tab.build')
+            category: Group shown in the trace viewer (e.g. 'tabs', 'search')
+            **args: Values shown with the span
+
+        Returns:
+            Span (or a no-op while disabled) - a context manager with finish()
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args)
+
+    def _record(self, span: Span, finished: float):
+        thread = threading.current_thread()
+        self._spans.append(SpanRecord(
+            name=span.name,
+            category=span.category,
+            start_us=(span._started - self._origin) * 1e6,
+            duration_us=(finished - span._started) * 1e6,
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            args=span.args))
+
+    def clear(self):
+        self._spans.clear()
+
+    def records(self) -> List[SpanRecord]:
+        """Recorded spans, oldest first"""
+        return list(self._spans)
+
+    def slowest(self, limit: int = 20, category: Optional[str] = None) -> List[SpanRecord]:
+        """Slowest spans currently in the buffer
+
+        Args:
+            limit: Maximum number of spans
+            category: Only spans of this category
+        """
+        spans = [s for s in self._spans if category is None or s.category == category]
+        return sorted(spans, key=lambda s: s.duration_us, reverse=True)[:limit]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Buffer as a Chrome trace ('Trace Event Format') document"""
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for record in self._spans:
+            threads.setdefault(record.thread_id, record.thread_name)
+            events.append({
+                'name': record.name,
+                'cat': record.category,
+                'ph': 'X',
+                'ts': round(record.start_us, 3),
+                'dur': round(record.duration_us, 3),
+                'pid': pid,
+                'tid': record.thread_id,
+                'args': {key: _json_value(value) for key, value in record.args.items()},
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                           'tid': thread_id, 'args': {'name': thread_name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write the buffer as Chrome trace JSON
+
+        Returns:
+            Number of spans written
+        """
+        trace = self.to_chrome_trace()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        count = sum(1 for event in trace['traceEvents'] if event['ph'] == 'X')
+        print(f"[Profiler] ✓ Exported {count} spans to {path}")
+        return count
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def profile_span(name: str, category: str = 'app', **args) -> Any:
+    """Start a span on the shared profiler (see Profiler.span)"""
+    return Profiler.shared().span(name, category, **args)
+
+
+def profiled(name: Optional[str] = None, category: str = 'app') -> Callable:
+    """Decorator recording each call of a function as a span
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Span category
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = Profiler.shared()
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with Span(profiler, span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
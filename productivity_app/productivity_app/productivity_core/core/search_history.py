@@ -0,0 +1,330 @@
+"""
+Search History - Shared, append-only store of past searches
+
+Every search is appended to a log table; a per-term summary table (one row
+per distinct term in each scope) is updated in the same transaction and
+indexed for the three ways history is read:
+- Most recent first             (scope, last_used) index
+- Most used ("frecency") first  (scope, rank) index
+- Autocomplete by prefix        (scope, term_norm) primary key, range scan
+
+so lookups stay O(log n) with tens of thousands of entries. The summary row
+also keeps the latest result count (and an optional JSON payload, e.g. the
+filters of a Lookup search) so "re-run previous search" can show how many
+results to expect without running it.
+
+Rank is an exponentially decayed use count stored as a log2 value relative
+to a fixed epoch: each use adds 2^((t - epoch) / half-life). Newer uses
+count for more, yet stored ranks never need to be recalculated as time
+passes because every row is scaled by the same factor.
+
+Scopes keep features apart ('document_scanner', 'connector_lookup', ...).
+"""
+import json
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from . import config
+from .config import CONFIG_FILES
+
+# A use this long ago counts half as much as a use now
+RANK_HALF_LIFE_SECONDS = 14 * 24 * 3600
+
+# Fixed reference time for stored ranks (2024-01-01 UTC)
+RANK_EPOCH = 1704067200.0
+
+# Upper bound appended to a prefix for range scans (highest code point)
+_PREFIX_END = '\U0010ffff'
+
+
+def normalize_term(term: str) -> str:
+    """Key a term is stored and matched under (case and spacing ignored)"""
+    return ' '.join(str(term).split()).casefold()
+
+
+def _rank_weight(timestamp: float) -> float:
+    """log2 weight of one use at `timestamp`"""
+    return (timestamp - RANK_EPOCH) / RANK_HALF_LIFE_SECONDS
+
+
+def _log2_add(a: float, b: float) -> float:
+    """log2(2^a + 2^b) without overflow"""
+    high, low = max(a, b), min(a, b)
+    return high + math.log2(1.0 + 2.0 ** (low - high))
+
+
+@dataclass
+class HistoryEntry:
+    """One distinct search term with its usage summary"""
+    scope: str
+    term: str  # Spelling from the most recent use
+    uses: int
+    first_used: float  # Unix timestamps
+    last_used: float
+    result_count: Optional[int] = None  # From the most recent use
+    payload: Dict[str, Any] = field(default_factory=dict)
+    rank: float = 0.0
+
+    @property
+    def last_used_at(self) -> datetime:
+        return datetime.fromtimestamp(self.last_used)
+
+
+class SearchHistoryStore:
+    """SQLite-backed search history shared by the search features
+
+    Usage:
+        history = context.get('search_history')  # or SearchHistoryStore.shared()
+        history.record('document_scanner', 'D38999', result_count=25)
+
+        history.recent('document_scanner', limit=10)
+        history.ranked('document_scanner', limit=10)
+        history.complete('document_scanner', 'd38')   # -> ['D38999', ...]
+
+    The connection is opened lazily on first use and all methods are
+    thread-safe (same approach as LocalDataStore).
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS search_log ("
+        "id INTEGER PRIMARY KEY, scope TEXT NOT NULL, term TEXT NOT NULL, "
+        "term_norm TEXT NOT NULL, searched_at REAL NOT NULL, result_count INTEGER)",
+        "CREATE TABLE IF NOT EXISTS search_terms ("
+        "scope TEXT NOT NULL, term_norm TEXT NOT NULL, term TEXT NOT NULL, "
+        "uses INTEGER NOT NULL, first_used REAL NOT NULL, last_used REAL NOT NULL, "
+        "result_count INTEGER, payload TEXT, rank REAL NOT NULL, "
+        "PRIMARY KEY (scope, term_norm)) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS search_terms_recent "
+        "ON search_terms (scope, last_used)",
+        "CREATE INDEX IF NOT EXISTS search_terms_rank "
+        "ON search_terms (scope, rank)",
+    )
+
+    _TERM_COLUMNS = ("scope, term, uses, first_used, last_used, "
+                     "result_count, payload, rank")
+
+    _shared: Optional['SearchHistoryStore'] = None
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """Initialize the store
+
+        Args:
+            db_path: Path to the SQLite file, ':memory:' for an in-memory
+                     store, or None to use the configuration directory
+        """
+        self._db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls) -> 'SearchHistoryStore':
+        """Process-wide store (used when no AppContext is available)"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _resolve_path(self) -> str:
+        if self._db_path is None:
+            path = config.CONFIG_DIR / CONFIG_FILES["search_history"]
+        elif str(self._db_path) == ':memory:':
+            return ':memory:'
+        else:
+            path = Path(self._db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return str(path)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self._resolve_path()
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            if path != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+            self._conn.commit()
+        return self._conn
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def record(self, scope: str, term: str, result_count: Optional[int] = None,
+               payload: Optional[Dict[str, Any]] = None,
+               searched_at: Optional[float] = None) -> Optional[HistoryEntry]:
+        """Append a search to the history
+
+        Args:
+            scope: Feature the search belongs to (e.g. 'document_scanner')
+            term: Search term as typed
+            result_count: Number of results the search returned, if known
+            payload: JSON-serializable data needed to re-run the search
+                (replaces the payload of earlier uses)
+            searched_at: Unix timestamp (defaults to now)
+
+        Returns:
+            Updated entry for the term, or None for a blank term
+        """
+        term = ' '.join(str(term).split())
+        if not term:
+            return None
+        term_norm = normalize_term(term)
+        searched_at = time.time() if searched_at is None else searched_at
+        weight = _rank_weight(searched_at)
+        payload_json = json.dumps(payload, default=str) if payload is not None else None
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO search_log (scope, term, term_norm, searched_at, result_count) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (scope, term, term_norm, searched_at, result_count))
+                row = conn.execute(
+                    "SELECT rank, payload FROM search_terms "
+                    "WHERE scope = ? AND term_norm = ?", (scope, term_norm)).fetchone()
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO search_terms (scope, term_norm, term, uses, first_used, "
+                        "last_used, result_count, payload, rank) "
+                        "VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)",
+                        (scope, term_norm, term, searched_at, searched_at,
+                         result_count, payload_json, weight))
+                else:
+                    conn.execute(
+                        "UPDATE search_terms SET term = ?, uses = uses + 1, "
+                        "last_used = MAX(last_used, ?), "
+                        "result_count = COALESCE(?, result_count), payload = ?, rank = ? "
+                        "WHERE scope = ? AND term_norm = ?",
+                        (term, searched_at, result_count,
+                         payload_json if payload is not None else row[1],
+                         _log2_add(row[0], weight), scope, term_norm))
+            return self._get(scope, term_norm)
+
+    def import_terms(self, scope: str, terms: Iterable[str],
+                     searched_at: Optional[float] = None) -> int:
+        """Add terms from an older, most-recent-first history list
+
+        Terms keep their order: each is recorded one second before the
+        one listed ahead of it.
+
+        Returns:
+            Number of terms imported
+        """
+        terms = [term for term in terms if str(term).strip()]
+        newest = time.time() if searched_at is None else searched_at
+        with self._lock:
+            for offset, term in enumerate(reversed(terms)):
+                self.record(scope, term, searched_at=newest - len(terms) + 1 + offset)
+        return len(terms)
+
+    def remove(self, scope: str, term: str) -> bool:
+        """Forget a term (its summary and its log entries)
+
+        Returns:
+            True if the term was in the history
+        """
+        term_norm = normalize_term(term)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM search_log WHERE scope = ? AND term_norm = ?",
+                             (scope, term_norm))
+                deleted = conn.execute(
+                    "DELETE FROM search_terms WHERE scope = ? AND term_norm = ?",
+                    (scope, term_norm)).rowcount
+        return deleted > 0
+
+    def clear(self, scope: str):
+        """Forget all history of a scope"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM search_log WHERE scope = ?", (scope,))
+                conn.execute("DELETE FROM search_terms WHERE scope = ?", (scope,))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _entry(self, row) -> HistoryEntry:
+        return HistoryEntry(
+            scope=row[0], term=row[1], uses=row[2], first_used=row[3],
+            last_used=row[4], result_count=row[5],
+            payload=json.loads(row[6]) if row[6] else {}, rank=row[7])
+
+    def _get(self, scope: str, term_norm: str) -> Optional[HistoryEntry]:
+        row = self._connection().execute(
+            f"SELECT {self._TERM_COLUMNS} FROM search_terms "
+            "WHERE scope = ? AND term_norm = ?", (scope, term_norm)).fetchone()
+        return self._entry(row) if row else None
+
+    def get(self, scope: str, term: str) -> Optional[HistoryEntry]:
+        """Summary of a term, or None if it was never searched"""
+        with self._lock:
+            return self._get(scope, normalize_term(term))
+
+    def recent(self, scope: str, limit: int = 20) -> List[HistoryEntry]:
+        """Distinct terms, most recently used first"""
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {self._TERM_COLUMNS} FROM search_terms WHERE scope = ? "
+                "ORDER BY last_used DESC LIMIT ?", (scope, limit)).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def ranked(self, scope: str, limit: int = 20) -> List[HistoryEntry]:
+        """Distinct terms, most frequently and recently used first"""
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {self._TERM_COLUMNS} FROM search_terms WHERE scope = ? "
+                "ORDER BY rank DESC LIMIT ?", (scope, limit)).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def complete(self, scope: str, prefix: str, limit: int = 10) -> List[str]:
+        """Previous terms starting with `prefix`, best ranked first
+
+        Matching ignores case and repeated spaces. An empty prefix returns
+        the best ranked terms.
+        """
+        prefix_norm = normalize_term(prefix)
+        if not prefix_norm:
+            return [entry.term for entry in self.ranked(scope, limit)]
+        # Keep a trailing space so "d38 " only matches multi-word terms
+        if prefix[-1:].isspace():
+            prefix_norm += ' '
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT term FROM search_terms "
+                "WHERE scope = ? AND term_norm >= ? AND term_norm < ? "
+                "ORDER BY rank DESC LIMIT ?",
+                (scope, prefix_norm, prefix_norm + _PREFIX_END, limit)).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, scope: str) -> int:
+        """Number of distinct terms in a scope"""
+        with self._lock:
+            return self._connection().execute(
+                "SELECT COUNT(*) FROM search_terms WHERE scope = ?", (scope,)).fetchone()[0]
+
+    def log_size(self, scope: str) -> int:
+        """Number of searches recorded in a scope"""
+        with self._lock:
+            return self._connection().execute(
+                "SELECT COUNT(*) FROM search_log WHERE scope = ?", (scope,)).fetchone()[0]
@@ -0,0 +1,487 @@
+"""
+Search Query - Boolean text queries compiled once, evaluated as column masks
+
+Syntax (case-insensitive matching, NOT > AND > OR):
+    aluminum plug         Plain words: one phrase, matched as a substring
+    "26 - plug"           Quoted phrase (operators inside are plain text)
+    /d38999.*pn/          Regular expression
+    Material:aluminum     Term scoped to one column; quote names with
+    "Shell Type":plug     spaces. Unknown columns search "name:value" as text
+    a AND b   "a" "b"     Both (terms next to each other are ANDed)
+    a OR b    a | b       Either (a, b as well when commas are enabled)
+    NOT a     -a          Not (-a only in queries using AND/OR/NOT or |)
+    ( ... )               Grouping (in queries using AND/OR/NOT or |)
+
+Plain text without any of this syntax means what it always did: one
+substring (comma-separated alternatives in the Connector Lookup). Text is
+never read as a regular expression unless written as /.../, and
+parentheses and dashes in a query without operators are text, so `1.5`,
+`Plug (Male)` and `-10P` find exactly that.
+
+compile_query() parses a query once (and caches it). Identical terms are
+shared, so `(a AND b) OR (a AND c)` looks for `a` only once. Each term is a
+vectorized str.contains over the lower-cased column text kept by a
+TextColumns cache, combined with NumPy boolean operations.
+
+Usage:
+    query = compile_query('Material:aluminum AND (plug OR receptacle)')
+    mask = query.mask(TextColumns(df))
+    df[mask]
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .part_number_index import canonical_part_number, canonical_part_numbers
+
+# Shortest canonical term also matched against normalized part numbers
+_MIN_KEY_LENGTH = 4
+
+_KEYWORDS = {'AND', 'OR', 'NOT'}
+
+# Tokens of AND/OR/NOT and '|', which make parentheses group terms and
+# '-' negate (commas and '-' give ('OR', ',') and ('NOT', '-') instead)
+_OPERATOR_TOKENS = {('AND',), ('OR',), ('NOT',)}
+
+# /regex/ (with \/ for a slash), optionally after a column name
+_REGEX_LITERAL = re.compile(r'(?:([^\s:"/()|,]+):)?/((?:[^/\\]|\\.)+)/')
+
+
+@dataclass(frozen=True)
+class Term:
+    """A single condition of a query"""
+    value: str  # Lower-cased text, or the regex pattern
+    regex: bool = False
+    column: Optional[str] = None  # Column name as written, None for any column
+    raw: str = ''  # Term as written (searched as text if the column is unknown)
+
+    @property
+    def pattern(self) -> 're.Pattern':
+        return _compile_pattern(self.value)
+
+    @property
+    def part_number_key(self) -> str:
+        """Canonical part number form, if the term looks like one"""
+        if self.regex:
+            return ''
+        key = canonical_part_number(self.value)
+        if len(key) < _MIN_KEY_LENGTH or not any(c.isdigit() for c in key):
+            return ''
+        return key
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> 're.Pattern':
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def column_key(name: str) -> str:
+    """How a query names a column (case, spaces and underscores ignored)"""
+    return re.sub(r'[\s_]+', '', str(name)).casefold()
+
+
+def _text_term(text: str, column: Optional[str] = None, raw: str = '') -> Term:
+    return Term(value=text.lower(), column=column, raw=raw or text)
+
+
+class TextColumns:
+    """Lower-cased text of a DataFrame's columns, built on first use
+
+    Keep one per loaded frame to reuse the text across searches.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: Optional[Iterable[str]] = None,
+                 key_columns: Iterable[str] = ()):
+        """Initialize the cache
+
+        Args:
+            df: Frame to search
+            columns: Columns searched by terms without a column (default all)
+            key_columns: Columns where text terms also match part numbers
+                written with other punctuation (D38999-26 finds D38999/26)
+        """
+        self.df = df
+        self.columns = [c for c in (df.columns if columns is None else columns)
+                        if c in df.columns]
+        self.key_columns = set(key_columns)
+        self._text: Dict[str, pd.Series] = {}
+        self._keys: Dict[str, pd.Series] = {}
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def text(self, column: str) -> pd.Series:
+        """Lower-cased text of a column"""
+        text = self._text.get(column)
+        if text is None:
+            text = self._text[column] = self.df[column].astype(str).str.lower()
+        return text
+
+    def keys(self, column: str) -> pd.Series:
+        """Canonical part number form of a column"""
+        keys = self._keys.get(column)
+        if keys is None:
+            keys = self._keys[column] = canonical_part_numbers(self.df[column])
+        return keys
+
+    def find_column(self, name: str) -> Optional[str]:
+        """Column a query names (case, spaces and underscores ignored)"""
+        if name in self.df.columns:
+            return name
+        wanted = column_key(name)
+        for column in self.df.columns:
+            if column_key(column) == wanted:
+                return column
+        return None
+
+    def match(self, column: str, term: Term, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows (of `rows`, or of the frame) where the column matches a term"""
+        text = self.text(column)
+        if rows is not None:
+            text = text.iloc[rows]
+        if term.regex:
+            return text.str.contains(term.pattern, na=False).to_numpy(dtype=bool)
+        found = text.str.contains(term.value, regex=False).to_numpy(dtype=bool)
+        key = term.part_number_key if column in self.key_columns else ''
+        if key:
+            keys = self.keys(column)
+            if rows is not None:
+                keys = keys.iloc[rows]
+            found |= keys.str.contains(key, regex=False).to_numpy(dtype=bool)
+        return found
+
+
+# ----------------------------------------------------------------------
+# Query tree
+# ----------------------------------------------------------------------
+
+class _Evaluation:
+    """State of one query evaluation (each distinct term is matched once)"""
+
+    def __init__(self, source: TextColumns, rows: Optional[np.ndarray], token):
+        self.source = source
+        self.rows = rows
+        self.size = len(source) if rows is None else len(rows)
+        self.token = token
+        self.masks: Dict[Term, np.ndarray] = {}
+
+    def term(self, term: Term) -> np.ndarray:
+        mask = self.masks.get(term)
+        if mask is None:
+            if self.token is not None:
+                self.token.raise_if_cancelled()
+            mask = self.masks[term] = self._match(term)
+        return mask
+
+    def _match(self, term: Term) -> np.ndarray:
+        columns = self.source.columns
+        if term.column is not None:
+            column = self.source.find_column(term.column)
+            if column is None:
+                return self.term(_text_term(term.raw))
+            columns = [column]
+        mask = np.zeros(self.size, dtype=bool)
+        for column in columns:
+            mask |= self.source.match(column, term, self.rows)
+        return mask
+
+
+class _Node:
+    def evaluate(self, evaluation: _Evaluation) -> np.ndarray:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class _TermNode(_Node):
+    term: Term
+
+    def evaluate(self, evaluation):
+        return evaluation.term(self.term)
+
+
+@dataclass(frozen=True)
+class _And(_Node):
+    children: Tuple[_Node, ...]
+
+    def evaluate(self, evaluation):
+        mask = self.children[0].evaluate(evaluation).copy()
+        for child in self.children[1:]:
+            if not mask.any():
+                break
+            mask &= child.evaluate(evaluation)
+        return mask
+
+
+@dataclass(frozen=True)
+class _Or(_Node):
+    children: Tuple[_Node, ...]
+
+    def evaluate(self, evaluation):
+        mask = self.children[0].evaluate(evaluation).copy()
+        for child in self.children[1:]:
+            if mask.all():
+                break
+            mask |= child.evaluate(evaluation)
+        return mask
+
+
+@dataclass(frozen=True)
+class _Not(_Node):
+    child: _Node
+
+    def evaluate(self, evaluation):
+        return ~self.child.evaluate(evaluation)
+
+
+class SearchQuery:
+    """A compiled query (see the module docstring for the syntax)"""
+
+    def __init__(self, text: str, root: Optional[_Node], terms: List[Term]):
+        self.text = text
+        self._root = root
+        self.terms = terms  # Distinct terms
+
+    def __repr__(self) -> str:
+        return f"SearchQuery({self.text!r})"
+
+    @property
+    def is_empty(self) -> bool:
+        return self._root is None
+
+    @property
+    def single_term(self) -> Optional[Term]:
+        """The term, when the query is one term searched in every column"""
+        if isinstance(self._root, _TermNode) and self._root.term.column is None:
+            return self._root.term
+        return None
+
+    @property
+    def plain_text(self) -> Optional[str]:
+        """Lower-cased text, when the query is one plain substring"""
+        term = self.single_term
+        return term.value if term is not None and not term.regex else None
+
+    def mask(self, source: TextColumns, rows: Optional[np.ndarray] = None,
+             token=None) -> np.ndarray:
+        """Boolean mask of the matching rows
+
+        Args:
+            source: Column text of the frame to search
+            rows: Only evaluate these row positions (mask is aligned to them)
+            token: Cancellation token checked before each term
+        """
+        if self._root is None:
+            return np.ones(len(source) if rows is None else len(rows), dtype=bool)
+        return self._root.evaluate(_Evaluation(source, rows, token))
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rows of df matching the query, searching all columns"""
+        if self._root is None:
+            return df
+        return df[self.mask(TextColumns(df))]
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+
+class QuerySyntaxError(ValueError):
+    """Raised for queries that cannot be parsed"""
+
+
+def _tokenize(text: str, comma_or: bool, operators: bool = True) -> List[tuple]:
+    """Split a query into ('LP',), ('RP',), ('OR',), ('AND',), ('NOT',),
+    ('WORD', start, end) and ('TERM', column, kind, value, raw) tokens
+
+    With operators off, parentheses and a leading '-' are part of the words.
+    """
+    tokens: List[tuple] = []
+    separators = '|,' if comma_or else '|'
+    depth = 0
+    column = None  # Column of a "name": prefix waiting for its value
+    i, n = 0, len(text)
+
+    def term(kind, value, raw):
+        nonlocal column
+        tokens.append(('TERM', column, kind, value,
+                       f'{column}:{raw}' if column is not None else raw))
+        column = None
+
+    while i < n:
+        char = text[i]
+        if char.isspace():
+            i += 1
+        elif char == '(' and column is None and operators:
+            tokens.append(('LP',))
+            depth += 1
+            i += 1
+        elif char == ')' and depth:
+            tokens.append(('RP',))
+            depth -= 1
+            i += 1
+        elif char in separators and column is None:
+            tokens.append(('OR',) if char == '|' else ('OR', char))
+            i += 1
+        elif char == '"':
+            end = text.find('"', i + 1)
+            end = n if end < 0 else end
+            value = text[i + 1:end]
+            i = end + 1
+            if column is None and i < n and text[i] == ':':
+                column = value  # "Shell Type":value
+                i += 1
+            else:
+                term('text', value, f'"{value}"')
+        elif _REGEX_LITERAL.match(text, i) and (column is None or char == '/'):
+            match = _REGEX_LITERAL.match(text, i)
+            if match.group(1) is not None:
+                column = match.group(1)
+            term('regex', match.group(2), f'/{match.group(2)}/')
+            i = match.end()
+        elif (char == '-' and column is None and operators and i + 1 < n
+              and not text[i + 1].isspace() and text[i + 1] not in ')' + separators
+              and (i == 0 or text[i - 1].isspace() or text[i - 1] == '(')):
+            tokens.append(('NOT', char))
+            i += 1
+        else:
+            start = i
+            while i < n and not text[i].isspace() and text[i] not in separators + '"':
+                i += 1
+            word = text[start:i]
+            # Trailing ')' close open groups; other parentheses are text
+            closing = 0
+            while word.endswith(')') and closing < depth:
+                word = word[:-1]
+                closing += 1
+            i = start + len(word)
+            if not word:
+                continue
+            if column is not None:
+                term('text', word, word)
+            elif word in _KEYWORDS:
+                tokens.append((word,))
+            elif ':' in word[1:-1] and not word.startswith(':'):
+                column, value = word.split(':', 1)
+                term('text', value, value)
+            elif word.endswith(':') and len(word) > 1 and i < n and text[i] == '"':
+                column = word[:-1]  # Name:"quoted value"
+            else:
+                tokens.append(('WORD', start, i))
+    if column is not None:
+        raise QuerySyntaxError(f"Missing value for column '{column}'")
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser over the tokens (NOT > AND > OR)"""
+
+    _OPERAND_STARTS = {'LP', 'NOT', 'WORD', 'TERM'}
+
+    def __init__(self, text: str, tokens: List[tuple]):
+        self.text = text
+        self.tokens = tokens
+        self.position = 0
+        self.terms: Dict[Term, _TermNode] = {}
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def take(self) -> tuple:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> Optional[_Node]:
+        if not self.tokens:
+            return None
+        node = self.parse_or()
+        if self.position != len(self.tokens):
+            raise QuerySyntaxError("Unexpected ')'")
+        return node
+
+    def parse_or(self) -> _Node:
+        children = [self.parse_and()]
+        while self.peek() == 'OR':
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else _Or(tuple(children))
+
+    def parse_and(self) -> _Node:
+        children = [self.parse_not()]
+        while self.peek() == 'AND' or self.peek() in self._OPERAND_STARTS:
+            if self.peek() == 'AND':
+                self.take()
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else _And(tuple(children))
+
+    def parse_not(self) -> _Node:
+        if self.peek() == 'NOT':
+            self.take()
+            return _Not(self.parse_not())
+        return self.parse_atom()
+
+    def parse_atom(self) -> _Node:
+        kind = self.peek()
+        if kind == 'LP':
+            self.take()
+            node = self.parse_or()
+            if self.peek() != 'RP':
+                raise QuerySyntaxError("Missing ')'")
+            self.take()
+            return node
+        if kind == 'WORD':
+            # Words next to each other form one phrase, spacing as typed
+            _, start, end = self.take()
+            while self.peek() == 'WORD':
+                end = self.take()[2]
+            return self.intern(_text_term(self.text[start:end]))
+        if kind == 'TERM':
+            _, column, term_kind, value, raw = self.take()
+            if term_kind == 'regex':
+                try:
+                    _compile_pattern(value)
+                    return self.intern(Term(value=value, regex=True, column=column, raw=raw))
+                except re.error:
+                    pass
+            return self.intern(_text_term(value, column, raw))
+        raise QuerySyntaxError("Expected a search term")
+
+    def intern(self, term: Term) -> _TermNode:
+        """Node for a term, shared by every occurrence of the term"""
+        node = self.terms.get(term)
+        if node is None:
+            node = self.terms[term] = _TermNode(term)
+        return node
+
+
+@lru_cache(maxsize=128)
+def compile_query(text: str, comma_or: bool = False) -> SearchQuery:
+    """Compile a search query
+
+    Text that does not parse (e.g. unbalanced parentheses) is searched as
+    one plain substring.
+
+    Args:
+        text: Query as typed
+        comma_or: Commas separate alternatives (Connector Lookup)
+
+    Returns:
+        SearchQuery (an empty query matches every row)
+    """
+    text = (text or '').strip()
+    if not text:
+        return SearchQuery(text, None, [])
+    try:
+        tokens = _tokenize(text, comma_or)
+        if not any(token in _OPERATOR_TOKENS for token in tokens):
+            tokens = _tokenize(text, comma_or, operators=False)
+        parser = _Parser(text, tokens)
+        root = parser.parse()
+    except QuerySyntaxError:
+        term = _text_term(text)
+        return SearchQuery(text, _TermNode(term), [term])
+    return SearchQuery(text, root, list(parser.terms))
@@ -12,6 +12,7 @@ Two-phase initialization:
 from typing import Dict, Any
 from .app_context import AppContext
 from ..connector.connector_context_provider import ConnectorContextProvider
+from ..tabs.tab_ids import TabId
 # from ..epd.epd_context_provider import EpdContextProvider
 
 
@@ -29,6 +30,15 @@ def setup_context_providers(context: AppContext, tab_registry: Dict[str, Any]) -
     """
 
     # Phase 1: Register initial providers (may be stubs/defaults)
-    context.register_context_provider('connectors', ConnectorContextProvider())
+    # The connector model is taken from the context once the Connector tab
+    # has loaded it
+    connector_provider = ConnectorContextProvider(context=context)
+    context.register_context_provider('connectors', connector_provider)
+
+    # Document Scanner results get connector context (a Document Scanner
+    # tab loaded later picks the provider up from the context itself)
+    document_scanner = tab_registry.get(TabId.DOCUMENT_SCANNER, {}).get('presenter')
+    if document_scanner is not None and hasattr(document_scanner, 'search_presenter'):
+        document_scanner.search_presenter.register_context_provider(connector_provider)
 
     print("[AppContext] ✓ All context providers setup complete (Phase 1 - defaults)")
@@ -0,0 +1,448 @@
+"""
+Task Scheduler - Shared bounded thread pool for background work
+
+Replaces one QThread per operation with a single QThreadPool:
+- Priorities: interactive work (searches, comparisons) runs ahead of
+  background loading when the pool is busy
+- Coalescing: submitting under a key that is already queued or running
+  returns the existing task (or replaces it, for "latest wins" work)
+- Cancellation: every task carries a CancellationToken; cancelling a queued
+  task removes it from the pool, cancelling a running one sets the token
+- Timing: queue wait and run time are recorded for every task
+
+Usage:
+    scheduler = context.get('task_scheduler')
+
+    # Plain function
+    task = scheduler.submit(load_rows, path, name='load_rows',
+                            priority=TaskPriority.BACKGROUND)
+    task.finished.connect(on_rows)
+
+    # Existing BaseDataWorker (its own signals keep working)
+    worker = EpdDataWorker()
+    worker.finished.connect(on_loaded)
+    scheduler.submit_worker(worker, name='epd_load', key='epd_load')
+"""
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal, Slot
+
+from .app_logging import fields, get_logger, sample
+
+logger = get_logger(__name__)
+
+# Default number of pool threads
+DEFAULT_MAX_THREADS = 4
+
+# Number of finished task timings kept for reporting
+TIMING_HISTORY_SIZE = 200
+
+# Completed tasks logged (1 in N); failures are always logged
+LOG_SAMPLE_EVERY = 20
+
+
+class TaskPriority(IntEnum):
+    """Pool priority - higher values start first"""
+    BACKGROUND = 0
+    NORMAL = 10
+    INTERACTIVE = 20
+
+
+class TaskCancelled(Exception):
+    """Raised by CancellationToken.raise_if_cancelled()"""
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag shared between a task and its owner"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        """Request cancellation and run registered callbacks (once)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def add_callback(self, callback: Callable[[], None]):
+        """Call callback on cancellation (immediately if already cancelled)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self):
+        """Raise TaskCancelled if cancellation was requested"""
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+@dataclass
+class TaskTiming:
+    """Timing of one finished task"""
+    name: str
+    priority: TaskPriority
+    status: str  # 'finished', 'error' or 'cancelled'
+    wait_ms: float  # Time queued before a pool thread picked it up
+    run_ms: float  # Time spent running
+
+
+class TaskHandle(QObject):
+    """A submitted task: result signals, cancellation token and timing
+
+    finished/error/cancelled are emitted in the thread the handle was
+    created in (the submitting thread), once control returns to its event
+    loop - never during submit() - so connecting right after submit()
+    cannot miss a task that finishes immediately. progress is emitted from
+    the pool thread.
+    """
+
+    progress = Signal(int, str)  # progress_percent, status_message
+    finished = Signal(object)  # return value
+    error = Signal(str)  # error_message
+    cancelled = Signal()
+
+    # Final status and payload, emitted from any thread and queued to the
+    # handle's own thread (see _deliver)
+    _completed = Signal(str, object)
+
+    def __init__(self, name: str, priority: TaskPriority, key: Optional[str]):
+        super().__init__()
+        self.name = name
+        self.priority = priority
+        self.key = key
+        self.token = CancellationToken()
+        self.queued_at = time.perf_counter()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.status = 'queued'
+        self._keep_alive: Optional['TaskHandle'] = None
+        self._completed.connect(self._deliver, Qt.QueuedConnection)
+
+    def cancel(self):
+        """Request cancellation (queued tasks are dropped by the scheduler)"""
+        self.token.cancel()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.token.is_cancelled
+
+    def is_active(self) -> bool:
+        """Whether the task is queued or running"""
+        return self.status in ('queued', 'running')
+
+    def _complete(self, payload: Any = None):
+        """Report the final status (from any thread)"""
+        # Stay alive until delivered even if the submitter dropped the handle
+        self._keep_alive = self
+        self._completed.emit(self.status, payload)
+
+    @Slot(str, object)
+    def _deliver(self, status: str, payload: Any):
+        self._keep_alive = None
+        if status == 'finished':
+            self.finished.emit(payload)
+        elif status == 'error':
+            self.error.emit(payload)
+        else:
+            self.cancelled.emit()
+
+    def report_progress(self, percent: int, message: str) -> bool:
+        """Emit progress unless cancelled
+
+        Returns True if the task should continue, False if cancelled.
+        Use as: if not task.report_progress(50, "Loading..."): return
+        """
+        if self.token.is_cancelled:
+            return False
+        self.progress.emit(percent, message)
+        return True
+
+    def timing(self) -> TaskTiming:
+        started = self.started_at or self.finished_at or self.queued_at
+        finished = self.finished_at or started
+        return TaskTiming(
+            name=self.name,
+            priority=self.priority,
+            status=self.status,
+            wait_ms=(started - self.queued_at) * 1000,
+            run_ms=(finished - started) * 1000)
+
+
+class _TaskRunnable(QRunnable):
+    """Runs one task function on a pool thread"""
+
+    def __init__(self, handle: TaskHandle, func: Callable[[], Any],
+                 on_done: Callable[[TaskHandle], None]):
+        super().__init__()
+        self.handle = handle
+        self.func = func
+        self.on_done = on_done
+
+    def run(self):
+        handle = self.handle
+        handle.started_at = time.perf_counter()
+        handle.status = 'running'
+        try:
+            if handle.token.is_cancelled:
+                raise TaskCancelled()
+            result = self.func()
+            handle.token.raise_if_cancelled()
+        except TaskCancelled:
+            handle.status = 'cancelled'
+        except Exception as e:
+            handle.status = 'error'
+            traceback.print_exc()
+            handle.finished_at = time.perf_counter()
+            self.on_done(handle)
+            handle._complete(str(e))
+            return
+        else:
+            handle.status = 'finished'
+
+        handle.finished_at = time.perf_counter()
+        self.on_done(handle)
+        handle._complete(result if handle.status == 'finished' else None)
+
+
+class TaskScheduler(QObject):
+    """Bounded, prioritised pool shared by all background work
+
+    Register one instance in AppContext as 'task_scheduler'; code without a
+    context can use TaskScheduler.shared().
+    """
+
+    # TaskTiming of each finished task (delivered in the receiver's thread)
+    task_completed = Signal(object)
+
+    _shared: Optional['TaskScheduler'] = None
+
+    def __init__(self, max_threads: int = DEFAULT_MAX_THREADS):
+        super().__init__()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads)
+        self._lock = threading.Lock()
+        self._active: Dict[int, _TaskRunnable] = {}
+        self._by_key: Dict[str, TaskHandle] = {}
+        self._timings: Deque[TaskTiming] = deque(maxlen=TIMING_HISTORY_SIZE)
+
+    @classmethod
+    def shared(cls) -> 'TaskScheduler':
+        """Process-wide scheduler (created on first use)"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def max_threads(self) -> int:
+        return self._pool.maxThreadCount()
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(self, func: Callable, *args, name: Optional[str] = None,
+               priority: TaskPriority = TaskPriority.NORMAL,
+               key: Optional[str] = None, replace: bool = False,
+               pass_task: bool = False, **kwargs) -> TaskHandle:
+        """Queue func(*args, **kwargs) on the pool
+
+        Args:
+            func: Function to run on a pool thread
+            name: Name used in timing reports (defaults to func's name)
+            priority: Pool priority
+            key: Coalescing key - while a task with this key is active,
+                submit returns it instead of queueing a duplicate
+            replace: With a key, cancel the active task and queue this one
+            pass_task: Pass the TaskHandle as a 'task' keyword argument, for
+                progress reporting and cancellation checks
+
+        Returns:
+            TaskHandle of the queued (or coalesced) task
+        """
+        name = name or getattr(func, '__name__', 'task')
+        existing = self._coalesce(key, replace)
+        if existing is not None:
+            return existing
+
+        handle = TaskHandle(name, priority, key)
+        if pass_task:
+            kwargs['task'] = handle
+        self._start(handle, lambda: func(*args, **kwargs))
+        return handle
+
+    def submit_worker(self, worker, name: Optional[str] = None,
+                      priority: TaskPriority = TaskPriority.NORMAL,
+                      key: Optional[str] = None, replace: bool = False,
+                      run: Optional[Callable[[], Any]] = None,
+                      cancel: Optional[Callable[[], None]] = None) -> TaskHandle:
+        """Run a worker object (e.g. a BaseDataWorker) on the pool
+
+        The worker keeps its own signals; cancelling the task calls the
+        worker's cancel method. Callers may rely on the worker's signals
+        alone: however the task ends, the worker emits exactly one of
+        finished, error or cancelled (for those it has). When the worker
+        did not report the end itself, the scheduler emits for it:
+        - cancelled if the task was dropped from the queue, or run returned
+          after cancellation without emitting anything
+        - error(message) if run raised
+        These are emitted in the submitting thread, like the handle's.
+
+        Args:
+            worker: Worker object
+            name: Name used in timing reports (defaults to the class name)
+            priority: Pool priority
+            key: Coalescing key (see submit)
+            replace: With a key, cancel the active task and queue this one
+            run: Entry point (defaults to worker.run)
+            cancel: Cancellation method (defaults to worker.cancel)
+
+        Returns:
+            TaskHandle of the queued (or coalesced) task
+        """
+        name = name or type(worker).__name__
+        existing = self._coalesce(key, replace)
+        if existing is not None:
+            return existing
+
+        handle = TaskHandle(name, priority, key)
+        handle.worker = worker  # Keep the worker alive while queued/running
+        handle.token.add_callback(cancel or worker.cancel)
+        self._forward_end(handle, worker)
+        self._start(handle, run or worker.run)
+        return handle
+
+    @staticmethod
+    def _forward_end(handle: TaskHandle, worker):
+        """Emit the worker's cancelled/error signal when the task ends
+        without the worker having reported it (see submit_worker)"""
+        reported = threading.Event()
+        for signal_name in ('finished', 'error', 'cancelled'):
+            signal = getattr(worker, signal_name, None)
+            if signal is not None:
+                signal.connect(lambda *_: reported.set(), Qt.DirectConnection)
+
+        def forward(signal_name: str, *args):
+            signal = getattr(worker, signal_name, None)
+            if signal is not None and not reported.is_set():
+                signal.emit(*args)
+
+        handle.cancelled.connect(lambda: forward('cancelled'))
+        handle.error.connect(lambda message: forward('error', message))
+
+    def _coalesce(self, key: Optional[str], replace: bool) -> Optional[TaskHandle]:
+        """Existing active task for key, cancelling it when replacing"""
+        if key is None:
+            return None
+        with self._lock:
+            existing = self._by_key.get(key)
+        if existing is None or not existing.is_active() or existing.is_cancelled:
+            return None
+        if replace:
+            self.cancel(existing)
+            return None
+        return existing
+
+    def _start(self, handle: TaskHandle, func: Callable[[], Any]):
+        runnable = _TaskRunnable(handle, func, self._task_done)
+        runnable.setAutoDelete(False)
+        # Owned by the handle, so it is not freed on the pool thread mid-run
+        handle.runnable = runnable
+        with self._lock:
+            self._active[id(handle)] = runnable
+            if handle.key is not None:
+                self._by_key[handle.key] = handle
+        self._pool.start(runnable, int(handle.priority))
+
+    # ------------------------------------------------------------------
+    # Cancellation
+    # ------------------------------------------------------------------
+
+    def cancel(self, handle: TaskHandle):
+        """Cancel a task, dropping it from the queue if it has not started"""
+        handle.token.cancel()
+        with self._lock:
+            runnable = self._active.get(id(handle))
+        if runnable is not None and self._pool.tryTake(runnable):
+            handle.status = 'cancelled'
+            handle.finished_at = time.perf_counter()
+            self._task_done(handle)
+            handle._complete()
+
+    def cancel_key(self, key: str):
+        """Cancel the active task submitted under key, if any"""
+        with self._lock:
+            handle = self._by_key.get(key)
+        if handle is not None and handle.is_active():
+            self.cancel(handle)
+
+    def cancel_all(self):
+        """Cancel every queued and running task"""
+        with self._lock:
+            handles = [runnable.handle for runnable in self._active.values()]
+        for handle in handles:
+            self.cancel(handle)
+
+    def shutdown(self, timeout_ms: int = 3000) -> bool:
+        """Cancel all tasks and wait for running ones to return
+
+        Returns:
+            True if the pool drained within the timeout
+        """
+        self.cancel_all()
+        return self._pool.waitForDone(timeout_ms)
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """Block until all tasks have finished (mainly for tests and shutdown)"""
+        return self._pool.waitForDone(timeout_ms)
+
+    # ------------------------------------------------------------------
+    # Bookkeeping and timing
+    # ------------------------------------------------------------------
+
+    def _task_done(self, handle: TaskHandle):
+        """Record a finished task (called from the pool thread)"""
+        with self._lock:
+            self._active.pop(id(handle), None)
+            if handle.key is not None and self._by_key.get(handle.key) is handle:
+                del self._by_key[handle.key]
+            timing = handle.timing()
+            self._timings.append(timing)
+
+        values = dict(task=timing.name, status=timing.status,
+                      run_ms=round(timing.run_ms), wait_ms=round(timing.wait_ms))
+        if timing.status == 'error':
+            logger.debug("Task %s failed after %.0f ms", timing.name, timing.run_ms,
+                         extra=fields(**values))
+        else:
+            logger.debug("Task %s %s in %.0f ms (queued %.0f ms)", timing.name,
+                         timing.status, timing.run_ms, timing.wait_ms,
+                         extra=sample(LOG_SAMPLE_EVERY, **values))
+        self.task_completed.emit(timing)
+
+    def active_count(self) -> int:
+        """Number of queued or running tasks"""
+        with self._lock:
+            return len(self._active)
+
+    def timings(self) -> List[TaskTiming]:
+        """Timings of recently finished tasks, oldest first"""
+        with self._lock:
+            return list(self._timings)
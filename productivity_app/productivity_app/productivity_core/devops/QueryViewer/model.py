@@ -1,8 +1,22 @@
 """
 Query Viewer Model - Data management for Azure DevOps query execution
 """
+import asyncio
+import base64
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
 from PySide6.QtCore import QObject, Signal
 
+from ...core import async_http
+from ...core.async_bridge import AsyncBridge, AsyncTask
+
+# Azure DevOps REST API version used for work item queries
+API_VERSION = "7.0"
+
+# Maximum work item ids per "get work items" request (service limit)
+WORK_ITEMS_BATCH_SIZE = 200
+
 
 class QueryViewerModel(QObject):
     """Model for Azure DevOps Query Viewer"""
@@ -13,7 +27,14 @@ class QueryViewerModel(QObject):
     connection_failed = Signal(str)  # error message
     error_occurred = Signal(str)  # error message
 
-    def __init__(self):
+    def __init__(self, api_base_url: Optional[str] = None,
+                 bridge: Optional[AsyncBridge] = None):
+        """
+        Args:
+            api_base_url: Azure DevOps REST root (e.g. "https://dev.azure.com");
+                None returns placeholder results
+            bridge: AsyncBridge queries run on (defaults to the shared one)
+        """
         super().__init__()
         self.organization = ""
         self.project = ""
@@ -21,6 +42,9 @@ class QueryViewerModel(QObject):
         self.connected = False
         self.last_query = ""
         self.last_results = []
+        self.api_base_url = api_base_url.rstrip('/') if api_base_url else None
+        self._bridge = bridge or AsyncBridge.shared()
+        self._query_task: Optional[AsyncTask] = None
 
     def connect_to_azure_devops(self, organization: str, project: str, pat: str):
         """Connect to Azure DevOps
@@ -59,7 +83,10 @@ class QueryViewerModel(QObject):
             self.connection_failed.emit(error_msg)
 
     def execute_query(self, query: str, query_type: str = "WIQL Query"):
-        """Execute an Azure DevOps query
+        """Execute an Azure DevOps query on the async bridge
+
+        Results arrive through query_executed / error_occurred. A new query
+        cancels one that is still running.
 
         Args:
             query: The query to execute (Query ID or WIQL)
@@ -69,23 +96,94 @@ class QueryViewerModel(QObject):
             self.error_occurred.emit("Not connected to Azure DevOps")
             return
 
-        try:
-            # Store last query
-            self.last_query = query
+        # Store last query
+        self.last_query = query
 
-            # Execute based on type
-            if query_type == "Saved Query (ID)":
-                results = self._execute_saved_query(query)
-            else:  # WIQL Query
-                results = self._execute_wiql_query(query)
+        if self._query_task is not None and self._query_task.is_active():
+            self._query_task.cancel()
+        task = self._bridge.submit(
+            self.execute_query_async(query, query_type), name='devops_query')
+        task.finished.connect(self._on_query_finished)
+        task.error.connect(self._on_query_failed)
+        self._query_task = task
 
-            self.last_results = results
-            headers, rows = results
-            self.query_executed.emit(headers, rows)
+    async def execute_query_async(self, query: str,
+                                  query_type: str = "WIQL Query") -> Tuple[List[str], List[List[str]]]:
+        """Execute an Azure DevOps query
 
-        except Exception as e:
-            error_msg = f"Error executing query: {str(e)}"
-            self.error_occurred.emit(error_msg)
+        Args:
+            query: The query to execute (Query ID or WIQL)
+            query_type: Type of query ("Saved Query (ID)" or "WIQL Query")
+
+        Returns:
+            Tuple of (headers, rows)
+        """
+        if self.api_base_url is None:
+            if query_type == "Saved Query (ID)":
+                return self._execute_saved_query(query)
+            return self._execute_wiql_query(query)
+
+        if query_type == "Saved Query (ID)":
+            result = await async_http.get_json(
+                self._api_url(f"wit/wiql/{quote(query.strip(), safe='')}"),
+                headers=self._auth_headers())
+        else:
+            result = await async_http.post_json(
+                self._api_url("wit/wiql"), {'query': query},
+                headers=self._auth_headers())
+        return await self._fetch_work_items(result)
+
+    def _on_query_finished(self, results: Tuple[List[str], List[List[str]]]):
+        self.last_results = results
+        headers, rows = results
+        self.query_executed.emit(headers, rows)
+
+    def _on_query_failed(self, message: str):
+        self.error_occurred.emit(f"Error executing query: {message}")
+
+    def _api_url(self, path: str, **params: str) -> str:
+        query = '&'.join(f"{key}={value}" for key, value in params.items())
+        return (f"{self.api_base_url}/{quote(self.organization)}/{quote(self.project)}"
+                f"/_apis/{path}?{query + '&' if query else ''}api-version={API_VERSION}")
+
+    def _auth_headers(self) -> Dict[str, str]:
+        token = base64.b64encode(f":{self.pat}".encode('utf-8')).decode('ascii')
+        return {'Authorization': f"Basic {token}"}
+
+    async def _fetch_work_items(self, result: Dict[str, Any]) -> Tuple[List[str], List[List[str]]]:
+        """Turn a WIQL result into (headers, rows), fetching work item fields
+
+        Batches of work items are requested concurrently.
+        """
+        columns = result.get('columns', [])
+        ids = [item['id'] for item in result.get('workItems', [])]
+        if not ids:
+            # Link queries return relations instead of a flat list
+            ids = list(dict.fromkeys(
+                relation['target']['id']
+                for relation in result.get('workItemRelations', [])
+                if relation.get('target')))
+
+        headers = [column['name'] for column in columns]
+        fields = [column['referenceName'] for column in columns]
+        if not ids or not fields:
+            return (headers, [])
+
+        batches = [ids[i:i + WORK_ITEMS_BATCH_SIZE]
+                   for i in range(0, len(ids), WORK_ITEMS_BATCH_SIZE)]
+        responses = await asyncio.gather(*(
+            async_http.get_json(
+                self._api_url("wit/workitems",
+                              ids=','.join(map(str, batch)),
+                              fields=','.join(fields)),
+                headers=self._auth_headers())
+            for batch in batches))
+
+        items = {item['id']: item.get('fields', {})
+                 for response in responses for item in response.get('value', [])}
+        rows = [[_format_field(items[item_id].get(field)) for field in fields]
+                for item_id in ids if item_id in items]
+        return (headers, rows)
 
     def _execute_saved_query(self, query_id: str):
         """Execute a saved Azure DevOps query by ID
@@ -96,12 +194,7 @@ class QueryViewerModel(QObject):
         Returns:
             Tuple of (headers, rows)
         """
-        # TODO: Implement actual Azure DevOps saved query execution
-        # from azure.devops.v7_0.work_item_tracking.models import Wiql
-        # wit_client = self.connection.clients.get_work_item_tracking_client()
-        # query_result = wit_client.query_by_id(query_id)
-
-        # Placeholder implementation
+        # Placeholder results, used when no api_base_url is configured
         headers = ["ID", "Title", "State", "Assigned To", "Work Item Type"]
         rows = [
             ["12345", "Sample Bug", "Active", "user@example.com", "Bug"],
@@ -121,14 +214,7 @@ class QueryViewerModel(QObject):
         Returns:
             Tuple of (headers, rows)
         """
-        # TODO: Implement actual WIQL query execution
-        # from azure.devops.v7_0.work_item_tracking.models import Wiql
-        # wit_client = self.connection.clients.get_work_item_tracking_client()
-        # wiql_object = Wiql(query=wiql)
-        # query_result = wit_client.query_by_wiql(wiql_object)
-        # work_items = wit_client.get_work_items(ids=[item.id for item in query_result.work_items])
-
-        # Placeholder implementation
+        # Placeholder results, used when no api_base_url is configured
         headers = ["ID", "Title", "State", "Assigned To",
                    "Work Item Type", "Created Date"]
         rows = [
@@ -148,3 +234,13 @@ class QueryViewerModel(QObject):
         """Clear stored query and results"""
         self.last_query = ""
         self.last_results = []
+
+
+def _format_field(value: Any) -> str:
+    """Display text for a work item field value"""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        # Identity fields such as System.AssignedTo
+        return value.get('displayName') or value.get('uniqueName') or ""
+    return str(value)
@@ -3,12 +3,13 @@ DevOps Presenter - Manages the DevOps module
 """
 from PySide6.QtCore import QObject
 from ..devops import DevOpsModuleView
+from ..tabs.tab_ids import TabId
 
 
 class DevOpsPresenter(QObject):
     """Presenter for the DevOps module"""
 
-    MODULE_ID = 'devops'
+    MODULE_ID = TabId.DEVOPS
 
     def __init__(self, context):
         super().__init__()
@@ -3,21 +3,14 @@ DevOps Module - Main tab containing Query Viewer and other DevOps tools
 """
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
 from ..devops.QueryViewer import QueryViewerPresenter
+from ..tabs.tab_ids import DevOpsTabs
 
 
-class DevOpsModuleView(QWidget):
+class DevOpsModuleView(QWidget, DevOpsTabs):
     """Main DevOps module containing Query Viewer and other sub-tabs"""
 
-    # ========================================================================
-    # Module Constants - Single source of truth for module identification
-    # ========================================================================
-    MODULE_ID = 'devops'
-    SUB_TAB_QUERY_VIEWER = 'query_viewer'
-
-    SUB_TAB_ORDER = [SUB_TAB_QUERY_VIEWER]
-    SUB_TAB_LABELS = {
-        SUB_TAB_QUERY_VIEWER: 'Query Viewer',
-    }
+    # Module and sub-tab identifiers (MODULE_ID, SUB_TAB_*) come from
+    # DevOpsTabs in tabs/tab_ids.py
 
     def __init__(self, context):
         super().__init__()
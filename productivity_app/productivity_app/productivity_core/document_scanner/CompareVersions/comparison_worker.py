@@ -0,0 +1,45 @@
+"""
+Comparison Worker - Runs a version comparison on a background task thread
+"""
+from typing import Any, Dict
+
+import pandas as pd
+
+from ...core.base_data_worker import BaseDataWorker
+from .diff_engine import HASH_CHUNK_SIZE, compare_versions_chunked
+
+
+class ComparisonWorker(BaseDataWorker):
+    """Worker comparing two document versions off the GUI thread
+
+    Emits finished(results_df) on success, error(message) on failure and
+    cancelled() if cancel() was called before the comparison completed.
+    """
+
+    def __init__(self, df1: pd.DataFrame, df2: pd.DataFrame, config: Dict[str, Any],
+                 chunk_size: int = HASH_CHUNK_SIZE):
+        super().__init__()
+        self.df1 = df1
+        self.df2 = df2
+        self.config = config
+        self.chunk_size = chunk_size
+
+    def run(self):
+        """Execute the comparison in background thread"""
+        try:
+            results = compare_versions_chunked(
+                self.df1,
+                self.df2,
+                self.config,
+                chunk_size=self.chunk_size,
+                progress_callback=self.emit_progress)
+
+            if results is None or self.is_cancelled:
+                self.cancelled.emit()
+                return
+
+            self.emit_progress(100, f"Compared {len(results):,} rows")
+            self.finished.emit(results)
+
+        except Exception as e:
+            self.error.emit(f"Comparison failed: {str(e)}")
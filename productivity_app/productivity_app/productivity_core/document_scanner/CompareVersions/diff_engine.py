@@ -0,0 +1,362 @@
+"""
+Diff Engine - Vectorized key-based comparison of two document versions
+
+Rows are aligned with a full outer join on the key column (plus an
+occurrence counter, so duplicate keys are paired first-with-first,
+second-with-second and any extras reported as only in one version).
+Values are then compared one column at a time over whole arrays instead
+of per key.
+
+Kept free of Qt so it can be tested directly and run from a worker thread.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+VERDICT_SAME = "Same"
+VERDICT_DIFFERENT = "Different"
+VERDICT_ONLY_V1 = "Only in Version 1"
+VERDICT_ONLY_V2 = "Only in Version 2"
+
+# Rows hashed per chunk between progress updates / cancellation checks
+HASH_CHUNK_SIZE = 100_000
+
+# Internal row position columns
+_ROW_V1 = '__row_v1'
+_ROW_V2 = '__row_v2'
+
+
+def validate_config(df1: pd.DataFrame, df2: pd.DataFrame, config: Dict[str, Any]):
+    """Raise ValueError if a configured key/compare column is missing"""
+    for col in [config['key_column']] + list(config['compare_columns']):
+        if col not in df1.columns:
+            raise ValueError(f"Column '{col}' not found in Version 1")
+        if col not in df2.columns:
+            raise ValueError(f"Column '{col}' not found in Version 2")
+
+
+def count_duplicate_keys(df: pd.DataFrame, key_col: str) -> int:
+    """Number of rows whose key already appeared earlier in the frame"""
+    return int(df[key_col].duplicated().sum())
+
+
+def align_versions(df1: pd.DataFrame, df2: pd.DataFrame, key_col: str) -> pd.DataFrame:
+    """Pair rows of both versions by key (a vectorized full outer join)
+
+    Keys of both versions are factorized together, so rows come out in
+    Version 1 order followed by keys only found in Version 2. Duplicate keys
+    are paired by occurrence order within each version.
+
+    Returns:
+        DataFrame with the key column, '__row_v1'/'__row_v2' row positions
+        (-1 when absent) and a merge indicator column '_merge'
+        ('both', 'left_only' or 'right_only')
+    """
+    n1, n2 = len(df1), len(df2)
+    keys = pd.concat([df1[key_col], df2[key_col]], ignore_index=True)
+    codes, _ = pd.factorize(keys, use_na_sentinel=False)
+
+    if df1[key_col].duplicated().any() or df2[key_col].duplicated().any():
+        # Make (key, occurrence) the join key so duplicates pair up in order
+        occurrence = np.concatenate([
+            pd.Series(codes[:n1]).groupby(codes[:n1]).cumcount().to_numpy(),
+            pd.Series(codes[n1:]).groupby(codes[n1:]).cumcount().to_numpy(),
+        ])
+        codes, _ = pd.factorize(codes * (int(occurrence.max()) + 1) + occurrence)
+
+    n_keys = int(codes.max()) + 1 if len(codes) else 0
+    rows_v1 = np.full(n_keys, -1, dtype=np.int64)
+    rows_v2 = np.full(n_keys, -1, dtype=np.int64)
+    rows_v1[codes[:n1]] = np.arange(n1)
+    rows_v2[codes[n1:]] = np.arange(n2)
+
+    # factorize numbers codes by first appearance, so a new code marks the
+    # first occurrence of each joined key
+    previous_max = np.maximum.accumulate(np.concatenate([[-1], codes[:-1]]))
+    first_position = np.flatnonzero(codes > previous_max)
+
+    in_v1 = rows_v1 >= 0
+    in_v2 = rows_v2 >= 0
+    indicator = np.where(in_v1 & in_v2, 'both',
+                         np.where(in_v1, 'left_only', 'right_only'))
+
+    return pd.DataFrame({
+        key_col: keys.to_numpy()[first_position],
+        _ROW_V1: rows_v1,
+        _ROW_V2: rows_v2,
+        '_merge': indicator,
+    })
+
+
+def values_differ(a: pd.Series, b: pd.Series) -> np.ndarray:
+    """NaN-aware elementwise inequality
+
+    Matches the previous per-cell rule: missing values count as "" and other
+    values are compared by their string form. The string conversion is only
+    done for pairs that are not already equal by value.
+    """
+    a = a.reset_index(drop=True)
+    b = b.reset_index(drop=True)
+    a_na = a.isna().to_numpy()
+    b_na = b.isna().to_numpy()
+
+    try:
+        equal = np.asarray(a.to_numpy() == b.to_numpy(), dtype=bool)
+    except (TypeError, ValueError):
+        equal = np.zeros(len(a), dtype=bool)
+    equal |= a_na & b_na
+
+    candidates = ~equal
+    if candidates.any():
+        str_a = a[candidates].astype(object).where(~a_na[candidates], "").astype(str)
+        str_b = b[candidates].astype(object).where(~b_na[candidates], "").astype(str)
+        equal[candidates] = str_a.to_numpy() == str_b.to_numpy()
+
+    return ~equal
+
+
+def change_matrix(df1: pd.DataFrame, df2: pd.DataFrame, rows_v1: np.ndarray,
+                  rows_v2: np.ndarray, columns: List[str]) -> np.ndarray:
+    """Boolean matrix (rows x columns) marking which compared values differ
+
+    Args:
+        df1, df2: The two versions
+        rows_v1, rows_v2: Paired row positions in each version
+        columns: Columns to compare
+    """
+    matrix = np.zeros((len(rows_v1), len(columns)), dtype=bool)
+    for idx, col in enumerate(columns):
+        matrix[:, idx] = values_differ(
+            df1[col].take(rows_v1), df2[col].take(rows_v2))
+    return matrix
+
+
+def changed_column_labels(matrix: np.ndarray, columns: List[str]) -> np.ndarray:
+    """Join the names of the differing columns of each row with ", "
+
+    Each distinct change pattern is formatted once and broadcast back; rows
+    without changes get "".
+    """
+    labels = np.full(len(matrix), "", dtype=object)
+    changed = matrix.any(axis=1) if matrix.size else np.zeros(len(matrix), dtype=bool)
+    if not changed.any():
+        return labels
+
+    changed_rows = matrix[changed]
+    if len(columns) <= 62:
+        # Encode each pattern as a bit mask so unique() works on integers
+        weights = np.left_shift(np.int64(1), np.arange(len(columns), dtype=np.int64))
+        codes = changed_rows.astype(np.int64) @ weights
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        patterns = (unique_codes[:, None] & weights) != 0
+    else:
+        patterns, inverse = np.unique(changed_rows, axis=0, return_inverse=True)
+
+    pattern_labels = np.array(
+        [", ".join(col for col, differs in zip(columns, pattern) if differs)
+         for pattern in patterns],
+        dtype=object)
+    labels[changed] = pattern_labels[inverse.reshape(-1)]
+    return labels
+
+
+def _take_or_nan(series: pd.Series, rows: np.ndarray) -> pd.Series:
+    """Values at row positions, NaN where the position is -1"""
+    values = series.reset_index(drop=True)
+    return values.reindex(rows).reset_index(drop=True)
+
+
+def build_results(df1: pd.DataFrame, df2: pd.DataFrame, aligned: pd.DataFrame,
+                  key_col: str, show_cols: List[str],
+                  changed_labels: Optional[np.ndarray]) -> pd.DataFrame:
+    """Assemble the comparison result table
+
+    Args:
+        df1, df2: The two versions
+        aligned: Output of align_versions
+        key_col: Key column name
+        show_cols: Columns shown side by side as <col>_V1 / <col>_V2
+        changed_labels: Changed_Columns per aligned row ("" when unchanged)
+
+    Returns:
+        DataFrame with the key, Verdict, Changed_Columns (if any row differs)
+        and the shown columns of each version
+    """
+    indicator = aligned['_merge'].to_numpy()
+    if changed_labels is None:
+        changed_labels = np.full(len(aligned), "", dtype=object)
+    different = changed_labels != ""
+
+    verdict = np.select(
+        [indicator == 'left_only', indicator == 'right_only', different],
+        [VERDICT_ONLY_V1, VERDICT_ONLY_V2, VERDICT_DIFFERENT],
+        default=VERDICT_SAME)
+
+    columns = {key_col: aligned[key_col].to_numpy(), 'Verdict': verdict}
+    if different.any():
+        columns['Changed_Columns'] = np.where(different, changed_labels, np.nan)
+
+    rows_v1 = aligned[_ROW_V1].to_numpy()
+    rows_v2 = aligned[_ROW_V2].to_numpy()
+    for col in show_cols:
+        if col == key_col:
+            continue
+        if col in df1.columns:
+            columns[f"{col}_V1"] = _take_or_nan(df1[col], rows_v1)
+        if col in df2.columns:
+            columns[f"{col}_V2"] = _take_or_nan(df2[col], rows_v2)
+
+    return pd.DataFrame(columns)
+
+
+def paired_rows(aligned: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Positions of rows present in both versions
+
+    Returns:
+        (mask over aligned rows, row positions in version 1, in version 2)
+    """
+    both = (aligned['_merge'] == 'both').to_numpy()
+    return both, aligned[_ROW_V1].to_numpy()[both], aligned[_ROW_V2].to_numpy()[both]
+
+
+def compare_versions(df1: pd.DataFrame, df2: pd.DataFrame,
+                     config: Dict[str, Any]) -> pd.DataFrame:
+    """Compare two dataframes based on configuration
+
+    Args:
+        df1: First version dataframe
+        df2: Second version dataframe
+        config: Comparison configuration with keys:
+            - key_column: Column to use as key
+            - compare_columns: Columns to compare
+            - show_columns: Columns to show in results
+
+    Returns:
+        DataFrame with comparison results. attrs['duplicate_keys'] holds the
+        number of duplicate key rows found in each version.
+    """
+    validate_config(df1, df2, config)
+    key_col = config['key_column']
+    compare_cols = [col for col in config['compare_columns'] if col != key_col]
+
+    aligned = align_versions(df1, df2, key_col)
+    both, rows_v1, rows_v2 = paired_rows(aligned)
+
+    labels = np.full(len(aligned), "", dtype=object)
+    if compare_cols and both.any():
+        matrix = change_matrix(df1, df2, rows_v1, rows_v2, compare_cols)
+        labels[both] = changed_column_labels(matrix, compare_cols)
+
+    results = build_results(
+        df1, df2, aligned, key_col, config['show_columns'], labels)
+    results.attrs['duplicate_keys'] = {
+        'Version 1': count_duplicate_keys(df1, key_col),
+        'Version 2': count_duplicate_keys(df2, key_col),
+    }
+    return results
+
+
+def row_hashes(df: pd.DataFrame, rows: np.ndarray, columns: List[str],
+               chunk_size: int = HASH_CHUNK_SIZE,
+               on_chunk: Optional[Callable[[int, int], bool]] = None) -> Optional[np.ndarray]:
+    """Hash the given columns of selected rows, one chunk at a time
+
+    Missing values in object columns are hashed as "" so they match empty
+    strings, as in values_differ. Equal hashes mean equal values; unequal
+    hashes only mark rows for the exact column-level comparison.
+
+    Args:
+        df: Version dataframe
+        rows: Row positions to hash
+        columns: Columns included in each row's hash
+        chunk_size: Rows hashed per chunk
+        on_chunk: Called as (rows_done, total_rows) after each chunk; return
+            False to stop
+
+    Returns:
+        uint64 array of row hashes, or None if stopped
+    """
+    hashes = np.empty(len(rows), dtype=np.uint64)
+    subset = df[columns]
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = subset.take(rows[start:start + chunk_size])
+        for col in chunk.columns[(chunk.dtypes == object).to_numpy()]:
+            chunk[col] = chunk[col].where(chunk[col].notna(), "")
+        hashes[start:start + len(chunk)] = pd.util.hash_pandas_object(
+            chunk, index=False).to_numpy()
+
+        if on_chunk and not on_chunk(start + len(chunk), len(rows)):
+            return None
+
+    return hashes
+
+
+def compare_versions_chunked(df1: pd.DataFrame, df2: pd.DataFrame, config: Dict[str, Any],
+                             chunk_size: int = HASH_CHUNK_SIZE,
+                             progress_callback: Optional[Callable[[int, str], bool]] = None
+                             ) -> Optional[pd.DataFrame]:
+    """Compare two versions, hashing rows first to skip unchanged ones
+
+    Paired rows are hashed over the compare columns in chunks; only pairs
+    whose hashes differ get the column-level comparison. Produces the same
+    result as compare_versions.
+
+    Args:
+        df1: First version dataframe
+        df2: Second version dataframe
+        config: Comparison configuration (see compare_versions)
+        chunk_size: Rows hashed between progress updates
+        progress_callback: Called as (percent, message); return False to cancel
+
+    Returns:
+        DataFrame with comparison results, or None if cancelled
+    """
+    def report(percent: int, message: str) -> bool:
+        return progress_callback(percent, message) if progress_callback else True
+
+    validate_config(df1, df2, config)
+    key_col = config['key_column']
+    compare_cols = [col for col in config['compare_columns'] if col != key_col]
+
+    if not report(5, "Matching keys..."):
+        return None
+    aligned = align_versions(df1, df2, key_col)
+    both, rows_v1, rows_v2 = paired_rows(aligned)
+
+    labels = np.full(len(aligned), "", dtype=object)
+    if compare_cols and both.any():
+        def hash_progress(start: int, span: int, label: str):
+            return lambda done, total: report(
+                start + int(span * done / total), f"Hashing {label}: {done:,}/{total:,} rows")
+
+        hashes_v1 = row_hashes(df1, rows_v1, compare_cols, chunk_size,
+                               hash_progress(15, 35, "Version 1"))
+        if hashes_v1 is None:
+            return None
+        hashes_v2 = row_hashes(df2, rows_v2, compare_cols, chunk_size,
+                               hash_progress(50, 35, "Version 2"))
+        if hashes_v2 is None:
+            return None
+
+        candidates = hashes_v1 != hashes_v2
+        if not report(85, f"Comparing {int(candidates.sum()):,} changed rows..."):
+            return None
+
+        if candidates.any():
+            matrix = change_matrix(
+                df1, df2, rows_v1[candidates], rows_v2[candidates], compare_cols)
+            paired_labels = np.full(len(rows_v1), "", dtype=object)
+            paired_labels[candidates] = changed_column_labels(matrix, compare_cols)
+            labels[both] = paired_labels
+
+    if not report(95, "Building results..."):
+        return None
+    results = build_results(
+        df1, df2, aligned, key_col, config['show_columns'], labels)
+    results.attrs['duplicate_keys'] = {
+        'Version 1': count_duplicate_keys(df1, key_col),
+        'Version 2': count_duplicate_keys(df2, key_col),
+    }
+    return results
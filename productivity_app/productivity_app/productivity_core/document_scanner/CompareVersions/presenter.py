@@ -5,7 +5,10 @@ from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 from ...document_scanner.CompareVersions.view import CompareVersionsView
 from ...document_scanner.CompareVersions.config_dialog import ComparisonConfigDialog
+from ...document_scanner.CompareVersions.diff_engine import compare_versions
+from ...document_scanner.CompareVersions.comparison_worker import ComparisonWorker
 from ...document_scanner.document_store import DocumentStore
+from ...core.task_scheduler import TaskPriority, TaskScheduler
 from typing import Dict, Any, Optional
 import pandas as pd
 
@@ -33,6 +36,12 @@ class CompareVersionsPresenter(QObject):
         self.full_results = None  # Store unfiltered results
         self.filtered_mode = False
 
+        # Background comparison (runs on the shared task scheduler)
+        self._compare_worker = None
+        self._compare_task = None
+        self._scheduler = (context.get('task_scheduler') if context is not None
+                           else None) or TaskScheduler.shared()
+
         # Connect view signals
         self.view.document_selected.connect(self.on_document_selected)
         self.view.version1_selected.connect(self.on_version1_selected)
@@ -40,6 +49,7 @@ class CompareVersionsPresenter(QObject):
         self.view.custom_file1_dropped.connect(self.on_custom_file1_dropped)
         self.view.custom_file2_dropped.connect(self.on_custom_file2_dropped)
         self.view.compare_requested.connect(self.on_compare_requested)
+        self.view.cancel_compare_requested.connect(self.on_cancel_compare)
         self.view.filter_changes_requested.connect(self.on_filter_changes)
         self.view.export_requested.connect(self.on_export_results)
 
@@ -145,20 +155,13 @@ class CompareVersionsPresenter(QObject):
 
             self.comparison_config = dialog.get_config()
 
-            # Perform comparison
-            results_df = self._compare_versions(
+            # Perform comparison in the background
+            self._start_comparison(
                 self.data1,
                 self.data2,
                 self.comparison_config
             )
 
-            # Store full results
-            self.full_results = results_df
-            self.filtered_mode = False
-
-            # Display results
-            self.view.display_comparison_results(results_df)
-
         except Exception as e:
             QMessageBox.critical(
                 self.view,
@@ -168,6 +171,78 @@ class CompareVersionsPresenter(QObject):
             import traceback
             traceback.print_exc()
 
+    def _start_comparison(self, df1: pd.DataFrame, df2: pd.DataFrame, config: Dict[str, Any]):
+        """Run the comparison on the task scheduler
+
+        Args:
+            df1: First version dataframe
+            df2: Second version dataframe
+            config: Comparison configuration from the config dialog
+        """
+        if self._compare_task is not None and self._compare_task.is_active():
+            print("Compare Versions: Comparison already in progress")
+            return
+
+        self._compare_worker = ComparisonWorker(df1, df2, config)
+        self._compare_worker.progress.connect(
+            self.view.show_comparison_progress)
+        self._compare_worker.finished.connect(self._on_comparison_finished)
+        self._compare_worker.error.connect(self._on_comparison_error)
+        self._compare_worker.cancelled.connect(self._on_comparison_cancelled)
+
+        self.view.set_comparison_running(True)
+        self._compare_task = self._scheduler.submit_worker(
+            self._compare_worker, name='compare_versions',
+            priority=TaskPriority.INTERACTIVE)
+
+        # Drop the references and leave the running state however the task
+        # ends (a comparison cancelled while queued never runs the worker)
+        for signal in (self._compare_task.finished,
+                       self._compare_task.error,
+                       self._compare_task.cancelled):
+            signal.connect(self._on_comparison_task_ended)
+        print(
+            f"Compare Versions: Comparing {len(df1)} vs {len(df2)} rows in background")
+
+    def _on_comparison_task_ended(self, *_):
+        """Reset the view and drop the worker and task references once the
+        task has ended"""
+        self.view.set_comparison_running(False)
+        self._compare_worker = None
+        self._compare_task = None
+
+    def on_cancel_compare(self):
+        """Cancel the running comparison"""
+        if self._compare_task is not None and self._compare_task.is_active():
+            self._scheduler.cancel(self._compare_task)
+            print("Compare Versions: Cancelling comparison")
+
+    def _on_comparison_finished(self, results_df: pd.DataFrame):
+        """Display results returned by the comparison worker"""
+        self.view.set_comparison_running(False)
+
+        # Store full results
+        self.full_results = results_df
+        self.filtered_mode = False
+
+        # Display results
+        self.view.display_comparison_results(results_df)
+        self._report_duplicate_keys(results_df)
+
+    def _on_comparison_error(self, error_message: str):
+        """Handle a failed background comparison"""
+        self.view.set_comparison_running(False)
+        QMessageBox.critical(
+            self.view,
+            "Comparison Error",
+            f"Error comparing versions:\n{error_message}"
+        )
+
+    def _on_comparison_cancelled(self):
+        """Handle a cancelled background comparison"""
+        self.view.set_comparison_running(False)
+        self.view.update_status("Comparison cancelled", "orange")
+
     def on_filter_changes(self):
         """Toggle between showing all rows and only changed rows"""
         if self.full_results is None:
@@ -322,97 +397,12 @@ class CompareVersionsPresenter(QObject):
         Returns:
             DataFrame with comparison results
         """
-        key_col = config['key_column']
-        compare_cols = config['compare_columns']
-        show_cols = config['show_columns']
-
-        # Ensure key column and compare columns exist in both dataframes
-        for col in [key_col] + compare_cols:
-            if col not in df1.columns:
-                raise ValueError(f"Column '{col}' not found in Version 1")
-            if col not in df2.columns:
-                raise ValueError(f"Column '{col}' not found in Version 2")
-
-        # Set key column as index
-        df1_indexed = df1.set_index(key_col)
-        df2_indexed = df2.set_index(key_col)
-
-        # Find all keys (union of both versions)
-        all_keys = set(df1_indexed.index) | set(df2_indexed.index)
-
-        results = []
-
-        for key in all_keys:
-            row_result = {key_col: key}
-
-            # Check if key exists in both versions
-            in_v1 = key in df1_indexed.index
-            in_v2 = key in df2_indexed.index
-
-            if not in_v1:
-                row_result['Verdict'] = "Only in Version 2"
-                # Add Version 2 data
-                for col in show_cols:
-                    if col != key_col and col in df2_indexed.columns:
-                        row_result[f"{col}_V2"] = df2_indexed.loc[key, col]
-
-            elif not in_v2:
-                row_result['Verdict'] = "Only in Version 1"
-                # Add Version 1 data
-                for col in show_cols:
-                    if col != key_col and col in df1_indexed.columns:
-                        row_result[f"{col}_V1"] = df1_indexed.loc[key, col]
-
-            else:
-                # Key exists in both - compare columns
-                differences = []
-
-                for col in compare_cols:
-                    if col == key_col:
-                        continue
-
-                    val1 = df1_indexed.loc[key, col]
-                    val2 = df2_indexed.loc[key, col]
-
-                    # Convert to string for comparison (handles NaN, None, etc.)
-                    str1 = str(val1) if pd.notna(val1) else ""
-                    str2 = str(val2) if pd.notna(val2) else ""
-
-                    if str1 != str2:
-                        differences.append(col)
-
-                # Set verdict
-                if differences:
-                    row_result['Verdict'] = "Different"
-                    row_result['Changed_Columns'] = ", ".join(differences)
-                else:
-                    row_result['Verdict'] = "Same"
-
-                # Add data from both versions for show columns
-                for col in show_cols:
-                    if col == key_col:
-                        continue
-
-                    if col in df1_indexed.columns:
-                        row_result[f"{col}_V1"] = df1_indexed.loc[key, col]
-                    if col in df2_indexed.columns:
-                        row_result[f"{col}_V2"] = df2_indexed.loc[key, col]
-
-            results.append(row_result)
-
-        # Convert to DataFrame
-        results_df = pd.DataFrame(results)
-
-        # Reorder columns: Key, Verdict, Changed_Columns (if exists), then data columns
-        ordered_cols = [key_col, 'Verdict']
-        if 'Changed_Columns' in results_df.columns:
-            ordered_cols.append('Changed_Columns')
-
-        # Add remaining columns
-        remaining_cols = [
-            col for col in results_df.columns if col not in ordered_cols]
-        ordered_cols.extend(remaining_cols)
-
-        results_df = results_df[ordered_cols]
-
-        return results_df
+        return compare_versions(df1, df2, config)
+
+    def _report_duplicate_keys(self, results_df: pd.DataFrame):
+        """Warn when either version had duplicate keys"""
+        duplicates = results_df.attrs.get('duplicate_keys', {})
+        found = [f"{label}: {count}" for label, count in duplicates.items() if count]
+        if found:
+            print(
+                f"⚠️ Compare Versions: Duplicate keys paired by occurrence ({', '.join(found)})")
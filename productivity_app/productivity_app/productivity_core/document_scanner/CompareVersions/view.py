@@ -32,6 +32,7 @@ class CompareVersionsView(BaseTabView):
     custom_file1_dropped = Signal(str)  # file_path
     custom_file2_dropped = Signal(str)  # file_path
     compare_requested = Signal()
+    cancel_compare_requested = Signal()
     filter_changes_requested = Signal()
     export_requested = Signal()
 
@@ -74,7 +75,7 @@ class CompareVersionsView(BaseTabView):
             
             <h3>Tips</h3>
             <ul>
-                <li>Key column must be unique in both versions</li>
+                <li>Duplicate keys are paired in order of appearance</li>
                 <li>Select only relevant columns to compare (faster)</li>
                 <li>Use CSV files for best performance with large data</li>
                 <li>Right-click results table for context menu</li>
@@ -111,6 +112,13 @@ class CompareVersionsView(BaseTabView):
         self.compare_btn.clicked.connect(self.compare_requested)
         title_row.addWidget(self.compare_btn)
 
+        # Cancel button (shown only while a comparison is running)
+        self.cancel_compare_btn = StandardButton(
+            "✖ Cancel", role=ButtonRole.DANGER)
+        self.cancel_compare_btn.clicked.connect(self.cancel_compare_requested)
+        self.cancel_compare_btn.setVisible(False)
+        title_row.addWidget(self.cancel_compare_btn)
+
         header_layout.addLayout(title_row)
 
         # Document selector - narrower width (DOUBLE width = 400px)
@@ -375,6 +383,25 @@ class CompareVersionsView(BaseTabView):
 
         menu.exec_(self.results_table.mapToGlobal(pos))
 
+    def set_comparison_running(self, running: bool):
+        """Toggle the header between idle and comparison-in-progress states
+
+        Args:
+            running: True while a comparison runs in the background
+        """
+        self.compare_btn.setEnabled(not running)
+        self.cancel_compare_btn.setVisible(running)
+        self.cancel_compare_btn.setEnabled(running)
+
+    def show_comparison_progress(self, percent: int, message: str):
+        """Show background comparison progress in the status label
+
+        Args:
+            percent: Progress percentage (0-100)
+            message: Progress message
+        """
+        self.results_status.setText(f"{message} ({percent}%)")
+
     def update_status(self, message: str, color: str = "black"):
         """Update status message
 
@@ -12,6 +12,8 @@ from ...ui.base_sub_tab_view import BaseTabView
 from ...ui.components.label import StandardLabel, TextStyle
 import pandas as pd
 from pathlib import Path
+from ...core.task_scheduler import TaskPriority, TaskScheduler
+from ..document_preview import DocumentPreviewService, PREVIEW_ROWS, is_excel_file
 
 
 class DropZoneWidget(QFrame):
@@ -100,19 +102,35 @@ class DropZoneWidget(QFrame):
 
 
 class AddDocumentDialog(QDialog):
-    """Dialog for adding a new document with expandable step-by-step workflow"""
+    """Dialog for adding a new document with expandable step-by-step workflow
 
-    def __init__(self, parent=None):
+    Sheet names and preview rows are read on the task scheduler through the
+    shared DocumentPreviewService, which keeps the first rows of each sheet;
+    changing the header row re-cuts those rows instead of reading the file.
+    Whatever the service has cached is shown straight away on the UI thread.
+    """
+
+    # Task scheduler keys (a newer request replaces a running one)
+    SHEETS_TASK_KEY = 'add_document_sheets'
+    PREVIEW_TASK_KEY = 'add_document_preview'
+
+    def __init__(self, parent=None, preview_service: DocumentPreviewService = None,
+                 scheduler: TaskScheduler = None):
         super().__init__(parent)
         self.setWindowTitle("Add Document")
         self.setMinimumWidth(800)
 
         self.file_path = None
-        self.df = None
+        self.df = None  # Preview rows under the current header row
         self.config = {}
         self.is_excel_file = False
         self.available_sheets = []
 
+        self._previews = preview_service or DocumentPreviewService.shared()
+        self._scheduler = scheduler or TaskScheduler.shared()
+        self._sheets_task = None
+        self._preview_task = None
+
         # Track completion state of each step
         self.step_completed = {
             1: False,  # File selected
@@ -220,7 +238,7 @@ class AddDocumentDialog(QDialog):
         self.step2_group.layout().addLayout(header_layout)
 
         # Preview table
-        preview_label = QLabel("Preview (first 20 rows):")
+        preview_label = QLabel(f"Preview (first {PREVIEW_ROWS} rows):")
         preview_label.setStyleSheet("margin-top: 10px; font-weight: bold;")
         self.step2_group.layout().addWidget(preview_label)
 
@@ -388,41 +406,77 @@ class AddDocumentDialog(QDialog):
         """Handle file selection from drag-drop or browse"""
         self.file_path = file_path
         path = Path(file_path)
+        self.df = None
+        self._preview_task = None
+        self.preview_table.setModel(None)
 
         # Check if it's an Excel file
-        self.is_excel_file = path.suffix.lower() in ['.xlsx', '.xls']
+        self.is_excel_file = is_excel_file(path)
 
         if self.is_excel_file:
-            # Load sheet names using pandas
-            try:
-                excel_file = pd.ExcelFile(file_path)
-                self.available_sheets = excel_file.sheet_names
-                excel_file.close()
-
-                # Populate combo box
-                self.sheet_combo.clear()
-                self.sheet_combo.addItems(self.available_sheets)
-
-                # Show sheet selection
-                self.sheet_selection_widget.setVisible(True)
-
-                self.file_path_label.setText(
-                    f"📄 Selected: {path.name} ({len(self.available_sheets)} sheet(s))"
-                )
-            except Exception as e:
-                QMessageBox.warning(
-                    self, "Error", f"Could not read Excel sheets: {e}")
-                self.file_path_label.setText(
-                    f"❌ Error reading sheets: {path.name}")
-                self.file_path_label.setStyleSheet(
-                    "color: red; font-weight: bold; margin-top: 10px;")
-                self.file_path_label.setVisible(True)
+            self._sheets_task = None
+            sheets = self._previews.cached_sheet_names(path)
+            if sheets is not None:
+                self._show_sheets(sheets)
                 return
+            # Read sheet names in the background
+            self.step1_ok_btn.setEnabled(False)
+            self.file_path_label.setText(f"⏳ Reading sheets: {path.name}")
+            self.file_path_label.setStyleSheet("color: #666; margin-top: 10px;")
+            self.file_path_label.setVisible(True)
+            task = self._scheduler.submit(
+                self._previews.sheet_names, file_path, name='add_document_sheets',
+                key=self.SHEETS_TASK_KEY, replace=True, priority=TaskPriority.INTERACTIVE)
+            self._sheets_task = task
+            task.finished.connect(
+                lambda sheets, task=task: self._on_sheets_loaded(task, sheets))
+            task.error.connect(
+                lambda message, task=task: self._on_sheets_failed(task, message))
         else:
             # Not an Excel file, hide sheet selection
             self.sheet_selection_widget.setVisible(False)
             self.file_path_label.setText(f"📄 Selected: {path.name}")
+            self._on_file_ready()
 
+    def _on_sheets_loaded(self, task, sheets: list):
+        # Ignore sheets of a file that is no longer selected
+        if task is not self._sheets_task:
+            return
+        self._sheets_task = None
+        self._show_sheets(sheets)
+
+    def _show_sheets(self, sheets: list):
+        """Show the sheets of the selected workbook"""
+        self.available_sheets = sheets
+
+        # Populate combo box (the first sheet's preview is loaded below)
+        self.sheet_combo.blockSignals(True)
+        self.sheet_combo.clear()
+        self.sheet_combo.addItems(self.available_sheets)
+        self.sheet_combo.blockSignals(False)
+
+        # Show sheet selection
+        self.sheet_selection_widget.setVisible(True)
+
+        self.file_path_label.setText(
+            f"📄 Selected: {Path(self.file_path).name} ({len(self.available_sheets)} sheet(s))"
+        )
+        self._on_file_ready()
+
+    def _on_sheets_failed(self, task, message: str):
+        if task is not self._sheets_task:
+            return
+        self._sheets_task = None
+        QMessageBox.warning(
+            self, "Error", f"Could not read Excel sheets: {message}")
+        self.file_path_label.setText(
+            f"❌ Error reading sheets: {Path(self.file_path).name}")
+        self.file_path_label.setStyleSheet(
+            "color: red; font-weight: bold; margin-top: 10px;")
+        self.file_path_label.setVisible(True)
+
+    def _on_file_ready(self):
+        """File (and sheet list) read - allow confirming and start the preview"""
         self.file_path_label.setStyleSheet(
             "color: green; font-weight: bold; margin-top: 10px;")
         self.file_path_label.setVisible(True)
@@ -442,37 +496,54 @@ class AddDocumentDialog(QDialog):
         self.cached_fields_group.setVisible(is_cached)
 
     def _load_file(self):
-        """Load the file into dataframe"""
+        """Read the first rows of the file (or selected sheet) in the background"""
         if not self.file_path:
             return
+        self._request_preview()
 
-        try:
-            path = Path(self.file_path)
-
-            # Load based on file type
-            if path.suffix.lower() in ['.xlsx', '.xls']:
-                # Get selected sheet name
-                sheet_name = self.sheet_combo.currentText() if self.sheet_combo.count() > 0 else 0
-                self.df = pd.read_excel(
-                    self.file_path, sheet_name=sheet_name, header=None)
-            else:
-                # Try to read as CSV, fall back to tab-separated if that fails
-                try:
-                    self.df = pd.read_csv(self.file_path, header=None)
-                except:
-                    # Try tab-separated
-                    self.df = pd.read_csv(
-                        self.file_path, sep='\t', header=None)
-
-            # Auto-complete step 1 if not already completed
-            if not self.step_completed[1]:
-                # Don't auto-complete, let user confirm
-                pass
+    def _selected_sheet(self):
+        """Selected sheet name (None for the first sheet or non-Excel files)"""
+        if self.is_excel_file and self.sheet_combo.count() > 0:
+            return self.sheet_combo.currentText()
+        return None
 
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load file: {e}")
-            self.file_path_label.setText("❌ Error loading file")
-            self.file_path_label.setStyleSheet("color: red; margin-top: 10px;")
+    def _request_preview(self):
+        """Show the preview for the current sheet and header row
+
+        Cut from cached rows straight away when possible, otherwise read on
+        the task scheduler.
+        """
+        args = (self.file_path, self._selected_sheet(), self.header_row_spin.value())
+        preview_df = self._previews.cached_preview(*args)
+        if preview_df is not None:
+            self._preview_task = None
+            self._show_preview(preview_df)
+            return
+
+        task = self._scheduler.submit(
+            self._previews.preview, *args, name='add_document_preview',
+            key=self.PREVIEW_TASK_KEY, replace=True, priority=TaskPriority.INTERACTIVE)
+        self._preview_task = task
+        task.finished.connect(
+            lambda preview_df, task=task: self._on_preview_loaded(task, preview_df))
+        task.error.connect(
+            lambda message, task=task: self._on_preview_failed(task, message))
+
+    def _on_preview_loaded(self, task, preview_df: pd.DataFrame):
+        # Ignore a preview superseded by another sheet or header row
+        if task is not self._preview_task:
+            return
+        self._preview_task = None
+        self._show_preview(preview_df)
+
+    def _on_preview_failed(self, task, message: str):
+        if task is not self._preview_task:
+            return
+        self._preview_task = None
+        QMessageBox.warning(self, "Preview Error",
+                            f"Failed to load preview: {message}")
+        self.file_path_label.setText("❌ Error loading file")
+        self.file_path_label.setStyleSheet("color: red; margin-top: 10px;")
 
     def _check_step2_complete(self):
         """Check if step 2 can be completed"""
@@ -483,27 +554,12 @@ class AddDocumentDialog(QDialog):
         """Reload the preview with current header row setting"""
         if not self.file_path:
             return
+        self._request_preview()
 
+    def _show_preview(self, preview_df: pd.DataFrame):
+        """Fill the preview table and search column list"""
+        self.df = preview_df
         try:
-            header_row = self.header_row_spin.value()
-            path = Path(self.file_path)
-
-            # Reload file with proper header row using pandas parameters
-            if path.suffix.lower() in ['.xlsx', '.xls']:
-                # Get selected sheet name
-                sheet_name = self.sheet_combo.currentText() if self.sheet_combo.count() > 0 else 0
-                preview_df = pd.read_excel(
-                    self.file_path, sheet_name=sheet_name, header=header_row, nrows=20)
-            else:
-                # Try CSV first
-                try:
-                    preview_df = pd.read_csv(
-                        self.file_path, header=header_row, nrows=20)
-                except:
-                    # Fall back to tab-separated
-                    preview_df = pd.read_csv(
-                        self.file_path, sep='\t', header=header_row, nrows=20)
-
             # Display in table
             model = QStandardItemModel(
                 len(preview_df), len(preview_df.columns))
@@ -535,6 +591,13 @@ class AddDocumentDialog(QDialog):
             QMessageBox.warning(self, "Preview Error",
                                 f"Failed to reload preview: {e}")
 
+    def done(self, result: int):
+        """Drop background reads still running when the dialog closes"""
+        self._sheets_task = self._preview_task = None
+        self._scheduler.cancel_key(self.SHEETS_TASK_KEY)
+        self._scheduler.cancel_key(self.PREVIEW_TASK_KEY)
+        super().done(result)
+
     def _check_step2_complete(self):
         """Check if step 2 can be completed"""
         search_cols = self.search_columns_list.selectedItems()
@@ -39,7 +39,8 @@ class HistoryPresenter(QObject):
             search_term: The selected search term
         """
         print(f"History: Selected '{search_term}'")
-        self.view.update_details(search_term)
+        self.view.update_details(
+            search_term, self.model.get_search_history_entry(search_term))
         # Emit signal to trigger search in Search tab
         self.search_requested.emit(search_term)
 
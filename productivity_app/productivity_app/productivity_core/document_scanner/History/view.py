@@ -6,7 +6,8 @@ from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton,
 from PySide6.QtCore import Signal, Qt
 from ...ui.base_sub_tab_view import BaseTabView
 from ...ui.components import StandardLabel, TextStyle
-from typing import List, Dict
+from ...core.search_history import HistoryEntry
+from typing import List, Optional
 
 
 class HistoryView(BaseTabView):
@@ -69,11 +70,11 @@ class HistoryView(BaseTabView):
         """Handle clear history button click"""
         self.clear_history_requested.emit()
 
-    def display_history(self, history: List[str]):
+    def display_history(self, history: List[HistoryEntry]):
         """Display search history
 
         Args:
-            history: List of search terms (newest first)
+            history: History entries (newest first)
         """
         self.history_list.clear()
 
@@ -87,21 +88,32 @@ class HistoryView(BaseTabView):
 
         self.clear_btn.setEnabled(True)
 
-        for idx, search_term in enumerate(history, 1):
-            item = QListWidgetItem(f"{idx}. {search_term}")
-            item.setData(Qt.UserRole, search_term)
+        for idx, entry in enumerate(history, 1):
+            text = f"{idx}. {entry.term}"
+            if entry.result_count is not None:
+                text += f"  ({_results_text(entry.result_count)})"
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, entry.term)
             self.history_list.addItem(item)
 
-    def update_details(self, search_term: str, timestamp: str = None):
+    def update_details(self, search_term: str, entry: Optional[HistoryEntry] = None):
         """Update context area with search details
 
         Args:
             search_term: The search term
-            timestamp: When the search was performed (optional)
+            entry: History summary for the term (optional)
         """
         details = f"Search Term: {search_term}\n\n"
-        if timestamp:
-            details += f"Last Searched: {timestamp}\n\n"
+        if entry is not None:
+            details += f"Last Searched: {entry.last_used_at:%Y-%m-%d %H:%M}\n"
+            details += f"Times Searched: {entry.uses}\n"
+            if entry.result_count is not None:
+                details += f"Last Result: {_results_text(entry.result_count)}\n"
+            details += "\n"
         details += "Click to re-run this search in the Search tab"
 
         self.context_box.setPlainText(details)
+
+
+def _results_text(count: int) -> str:
+    return f"{count} result{'s' if count != 1 else ''}"
@@ -2,16 +2,29 @@
 Document Scanner Search Presenter
 """
 from PySide6.QtCore import QObject
+from ...core.task_scheduler import TaskPriority, TaskScheduler
+from ...core.app_logging import get_logger
 from ...document_scanner.Search.view import SearchView
-from ...document_scanner.search_result import SearchResult, Context
+from ...document_scanner.search_result import SearchResult, SearchResultSet
 from ...document_scanner.searchable_document import SearchableDocument
 from ...document_scanner.context_provider import ContextProvider
 from ...document_scanner.threaded_context_manager import ThreadedContextManager
 from typing import List
 
+logger = get_logger(__name__)
+
 
 class SearchPresenter(QObject):
-    """Presenter for document search functionality"""
+    """Presenter for document search functionality
+
+    Searches run when requested (Enter / Search button) and, with the
+    'search_as_you_type' flag on, while typing: the view debounces edits and
+    each typed search runs on the task scheduler, replacing (cancelling) the
+    previous one. Typed searches are not added to the search history.
+    """
+
+    # Key of the typed search on the task scheduler (latest wins)
+    LIVE_SEARCH_KEY = 'document_live_search'
 
     def __init__(self, context, model):
         super().__init__()
@@ -27,18 +40,33 @@ class SearchPresenter(QObject):
         self.context_manager.enrichment_complete.connect(
             self._on_enrichment_complete)
         self.context_manager.error_occurred.connect(self._on_enrichment_error)
-
-        # Store current results for updating
-        self.current_results: List[SearchResult] = []
+        if context is not None and context.get_context_provider('connectors'):
+            self.register_context_provider(context.get_context_provider('connectors'))
+
+        # Store current results (one set per document) for updating
+        self.current_results: List[SearchResultSet] = []
+
+        # Typed searches run in the background; only the latest is shown
+        self._scheduler = (context.get('task_scheduler') if context is not None
+                           else None) or TaskScheduler.shared()
+        self._live_task = None
+        self.feature_flags = context.get('feature_flags') if context is not None else None
+        if self.feature_flags is not None:
+            self.view.set_search_as_you_type(
+                self.feature_flags.get('document_scanner', 'search_as_you_type'))
+            self.feature_flags.subscribe(
+                'document_scanner', 'search_as_you_type', self.view.set_search_as_you_type)
 
         # Connect view signals
         self.view.search_requested.connect(self.on_search)
         self.view.reload_requested.connect(self.on_reload_documents)
         self.view.open_document_requested.connect(self.on_open_document)
+        self.view.search_text_edited.connect(self.on_search_text_edited)
+        self.view.live_search_requested.connect(self.on_live_search)
 
     def start_loading(self):
         """Initialize the search tab"""
-        print("Document Scanner Search: Ready")
+        logger.debug("Document Scanner Search: Ready")
         searchable_docs = self.model.get_searchable_documents()
         self.view.update_document_count(len(searchable_docs))
 
@@ -48,13 +76,16 @@ class SearchPresenter(QObject):
         Args:
             searchable_documents: List of SearchableDocument objects from model
         """
-        print(
-            f"SEARCH: Received {len(searchable_documents)} loaded document(s)")
+        logger.debug("Received %d loaded document(s)", len(searchable_documents))
         self.view.update_document_count(len(searchable_documents))
 
+    def on_search_text_edited(self, text: str):
+        """Offer previous searches starting with the typed text"""
+        self.view.set_completions(self.model.complete_search_term(text))
+
     def on_reload_documents(self):
         """Handle reload all documents request"""
-        print("\n🔄 Reloading all documents...")
+        logger.info("Reloading all documents")
         self.view.update_status("Reloading all documents...", "blue")
         self.model.reload_documents()
         self.view.update_status("Documents reloaded successfully", "green")
@@ -69,7 +100,7 @@ class SearchPresenter(QObject):
         import subprocess
         import platform
 
-        print(f"\n📂 Opening document: {document_name}")
+        logger.info("Opening document: %s", document_name)
 
         # Get the file path from the model
         searchable_docs = self.model.get_searchable_documents()
@@ -81,13 +112,13 @@ class SearchPresenter(QObject):
                 break
 
         if not file_path:
-            print(f"❌ Could not find file path for: {document_name}")
+            logger.warning("Could not find file path for: %s", document_name)
             self.view.update_status(
                 f"Error: Could not find {document_name}", "red")
             return
 
         if not os.path.exists(file_path):
-            print(f"❌ File does not exist: {file_path}")
+            logger.warning("File does not exist: %s", file_path)
             self.view.update_status(
                 f"Error: File not found at {file_path}", "red")
             return
@@ -101,11 +132,11 @@ class SearchPresenter(QObject):
             else:  # Linux
                 subprocess.run(['xdg-open', file_path])
 
-            print(f"✓ Opened: {file_path}")
+            logger.debug("Opened: %s", file_path)
             self.view.update_status(f"Opened: {document_name}", "green")
 
         except Exception as e:
-            print(f"❌ Error opening file: {e}")
+            logger.exception("Error opening file %s", file_path)
             self.view.update_status(f"Error opening file: {e}", "red")
 
     def register_context_provider(self, provider: ContextProvider):
@@ -115,33 +146,30 @@ class SearchPresenter(QObject):
             provider: ContextProvider implementation
         """
         self.context_manager.register_provider(provider)
-        print(f"✓ Registered context provider: {provider.get_context_name()}")
+        logger.debug("Registered context provider: %s", provider.get_context_name())
 
     def _on_result_enriched(self, idx: int, result: SearchResult):
         """Handle a result that has been enriched with context in background thread
 
         Args:
-            idx: Index of the result in current_results
-            result: Enriched SearchResult object
+            idx: Index of the result across all documents
+            result: Enriched SearchResult object (its set holds the contexts)
         """
-        # Update stored result
-        if idx < len(self.current_results):
-            self.current_results[idx] = result
-
-            # Update the display for this result
-            self.view.update_result(idx, result)
+        # Update the display for this result
+        self.view.update_result(idx, result)
 
     def _on_enrichment_complete(self):
         """Handle completion of background context enrichment"""
-        print("\n✓ Context enrichment complete")
+        logger.debug("Context enrichment complete")
 
         # Count results with context
         enriched_count = sum(
-            1 for r in self.current_results if r.has_contexts())
+            result_set.context_count() for result_set in self.current_results)
 
         if enriched_count > 0:
+            total = sum(len(result_set) for result_set in self.current_results)
             self.view.update_status(
-                f"Found {len(self.current_results)} result(s) ({enriched_count} with context)",
+                f"Found {total} result(s) ({enriched_count} with context)",
                 "green"
             )
 
@@ -152,8 +180,7 @@ class SearchPresenter(QObject):
             provider_name: Name of the provider that encountered an error
             error_msg: Error message
         """
-        print(
-            f"⚠️  Context enrichment error from {provider_name}: {error_msg}")
+        logger.warning("Context enrichment error from %s: %s", provider_name, error_msg)
 
     def on_search(self, search_term: str):
         """Handle search request
@@ -161,22 +188,21 @@ class SearchPresenter(QObject):
         Args:
             search_term: Term to search for
         """
-        print(f"\n{'='*60}")
-        print(f"SEARCH STARTED: '{search_term}'")
-        print(f"{'='*60}")
+        logger.debug("Search started: '%s'", search_term)
 
-        # Add to search history
-        self.model.add_to_search_history(search_term)
+        # An explicit search supersedes any typed search still running
+        self._cancel_live_search()
 
         # Get searchable documents from model
         searchable_documents = self.model.get_searchable_documents()
 
         if not searchable_documents:
-            print("❌ No documents loaded")
+            self.model.add_to_search_history(search_term)
+            logger.info("No documents loaded")
             self.view.update_status("No documents configured", "orange")
             return
 
-        print(f"📚 Searching {len(searchable_documents)} document(s)")
+        logger.debug("Searching %d document(s)", len(searchable_documents))
 
         # Clear previous results
         self.view.clear_results()
@@ -185,30 +211,35 @@ class SearchPresenter(QObject):
         self.view.update_status(
             f"Searching {len(searchable_documents)} document(s)...", "blue")
 
-        # Search all documents
-        all_results = []
-        total_docs = len(searchable_documents)
+        # Search all documents at once through the model's index
+        # (preconditions are checked per document)
+        all_results = self.model.search(
+            search_term, normalized=self._normalized_part_numbers())
+        total_results = 0
+        for results in all_results:
+            logger.debug("%s: %d result(s)", results.document_name, len(results))
+            total_results += len(results)
 
-        for idx, searchable_doc in enumerate(searchable_documents):
-            # Update progress
-            progress = int((idx / total_docs) * 100)
-            self.view.update_progress(progress)
+        # Display results immediately (without context)
+        logger.info("Search '%s': %d match(es)", search_term, total_results)
 
-            print(f"\n[{idx+1}/{total_docs}] {searchable_doc.file_name}")
+        # Add to search history with its result count
+        self.model.add_to_search_history(search_term, total_results)
 
-            # Search document (it handles preconditions internally)
-            results = searchable_doc.search(search_term)
-            if results:
-                print(f"  ✅ Found {len(results)} result(s)")
-            all_results.extend(results)
+        # Update status
+        self.view.update_progress(100)
+        self.view.show_progress(False)
 
-        # Display results immediately (without context)
-        print(f"\n{'='*60}")
-        print(f"SEARCH RESULTS: {len(all_results)} total match(es)")
-        print(f"{'='*60}")
+        self._show_results(all_results, len(searchable_documents))
 
-        for result in all_results:
-            print(f"  • {result.document_name}: {result.get_formatted_data()}")
+    def _show_results(self, all_results: List[SearchResultSet], document_count: int):
+        """Display results and start enriching them with context
+
+        Args:
+            all_results: Per-document results (documents with hits only)
+            document_count: Number of documents searched
+        """
+        total_results = sum(len(results) for results in all_results)
 
         # Store results
         self.current_results = all_results
@@ -216,34 +247,83 @@ class SearchPresenter(QObject):
         # Display results in view
         self.view.display_results(all_results)
 
-        # Update status
-        self.view.update_progress(100)
-        self.view.show_progress(False)
-
         if all_results:
             self.view.update_status(
-                f"Found {len(all_results)} result(s) - enriching with context...",
+                f"Found {total_results} result(s) - enriching with context...",
                 "blue"
             )
         else:
             self.view.update_status(
-                f"No results found in {len(searchable_documents)} document(s)",
+                f"No results found in {document_count} document(s)",
                 "orange"
             )
 
-        # Start background context enrichment (non-blocking)
+        # Start background context enrichment (non-blocking); this replaces
+        # enrichment of the previous results
         if all_results:
             self.context_manager.enrich_results_async(all_results)
+        else:
+            self.context_manager.stop_enrichment()
+
+    def _normalized_part_numbers(self) -> bool:
+        """Whether searches also match differently punctuated part numbers"""
+        return self.feature_flags is None or self.feature_flags.get(
+            'document_scanner', 'normalized_part_numbers')
+
+    def on_live_search(self, search_term: str):
+        """Search while typing (debounced by the view)
+
+        Runs on the task scheduler, cancelling the previous typed search.
+        The index refines its previous matches when the term extends the
+        last one, so each keystroke only re-checks values that still match.
+
+        Args:
+            search_term: Text typed so far
+        """
+        searchable_documents = list(self.model.get_searchable_documents())
+        if not searchable_documents:
+            return
+
+        self.view.update_status(f"Searching for '{search_term}'...", "blue")
+        task = self._scheduler.submit(
+            self._search_documents, search_term, self.model,
+            self._normalized_part_numbers(),
+            name='document_live_search', key=self.LIVE_SEARCH_KEY, replace=True,
+            priority=TaskPriority.INTERACTIVE, pass_task=True)
+        self._live_task = task
+        task.finished.connect(
+            lambda results, task=task: self._on_live_search_finished(
+                task, results, len(searchable_documents)))
+        task.error.connect(
+            lambda message: self.view.update_status(f"Search failed: {message}", "red"))
+
+    @staticmethod
+    def _search_documents(search_term: str, model, normalized: bool,
+                          task) -> List[SearchResultSet]:
+        """Search documents on a pool thread (stops when the task is cancelled)"""
+        all_results = model.search(search_term, task.token, normalized)
+        logger.debug("Typed search '%s': %d result(s)", search_term,
+                     sum(len(results) for results in all_results))
+        return all_results
+
+    def _on_live_search_finished(self, task, all_results: List[SearchResultSet],
+                                 document_count: int):
+        # Ignore a typed search that finished just as it was superseded
+        if task is not self._live_task:
+            return
+        self._live_task = None
+        self._show_results(all_results, document_count)
 
-        print(f"\n{'='*60}")
-        print(f"SEARCH COMPLETE")
-        print(f"{'='*60}\n")
+    def _cancel_live_search(self):
+        self.view.stop_live_search()
+        self._live_task = None
+        self._scheduler.cancel_key(self.LIVE_SEARCH_KEY)
 
     def get_all_results(self) -> List[SearchResult]:
         """Get all current search results
 
         Returns:
-            List of SearchResult dataclass objects
+            List of SearchResult objects
         """
         # TODO: Store results in presenter
         return []
@@ -0,0 +1,335 @@
+"""
+Search Results Model - Item model over per-document SearchResultSets
+
+Replaces a QStandardItem per cell with a model that produces cell data on
+demand. Top-level rows are documents; each document's children are a column
+header row followed by its results. Result rows are exposed in batches via
+fetchMore, so the view only ever lays out what has been scrolled to.
+
+Cells are read straight from the result sets; a SearchResult view is only
+created when a row's result is asked for (UserRole). Enrichment updates are
+coalesced into one dataChanged per document on a short timer.
+"""
+from typing import Any, Dict, List, Optional, Set
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt, QTimer
+from PySide6.QtGui import QFont
+
+from ...core.profiler import profiled
+from ...document_scanner.search_result import SearchResult, SearchResultSet
+
+# Role carrying the item type marker ("document_header" for group rows)
+ItemTypeRole = Qt.UserRole + 1
+
+DOCUMENT_HEADER = "document_header"
+
+_ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class _DocumentGroup:
+    """Results of one document plus how many rows are exposed to the view"""
+
+    __slots__ = ('name', 'results', 'columns', 'loaded')
+
+    def __init__(self, results: SearchResultSet, loaded: int):
+        self.name = results.document_name
+        self.results = results
+        self.columns = results.columns
+        self.loaded = loaded
+
+
+class SearchResultsModel(QAbstractItemModel):
+    """Two-level model: document groups -> header row + result rows
+
+    Index internal ids: 0 for document rows, group position + 1 for rows
+    inside a group.
+    """
+
+    # Result rows exposed per fetchMore call
+    FETCH_BATCH_SIZE = 500
+
+    # Delay (ms) over which result updates are batched into one repaint
+    UPDATE_COALESCE_MS = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._groups: List[_DocumentGroup] = []
+        # id() of each group's result set -> group position
+        self._group_positions: Dict[int, int] = {}
+        self._column_count = 1
+
+        # Group position -> changed result positions awaiting dataChanged
+        self._pending_updates: Dict[int, Set[int]] = {}
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_COALESCE_MS)
+        self._update_timer.timeout.connect(self.flush_updates)
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+
+    @profiled('results.set', 'table')
+    def set_results(self, result_sets: List[SearchResultSet]):
+        """Replace the model contents with one group per document
+
+        Args:
+            result_sets: Per-document search results in display order
+                (documents without hits are skipped)
+        """
+        self.beginResetModel()
+        self._update_timer.stop()
+        self._pending_updates.clear()
+
+        self._groups = [
+            _DocumentGroup(results, min(len(results), self.FETCH_BATCH_SIZE))
+            for results in result_sets if len(results)
+        ]
+        self._group_positions = {
+            id(group.results): group_pos for group_pos, group in enumerate(self._groups)}
+        # +1 for the row number column
+        self._column_count = max(
+            [len(group.columns) + 1 for group in self._groups], default=1)
+
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all results"""
+        self.set_results([])
+
+    def update_result(self, result: SearchResult) -> bool:
+        """Schedule a repaint of a result's row (e.g. after enrichment)
+
+        Repaints are batched: rows changed within UPDATE_COALESCE_MS are
+        reported together by flush_updates().
+
+        Args:
+            result: Updated SearchResult
+
+        Returns:
+            True if the result is shown by this model
+        """
+        group_pos = self._group_position(result.result_set)
+        if group_pos is None:
+            return False
+
+        group = self._groups[group_pos]
+        result_pos = result.position
+
+        # Rows not fetched yet are read fresh when the view fetches them
+        if result_pos < group.loaded:
+            self._pending_updates.setdefault(group_pos, set()).add(result_pos)
+            if not self._update_timer.isActive():
+                self._update_timer.start()
+        return True
+
+    def flush_updates(self):
+        """Emit one dataChanged per document covering its updated rows"""
+        self._update_timer.stop()
+        pending, self._pending_updates = self._pending_updates, {}
+
+        last_column = self._column_count - 1
+        for group_pos, result_positions in pending.items():
+            # Child rows are offset by one for the header row
+            first_row = min(result_positions) + 1
+            last_row = max(result_positions) + 1
+            self.dataChanged.emit(
+                self.createIndex(first_row, 0, group_pos + 1),
+                self.createIndex(last_row, last_column, group_pos + 1),
+                [Qt.DisplayRole, Qt.ToolTipRole])
+
+    def document_count(self) -> int:
+        """Number of document groups"""
+        return len(self._groups)
+
+    # ------------------------------------------------------------------
+    # Lookup helpers
+    # ------------------------------------------------------------------
+
+    def _group_position(self, result_set: SearchResultSet) -> Optional[int]:
+        group_pos = self._group_positions.get(id(result_set))
+        # The groups hold their sets, so a matching id is the same set
+        if group_pos is None or self._groups[group_pos].results is not result_set:
+            return None
+        return group_pos
+
+    def _group_for(self, index: QModelIndex) -> Optional[_DocumentGroup]:
+        """Group containing a child index (None for document rows)"""
+        group_id = index.internalId()
+        if group_id == 0:
+            return None
+        return self._groups[group_id - 1]
+
+    def result_at(self, index: QModelIndex) -> Optional[SearchResult]:
+        """SearchResult shown on the row of an index, if any"""
+        if not index.isValid():
+            return None
+        group = self._group_for(index)
+        if group is None or index.row() == 0:
+            return None
+        return group.results[index.row() - 1]
+
+    def sample_column_texts(self, column: int, max_samples: int = 200) -> List[str]:
+        """Texts from evenly spaced rows of a column, for width estimation
+
+        Args:
+            column: Column number
+            max_samples: Maximum number of texts returned per document
+
+        Returns:
+            Display texts including document and header rows
+        """
+        texts = []
+        for group in self._groups:
+            if column == 0:
+                texts.append(self._document_title(group))
+            texts.append(self._header_text(group, column))
+
+            total = len(group.results)
+            step = max(1, total // max_samples)
+            for result_pos in range(0, total, step):
+                texts.append(self._result_text(group, result_pos, column))
+        return texts
+
+    # ------------------------------------------------------------------
+    # Cell text
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _document_title(group: _DocumentGroup) -> str:
+        count = len(group.results)
+        return f"📄 {group.name} ({count} result{'s' if count != 1 else ''})"
+
+    @staticmethod
+    def _header_text(group: _DocumentGroup, column: int) -> str:
+        if column == 0:
+            return "#"
+        if column - 1 < len(group.columns):
+            return group.columns[column - 1]
+        return ""
+
+    @staticmethod
+    def _result_text(group: _DocumentGroup, result_pos: int, column: int) -> str:
+        if column == 0:
+            text = str(result_pos + 1)
+            if group.results.has_contexts(result_pos):
+                text += " 🔍"  # Indicator for results with context
+            return text
+        if column - 1 < len(group.columns):
+            return str(group.results.value(result_pos, column - 1))
+        return ""
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel interface
+    # ------------------------------------------------------------------
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if column < 0 or column >= self._column_count or row < 0:
+            return QModelIndex()
+
+        if not parent.isValid():
+            if row >= len(self._groups):
+                return QModelIndex()
+            return self.createIndex(row, column, 0)
+
+        if parent.internalId() != 0:
+            return QModelIndex()  # Only two levels
+        group = self._groups[parent.row()]
+        if row > group.loaded:
+            return QModelIndex()
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        group_id = index.internalId()
+        if group_id == 0:
+            return QModelIndex()
+        return self.createIndex(group_id - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.internalId() != 0 or parent.column() != 0:
+            return 0
+        group = self._groups[parent.row()]
+        return group.loaded + 1  # +1 for the header row
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return self._column_count
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._groups)
+        return parent.internalId() == 0 and parent.column() == 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+        group = self._groups[parent.row()]
+        return group.loaded < len(group.results)
+
+    def fetchMore(self, parent: QModelIndex):
+        if not self.canFetchMore(parent):
+            return
+        group = self._groups[parent.row()]
+        new_loaded = min(len(group.results), group.loaded + self.FETCH_BATCH_SIZE)
+        # Child rows are offset by one for the header row
+        self.beginInsertRows(parent, group.loaded + 1, new_loaded)
+        group.loaded = new_loaded
+        self.endInsertRows()
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return _ITEM_FLAGS
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Results" if not self._groups and section == 0 else ""
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        group = self._group_for(index)
+
+        # Document header row
+        if group is None:
+            group = self._groups[row]
+            if column != 0:
+                return None
+            if role == Qt.DisplayRole:
+                return self._document_title(group)
+            if role == Qt.FontRole:
+                return self._bold_font
+            if role == Qt.ToolTipRole:
+                return f"Double-click to open {group.name}"
+            if role == Qt.UserRole:
+                return group.name
+            if role == ItemTypeRole:
+                return DOCUMENT_HEADER
+            return None
+
+        # Column header row of a document table
+        if row == 0:
+            if role == Qt.DisplayRole:
+                return self._header_text(group, column)
+            if role == Qt.FontRole:
+                return self._bold_font
+            return None
+
+        result_pos = row - 1
+        if role == Qt.DisplayRole:
+            return self._result_text(group, result_pos, column)
+        if role == Qt.UserRole:
+            return group.results[result_pos]
+        if role == Qt.ToolTipRole and column == 0:
+            contexts = group.results.contexts(result_pos)
+            if contexts:
+                return f"This result has {len(contexts)} context item(s)"
+        return None
@@ -3,14 +3,17 @@ Document Scanner Search View
 """
 from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton,
                                QLineEdit, QTreeView, QProgressBar, QTextEdit,
-                               QWidget, QScrollArea, QFrame, QSizePolicy)
-from PySide6.QtCore import Signal, Qt
-from PySide6.QtGui import QStandardItemModel, QStandardItem, QCursor
+                               QWidget, QScrollArea, QFrame, QSizePolicy,
+                               QCompleter)
+from PySide6.QtCore import Signal, Qt, QStringListModel, QTimer
+from PySide6.QtGui import QCursor, QFont, QFontMetrics
 from ...ui.base_sub_tab_view import BaseTabView
 from ...ui.components import StandardLabel, TextStyle, StandardGroupBox
-from ...document_scanner.search_result import SearchResult, Context
-from ...core.config import UI_COLORS
-from typing import List, Dict
+from ...document_scanner.search_result import SearchResult, SearchResultSet, Context
+from ...document_scanner.Search.results_model import (
+    SearchResultsModel, ItemTypeRole, DOCUMENT_HEADER)
+from ...core.config import UI_COLORS, SEARCH_AS_YOU_TYPE
+from typing import List
 
 
 class SearchView(BaseTabView):
@@ -18,14 +21,27 @@ class SearchView(BaseTabView):
 
     # Signals
     search_requested = Signal(str)  # search_term
+    search_text_edited = Signal(str)  # typed text, for history completions
+    live_search_requested = Signal(str)  # typed text, after a pause in typing
     reload_requested = Signal()  # reload all documents
     open_document_requested = Signal(str)  # document_name
 
+    # Rows sampled per document when sizing columns
+    COLUMN_SIZE_SAMPLES = 200
+    MAX_COLUMN_WIDTH = 400
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.results_model = None
+        self._search_as_you_type = False
         self._setup_ui_content()
 
+        # Restarted on every edit, so a search starts once typing pauses
+        self._live_search_timer = QTimer(self)
+        self._live_search_timer.setSingleShot(True)
+        self._live_search_timer.setInterval(SEARCH_AS_YOU_TYPE["delay_ms"])
+        self._live_search_timer.timeout.connect(self._on_live_search_timeout)
+
     def _setup_ui_content(self):
         """Setup the search UI"""
         # Update header
@@ -45,9 +61,24 @@ class SearchView(BaseTabView):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Enter search term...")
+        self.search_input.setToolTip(
+            "Search text (matched as typed), or a /regular expression/.\n"
+            "Combine terms with AND, OR, NOT (then also -term) and ( ), quote \"exact phrases\",\n"
+            "and limit a term to a column with Column:term (\"Column Name\":term).")
         self.search_input.returnPressed.connect(self._on_search)
+        self.search_input.textEdited.connect(self.search_text_edited)
+        self.search_input.textEdited.connect(self._on_text_edited)
         search_row.addWidget(self.search_input)
 
+        # Previous searches matching the typed text (filled by the presenter,
+        # so the popup shows them as given instead of re-filtering)
+        self.completion_model = QStringListModel(self)
+        self.search_completer = QCompleter(self.completion_model, self)
+        self.search_completer.setCompletionMode(
+            QCompleter.UnfilteredPopupCompletion)
+        self.search_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.search_input.setCompleter(self.search_completer)
+
         self.search_btn = QPushButton("🔍 Search All Documents")
         self.search_btn.clicked.connect(self._on_search)
         search_row.addWidget(self.search_btn)
@@ -83,10 +114,11 @@ class SearchView(BaseTabView):
         self.results_tree.setToolTip(
             "Double-click a result to open the source document")
         self.results_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        # All rows are single-line text, so the view can skip measuring each
+        self.results_tree.setUniformRowHeights(True)
 
-        # Setup results model
-        self.results_model = QStandardItemModel()
-        self.results_model.setHorizontalHeaderLabels(['Results'])
+        # Setup results model (cell data is produced on demand)
+        self.results_model = SearchResultsModel()
         self.results_tree.setModel(self.results_model)
         self.results_tree.header().setStretchLastSection(True)
 
@@ -100,7 +132,7 @@ class SearchView(BaseTabView):
         results_layout.addWidget(self.results_tree)
 
         # Store results for context display
-        self.all_results = []  # List[SearchResult]
+        self.all_results = []  # List[SearchResultSet], one per document
 
         # Replace context_box with scrollable collapsible widget area
         # Find the context_box in the parent layout and replace it
@@ -135,6 +167,7 @@ class SearchView(BaseTabView):
 
     def _on_search(self):
         """Handle search button click"""
+        self._live_search_timer.stop()
         search_term = self.search_input.text().strip()
 
         if not search_term:
@@ -144,6 +177,37 @@ class SearchView(BaseTabView):
 
         self.search_requested.emit(search_term)
 
+    def set_search_as_you_type(self, enabled: bool):
+        """Turn searching while typing on or off"""
+        self._search_as_you_type = enabled
+        if not enabled:
+            self._live_search_timer.stop()
+
+    def stop_live_search(self):
+        """Drop a typed search that is waiting for the typing pause"""
+        self._live_search_timer.stop()
+
+    def _on_text_edited(self, text: str):
+        if self._search_as_you_type:
+            self._live_search_timer.start()
+
+    def _on_live_search_timeout(self):
+        search_term = self.search_input.text().strip()
+        if len(search_term) >= SEARCH_AS_YOU_TYPE["min_chars"]:
+            self.live_search_requested.emit(search_term)
+
+    def set_completions(self, terms: List[str]):
+        """Show previous search terms below the search box
+
+        Args:
+            terms: Suggestions for the current text (best first)
+        """
+        self.completion_model.setStringList(terms)
+        if terms and self.search_input.hasFocus():
+            self.search_completer.complete()
+        else:
+            self.search_completer.popup().hide()
+
     def _on_reload_requested(self):
         """Handle reload button click"""
         self.reload_requested.emit()
@@ -155,13 +219,12 @@ class SearchView(BaseTabView):
             return
 
         index = selection.selectedRows()[0]
-        item = self.results_model.itemFromIndex(index)
 
-        # Check if item has user data (SearchResult object)
-        result = item.data(Qt.UserRole)
+        # Check if row has user data (SearchResult object)
+        result = index.data(Qt.UserRole)
 
         # Check if this is a document header (contains string, not SearchResult)
-        if isinstance(result, str) or not hasattr(result, 'matched_row_data'):
+        if not isinstance(result, SearchResult):
             # Document header or other non-result item - clear context panel
             self._clear_context_layout()
             return
@@ -191,26 +254,25 @@ class SearchView(BaseTabView):
         Args:
             index: QModelIndex of the clicked item
         """
-        item = self.results_model.itemFromIndex(index)
-        if not item:
+        if not index.isValid():
             return
 
         # Check if this is a document header
-        item_type = item.data(Qt.UserRole + 1)
-        if item_type == "document_header":
+        item_type = index.data(ItemTypeRole)
+        if item_type == DOCUMENT_HEADER:
             # Document header clicked - get document name and open
-            doc_name = item.data(Qt.UserRole)
+            doc_name = index.data(Qt.UserRole)
             if doc_name:
                 print(f"📂 Double-clicked document header: {doc_name}")
                 self.open_document_requested.emit(doc_name)
             return
 
         # Otherwise, check if it's a result row
-        result = item.data(Qt.UserRole)
+        result = index.data(Qt.UserRole)
         if result:
             # Result row clicked - open its document
             self._open_document(result)
-        elif item.hasChildren():
+        elif self.results_model.hasChildren(index):
             # Some other item with children - expand/collapse it
             if self.results_tree.isExpanded(index):
                 self.results_tree.collapse(index)
@@ -242,18 +304,14 @@ class SearchView(BaseTabView):
         if not index.isValid():
             return
 
-        item = self.results_model.itemFromIndex(index)
-        if not item:
-            return
-
-        # Check what was clicked
-        item_type = item.data(Qt.UserRole + 1)
-        result = item.data(Qt.UserRole)
+        # Check what was clicked (document headers are in column 0)
+        item_type = index.siblingAtColumn(0).data(ItemTypeRole)
+        result = index.siblingAtColumn(0).data(Qt.UserRole)
 
         # Create context menu
         menu = QMenu(self)
 
-        if item_type == "document_header":
+        if item_type == DOCUMENT_HEADER:
             # Document header - offer to open document
             doc_name = result  # For headers, UserRole contains the document name
             if doc_name:
@@ -357,156 +415,69 @@ class SearchView(BaseTabView):
 
     def clear_results(self):
         """Clear all results"""
-        self.results_model.removeRows(0, self.results_model.rowCount())
+        self.results_model.clear()
         self._clear_context_layout()
         self.all_results = []
 
-    def display_results(self, results: List[SearchResult]):
+    def display_results(self, results: List[SearchResultSet]):
         """Display search results grouped by document with separate tables per document
 
         Each document gets its own collapsible section with a table showing only
-        the columns that are relevant to that document.
+        the columns that are relevant to that document. Cells are produced on
+        demand by SearchResultsModel, so cost scales with visible rows.
 
         Args:
-            results: List of search results to display
+            results: Per-document search results to display
         """
-        self.results_model.clear()
+        self.all_results = list(results)
+        self.results_model.set_results(self.all_results)
 
         if not results:
             return
 
-        # Group results by document
-        grouped: Dict[str, List[SearchResult]] = {}
-        for result in results:
-            doc_name = result.document_name
-            if doc_name not in grouped:
-                grouped[doc_name] = []
-            grouped[doc_name].append(result)
-
-        # Find maximum number of columns needed across all documents
-        max_columns = 0
-        for doc_results in grouped.values():
-            if doc_results:
-                # +1 for row number
-                num_cols = len(doc_results[0].matched_row_data.keys()) + 1
-                max_columns = max(max_columns, num_cols)
-
-        # Set up model with enough columns
-        headers = [""] * max_columns
-        self.results_model.setHorizontalHeaderLabels(headers)
-
-        # Create separate table for each document
-        for doc_name, doc_results in grouped.items():
-            # Document header (collapsible parent)
-            doc_header_items = []
-            doc_item = QStandardItem(
-                f"📄 {doc_name} ({len(doc_results)} result{'s' if len(doc_results) != 1 else ''})")
-            doc_item.setEditable(False)
-            font = doc_item.font()
-            font.setBold(True)
-            doc_item.setFont(font)
-            # Store document name in UserRole for easy access
-            doc_item.setData(doc_name, Qt.UserRole)
-            # Mark as document header
-            doc_item.setData("document_header", Qt.UserRole + 1)
-            doc_item.setToolTip(f"Double-click to open {doc_name}")
-            doc_header_items.append(doc_item)
-
-            # Fill remaining columns with empty items
-            for _ in range(max_columns - 1):
-                empty = QStandardItem("")
-                empty.setEditable(False)
-                doc_header_items.append(empty)
-
-            self.results_model.appendRow(doc_header_items)
-
-            # Get column names from first result for THIS document
-            if doc_results:
-                column_names = list(doc_results[0].matched_row_data.keys())
-
-                # Create header row for this document's table
-                header_row = []
-                header_item = QStandardItem("#")
-                header_item.setEditable(False)
-                font = header_item.font()
-                font.setBold(True)
-                header_item.setFont(font)
-                header_row.append(header_item)
-
-                for col_name in column_names:
-                    col_item = QStandardItem(col_name)
-                    col_item.setEditable(False)
-                    font = col_item.font()
-                    font.setBold(True)
-                    col_item.setFont(font)
-                    header_row.append(col_item)
-
-                # Fill remaining columns with empty items
-                while len(header_row) < max_columns:
-                    empty = QStandardItem("")
-                    empty.setEditable(False)
-                    header_row.append(empty)
-
-                doc_item.appendRow(header_row)
-
-                # Add data rows for this document
-                for idx, result in enumerate(doc_results, 1):
-                    row = []
-
-                    # Row number with context indicator
-                    row_num_text = str(idx)
-                    if result.has_contexts():
-                        row_num_text += f" 🔍"  # Indicator for results with context
-                    num_item = QStandardItem(row_num_text)
-                    num_item.setEditable(False)
-                    num_item.setData(result, Qt.UserRole)
-                    if result.has_contexts():
-                        num_item.setToolTip(
-                            f"This result has {len(result.contexts)} context item(s)")
-                    row.append(num_item)
-
-                    # Data columns (only the columns for THIS document)
-                    for col_name in column_names:
-                        value = result.matched_row_data.get(col_name, '')
-                        value_item = QStandardItem(str(value))
-                        value_item.setEditable(False)
-                        value_item.setData(result, Qt.UserRole)
-                        row.append(value_item)
-
-                    # Fill remaining columns with empty items
-                    while len(row) < max_columns:
-                        empty = QStandardItem("")
-                        empty.setEditable(False)
-                        empty.setData(result, Qt.UserRole)
-                        row.append(empty)
-
-                    doc_item.appendRow(row)
-
-        # Expand all groups and resize columns
-        self.results_tree.expandAll()
-        for i in range(max_columns):
-            self.results_tree.resizeColumnToContents(i)
+        # Expand the document groups (their rows have no children, so
+        # expandAll would only walk every row) and size columns from a sample
+        for row in range(self.results_model.document_count()):
+            self.results_tree.expand(self.results_model.index(row, 0))
+        self._resize_columns_by_sampling()
+
+    def _resize_columns_by_sampling(self):
+        """Size columns from a sample of each column's texts
+
+        resizeColumnToContents would measure every row; sampling keeps
+        sizing time independent of the number of results.
+        """
+        font = QFont(self.results_tree.font())
+        font.setBold(True)  # Headers are bold - measure the wider font
+        metrics = QFontMetrics(font)
+        indent = self.results_tree.indentation()
+
+        for column in range(self.results_model.columnCount()):
+            texts = self.results_model.sample_column_texts(
+                column, self.COLUMN_SIZE_SAMPLES)
+            width = max((metrics.horizontalAdvance(text) for text in texts), default=0)
+            # Column 0 holds the tree decoration for child rows
+            padding = 2 * indent if column == 0 else 16
+            self.results_tree.setColumnWidth(
+                column, min(width + padding, self.MAX_COLUMN_WIDTH))
 
     def update_result(self, idx: int, result: SearchResult):
         """Update a specific result in the display (e.g., after context enrichment)
 
-        This is more efficient than redisplaying all results when only one changes.
+        The row is repainted in a batch with other updates arriving within
+        a few milliseconds.
 
         Args:
-            idx: Index of the result in the all_results list
+            idx: Index of the result across all documents
             result: Updated SearchResult object
         """
-        # Update stored result
-        if idx < len(self.all_results):
-            self.all_results[idx] = result
-
-            # Update the tree display to show context indicator
-            self._update_tree_item_for_result(result)
+        # Update the tree display to show context indicator
+        self._update_tree_item_for_result(result)
 
-            # If this result is currently selected, update the context display
-            current_result = self._get_selected_result()
-            if current_result and current_result.search_id == result.search_id:
-                self._display_result_details(result)
+        # If this result is currently selected, update the context display
+        current_result = self._get_selected_result()
+        if current_result and current_result.search_id == result.search_id:
+            self._display_result_details(result)
 
     def _get_selected_result(self) -> SearchResult:
         """Get the currently selected result
@@ -519,8 +490,8 @@ class SearchView(BaseTabView):
             return None
 
         index = selection.selectedRows()[0]
-        item = self.results_model.itemFromIndex(index)
-        return item.data(Qt.UserRole) if item else None
+        result = index.data(Qt.UserRole)
+        return result if isinstance(result, SearchResult) else None
 
     def _display_result_details(self, result: SearchResult):
         """Redisplay details for a specific result (used when context updates)
@@ -553,41 +524,7 @@ class SearchView(BaseTabView):
         Args:
             result: SearchResult that was updated
         """
-        # Walk through all items in the tree to find matching result
-        for doc_idx in range(self.results_model.rowCount()):
-            doc_item = self.results_model.item(doc_idx, 0)
-            if not doc_item:
-                continue
-
-            # Check all rows under this document
-            for row_idx in range(doc_item.rowCount()):
-                # Skip header row (row 0)
-                if row_idx == 0:
-                    continue
-
-                # Get first column item (row number column)
-                row_item = doc_item.child(row_idx, 0)
-                if not row_item:
-                    continue
-
-                # Check if this is our result
-                stored_result = row_item.data(Qt.UserRole)
-                if stored_result and stored_result.search_id == result.search_id:
-                    # Update the row number text to include context indicator
-                    current_text = row_item.text()
-                    # Remove existing emoji if present
-                    base_num = current_text.split()[0]
-
-                    if result.has_contexts():
-                        new_text = f"{base_num} 🔍"
-                        row_item.setText(new_text)
-                        row_item.setToolTip(
-                            f"This result has {len(result.contexts)} context item(s)")
-                    else:
-                        row_item.setText(base_num)
-                        row_item.setToolTip("")
-
-                    return  # Found and updated
+        self.results_model.update_result(result)
 
     def add_result(self, search_term: str, document: str, matched_data: str):
         """DEPRECATED: Use display_results() instead
@@ -22,6 +22,9 @@ class ContextProvider(ABC):
     def get_context(self, result: SearchResult) -> List[Context]:
         """Get additional context for a search result
 
+        Called for every hit, so read the row with result.items() rather
+        than result.matched_row_data (which builds a dict on each access).
+
         Args:
             result: The search result to provide context for
 
@@ -0,0 +1,399 @@
+"""
+Document Index - One search index across all loaded documents
+
+Instead of searching every SearchableDocument in turn, the index keeps:
+- A dictionary of the distinct lower-cased values of every document's
+  search columns (values repeated across rows and documents stored once)
+- Postings: flat NumPy arrays of (value id, document, column, row), ordered
+  by document, then search column, then row
+
+A query is matched against the distinct values once; the postings of the
+matching values are then selected in one vectorized pass and split into
+per-document SearchResultSets, in the order the documents were added.
+
+Documents are added and removed individually (sync() does both for a new
+document list), so adding one document to the configuration only indexes
+that document.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from .search_result import SearchResultSet
+from ..core.app_logging import get_logger
+from ..core.part_number_index import canonical_part_numbers
+from ..core.profiler import profile_span
+from ..core.search_query import Term, TextColumns, column_key, compile_query
+
+if TYPE_CHECKING:
+    from .searchable_document import SearchableDocument
+    from ..core.task_scheduler import CancellationToken
+
+logger = get_logger(__name__)
+
+# Column name used by the query evaluation for "every search column"
+_ALL_COLUMNS = '\0all'
+
+
+@dataclass
+class _Segment:
+    """Postings of one document"""
+    document: 'SearchableDocument'
+    df: pd.DataFrame  # Frame the postings were built from
+    columns: List[str]  # Search columns present in the frame
+    value_ids: np.ndarray  # int32, one per posting
+    column_ids: np.ndarray  # int16 index into `columns`
+    rows: np.ndarray  # int32 row positions
+
+
+@dataclass
+class _Postings:
+    """All segments' postings concatenated (rebuilt after changes)"""
+    documents: List['SearchableDocument']
+    value_ids: np.ndarray
+    column_ids: np.ndarray  # Global column id (index into column_names)
+    column_names: List[str]  # Per global column id
+    global_rows: np.ndarray  # Row offset of the document + row
+    rows: np.ndarray
+    posting_offsets: np.ndarray  # Start of each document's postings (+ end)
+    row_offsets: np.ndarray  # Start of each document's rows (+ total)
+
+
+class DocumentIndex:
+    """Search index over the search columns of many documents
+
+    Usage:
+        index = DocumentIndex()
+        index.sync(documents)          # add new, drop removed documents
+        result_sets = index.search('D38999', normalized=True)
+
+    Searches accept the query syntax of core.search_query and give the same
+    hits as SearchableDocument.search(). All methods are thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._segments: Dict[int, _Segment] = {}  # id(document) -> segment
+        self._value_ids: Dict[str, int] = {}
+        self._values: List[str] = []
+        self._value_text: Optional[pd.Series] = None
+        self._value_keys: Optional[pd.Series] = None
+        self._postings: Optional[_Postings] = None
+        # Last plain term and the values it matched (for refining)
+        self._last_needle: Optional[str] = None
+        self._last_normalized = False
+        self._last_values: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __contains__(self, document: 'SearchableDocument') -> bool:
+        segment = self._segments.get(id(document))
+        return segment is not None and segment.document is document
+
+    @property
+    def documents(self) -> List['SearchableDocument']:
+        """Indexed documents, in search order"""
+        with self._lock:
+            return [segment.document for segment in self._segments.values()]
+
+    @property
+    def value_count(self) -> int:
+        """Number of distinct values held"""
+        return len(self._values)
+
+    # ------------------------------------------------------------------
+    # Adding and removing documents
+    # ------------------------------------------------------------------
+
+    def add(self, document: 'SearchableDocument') -> bool:
+        """Index a loaded document (re-indexes it if its frame was reloaded)
+
+        Returns:
+            False if the document is not loaded
+        """
+        if not document.is_loaded():
+            self.remove(document)
+            return False
+
+        with self._lock:
+            segment = self._segments.get(id(document))
+            if segment is not None and segment.document is document and segment.df is document.df:
+                return True
+            df = document.df
+            columns = [c for c in document.search_columns if c in df.columns]
+
+            value_ids, column_ids, rows = [], [], []
+            for column_id, column in enumerate(columns):
+                codes, uniques = pd.factorize(df[column].astype(str).str.lower())
+                # Local codes -> ids in the shared value dictionary
+                lookup = np.fromiter((self._value_id(value) for value in uniques),
+                                     dtype=np.int32, count=len(uniques))
+                value_ids.append(lookup[codes])
+                column_ids.append(np.full(len(codes), column_id, dtype=np.int16))
+                rows.append(np.arange(len(codes), dtype=np.int32))
+
+            self._segments.pop(id(document), None)
+            self._segments[id(document)] = _Segment(
+                document=document, df=df, columns=columns,
+                value_ids=np.concatenate(value_ids) if value_ids else np.empty(0, np.int32),
+                column_ids=np.concatenate(column_ids) if column_ids else np.empty(0, np.int16),
+                rows=np.concatenate(rows) if rows else np.empty(0, np.int32))
+            self._changed()
+        logger.debug("Indexed '%s' (%d values)", document.file_name, len(self._values))
+        return True
+
+    def remove(self, document: 'SearchableDocument') -> bool:
+        """Drop a document from the index
+
+        Returns:
+            True if it was indexed
+        """
+        with self._lock:
+            segment = self._segments.get(id(document))
+            if segment is None or segment.document is not document:
+                return False
+            del self._segments[id(document)]
+            self._changed()
+            self._compact_if_sparse()
+        return True
+
+    def sync(self, documents: Sequence['SearchableDocument']):
+        """Make the index hold exactly these documents, in this order
+
+        Documents already indexed (with the same loaded frame) are kept as
+        they are.
+        """
+        with self._lock:
+            wanted = {id(document) for document in documents}
+            for segment in list(self._segments.values()):
+                if id(segment.document) not in wanted:
+                    self.remove(segment.document)
+            for document in documents:
+                self.add(document)
+            # Search order follows the document list
+            order = [id(document) for document in documents if id(document) in self._segments]
+            if list(self._segments) != order:
+                self._segments = {key: self._segments[key] for key in order}
+                self._changed()
+
+    def clear(self):
+        with self._lock:
+            self._segments.clear()
+            self._value_ids.clear()
+            self._values.clear()
+            self._changed()
+
+    def _value_id(self, value: str) -> int:
+        value_id = self._value_ids.get(value)
+        if value_id is None:
+            value_id = self._value_ids[value] = len(self._values)
+            self._values.append(value)
+        return value_id
+
+    def _changed(self):
+        """Drop everything derived from the segments and values"""
+        self._postings = None
+        self._value_text = None
+        self._value_keys = None
+        self._last_needle = None
+        self._last_values = None
+
+    def _compact_if_sparse(self):
+        """Forget values no document uses once they are the majority"""
+        used = np.zeros(len(self._values), dtype=bool)
+        for segment in self._segments.values():
+            used[segment.value_ids] = True
+        if used.sum() * 2 >= len(self._values):
+            return
+        new_ids = np.cumsum(used, dtype=np.int64).astype(np.int32) - 1
+        self._values = [value for value, keep in zip(self._values, used) if keep]
+        self._value_ids = {value: i for i, value in enumerate(self._values)}
+        for segment in self._segments.values():
+            segment.value_ids = new_ids[segment.value_ids]
+
+    # ------------------------------------------------------------------
+    # Derived structures
+    # ------------------------------------------------------------------
+
+    def _text(self) -> pd.Series:
+        if self._value_text is None:
+            self._value_text = pd.Series(self._values, dtype=object)
+        return self._value_text
+
+    def _keys(self) -> pd.Series:
+        if self._value_keys is None:
+            self._value_keys = canonical_part_numbers(self._text())
+        return self._value_keys
+
+    def _all_postings(self) -> _Postings:
+        if self._postings is None:
+            segments = list(self._segments.values())
+            column_names, column_starts, row_offsets, posting_offsets = [], [], [0], [0]
+            for segment in segments:
+                column_starts.append(len(column_names))
+                column_names.extend(segment.columns)
+                row_offsets.append(row_offsets[-1] + len(segment.df))
+                posting_offsets.append(posting_offsets[-1] + len(segment.rows))
+
+            def concat(arrays, dtype):
+                return np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.empty(0, dtype)
+
+            self._postings = _Postings(
+                documents=[segment.document for segment in segments],
+                value_ids=concat([s.value_ids for s in segments], np.int32),
+                column_ids=concat([s.column_ids.astype(np.int32) + start
+                                   for s, start in zip(segments, column_starts)], np.int32),
+                column_names=column_names,
+                global_rows=concat([s.rows.astype(np.int64) + offset
+                                    for s, offset in zip(segments, row_offsets)], np.int64),
+                rows=concat([s.rows for s in segments], np.int32),
+                posting_offsets=np.array(posting_offsets, dtype=np.int64),
+                row_offsets=np.array(row_offsets, dtype=np.int64))
+        return self._postings
+
+    # ------------------------------------------------------------------
+    # Searching
+    # ------------------------------------------------------------------
+
+    def _match_values(self, term: Term, normalized: bool,
+                      candidates: Optional[np.ndarray] = None) -> np.ndarray:
+        """Ids of the distinct values matching a term (of `candidates` if given)"""
+        text = self._text()
+        if candidates is not None:
+            text = text.iloc[candidates]
+        if term.regex:
+            found = text.str.contains(term.pattern, na=False).to_numpy(dtype=bool)
+        else:
+            found = text.str.contains(term.value, regex=False).to_numpy(dtype=bool)
+            key = term.part_number_key if normalized else ''
+            if key:
+                keys = self._keys()
+                if candidates is not None:
+                    keys = keys.iloc[candidates]
+                found |= keys.str.contains(key, regex=False).to_numpy(dtype=bool)
+        ids = np.flatnonzero(found)
+        return candidates[ids] if candidates is not None else ids
+
+    def search(self, search_term: str, token: Optional['CancellationToken'] = None,
+               normalized: bool = False) -> List[SearchResultSet]:
+        """Search every indexed document
+
+        Args:
+            search_term: Term or query (see core.search_query)
+            token: Cancellation token checked between query terms
+            normalized: Also match part numbers written with different
+                punctuation or case
+
+        Returns:
+            One SearchResultSet per document with hits, in document order.
+            A single term gives one hit per matching search column; other
+            queries give one hit per matching row.
+        """
+        with profile_span('document_index.search', 'search', documents=len(self)) as span:
+            with self._lock:
+                results = self._search(search_term, token, normalized)
+            span.finish(results=sum(len(r) for r in results))
+        return results
+
+    def _search(self, search_term: str, token, normalized: bool) -> List[SearchResultSet]:
+        postings = self._all_postings()
+        if not postings.documents:
+            return []
+        query = compile_query(search_term)
+        term = query.single_term
+
+        if term is None:
+            # Boolean query: evaluated per row across all documents
+            row_mask = query.mask(_IndexSource(self, postings, normalized), token=token)
+            selected_rows = np.flatnonzero(row_mask)
+            split = np.searchsorted(selected_rows, postings.row_offsets)
+            per_document = [
+                selected_rows[split[i]:split[i + 1]] - postings.row_offsets[i]
+                for i in range(len(postings.documents))]
+        else:
+            if token is not None:
+                token.raise_if_cancelled()
+            value_mask = np.zeros(len(self._values), dtype=bool)
+            value_mask[self._term_values(term, normalized)] = True
+            selected = np.flatnonzero(value_mask[postings.value_ids])
+            split = np.searchsorted(selected, postings.posting_offsets)
+            per_document = [postings.rows[selected[split[i]:split[i + 1]]]
+                            for i in range(len(postings.documents))]
+
+        results = []
+        for document, rows in zip(postings.documents, per_document):
+            if len(rows) == 0 or not document.check_precondition(search_term):
+                continue
+            results.append(SearchResultSet.from_frame(
+                search_term, document.file_name, document.doc_type,
+                document.df, document.return_columns, rows))
+        return results
+
+    def _term_values(self, term: Term, normalized: bool) -> np.ndarray:
+        """Values matching a single term, refining the last term's values
+        when the term extends it"""
+        needle = None if term.regex else term.value
+        uses_key = normalized and bool(term.part_number_key)
+        candidates = self._last_values if (
+            needle is not None and self._last_needle is not None
+            and self._last_needle in needle
+            and (self._last_normalized or not uses_key)) else None
+        values = self._match_values(term, normalized, candidates)
+        self._last_needle = needle
+        self._last_normalized = uses_key
+        self._last_values = values
+        return values
+
+
+class _IndexSource:
+    """Lets a SearchQuery evaluate over the index's rows
+
+    Rows are numbered across documents (document row offset + row). Column
+    terms on indexed search columns use the postings; other columns of the
+    documents' frames are matched directly.
+    """
+
+    columns = [_ALL_COLUMNS]
+
+    def __init__(self, index: DocumentIndex, postings: _Postings, normalized: bool):
+        self.index = index
+        self.postings = postings
+        self.normalized = normalized
+        self._column_keys = [column_key(name) for name in postings.column_names]
+
+    def __len__(self) -> int:
+        return int(self.postings.row_offsets[-1])
+
+    def find_column(self, name: str) -> Optional[str]:
+        wanted = column_key(name)
+        for document in self.postings.documents:
+            if any(column_key(column) == wanted for column in document.df.columns):
+                return wanted
+        return None
+
+    def match(self, column: str, term: Term, rows=None) -> np.ndarray:
+        value_mask = np.zeros(len(self.index._values), dtype=bool)
+        value_mask[self.index._match_values(term, self.normalized)] = True
+        posting_mask = value_mask[self.postings.value_ids]
+        row_mask = np.zeros(len(self), dtype=bool)
+        if column == _ALL_COLUMNS:
+            row_mask[self.postings.global_rows[posting_mask]] = True
+            return row_mask
+
+        indexed = [i for i, key in enumerate(self._column_keys) if key == column]
+        posting_mask &= np.isin(self.postings.column_ids, indexed)
+        row_mask[self.postings.global_rows[posting_mask]] = True
+        # Columns a document has but does not search
+        for i, document in enumerate(self.postings.documents):
+            for name in document.df.columns:
+                if column_key(name) != column or name in document.search_columns:
+                    continue
+                start, end = self.postings.row_offsets[i], self.postings.row_offsets[i + 1]
+                # Like SearchableDocument, only search columns match part number keys
+                text = TextColumns(document.df, [name])
+                row_mask[start:end] |= text.match(name, term)
+        return row_mask
@@ -0,0 +1,236 @@
+"""
+Document Preview - First rows of documents for the Add Document dialog
+
+The dialog shows a file's sheets, a preview of its first rows under the
+chosen header row and the column names found there. Instead of parsing the
+whole file each time the sheet or header row changes, this service reads
+only the first SAMPLE_ROWS rows of a sheet (read-only workbook access, no
+header) and keeps them. A preview for any header row is then cut from the
+kept rows; the file is read again only if the header row is moved past
+them or the file changed on disk.
+
+Methods may be called from any thread (the dialog reads on the task
+scheduler and cuts cached previews on the UI thread).
+"""
+import io
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..core.app_logging import get_logger
+from ..core.excel_reader import column_names, read_excel_sheet, sheet_names
+
+logger = get_logger(__name__)
+
+# Rows read per sheet (the header row plus the preview must fit, or more
+# rows are read)
+SAMPLE_ROWS = 100
+
+# Rows shown under the header row
+PREVIEW_ROWS = 20
+
+# Sheets kept in memory (least recently used dropped first)
+MAX_CACHED_SHEETS = 16
+
+_EXCEL_SUFFIXES = ('.xlsx', '.xlsm', '.xls')
+
+
+def is_excel_file(path: Union[str, Path]) -> bool:
+    return Path(path).suffix.lower() in _EXCEL_SUFFIXES
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    """Changes when the file is modified"""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _whole_number(value):
+    """Whole floats as ints, as read_excel reads cells"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+@dataclass
+class _Sample:
+    """First rows of a sheet: cells (no header applied), or text lines of
+    a CSV/TSV file"""
+    stamp: Tuple[int, int]
+    grid: Union[pd.DataFrame, List[str]]
+    complete: bool  # True if the sheet has no more rows
+
+
+class DocumentPreviewService:
+    """Reads and caches sheet names and the first rows of documents
+
+    Usage:
+        previews = DocumentPreviewService.shared()
+        previews.sheet_names('parts.xlsx')               # ['Parts', 'Notes']
+        previews.cached_sheet_names('parts.xlsx')        # same, or None
+        df = previews.preview('parts.xlsx', 'Parts', header_row=2)
+        previews.cached_preview('parts.xlsx', 'Parts', header_row=3)
+    """
+
+    _shared: Optional['DocumentPreviewService'] = None
+
+    def __init__(self, sample_rows: int = SAMPLE_ROWS):
+        self.sample_rows = sample_rows
+        self._lock = threading.Lock()
+        self._sheets: 'OrderedDict[str, Tuple[Tuple[int, int], List[str]]]' = OrderedDict()
+        self._samples: 'OrderedDict[Tuple[str, object], _Sample]' = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> 'DocumentPreviewService':
+        """Process-wide service (created on first use)"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def sheet_names(self, path: Union[str, Path]) -> List[str]:
+        """Sheet names of a workbook ([] for other files)"""
+        path = Path(path)
+        if not is_excel_file(path):
+            return []
+        stamp = _stamp(path)
+        with self._lock:
+            cached = self._sheets.get(str(path))
+            if cached is not None and cached[0] == stamp:
+                return list(cached[1])
+        names = sheet_names(path)
+        with self._lock:
+            self._sheets[str(path)] = (stamp, names)
+            self._trim(self._sheets)
+        return list(names)
+
+    def cached_sheet_names(self, path: Union[str, Path]) -> Optional[List[str]]:
+        """sheet_names() if cached for the file as it is now, otherwise None
+
+        Never reads the workbook, so it is safe to call on the UI thread.
+        """
+        path = Path(path)
+        if not is_excel_file(path):
+            return []
+        try:
+            stamp = _stamp(path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._sheets.get(str(path))
+            if cached is None or cached[0] != stamp:
+                return None
+            return list(cached[1])
+
+    def preview(self, path: Union[str, Path], sheet: Union[str, int, None] = None,
+                header_row: int = 0, nrows: int = PREVIEW_ROWS) -> pd.DataFrame:
+        """Rows under the header row, named by the header row's cells
+
+        Reads the file only if its first rows are not cached (or it changed).
+
+        Args:
+            path: Excel or CSV/TSV file
+            sheet: Sheet name or position for workbooks (None for the first)
+            header_row: 0-based row holding the column names
+            nrows: Rows to return under the header row
+
+        Returns:
+            DataFrame like pd.read_excel(path, sheet, header=header_row,
+            nrows=nrows) gives
+        """
+        path = Path(path)
+        needed = header_row + 1 + nrows
+        sample = self._cached(path, sheet, needed)
+        if sample is None:
+            rows = max(self.sample_rows, 2 * needed)
+            grid = self._read(path, sheet, rows)
+            sample = _Sample(_stamp(path), grid, complete=len(grid) < rows)
+            with self._lock:
+                self._samples[(str(path), sheet)] = sample
+                self._trim(self._samples)
+        return self._cut(sample.grid, header_row, nrows)
+
+    def cached_preview(self, path: Union[str, Path], sheet: Union[str, int, None] = None,
+                       header_row: int = 0, nrows: int = PREVIEW_ROWS) -> Optional[pd.DataFrame]:
+        """preview() if it can be cut from cached rows, otherwise None
+
+        Never reads the file, so it is safe to call on the UI thread.
+        """
+        path = Path(path)
+        try:
+            sample = self._cached(path, sheet, header_row + 1 + nrows)
+        except OSError:
+            return None
+        return self._cut(sample.grid, header_row, nrows) if sample is not None else None
+
+    def invalidate(self, path: Union[str, Path, None] = None):
+        """Forget cached rows of a file (of every file if None)"""
+        with self._lock:
+            if path is None:
+                self._sheets.clear()
+                self._samples.clear()
+                return
+            self._sheets.pop(str(path), None)
+            for key in [key for key in self._samples if key[0] == str(path)]:
+                del self._samples[key]
+
+    def _cached(self, path: Path, sheet, needed: int) -> Optional[_Sample]:
+        """Cached sample holding `needed` rows (if the sheet has them)"""
+        stamp = _stamp(path)
+        with self._lock:
+            sample = self._samples.get((str(path), sheet))
+            if sample is None or sample.stamp != stamp:
+                return None
+            if not sample.complete and len(sample.grid) < needed:
+                return None
+            self._samples.move_to_end((str(path), sheet))
+            return sample
+
+    @staticmethod
+    def _trim(cache: OrderedDict):
+        while len(cache) > MAX_CACHED_SHEETS:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _read(path: Path, sheet, rows: int) -> Union[pd.DataFrame, List[str]]:
+        """First rows of a file: cells without a header, or text lines"""
+        logger.debug("Reading %d preview rows of %s", rows, path.name)
+        if is_excel_file(path):
+            return read_excel_sheet(path, sheet_name=sheet, header=None, nrows=rows)
+        # Text files are parsed per header row (rows above it may have
+        # fewer fields, e.g. a title line)
+        with open(path, newline='', encoding='utf-8', errors='replace') as file:
+            return list(itertools.islice(file, rows))
+
+    @staticmethod
+    def _cut(grid: Union[pd.DataFrame, List[str]], header_row: int,
+             nrows: int) -> pd.DataFrame:
+        """Apply a header row to cached cells"""
+        if isinstance(grid, list):
+            text = ''.join(grid)
+            try:
+                return pd.read_csv(io.StringIO(text), header=header_row, nrows=nrows)
+            except Exception:
+                # Fall back to tab-separated
+                return pd.read_csv(io.StringIO(text), sep='\t', header=header_row,
+                                   nrows=nrows)
+        if header_row >= len(grid):
+            return pd.DataFrame()
+        # As read_excel: columns up to the last one used in the rows read,
+        # without empty rows at the end
+        read = grid.iloc[:header_row + 1 + nrows]
+        used = read.notna()
+        width = int(used.any().to_numpy().nonzero()[0].max() + 1) if used.any().any() else 0
+        filled = used.iloc[header_row + 1:].any(axis=1).to_numpy().nonzero()[0]
+        end = header_row + 1 + (int(filled.max()) + 1 if len(filled) else 0)
+
+        preview = read.iloc[header_row + 1:end, :width].reset_index(drop=True)
+        preview.columns = column_names(read.iloc[header_row, :width].tolist())
+        # Types follow the preview rows only (the header row or rows below
+        # the preview may have made a column text or float)
+        preview = preview.astype(object).map(_whole_number)
+        return preview.infer_objects()
@@ -2,9 +2,12 @@
 Document Scanner Model - Manages searchable documents
 """
 from PySide6.QtCore import QObject, Signal, QThread
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from ..document_scanner.searchable_document import SearchableDocument
+from ..document_scanner.document_index import DocumentIndex
+from ..document_scanner.search_result import SearchResultSet
 from ..core.config_manager import DocumentScannerConfig
+from ..core.search_history import SearchHistoryStore, HistoryEntry
 
 
 class DocumentLoaderThread(QThread):
@@ -15,9 +18,21 @@ class DocumentLoaderThread(QThread):
     progress = Signal(int, str)  # Progress (index, file_name)
     error = Signal(str)  # Error message
 
-    def __init__(self, document_configs: List[Dict[str, Any]]):
+    def __init__(self, document_configs: List[Dict[str, Any]],
+                 loaded: Optional[List[SearchableDocument]] = None,
+                 index: Optional[DocumentIndex] = None):
+        """Initialize the loader
+
+        Args:
+            document_configs: Configurations to load
+            loaded: Documents already loaded; one whose config is in
+                document_configs is kept instead of being read again
+            index: Search index to bring up to date with the loaded documents
+        """
         super().__init__()
         self.document_configs = document_configs
+        self.loaded = {id(doc.config): doc for doc in (loaded or [])}
+        self.index = index
 
     def run(self):
         """Load documents in background thread"""
@@ -29,10 +44,16 @@ class DocumentLoaderThread(QThread):
                 file_name = config.get('file_name', 'Unknown')
                 self.progress.emit(idx + 1, file_name)
 
-                # Create SearchableDocument (loads the file)
-                searchable_doc = SearchableDocument(config)
+                # Reuse an unchanged document, otherwise load the file
+                searchable_doc = self.loaded.get(id(config))
+                if searchable_doc is None or searchable_doc.config is not config:
+                    searchable_doc = SearchableDocument(config)
                 searchable_docs.append(searchable_doc)
 
+            # Index new documents and drop removed ones
+            if self.index is not None:
+                self.index.sync(searchable_docs)
+
             # Emit loaded documents
             self.documents_loaded.emit(searchable_docs)
 
@@ -52,11 +73,20 @@ class DocumentScannerModel(QObject):
     loading_progress = Signal(int, int, str)  # current, total, message
     search_history_changed = Signal()  # Emitted when search history is updated
 
-    def __init__(self):
+    # Scope of this tab's entries in the shared search history
+    HISTORY_SCOPE = 'document_scanner'
+
+    # Distinct terms shown in the History tab
+    HISTORY_LIMIT = 50
+
+    def __init__(self, history_store: Optional[SearchHistoryStore] = None):
         super().__init__()
         self.searchable_documents = []  # List of SearchableDocument objects
         self.document_configs = []  # Raw config data
         self.loader_thread = None
+        self.search_index = DocumentIndex()  # Spans all loaded documents
+        self.history_store = history_store or SearchHistoryStore.shared()
+        self._history_migrated = False
 
     def load_from_config(self):
         """Load documents from configuration file"""
@@ -78,8 +108,14 @@ class DocumentScannerModel(QObject):
         # Start background loading
         self._load_documents_async(self.document_configs)
 
-    def _load_documents_async(self, configs: List[Dict[str, Any]]):
-        """Load documents in background thread"""
+    def _load_documents_async(self, configs: List[Dict[str, Any]], reload: bool = False):
+        """Load documents in background thread
+
+        Args:
+            configs: Document configurations
+            reload: Read every file again (otherwise documents already
+                loaded with the same configuration are kept)
+        """
         if self.loader_thread and self.loader_thread.isRunning():
             print("⚠️  Loader thread already running, waiting...")
             self.loader_thread.wait()
@@ -87,7 +123,8 @@ class DocumentScannerModel(QObject):
         self.loading_started.emit()
 
         # Create and start loader thread
-        self.loader_thread = DocumentLoaderThread(configs)
+        self.loader_thread = DocumentLoaderThread(
+            configs, None if reload else self.searchable_documents, self.search_index)
         self.loader_thread.documents_loaded.connect(self._on_documents_loaded)
         self.loader_thread.progress.connect(self._on_loading_progress)
         self.loader_thread.error.connect(self._on_loading_error)
@@ -135,7 +172,7 @@ class DocumentScannerModel(QObject):
         # Save to file
         DocumentScannerConfig.save_documents(self.document_configs)
 
-        # Reload all documents
+        # Load the new document (the others are kept)
         self._load_documents_async(self.document_configs)
 
     def remove_document(self, index: int):
@@ -147,7 +184,7 @@ class DocumentScannerModel(QObject):
             # Save to file
             DocumentScannerConfig.save_documents(self.document_configs)
 
-            # Reload all documents
+            # Drop the document (the others are kept)
             self._load_documents_async(self.document_configs)
 
     def get_searchable_documents(self) -> List[SearchableDocument]:
@@ -162,50 +199,68 @@ class DocumentScannerModel(QObject):
         """Reload all documents from disk"""
         if self.document_configs:
             print("♻️  Reloading documents...")
-            self._load_documents_async(self.document_configs)
+            self._load_documents_async(self.document_configs, reload=True)
 
-    # History Management
-    def get_search_history(self) -> List[str]:
-        """Get search history (most recent first)
+    def search(self, search_term: str, token=None,
+               normalized: bool = False) -> List[SearchResultSet]:
+        """Search all loaded documents through the shared index
+
+        Args:
+            search_term: Term or query (see core.search_query)
+            token: Cancellation token (TaskCancelled is raised when cancelled)
+            normalized: Also match part numbers written with other punctuation
 
         Returns:
-            List of search terms (max 10)
+            One SearchResultSet per document with hits, in document order
         """
-        from ..core.config_manager import DocumentScannerConfig
-        history = DocumentScannerConfig.load_search_history()
-        return history
+        # Cheap when the loader already indexed these documents
+        self.search_index.sync(self.searchable_documents)
+        return self.search_index.search(search_term, token=token, normalized=normalized)
 
-    def add_to_search_history(self, search_term: str):
-        """Add a search term to history
+    # History Management
+    def _history(self) -> SearchHistoryStore:
+        """History store, moving any history kept in the config across once"""
+        if not self._history_migrated:
+            self._history_migrated = True
+            legacy = DocumentScannerConfig.take_search_history()
+            if legacy:
+                self.history_store.import_terms(self.HISTORY_SCOPE, legacy)
+        return self.history_store
+
+    def get_search_history(self, limit: int = HISTORY_LIMIT) -> List[HistoryEntry]:
+        """Get search history (most recent first)
 
         Args:
-            search_term: The search term to add
-        """
-        from ..core.config_manager import DocumentScannerConfig
+            limit: Maximum number of distinct terms
 
-        # Get current history
-        history = DocumentScannerConfig.load_search_history()
+        Returns:
+            List of HistoryEntry (term, uses, last result count, ...)
+        """
+        return self._history().recent(self.HISTORY_SCOPE, limit)
 
-        # Remove if already exists (to move to front)
-        if search_term in history:
-            history.remove(search_term)
+    def get_search_history_entry(self, search_term: str) -> Optional[HistoryEntry]:
+        """History summary of one term (uses, last result count, ...)"""
+        return self._history().get(self.HISTORY_SCOPE, search_term)
 
-        # Add to front
-        history.insert(0, search_term)
+    def complete_search_term(self, prefix: str, limit: int = 10) -> List[str]:
+        """Previous search terms starting with prefix, most used first"""
+        return self._history().complete(self.HISTORY_SCOPE, prefix, limit)
 
-        # Keep only last 10
-        history = history[:10]
+    def add_to_search_history(self, search_term: str, result_count: Optional[int] = None):
+        """Add a search term to history
 
-        # Save
-        DocumentScannerConfig.save_search_history(history)
+        Args:
+            search_term: The search term to add
+            result_count: Number of results the search returned, if known
+        """
+        self._history().record(self.HISTORY_SCOPE, search_term, result_count)
 
         # Emit signal to notify History view
         self.search_history_changed.emit()
 
     def clear_search_history(self):
         """Clear all search history"""
-        from ..core.config_manager import DocumentScannerConfig
-        DocumentScannerConfig.save_search_history([])
+        self._history().clear(self.HISTORY_SCOPE)
 
         # Emit signal to notify History view
         self.search_history_changed.emit()
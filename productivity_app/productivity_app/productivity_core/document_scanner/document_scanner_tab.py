@@ -7,53 +7,21 @@ from ..document_scanner.Configuration.presenter import ConfigurationPresenter
 from ..document_scanner.History.presenter import HistoryPresenter
 from ..document_scanner.CompareVersions.presenter import CompareVersionsPresenter
 from ..document_scanner.document_scanner_model import DocumentScannerModel
+from ..tabs.tab_ids import DocumentScannerTabs
 
 
-class DocumentScannerModuleView(QWidget):
+class DocumentScannerModuleView(QWidget, DocumentScannerTabs):
     """Main Document Scanner module containing Search, Configuration, History, and Compare Versions tabs"""
 
-    # ========================================================================
-    # MODULE IDENTIFIER - Single source of truth for this module
-    # ========================================================================
-    # Used for tab registration and sub-tab visibility management
-    # ========================================================================
-
-    MODULE_ID = 'document_scanner'
-
-    # ========================================================================
-    # SUB-TAB IDENTIFIERS - Single source of truth
-    # ========================================================================
-    # All code that references sub-tabs should use these constants
-    # When renaming: update here and everything else auto-updates
-    # ========================================================================
-
-    SUB_TAB_SEARCH = 'search'
-    SUB_TAB_CONFIGURATION = 'configuration'
-    SUB_TAB_HISTORY = 'history'
-    SUB_TAB_COMPARE_VERSIONS = 'compare_versions'
-
-    # Ordered list of all sub-tabs (used for iteration)
-    SUB_TAB_ORDER = [
-        SUB_TAB_SEARCH,
-        SUB_TAB_CONFIGURATION,
-        SUB_TAB_HISTORY,
-        SUB_TAB_COMPARE_VERSIONS,
-    ]
-
-    # Display names (for UI labels)
-    SUB_TAB_LABELS = {
-        SUB_TAB_SEARCH: 'Search',
-        SUB_TAB_CONFIGURATION: 'Configuration',
-        SUB_TAB_HISTORY: 'History',
-        SUB_TAB_COMPARE_VERSIONS: 'Compare Versions',
-    }
+    # Module and sub-tab identifiers (MODULE_ID, SUB_TAB_*) come from
+    # DocumentScannerTabs in tabs/tab_ids.py
 
     def __init__(self, context):
         super().__init__()
         self.context = context
 
         # Create shared model
-        self.model = DocumentScannerModel()
+        self.model = DocumentScannerModel(context.get('search_history'))
 
         # Create sub-presenters (pass model to them)
         self.search_presenter = SearchPresenter(context, self.model)
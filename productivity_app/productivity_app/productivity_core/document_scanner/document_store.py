@@ -122,12 +122,13 @@ class DocumentStore:
         """
         import pandas as pd
         from pathlib import Path
+        from ..core.excel_reader import read_excel_sheet
 
         path = Path(file_path)
 
         if path.suffix.lower() == '.csv':
             return pd.read_csv(file_path)
         elif path.suffix.lower() in ['.xlsx', '.xls']:
-            return pd.read_excel(file_path)
+            return read_excel_sheet(file_path)
         else:
             raise ValueError(f"Unsupported file type: {path.suffix}")
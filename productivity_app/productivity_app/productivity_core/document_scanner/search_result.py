@@ -1,9 +1,12 @@
 """
-Search Result Data Class
+Search Result Data Classes
+
+Search hits are stored per document in a column-wise SearchResultSet;
+SearchResult objects are small views onto one of its rows.
 """
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Callable
-import uuid
+from typing import Dict, Any, Iterator, List, Optional, Callable, Sequence, Tuple
 
 
 @dataclass
@@ -45,30 +48,184 @@ class Context:
         return ", ".join([f"{k}: {v}" for k, v in self.data_context.items()])
 
 
-@dataclass
+class SearchResultSet:
+    """Hits of one search in one document, stored column-wise
+
+    Instead of one object (with its own dict, list and id string) per hit,
+    a set keeps:
+    - the return-column arrays of the source frame (shared, not copied)
+    - the positions of the matching rows in those arrays
+    - a block of consecutive integer search ids, one per hit
+    - contexts, only for hits that have any
+
+    Indexing or iterating yields SearchResult views, created on access.
+    value() and items() read cells without creating a view.
+    """
+
+    __slots__ = ('search_term', 'document_name', 'document_type', 'columns',
+                 '_arrays', '_rows', 'first_id', '_contexts')
+
+    def __init__(self, search_term: str, document_name: str, document_type: str,
+                 columns: List[str], arrays: Sequence[Sequence[Any]],
+                 rows: Sequence[int]):
+        """Initialize the set
+
+        Args:
+            search_term: Term that was searched for
+            document_name: Document the hits come from
+            document_type: Document type from its configuration
+            columns: Return column names
+            arrays: One array of values per return column (e.g. frame columns)
+            rows: Position in the arrays of each hit, in result order
+        """
+        self.search_term = search_term
+        self.document_name = document_name
+        self.document_type = document_type
+        self.columns = list(columns)
+        self._arrays = list(arrays)
+        self._rows = rows
+        self.first_id = _reserve_ids(len(rows))
+        self._contexts: Dict[int, List[Context]] = {}
+
+    @classmethod
+    def from_frame(cls, search_term: str, document_name: str, document_type: str,
+                   df, columns: List[str], rows: Sequence[int]) -> 'SearchResultSet':
+        """Set over rows of a DataFrame
+
+        Args:
+            df: Source frame (its columns are referenced, not copied)
+            columns: Return columns to expose (missing ones are skipped)
+            rows: Positional (iloc) row numbers of the hits
+        """
+        columns = [column for column in columns if column in df.columns]
+        arrays = [df[column].to_numpy() for column in columns]
+        return cls(search_term, document_name, document_type, columns, arrays, rows)
+
+    @classmethod
+    def from_rows(cls, search_term: str, document_name: str, document_type: str,
+                  rows: List[Dict[str, Any]]) -> 'SearchResultSet':
+        """Set over row dicts (for sources that are not DataFrames)"""
+        columns = list(rows[0].keys()) if rows else []
+        arrays = [[row.get(column) for row in rows] for column in columns]
+        return cls(search_term, document_name, document_type, columns, arrays,
+                   range(len(rows)))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, position: int) -> 'SearchResult':
+        if position < 0:
+            position += len(self._rows)
+        if not 0 <= position < len(self._rows):
+            raise IndexError(position)
+        return SearchResult(self, position)
+
+    def __iter__(self) -> Iterator['SearchResult']:
+        for position in range(len(self._rows)):
+            yield SearchResult(self, position)
+
+    def value(self, position: int, column: int) -> Any:
+        """Cell of a hit by return-column number"""
+        return self._arrays[column][self._rows[position]]
+
+    def items(self, position: int) -> Iterator[Tuple[str, Any]]:
+        """(column, value) pairs of a hit"""
+        row = self._rows[position]
+        for column, array in zip(self.columns, self._arrays):
+            yield column, array[row]
+
+    def position_of(self, search_id: int) -> Optional[int]:
+        """Position of a hit from its search id, or None if not in this set"""
+        position = search_id - self.first_id
+        return position if 0 <= position < len(self._rows) else None
+
+    def contexts(self, position: int) -> List[Context]:
+        return self._contexts.get(position, [])
+
+    def add_context(self, position: int, context: Context):
+        self._contexts.setdefault(position, []).append(context)
+
+    def has_contexts(self, position: int) -> bool:
+        return position in self._contexts
+
+    def context_count(self) -> int:
+        """Number of hits that have context"""
+        return len(self._contexts)
+
+
+_id_lock = threading.Lock()
+_next_id = 1
+
+
+def _reserve_ids(count: int) -> int:
+    """Reserve `count` consecutive search ids and return the first"""
+    global _next_id
+    with _id_lock:
+        first = _next_id
+        _next_id += count
+    return first
+
+
 class SearchResult:
-    """Data class for search results"""
-    search_term: str
-    document_name: str
-    document_type: str
-    matched_row_data: Dict[str, Any]  # Column: Value pairs from return columns
-    contexts: List[Context] = None  # Additional context from other sources
-    search_id: str = field(default_factory=lambda: str(
-        uuid.uuid4()))  # Unique ID for each result
-
-    def __post_init__(self):
-        """Initialize contexts list if None"""
-        if self.contexts is None:
-            self.contexts = []
+    """One hit: a lightweight view onto a row of a SearchResultSet"""
+
+    __slots__ = ('result_set', 'position')
+
+    def __init__(self, result_set: SearchResultSet, position: int):
+        self.result_set = result_set
+        self.position = position
+
+    @property
+    def search_term(self) -> str:
+        return self.result_set.search_term
+
+    @property
+    def document_name(self) -> str:
+        return self.result_set.document_name
+
+    @property
+    def document_type(self) -> str:
+        return self.result_set.document_type
+
+    @property
+    def search_id(self) -> int:
+        """Unique id of the hit (stable for the life of its set)"""
+        return self.result_set.first_id + self.position
+
+    @property
+    def matched_row_data(self) -> Dict[str, Any]:
+        """Column: Value pairs from the return columns (built on each access)"""
+        return dict(self.result_set.items(self.position))
+
+    @property
+    def contexts(self) -> List[Context]:
+        """Additional context from other sources"""
+        return self.result_set.contexts(self.position)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """(column, value) pairs from the return columns"""
+        return self.result_set.items(self.position)
 
     def add_context(self, context: Context):
         """Add context to this result"""
-        self.contexts.append(context)
+        self.result_set.add_context(self.position, context)
 
     def get_formatted_data(self) -> str:
         """Get formatted string of matched data"""
-        return ", ".join([f"{k}: {v}" for k, v in self.matched_row_data.items()])
+        return ", ".join([f"{k}: {v}" for k, v in self.items()])
 
     def has_contexts(self) -> bool:
         """Check if result has any contexts"""
-        return len(self.contexts) > 0
+        return self.result_set.has_contexts(self.position)
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, SearchResult)
+                and other.result_set is self.result_set
+                and other.position == self.position)
+
+    def __hash__(self) -> int:
+        return hash(self.search_id)
+
+    def __repr__(self) -> str:
+        return (f"SearchResult({self.document_name!r}, #{self.position}, "
+                f"{self.get_formatted_data()!r})")
@@ -1,10 +1,21 @@
 """
 Searchable Document - Pre-loaded document for fast searching
 """
+import threading
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
-from ..document_scanner.search_result import SearchResult
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from ..document_scanner.search_result import SearchResultSet
+from ..core.profiler import profile_span
+from ..core.app_logging import get_logger, sample
+from ..core.search_query import TextColumns, compile_query
+from ..core.excel_reader import read_excel_sheet
+
+if TYPE_CHECKING:
+    from ..core.task_scheduler import CancellationToken
+
+logger = get_logger(__name__)
 
 
 class SearchableDocument:
@@ -31,6 +42,12 @@ class SearchableDocument:
         self.df = None  # Will hold the loaded DataFrame
         self.load_error = None
 
+        # Searches run one at a time over column text built once per load
+        # (live search goes through DocumentIndex, which refines the
+        # previous term's matches itself)
+        self._search_lock = threading.Lock()
+        self._text: Optional[TextColumns] = None
+
         # Load the document immediately
         self._load()
 
@@ -39,15 +56,18 @@ class SearchableDocument:
         try:
             if not self.file_path.exists():
                 self.load_error = "File not found"
-                print(f"  ❌ ERROR: File not found: {self.file_path}")
+                logger.warning("File not found: %s", self.file_path)
                 return
 
             # Load based on file type
             if self.file_path.suffix.lower() in ['.xlsx', '.xls']:
-                # Use sheet name if provided, otherwise use first sheet (0)
+                # Use sheet name if provided, otherwise use first sheet (0).
+                # Only the search and return columns are kept.
                 sheet = self.sheet_name if self.sheet_name else 0
-                self.df = pd.read_excel(
-                    self.file_path, sheet_name=sheet, header=self.header_row)
+                self.df = read_excel_sheet(
+                    self.file_path, sheet_name=sheet, header=self.header_row,
+                    usecols=self._used_columns(), compact=True,
+                    progress=self._on_read_progress)
             else:
                 # Try CSV first
                 try:
@@ -58,14 +78,23 @@ class SearchableDocument:
                     self.df = pd.read_csv(
                         self.file_path, sep='\t', header=self.header_row)
 
-            print(
-                f"  ✓ Loaded '{self.file_name}': {len(self.df)} rows, {len(self.df.columns)} columns")
+            logger.info("Loaded '%s': %d rows, %d columns",
+                        self.file_name, len(self.df), len(self.df.columns))
 
         except Exception as e:
             self.load_error = str(e)
-            print(f"  ❌ ERROR loading '{self.file_name}': {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error loading '%s': %s", self.file_name, e)
+
+    def _used_columns(self) -> Optional[List[str]]:
+        """Columns searches and results need (None to read every column)"""
+        if self.header_row is None or not self.search_columns:
+            return None
+        return list(dict.fromkeys(list(self.search_columns) + list(self.return_columns)))
+
+    def _on_read_progress(self, rows: int, total: Optional[int]):
+        if rows != total:
+            logger.debug("Reading '%s': %d of %s rows", self.file_name, rows,
+                         total or '?', extra=sample(20))
 
     def is_loaded(self) -> bool:
         """Check if document loaded successfully"""
@@ -88,69 +117,97 @@ class SearchableDocument:
                           "search_term": search_term})
             return bool(result)
         except Exception as e:
-            print(
-                f"  ⚠️  Error evaluating precondition '{self.precondition}': {e}")
+            logger.warning("Error evaluating precondition '%s': %s", self.precondition, e)
             return False
 
-    def search(self, search_term: str) -> List[SearchResult]:
+    def search(self, search_term: str,
+               token: Optional['CancellationToken'] = None,
+               normalized: bool = False) -> SearchResultSet:
         """Search this document for the given term
 
+        The term may use the query syntax of core.search_query (AND/OR/NOT,
+        "phrases", Column:term, /regex/); other text is matched literally.
+
         Args:
             search_term: Term to search for
+            token: Cancellation token checked between search columns
+                (TaskCancelled is raised when cancelled)
+            normalized: Also match part numbers written with different
+                punctuation or case (D38999-26WA35PN finds D38999/26WA35PN);
+                applies to plain terms containing a digit
 
         Returns:
-            List of SearchResult objects
+            SearchResultSet of the matching rows. A single term gives one hit
+            per matching search column, in search column order; other
+            queries give one hit per matching row.
         """
-        results = []
-
-        if not self.is_loaded():
-            print(f"  ⏭️  Skipped '{self.file_name}': {self.load_error}")
-            return results
-
-        # Check precondition
-        if not self.check_precondition(search_term):
-            print(f"  ⏭️  Skipped '{self.file_name}': Precondition not met")
-            return results
-
-        print(f"  🔎 Searching '{self.file_name}'...")
-
-        # Search in each search column
-        for search_col in self.search_columns:
-            if search_col not in self.df.columns:
-                print(f"     ❌ Column '{search_col}' not found!")
-                continue
-
-            # Find matches (case-insensitive contains)
-            matches = self.df[self.df[search_col].astype(
-                str).str.contains(search_term, case=False, na=False)]
-
-            if len(matches) > 0:
-                print(f"     Found {len(matches)} match(es) in '{search_col}'")
-
-            # Create results for each match
-            for idx, row in matches.iterrows():
-                # Extract return column data
-                matched_data = {}
-                for return_col in self.return_columns:
-                    if return_col in self.df.columns:
-                        matched_data[return_col] = row[return_col]
-
-                result = SearchResult(
-                    search_term=search_term,
-                    document_name=self.file_name,
-                    document_type=self.doc_type,
-                    matched_row_data=matched_data
-                )
-
-                results.append(result)
-
+        with profile_span('document.search', 'search', document=self.file_name) as span:
+            results = self._search(search_term, token, normalized)
+            span.finish(results=len(results))
         return results
 
+    def _search(self, search_term: str, token: Optional['CancellationToken'],
+                normalized: bool) -> SearchResultSet:
+        with self._search_lock:
+            if not self.is_loaded():
+                logger.debug("Skipped '%s': %s", self.file_name, self.load_error)
+                return self._result_set(search_term, [])
+
+            # Check precondition
+            if not self.check_precondition(search_term):
+                logger.debug("Skipped '%s': precondition not met", self.file_name)
+                return self._result_set(search_term, [])
+
+            for search_col in self.search_columns:
+                if search_col not in self.df.columns:
+                    logger.warning("Column '%s' not found in '%s'",
+                                   search_col, self.file_name)
+
+            text = self._search_text()
+            text.key_columns = set(text.columns) if normalized else set()
+            query = compile_query(search_term)
+            term = query.single_term
+            if term is None:
+                # Boolean query: each matching row once
+                rows = np.flatnonzero(query.mask(text, token=token))
+                return self._result_set(search_term, [rows])
+
+            logger.debug("Searching '%s'", self.file_name)
+
+            # Search in each search column (case-insensitive contains)
+            matches: List[np.ndarray] = []
+            for search_col in text.columns:
+                if token is not None:
+                    token.raise_if_cancelled()
+                rows = np.flatnonzero(text.match(search_col, term))
+                if len(rows) > 0:
+                    logger.debug("Found %d match(es) in '%s'",
+                                 len(rows), search_col)
+                    matches.append(rows)
+            return self._result_set(search_term, matches)
+
+    def _search_text(self) -> TextColumns:
+        """Lower-cased text of the search columns, built once per load"""
+        if self._text is None:
+            self._text = TextColumns(self.df, self.search_columns)
+        return self._text
+
+    def _result_set(self, search_term: str, matched_rows: List[np.ndarray]) -> SearchResultSet:
+        """Result set over the matched row positions of the loaded frame"""
+        rows = np.concatenate(matched_rows) if matched_rows else np.empty(0, dtype=np.intp)
+        if self.df is None:
+            return SearchResultSet(search_term, self.file_name, self.doc_type, [], [], rows)
+        return SearchResultSet.from_frame(
+            search_term, self.file_name, self.doc_type,
+            self.df, self.return_columns, rows)
+
     def reload(self):
         """Reload the document from disk"""
-        self.df = None
-        self.load_error = None
-        self._load()
+        with self._search_lock:
+            self.df = None
+            self.load_error = None
+            self._text = None
+            self._load()
 
     def get_info(self) -> str:
         """Get document information string"""
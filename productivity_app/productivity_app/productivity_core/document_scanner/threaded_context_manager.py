@@ -1,14 +1,18 @@
 """
 Threaded Context Manager for non-blocking context enrichment
 """
-from PySide6.QtCore import QObject, QThread, Signal
-from typing import List, Dict
+from PySide6.QtCore import QObject, Signal
+from typing import List, Dict, Optional
 from .context_provider import ContextProvider
-from ..document_scanner.search_result import SearchResult, Context
+from ..document_scanner.search_result import SearchResult, SearchResultSet
+from ..core.task_scheduler import TaskPriority, TaskScheduler
+from ..core.app_logging import get_logger, fields, sample
+
+logger = get_logger(__name__)
 
 
 class ContextWorker(QObject):
-    """Worker that runs context enrichment in a separate thread"""
+    """Worker that runs context enrichment on a task scheduler thread"""
 
     # Signal emitted when a single result is enriched with context
     result_enriched = Signal(int, SearchResult)  # index, enriched_result
@@ -19,10 +23,10 @@ class ContextWorker(QObject):
     # Signal emitted on error
     error_occurred = Signal(str, str)  # provider_name, error_message
 
-    def __init__(self, providers: List[ContextProvider], results: List[SearchResult]):
+    def __init__(self, providers: List[ContextProvider], result_sets: List[SearchResultSet]):
         super().__init__()
         self.providers = providers
-        self.results = results
+        self.result_sets = result_sets
         self._should_stop = False
 
     def stop(self):
@@ -30,60 +34,65 @@ class ContextWorker(QObject):
         self._should_stop = True
 
     def process(self):
-        """Process all results with all context providers (runs in thread)"""
-        if not self.providers or not self.results:
+        """Process all results with all context providers (runs in thread)
+
+        Contexts are added to the result sets in place; result_enriched is
+        emitted only for results that received context.
+        """
+        total = sum(len(result_set) for result_set in self.result_sets)
+        if not self.providers or not total:
             self.enrichment_complete.emit()
             return
 
-        print(
-            f"\n[ContextWorker] Starting enrichment of {len(self.results)} result(s) with {len(self.providers)} provider(s)")
-
-        for idx, result in enumerate(self.results):
-            if self._should_stop:
-                print("[ContextWorker] Stopped by request")
-                return
-
-            # Make a working copy to avoid threading issues
-            enriched_result = result
-            contexts_added = 0
+        logger.info("Starting enrichment", extra=fields(
+            results=total, providers=len(self.providers)))
 
-            for provider in self.providers:
+        providers = [provider for provider in self.providers if provider.is_enabled()]
+        idx = -1
+        for result_set in self.result_sets:
+            for result in result_set:
+                idx += 1
                 if self._should_stop:
+                    logger.info("Stopped by request")
                     return
 
-                if not provider.is_enabled():
-                    continue
-
-                try:
-                    # Call the context provider (this is the potentially slow part)
-                    contexts = provider.get_context(enriched_result)
-
-                    for ctx in contexts:
-                        enriched_result.add_context(ctx)
-                        contexts_added += 1
-                        print(
-                            f"  [ContextWorker] ✓ Added context from {ctx.context_owner} for '{ctx.term}'")
-
-                except Exception as e:
-                    error_msg = str(e)
-                    print(
-                        f"  [ContextWorker] ⚠️  Error from {provider.get_context_name()}: {error_msg}")
-                    self.error_occurred.emit(
-                        provider.get_context_name(), error_msg)
-
-            # Emit enriched result (even if no contexts were added)
-            if contexts_added > 0:
-                print(
-                    f"  [ContextWorker] Result {idx+1}/{len(self.results)} enriched with {contexts_added} context(s)")
-
-            self.result_enriched.emit(idx, enriched_result)
-
-        print(f"[ContextWorker] ✓ Enrichment complete")
+                contexts_added = 0
+                for provider in providers:
+                    if self._should_stop:
+                        return
+
+                    try:
+                        # Call the context provider (this is the potentially slow part)
+                        contexts = provider.get_context(result)
+
+                        for ctx in contexts:
+                            result.add_context(ctx)
+                            contexts_added += 1
+                            logger.debug("Added context from %s for '%s'",
+                                         ctx.context_owner, ctx.term, extra=sample(50))
+
+                    except Exception as e:
+                        error_msg = str(e)
+                        logger.warning("Error from %s: %s",
+                                       provider.get_context_name(), error_msg)
+                        self.error_occurred.emit(
+                            provider.get_context_name(), error_msg)
+
+                if contexts_added > 0:
+                    logger.debug("Result %d/%d enriched with %d context(s)",
+                                 idx + 1, total, contexts_added, extra=sample(50))
+                    self.result_enriched.emit(idx, result)
+
+        logger.info("✓ Enrichment complete")
         self.enrichment_complete.emit()
 
 
 class ThreadedContextManager(QObject):
-    """Manages context enrichment in a separate thread to avoid blocking UI"""
+    """Manages context enrichment on the task scheduler to avoid blocking UI
+
+    Enrichment runs at interactive priority, and a new request replaces
+    (cancels) one still in progress.
+    """
 
     # Signal emitted when a result is enriched (forwarded from worker)
     result_enriched = Signal(int, SearchResult)
@@ -94,10 +103,11 @@ class ThreadedContextManager(QObject):
     # Signal emitted on error
     error_occurred = Signal(str, str)  # provider_name, error_message
 
-    def __init__(self):
+    def __init__(self, scheduler: Optional[TaskScheduler] = None):
         super().__init__()
         self.providers: List[ContextProvider] = []
-        self._thread = None
+        self._scheduler = scheduler or TaskScheduler.shared()
+        self._task = None
         self._worker = None
 
     def register_provider(self, provider: ContextProvider):
@@ -108,8 +118,7 @@ class ThreadedContextManager(QObject):
         """
         if provider not in self.providers:
             self.providers.append(provider)
-            print(
-                f"[ThreadedContextManager] ✓ Registered provider: {provider.get_context_name()}")
+            logger.debug("Registered provider: %s", provider.get_context_name())
 
     def unregister_provider(self, provider: ContextProvider):
         """Unregister a context provider
@@ -119,11 +128,10 @@ class ThreadedContextManager(QObject):
         """
         if provider in self.providers:
             self.providers.remove(provider)
-            print(
-                f"[ThreadedContextManager] Unregistered provider: {provider.get_context_name()}")
+            logger.debug("Unregistered provider: %s", provider.get_context_name())
 
-    def enrich_results_async(self, results: List[SearchResult]):
-        """Enrich search results with context in a background thread
+    def enrich_results_async(self, result_sets: List[SearchResultSet]):
+        """Enrich search results with context on the task scheduler
 
         This method returns immediately. Connect to the signals to receive results:
         - result_enriched: emitted for each enriched result
@@ -131,73 +139,50 @@ class ThreadedContextManager(QObject):
         - error_occurred: emitted if a provider encounters an error
 
         Args:
-            results: List of SearchResult objects to enrich
+            result_sets: Per-document search results to enrich
         """
-        # Stop any existing work (with safety check)
-        try:
-            self.stop_enrichment()
-        except RuntimeError:
-            # Thread already deleted, clear references
-            self._thread = None
-            self._worker = None
+        # Stop any existing work
+        self.stop_enrichment()
 
         if not self.providers:
-            print("[ThreadedContextManager] No providers registered")
+            logger.debug("No providers registered")
             self.enrichment_complete.emit()
             return
 
-        if not results:
-            print("[ThreadedContextManager] No results to enrich")
+        total = sum(len(result_set) for result_set in result_sets)
+        if not total:
+            logger.debug("No results to enrich")
             self.enrichment_complete.emit()
             return
 
-        # Create thread and worker
-        self._thread = QThread()
-        self._worker = ContextWorker(self.providers, results)
-
-        # Move worker to thread
-        self._worker.moveToThread(self._thread)
+        # Create worker
+        self._worker = ContextWorker(self.providers, result_sets)
 
         # Connect signals
-        self._thread.started.connect(self._worker.process)
         self._worker.result_enriched.connect(self._on_result_enriched)
         self._worker.enrichment_complete.connect(self._on_enrichment_complete)
         self._worker.error_occurred.connect(self._on_error)
 
-        # Cleanup when done
-        self._worker.enrichment_complete.connect(self._thread.quit)
-        self._worker.enrichment_complete.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.finished.connect(self._clear_references)
-
         # Start processing
-        print(
-            f"[ThreadedContextManager] Starting background enrichment of {len(results)} result(s)")
-        self._thread.start()
+        logger.debug("Starting background enrichment of %d result(s)", total)
+        self._task = self._scheduler.submit_worker(
+            self._worker, name='context_enrichment', key='context_enrichment',
+            replace=True, priority=TaskPriority.INTERACTIVE,
+            run=self._worker.process, cancel=self._worker.stop)
+        self._task.finished.connect(self._clear_references)
+        self._task.cancelled.connect(self._clear_references)
 
     def _clear_references(self):
-        """Clear thread and worker references after cleanup"""
-        self._thread = None
-        self._worker = None
+        """Clear task and worker references once the task has ended"""
+        if self._task is not None and not self._task.is_active():
+            self._task = None
+            self._worker = None
 
     def stop_enrichment(self):
         """Stop any ongoing enrichment work"""
-        if self._worker:
-            try:
-                self._worker.stop()
-            except RuntimeError:
-                pass  # Worker already deleted
-
-        if self._thread:
-            try:
-                if self._thread.isRunning():
-                    print(
-                        "[ThreadedContextManager] Stopping background enrichment...")
-                    self._thread.quit()
-                    self._thread.wait(1000)  # Wait up to 1 second
-            except RuntimeError:
-                # Thread already deleted
-                pass
+        if self._task is not None and self._task.is_active():
+            logger.debug("Stopping background enrichment")
+            self._scheduler.cancel(self._task)
 
     def _on_result_enriched(self, idx: int, result: SearchResult):
         """Handle enriched result from worker (runs in main thread)"""
@@ -206,7 +191,7 @@ class ThreadedContextManager(QObject):
 
     def _on_enrichment_complete(self):
         """Handle completion from worker (runs in main thread)"""
-        print("[ThreadedContextManager] ✓ Background enrichment complete")
+        logger.debug("Background enrichment complete")
         # Forward signal
         self.enrichment_complete.emit()
 
@@ -219,9 +204,9 @@ class ThreadedContextManager(QObject):
         """Check if enrichment is currently in progress
 
         Returns:
-            True if enrichment thread is running
+            True if enrichment is queued or running
         """
-        return self._thread is not None and self._thread.isRunning()
+        return self._task is not None and self._task.is_active()
 
     def cleanup(self):
         """Clean up resources (call on shutdown)"""
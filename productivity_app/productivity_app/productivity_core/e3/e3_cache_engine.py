@@ -0,0 +1,177 @@
+"""
+E3 Cache Engine - Merge and diff E3 connector cache snapshots
+
+Several project caches are merged into a single connector table with one
+row per (Part Code, E3 Project). Two snapshots are compared through a hashed
+signature per row, so a re-check only needs to touch connectors that were
+added, removed or changed.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Sequence, Union
+
+import pandas as pd
+
+from .e3_project_cache import E3ProjectCache
+
+# Columns identifying a connector across snapshots
+E3_KEY_COLUMNS = ['Part Code', 'E3 Project']
+
+CacheSource = Union[str, Path, pd.DataFrame]
+
+
+@dataclass
+class E3CacheDiff:
+    """Difference between two E3 cache snapshots
+
+    added and changed rows come from the new snapshot, removed rows from the
+    old one. changed_columns maps each changed key to the columns that differ.
+    """
+    added: pd.DataFrame
+    removed: pd.DataFrame
+    changed: pd.DataFrame
+    unchanged_count: int = 0
+    changed_columns: dict = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the snapshots hold identical connectors"""
+        return self.added.empty and self.removed.empty and self.changed.empty
+
+    def touched(self) -> pd.DataFrame:
+        """Rows of the new snapshot that need re-checking (added + changed)"""
+        return pd.concat([self.added, self.changed], ignore_index=True)
+
+    def summary(self) -> str:
+        """Short human-readable description"""
+        return (f"{len(self.added)} added, {len(self.removed)} removed, "
+                f"{len(self.changed)} changed, {self.unchanged_count} unchanged")
+
+
+class E3CacheEngine:
+    """Merges E3 cache snapshots and computes incremental diffs"""
+
+    def __init__(self, key_columns: Sequence[str] = E3_KEY_COLUMNS):
+        self.key_columns = list(key_columns)
+
+    # ------------------------------------------------------------------
+    # Merge
+    # ------------------------------------------------------------------
+
+    def _read(self, source: CacheSource) -> pd.DataFrame:
+        """Load a cache source (file path or DataFrame)"""
+        if isinstance(source, pd.DataFrame):
+            return source
+        return E3ProjectCache.read_file(source)
+
+    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Coerce a snapshot to strings, strip keys and drop duplicate keys
+
+        Later rows win when the same key appears more than once.
+        """
+        missing = [col for col in self.key_columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"E3 cache is missing key column(s): {missing}")
+
+        df = df.fillna('').astype(str)
+        for col in self.key_columns:
+            df[col] = df[col].str.strip()
+
+        df = df[(df[self.key_columns] != '').all(axis=1)]
+        return df.drop_duplicates(subset=self.key_columns, keep='last').reset_index(drop=True)
+
+    def merge(self, sources: Iterable[CacheSource]) -> pd.DataFrame:
+        """Merge several cache snapshots into one deduplicated table
+
+        Args:
+            sources: Cache file paths or DataFrames, oldest first; for a key
+                present in several sources the last one wins
+
+        Returns:
+            DataFrame with one row per (Part Code, E3 Project)
+        """
+        frames = [self._read(source) for source in sources]
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=self.key_columns)
+        return self.normalize(pd.concat(frames, ignore_index=True, sort=False))
+
+    def merge_files(self, paths: Iterable[Union[str, Path]]) -> pd.DataFrame:
+        """Merge cache files, ordering them by modification time (oldest first)"""
+        ordered = sorted((Path(p) for p in paths), key=lambda p: p.stat().st_mtime)
+        return self.merge(ordered)
+
+    # ------------------------------------------------------------------
+    # Diff
+    # ------------------------------------------------------------------
+
+    def _value_columns(self, *frames: pd.DataFrame) -> List[str]:
+        """Non-key columns present in any frame, in a stable order"""
+        columns = []
+        for frame in frames:
+            for col in frame.columns:
+                if col not in self.key_columns and col not in columns:
+                    columns.append(col)
+        return sorted(columns)
+
+    def row_signatures(self, df: pd.DataFrame, value_columns: List[str] = None) -> pd.Series:
+        """Hash each row's values into a 64-bit signature indexed by key
+
+        Args:
+            df: Normalized snapshot
+            value_columns: Columns included in the signature (default: all non-key)
+
+        Returns:
+            Series of uint64 signatures indexed by the key columns
+        """
+        if value_columns is None:
+            value_columns = self._value_columns(df)
+        values = df.reindex(columns=value_columns, fill_value='')
+        signatures = pd.util.hash_pandas_object(values, index=False)
+        signatures.index = pd.MultiIndex.from_frame(df[self.key_columns])
+        return signatures
+
+    def diff(self, old: CacheSource, new: CacheSource) -> E3CacheDiff:
+        """Compute added, removed and changed connectors between snapshots
+
+        Args:
+            old: Previous snapshot (path or DataFrame)
+            new: Current snapshot (path or DataFrame)
+
+        Returns:
+            E3CacheDiff describing the changes
+        """
+        old_df = self.normalize(self._read(old))
+        new_df = self.normalize(self._read(new))
+
+        value_columns = self._value_columns(old_df, new_df)
+        old_sig = self.row_signatures(old_df, value_columns)
+        new_sig = self.row_signatures(new_df, value_columns)
+
+        old_keys = old_sig.index
+        new_keys = new_sig.index
+
+        added_mask = ~new_keys.isin(old_keys)
+        removed_mask = ~old_keys.isin(new_keys)
+
+        common = new_keys[~added_mask]
+        changed_keys = common[new_sig.loc[common].values != old_sig.loc[common].values]
+        changed_mask = new_keys.isin(changed_keys)
+
+        changed_columns = {}
+        if len(changed_keys):
+            old_rows = old_df.set_index(self.key_columns).reindex(
+                columns=value_columns, fill_value='').loc[changed_keys]
+            new_rows = new_df.set_index(self.key_columns).reindex(
+                columns=value_columns, fill_value='').loc[changed_keys]
+            differs = old_rows.values != new_rows.values
+            for key, row in zip(changed_keys, differs):
+                changed_columns[key] = [col for col, d in zip(value_columns, row) if d]
+
+        return E3CacheDiff(
+            added=new_df[added_mask].reset_index(drop=True),
+            removed=old_df[removed_mask].reset_index(drop=True),
+            changed=new_df[changed_mask].reset_index(drop=True),
+            unchanged_count=len(common) - len(changed_keys),
+            changed_columns=changed_columns,
+        )
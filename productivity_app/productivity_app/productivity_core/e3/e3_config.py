@@ -9,6 +9,13 @@ E3_COM_PROG_ID = "CT.Application"  # E3.series COM ProgID
 E3_CACHE_DIRECTORY = "e3_caches"
 E3_CACHE_FILE_PATTERN = "e3_connector_cache_*.csv"
 
+# Per-project extraction cache (one file per project + modification stamp)
+E3_PROJECT_CACHE_DIRECTORY = "e3_caches/projects"
+E3_PROJECT_CACHE_VERSION = 1  # Bump when the cached column layout changes
+
+# Maximum number of projects extracted concurrently
+E3_MAX_PARALLEL_PROJECTS = 4
+
 # Default timeout for E3 operations (seconds)
 E3_OPERATION_TIMEOUT = 300  # 5 minutes
 
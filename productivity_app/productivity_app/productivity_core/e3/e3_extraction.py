@@ -0,0 +1,126 @@
+"""
+E3 Extraction - Parallel per-project connector extraction
+
+Projects are extracted on a bounded thread pool. Each task creates its own
+service instance (COM objects are apartment-threaded and must not be shared),
+checks the project's modification stamp against the on-disk cache, and only
+extracts projects whose cache entry is missing or stale.
+
+Kept free of Qt so it can be driven by E3DataWorker and tested directly.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from .e3_config import E3_MAX_PARALLEL_PROJECTS
+from .e3_project_cache import E3ProjectCache
+from .e3_service import E3Service
+
+
+def _extract_project(project: str, service_factory: Callable[[], E3Service],
+                     cache: Optional[E3ProjectCache]) -> Dict[str, Any]:
+    """Extract (or reuse the cached extraction of) a single project
+
+    Returns:
+        Dict with 'project', 'connectors', 'from_cache' and 'stamp'
+    """
+    service = service_factory()
+    if not service.connect():
+        raise RuntimeError(f"Could not connect to E3.series for {project}")
+
+    try:
+        stamp = service.get_project_stamp(project)
+
+        if cache is not None:
+            cached = cache.load(project, stamp)
+            if cached is not None:
+                return {
+                    'project': project,
+                    'connectors': cached.to_dict('records'),
+                    'from_cache': True,
+                    'stamp': stamp,
+                }
+
+        service.open_project(project)
+        connectors = service.get_connectors_from_project(project)
+
+        if cache is not None:
+            cache.save(project, stamp, connectors)
+
+        return {
+            'project': project,
+            'connectors': connectors,
+            'from_cache': False,
+            'stamp': stamp,
+        }
+    finally:
+        service.disconnect()
+
+
+def extract_projects(projects: List[str],
+                     service_factory: Callable[[], E3Service],
+                     cache: Optional[E3ProjectCache] = None,
+                     max_workers: int = E3_MAX_PARALLEL_PROJECTS,
+                     progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                     is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[Dict[str, Any]]:
+    """Extract connectors from several projects concurrently
+
+    Args:
+        projects: Project names to extract
+        service_factory: Callable returning a new E3Service per task
+        cache: Optional per-project cache; fresh entries are reused
+        max_workers: Maximum number of projects extracted at once
+        progress_callback: Called as (completed, total, project) after each project
+        is_cancelled: Polled between projects; pending work is dropped when True
+
+    Returns:
+        Dict with 'connectors' (in project order), 'projects', 'count',
+        'reused_projects', 'extracted_projects' and 'failed_projects',
+        or None if cancelled
+    """
+    cancelled = is_cancelled or (lambda: False)
+    results: Dict[str, Dict[str, Any]] = {}
+    failed: Dict[str, str] = {}
+    total = len(projects)
+
+    if not projects:
+        return {
+            'connectors': [], 'projects': [], 'count': 0,
+            'reused_projects': [], 'extracted_projects': [], 'failed_projects': {},
+        }
+
+    workers = max(1, min(max_workers, total))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='e3-extract') as executor:
+        futures = {
+            executor.submit(_extract_project, project, service_factory, cache): project
+            for project in projects
+        }
+
+        for completed, future in enumerate(as_completed(futures), start=1):
+            project = futures[future]
+            try:
+                results[project] = future.result()
+            except Exception as e:
+                print(f"E3: Extraction failed for {project}: {e}")
+                failed[project] = str(e)
+
+            if progress_callback:
+                progress_callback(completed, total, project)
+
+            if cancelled():
+                for pending in futures:
+                    pending.cancel()
+                return None
+
+    connectors: List[Dict[str, Any]] = []
+    for project in projects:
+        if project in results:
+            connectors.extend(results[project]['connectors'])
+
+    return {
+        'connectors': connectors,
+        'projects': projects,
+        'count': len(connectors),
+        'reused_projects': [p for p in projects if p in results and results[p]['from_cache']],
+        'extracted_projects': [p for p in projects if p in results and not results[p]['from_cache']],
+        'failed_projects': failed,
+    }
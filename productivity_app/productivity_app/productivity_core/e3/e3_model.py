@@ -3,9 +3,8 @@ E3.series Integration Model
 Handles loading and caching of E3 project data
 """
 import os
-import time
-from typing import List, Dict, Any, Optional
-from PySide6.QtCore import QObject, Signal, QThread, QMutex, QMutexLocker
+from typing import Callable, List, Dict, Any, Optional
+from PySide6.QtCore import QObject, Signal, QMutex, QMutexLocker
 import pandas as pd
 
 from .e3_config import (
@@ -13,19 +12,43 @@ from .e3_config import (
     E3_CACHE_DIRECTORY,
     E3_OPERATION_TIMEOUT,
     E3_CONNECTOR_FIELDS,
-    E3_PROGRESS_UPDATE_FREQUENCY
+    E3_PROGRESS_UPDATE_FREQUENCY,
+    E3_PROJECT_CACHE_DIRECTORY,
+    E3_MAX_PARALLEL_PROJECTS
 )
-from .e3_service import get_e3_service
+from .e3_service import E3Service, MockE3Service, get_e3_service
+from .e3_project_cache import E3ProjectCache
+from .e3_extraction import extract_projects
+from .e3_cache_engine import E3CacheEngine, E3CacheDiff
 from ..core.base_data_worker import BaseDataWorker
+from ..core.task_scheduler import TaskPriority, TaskScheduler
 
 
 class E3DataWorker(BaseDataWorker):
-    """Worker class for loading E3 data in a separate thread"""
-
-    def __init__(self, projects: List[str], operation: str = 'list_projects'):
+    """Worker class for loading E3 data in a separate thread
+
+    Connector loading extracts projects in parallel (bounded by max_workers),
+    reusing per-project cache entries whose modification stamp is unchanged.
+    When given a local data store, the loaded projects' rows are replaced in
+    it here, off the UI thread.
+    """
+
+    def __init__(self, projects: List[str], operation: str = 'list_projects',
+                 service_factory: Optional[Callable[[], E3Service]] = None,
+                 cache: Optional[E3ProjectCache] = None,
+                 max_workers: int = E3_MAX_PARALLEL_PROJECTS,
+                 store=None, table: str = 'e3_connectors',
+                 facet_columns: Optional[List[str]] = None):
         super().__init__()
         self.projects = projects
         self.operation = operation
+        # TODO: Default to E3Service once the COM interface is implemented
+        self.service_factory = service_factory or MockE3Service
+        self.cache = cache
+        self.max_workers = max_workers
+        self._store = store
+        self._table = table
+        self._facet_columns = facet_columns
 
     def run(self):
         """Execute the data loading in background thread"""
@@ -44,21 +67,17 @@ class E3DataWorker(BaseDataWorker):
         """List available E3 projects"""
         if not self.emit_progress(20, "Connecting to E3.series..."):
             return
-        time.sleep(0.3)
 
-        if not self.emit_progress(50, "Querying available projects..."):
+        service = self.service_factory()
+        if not service.connect():
+            self.error.emit("Could not connect to E3.series")
             return
-        time.sleep(0.4)
 
-        # TODO: Implement actual E3 COM connection
-        # For now, return mock data
-        projects = [
-            "Project_Alpha_Rev3",
-            "Project_Beta_Final",
-            "Connector_Library_Master",
-            "System_Integration_2024",
-            "Prototype_Assembly_v2"
-        ]
+        if not self.emit_progress(50, "Querying available projects..."):
+            service.disconnect()
+            return
+        projects = service.get_projects()
+        service.disconnect()
 
         if not self.emit_progress(100, "Projects loaded"):
             return
@@ -68,75 +87,54 @@ class E3DataWorker(BaseDataWorker):
         """Load connector data from E3 projects"""
         if not self.emit_progress(10, "Connecting to E3.series..."):
             return
-        time.sleep(0.3)
 
         total_projects = len(self.projects)
-        connectors = []
-
-        for idx, project in enumerate(self.projects):
-            if self.is_cancelled:
-                return
 
-            progress = 10 + (idx / total_projects) * 70
-            if not self.emit_progress(int(progress), f"Loading project: {project}..."):
-                return
-            time.sleep(0.5)
+        def on_project_done(completed: int, total: int, project: str):
+            progress = 10 + (completed / total) * 80
+            self.emit_progress(
+                int(progress), f"Loaded project {completed}/{total}: {project}")
 
-            # TODO: Implement actual E3 connector extraction
-            # For now, add mock connector data for this project
-            mock_connectors = self._get_mock_connectors(project)
-            connectors.extend(mock_connectors)
+        result = extract_projects(
+            self.projects,
+            self.service_factory,
+            cache=self.cache,
+            max_workers=self.max_workers,
+            progress_callback=on_project_done,
+            is_cancelled=lambda: self.is_cancelled)
 
-        if not self.emit_progress(90, "Processing connector data..."):
+        if result is None:
             return
-        time.sleep(0.2)
 
-        if not self.emit_progress(100, f"Loaded {len(connectors)} connectors from {total_projects} project(s)"):
+        reused = len(result['reused_projects'])
+        print(f"E3: {reused} project(s) from cache, "
+              f"{len(result['extracted_projects'])} extracted")
+
+        if self._store is not None:
+            if not self.emit_progress(95, "Saving connectors..."):
+                return
+            # One transaction: a failure keeps the projects' previous rows
+            self._store.replace_rows(
+                self._table, 'E3 Project', result['projects'], result['connectors'],
+                facet_columns=self._facet_columns)
+
+        if not self.emit_progress(100, f"Loaded {result['count']} connectors from {total_projects} project(s)"):
             return
-        self.finished.emit({
-            'connectors': connectors,
-            'projects': self.projects,
-            'count': len(connectors)
-        })
-
-    def _get_mock_connectors(self, project_name: str) -> List[Dict[str, Any]]:
-        """Generate mock connector data for testing"""
-        # Mock data based on project name
-        base_connectors = [
-            {
-                'Part Number': f'{project_name[:3].upper()}/001',
-                'Part Code': f'{project_name[:3].upper()}-001',
-                'Minified Part Code': f'{project_name[:3].upper()}001',
-                'Material': 'Aluminum',
-                'Database Status': 'Active',
-                'Family': project_name[:3].upper(),
-                'Shell Type': '26 - Plug',
-                'Shell Size': '10',
-                'Insert Arrangement': 'A - 1',
-                'Socket Type': 'Type A',
-                'Keying': 'Normal',
-                'E3 Project': project_name
-            },
-            {
-                'Part Number': f'{project_name[:3].upper()}/002',
-                'Part Code': f'{project_name[:3].upper()}-002',
-                'Minified Part Code': f'{project_name[:3].upper()}002',
-                'Material': 'Stainless Steel',
-                'Database Status': 'Active',
-                'Family': project_name[:3].upper(),
-                'Shell Type': '24 - Receptacle',
-                'Shell Size': '12',
-                'Insert Arrangement': 'B - 2',
-                'Socket Type': 'Type B',
-                'Keying': 'Keyed',
-                'E3 Project': project_name
-            }
-        ]
-        return base_connectors
+        self.finished.emit(result)
 
 
 class E3Model(QObject):
-    """Model for E3.series integration"""
+    """Model for E3.series integration
+
+    Loaded connectors are written to the shared local data store (when one is
+    registered in the context), replacing earlier rows for the same projects.
+    """
+
+    # Store table holding connectors extracted from E3 projects
+    STORE_TABLE = 'e3_connectors'
+
+    # Columns indexed for exact-match filtering in the store
+    FACET_COLUMNS = ['E3 Project', 'Part Code', 'Family']
 
     # Signals
     loading_progress = Signal(int, str)  # progress_percent, status_message
@@ -149,35 +147,35 @@ class E3Model(QObject):
         self.context = context
         self._data_mutex = QMutex()
         self._worker = None
-        self._thread = None
+        self._task = None  # Current operation on the task scheduler
+        self._scheduler = (context.get('task_scheduler') if context is not None
+                           else None) or TaskScheduler.shared()
         self._available_projects = []
-        self._cache_directory = "e3_caches"
+        self._cache_directory = E3_CACHE_DIRECTORY
+        self._project_cache = E3ProjectCache(E3_PROJECT_CACHE_DIRECTORY)
+        self._cache_engine = E3CacheEngine()
+        self._snapshot = None  # Merged connectors from all loads so far
+        self._store = context.get('data_store') if context is not None else None
 
     def load_available_projects_async(self):
         """Load list of available E3 projects asynchronously"""
         with QMutexLocker(self._data_mutex):
-            if self._thread and self._thread.isRunning():
+            if self._task is not None and self._task.is_active():
                 print("E3: Operation already in progress")
                 return
 
-            # Create worker and thread
+            # Create worker
             self._worker = E3DataWorker([], operation='list_projects')
-            self._thread = QThread()
-
-            # Move worker to thread
-            self._worker.moveToThread(self._thread)
 
             # Connect signals
-            self._thread.started.connect(self._worker.run)
             self._worker.progress.connect(self.loading_progress)
             self._worker.finished.connect(self._on_projects_loaded)
             self._worker.error.connect(self.loading_failed)
-            self._worker.finished.connect(self._thread.quit)
-            self._worker.finished.connect(self._worker.deleteLater)
-            self._thread.finished.connect(self._thread.deleteLater)
 
-            # Start thread
-            self._thread.start()
+            # The project list is requested by the user - run it first
+            self._task = self._scheduler.submit_worker(
+                self._worker, name='e3_list_projects',
+                priority=TaskPriority.INTERACTIVE)
 
             print("E3: Started loading available projects")
 
@@ -188,7 +186,7 @@ class E3Model(QObject):
             projects: List of E3 project names to load connectors from
         """
         with QMutexLocker(self._data_mutex):
-            if self._thread and self._thread.isRunning():
+            if self._task is not None and self._task.is_active():
                 print("E3: Operation already in progress")
                 return
 
@@ -196,24 +194,21 @@ class E3Model(QObject):
                 self.loading_failed.emit("No projects specified")
                 return
 
-            # Create worker and thread
-            self._worker = E3DataWorker(projects, operation='load_connectors')
-            self._thread = QThread()
-
-            # Move worker to thread
-            self._worker.moveToThread(self._thread)
+            # Create worker
+            self._worker = E3DataWorker(
+                projects, operation='load_connectors', cache=self._project_cache,
+                store=self._store, table=self.STORE_TABLE,
+                facet_columns=self.FACET_COLUMNS)
 
             # Connect signals
-            self._thread.started.connect(self._worker.run)
             self._worker.progress.connect(self.loading_progress)
             self._worker.finished.connect(self._on_connectors_loaded)
             self._worker.error.connect(self.loading_failed)
-            self._worker.finished.connect(self._thread.quit)
-            self._worker.finished.connect(self._worker.deleteLater)
-            self._thread.finished.connect(self._thread.deleteLater)
 
-            # Start thread
-            self._thread.start()
+            # Extraction fans out over its own project threads
+            self._task = self._scheduler.submit_worker(
+                self._worker, name='e3_load_connectors',
+                priority=TaskPriority.BACKGROUND)
 
             print(
                 f"E3: Started loading connectors from {len(projects)} project(s)")
@@ -228,8 +223,55 @@ class E3Model(QObject):
         """Handle connectors loaded event"""
         connectors = data.get('connectors', [])
         print(f"E3: Loaded {len(connectors)} connectors")
+        data['diff'] = self._update_snapshot(data.get('projects', []), connectors)
         self.connectors_loaded.emit(data)
 
+    def _update_snapshot(self, projects: List[str],
+                         connectors: List[Dict[str, Any]]) -> Optional[E3CacheDiff]:
+        """Replace the loaded projects in the merged snapshot
+
+        Returns:
+            Diff of the reloaded projects against their previous rows, or None
+            if none of them had been loaded before
+        """
+        try:
+            new_rows = self._cache_engine.merge([pd.DataFrame(connectors)])
+        except ValueError as e:
+            print(f"E3: Connectors not merged: {e}")
+            return None
+
+        previous = self._snapshot
+        if previous is None or previous.empty:
+            self._snapshot = new_rows
+            return None
+
+        in_projects = previous['E3 Project'].isin(projects)
+        diff = None
+        if in_projects.any():
+            diff = self._cache_engine.diff(previous[in_projects], new_rows)
+            print(f"E3: Changes since last load: {diff.summary()}")
+
+        self._snapshot = self._cache_engine.merge([previous[~in_projects], new_rows])
+        return diff
+
+    def search_connectors(self, search_text: str = "",
+                          projects: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Search stored E3 connectors
+
+        Args:
+            search_text: Case-insensitive text matched against all fields
+            projects: Optional list of projects to restrict the search to
+
+        Returns:
+            List of connector dictionaries (empty if no store is available)
+        """
+        if self._store is None:
+            return []
+        return self._store.query(
+            self.STORE_TABLE,
+            search_text=search_text,
+            facets={'E3 Project': projects or []})
+
     def get_available_projects(self) -> List[str]:
         """Get list of available E3 projects (synchronous)
 
@@ -271,10 +313,47 @@ class E3Model(QObject):
         # Return as string paths
         return [str(f) for f in cache_files]
 
+    def merge_cache_files(self, paths: List[str]) -> pd.DataFrame:
+        """Merge cache files into one connector table
+
+        Args:
+            paths: Cache file paths (CSV or per-project entries); newer files
+                take precedence for the same Part Code + E3 Project
+
+        Returns:
+            Deduplicated connector DataFrame
+        """
+        return self._cache_engine.merge_files(paths)
+
+    def diff_cache_files(self, old_path: str, new_path: str) -> E3CacheDiff:
+        """Compare two cache snapshots
+
+        Args:
+            old_path: Earlier cache file
+            new_path: Later cache file
+
+        Returns:
+            E3CacheDiff with added, removed and changed connectors
+        """
+        return self._cache_engine.diff(old_path, new_path)
+
+    def get_project_cache_files(self) -> List[str]:
+        """Get list of per-project extraction cache files
+
+        Returns:
+            List of cache file paths, newest first
+        """
+        return self._project_cache.list_entries()
+
+    def clear_project_cache(self):
+        """Delete all per-project extraction caches, forcing re-extraction"""
+        self._project_cache.clear()
+        print("E3: Project cache cleared")
+
     def cancel_loading(self):
         """Cancel current loading operation"""
-        if self._worker:
-            self._worker.cancel()
+        if self._task is not None and self._task.is_active():
+            self._scheduler.cancel(self._task)
             print("E3: Loading cancelled")
 
     def is_e3_available(self) -> bool:
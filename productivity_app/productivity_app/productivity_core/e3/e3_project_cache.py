@@ -0,0 +1,214 @@
+"""
+E3 Project Cache - Per-project extraction results on disk
+
+Each extracted project is stored in its own file, keyed by project name and
+the project's modification stamp. A cache entry is reused only when the stamp
+and the cache format version both match, so unchanged projects are never
+re-extracted while edited projects are.
+
+Files are columnar: Parquet when pyarrow is installed, otherwise gzipped JSON
+holding one value list per column.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .e3_config import E3_PROJECT_CACHE_DIRECTORY, E3_PROJECT_CACHE_VERSION
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+class E3ProjectCache:
+    """Versioned, per-project columnar cache of extracted E3 connectors"""
+
+    PARQUET_SUFFIX = '.parquet'
+    JSON_SUFFIX = '.json.gz'
+
+    def __init__(self, cache_directory: str = E3_PROJECT_CACHE_DIRECTORY,
+                 version: int = E3_PROJECT_CACHE_VERSION,
+                 use_parquet: Optional[bool] = None):
+        """
+        Args:
+            cache_directory: Directory holding the per-project cache files
+            version: Cache format version; files from other versions are ignored
+            use_parquet: Force/disable Parquet (defaults to pyarrow availability)
+        """
+        self.cache_directory = Path(cache_directory)
+        self.version = version
+        self.use_parquet = PARQUET_AVAILABLE if use_parquet is None else use_parquet
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _safe_name(project_name: str) -> str:
+        """Project name reduced to filesystem-safe characters"""
+        return re.sub(r'[^A-Za-z0-9_.-]+', '_', project_name)[:64] or 'project'
+
+    def _project_prefix(self, project_name: str) -> str:
+        """File name prefix shared by all cache files of one project"""
+        digest = hashlib.sha1(project_name.encode('utf-8')).hexdigest()[:8]
+        return f"{self._safe_name(project_name)}__{digest}__"
+
+    def _entry_stem(self, project_name: str, stamp: str) -> str:
+        """File name (without suffix) for a project at a given stamp"""
+        stamp_digest = hashlib.sha1(str(stamp).encode('utf-8')).hexdigest()[:12]
+        return f"{self._project_prefix(project_name)}{stamp_digest}.v{self.version}"
+
+    def cache_path(self, project_name: str, stamp: str) -> Path:
+        """Path the entry for this project and stamp is written to"""
+        suffix = self.PARQUET_SUFFIX if self.use_parquet else self.JSON_SUFFIX
+        return self.cache_directory / (self._entry_stem(project_name, stamp) + suffix)
+
+    def _existing_path(self, project_name: str, stamp: str) -> Optional[Path]:
+        """Path of an existing entry in either supported format"""
+        stem = self._entry_stem(project_name, stamp)
+        for suffix in (self.PARQUET_SUFFIX, self.JSON_SUFFIX):
+            path = self.cache_directory / (stem + suffix)
+            if path.exists():
+                if suffix == self.PARQUET_SUFFIX and not PARQUET_AVAILABLE:
+                    continue
+                return path
+        return None
+
+    # ------------------------------------------------------------------
+    # Read / write
+    # ------------------------------------------------------------------
+
+    def is_fresh(self, project_name: str, stamp: Optional[str]) -> bool:
+        """Check whether a cache entry exists for this project and stamp"""
+        if stamp is None:
+            return False
+        return self._existing_path(project_name, stamp) is not None
+
+    def load(self, project_name: str, stamp: Optional[str]) -> Optional[pd.DataFrame]:
+        """Load a project's cached connectors
+
+        Args:
+            project_name: Name of the E3 project
+            stamp: Current modification stamp of the project
+
+        Returns:
+            DataFrame of connectors, or None if no valid entry exists
+        """
+        if stamp is None:
+            return None
+
+        path = self._existing_path(project_name, stamp)
+        if path is None:
+            return None
+
+        try:
+            if path.name.endswith(self.JSON_SUFFIX):
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    payload = json.load(f)
+                if payload.get('version') != self.version or payload.get('project') != project_name:
+                    return None
+                return pd.DataFrame(payload['columns'], columns=payload['column_order'])
+            return self.read_file(path)
+        except Exception as e:
+            print(f"E3ProjectCache: Failed to read {path.name}: {e}")
+            return None
+
+    @classmethod
+    def read_file(cls, path) -> pd.DataFrame:
+        """Read any E3 cache file into a DataFrame
+
+        Handles per-project entries (Parquet or gzipped JSON) as well as the
+        legacy exported CSV caches.
+
+        Args:
+            path: Path to the cache file
+
+        Returns:
+            DataFrame of connectors
+        """
+        path = Path(path)
+        if path.name.endswith(cls.PARQUET_SUFFIX):
+            return pd.read_parquet(path)
+        if path.name.endswith(cls.JSON_SUFFIX):
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                payload = json.load(f)
+            return pd.DataFrame(payload['columns'], columns=payload['column_order'])
+        return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+    def save(self, project_name: str, stamp: Optional[str],
+             connectors: List[Dict[str, Any]]) -> Optional[Path]:
+        """Write a project's connectors, replacing older entries for it
+
+        Args:
+            project_name: Name of the E3 project
+            stamp: Modification stamp the connectors were extracted at
+            connectors: Connector dictionaries
+
+        Returns:
+            Path written, or None if the project has no stamp (not cacheable)
+        """
+        if stamp is None:
+            return None
+
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        path = self.cache_path(project_name, stamp)
+        tmp_path = path.with_name(path.name + '.tmp')
+        df = pd.DataFrame(connectors)
+
+        try:
+            if self.use_parquet:
+                df.to_parquet(tmp_path, index=False)
+            else:
+                payload = {
+                    'version': self.version,
+                    'project': project_name,
+                    'stamp': str(stamp),
+                    'column_order': list(df.columns),
+                    'columns': {col: df[col].tolist() for col in df.columns},
+                }
+                with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                    json.dump(payload, f, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"E3ProjectCache: Failed to write {path.name}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return None
+
+        self._remove_stale_entries(project_name, keep=path)
+        return path
+
+    def _remove_stale_entries(self, project_name: str, keep: Path):
+        """Delete a project's entries for older stamps or versions"""
+        prefix = self._project_prefix(project_name)
+        for path in self.cache_directory.glob(prefix + '*'):
+            if path != keep:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def list_entries(self) -> List[str]:
+        """List cache file paths, newest first"""
+        if not self.cache_directory.exists():
+            return []
+        files = [f for f in self.cache_directory.iterdir()
+                 if f.name.endswith((self.PARQUET_SUFFIX, self.JSON_SUFFIX))]
+        files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+        return [str(f) for f in files]
+
+    def clear(self):
+        """Delete every cache entry"""
+        for path in self.list_entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -1,8 +1,17 @@
 """
 E3.series Service - Low-level COM interface wrapper
 """
+import time
+from pathlib import Path
 from typing import List, Dict, Optional, Any
 
+from ..core.app_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Extensions of E3.series project files
+PROJECT_FILE_SUFFIXES = ('.e3s', '.e3p')
+
 
 class E3Service:
     """Low-level wrapper for E3.series COM interface"""
@@ -139,6 +148,60 @@ class E3Service:
                 f"E3Service: Failed to get connectors from {project_name}: {e}")
             return []
 
+    def get_project_path(self, project_name: str) -> Optional[Path]:
+        """Get the file an E3 project is saved in
+
+        Args:
+            project_name: Name or file path of the project
+
+        Returns:
+            Path of the project file, or None if it cannot be resolved
+        """
+        path = Path(project_name)
+        if path.suffix.lower() in PROJECT_FILE_SUFFIXES and path.is_file():
+            return path
+
+        if not self.is_connected:
+            return None
+
+        try:
+            # TODO: Resolve the file of an open project through COM
+            # project = self.e3_app.GetProject(project_name)
+            # return Path(project.GetPath()) / project.GetName()
+
+            return None
+
+        except Exception as e:
+            print(f"E3Service: Failed to get path of {project_name}: {e}")
+            return None
+
+    def get_project_stamp(self, project_name: str) -> Optional[str]:
+        """Get a modification stamp for an E3 project
+
+        The stamp is taken from the project file's modification time and
+        size, so it changes whenever the project is saved and can be used to
+        decide whether a cached extraction is still valid.
+
+        Args:
+            project_name: Name or file path of the project
+
+        Returns:
+            Stamp string, or None if the project file cannot be resolved
+            (the project is then extracted again every time)
+        """
+        path = self.get_project_path(project_name)
+        if path is None:
+            logger.info("No project file for %s; extraction will not be cached",
+                        project_name)
+            return None
+
+        try:
+            stat = path.stat()
+        except OSError as e:
+            logger.warning("Cannot read modification time of %s: %s", path, e)
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     def export_to_excel(self, project_name: str, output_path: str) -> bool:
         """Export project data to Excel
 
@@ -167,6 +230,89 @@ class E3Service:
             return False
 
 
+class MockE3Service(E3Service):
+    """Stand-in for E3Service returning generated connector data
+
+    Used until the COM interface is implemented, and by tests. Each instance
+    is independent, so one can be created per extraction thread just like the
+    real COM wrapper (COM objects must not be shared between threads).
+    """
+
+    def __init__(self, stamps: Optional[Dict[str, str]] = None,
+                 extraction_delay: float = 0.5):
+        """
+        Args:
+            stamps: Optional project name -> modification stamp overrides
+            extraction_delay: Seconds to sleep per project extraction
+        """
+        super().__init__()
+        self.stamps = stamps or {}
+        self.extraction_delay = extraction_delay
+        self.extracted_projects: List[str] = []
+
+    def connect(self) -> bool:
+        self.is_connected = True
+        return True
+
+    def disconnect(self):
+        self.is_connected = False
+
+    def get_projects(self) -> List[str]:
+        return [
+            "Project_Alpha_Rev3",
+            "Project_Beta_Final",
+            "Connector_Library_Master",
+            "System_Integration_2024",
+            "Prototype_Assembly_v2"
+        ]
+
+    def open_project(self, project_name: str) -> bool:
+        return True
+
+    def get_project_stamp(self, project_name: str) -> Optional[str]:
+        return self.stamps.get(project_name, "mock-1")
+
+    def get_connectors_from_project(self, project_name: str) -> List[Dict[str, Any]]:
+        if self.extraction_delay:
+            # Blocking on purpose: this stands in for synchronous COM calls,
+            # which run on extraction threads (see e3_extraction), not on the
+            # async bridge like the network clients
+            time.sleep(self.extraction_delay)
+        self.extracted_projects.append(project_name)
+
+        prefix = project_name[:3].upper()
+        return [
+            {
+                'Part Number': f'{prefix}/001',
+                'Part Code': f'{prefix}-001',
+                'Minified Part Code': f'{prefix}001',
+                'Material': 'Aluminum',
+                'Database Status': 'Active',
+                'Family': prefix,
+                'Shell Type': '26 - Plug',
+                'Shell Size': '10',
+                'Insert Arrangement': 'A - 1',
+                'Socket Type': 'Type A',
+                'Keying': 'Normal',
+                'E3 Project': project_name
+            },
+            {
+                'Part Number': f'{prefix}/002',
+                'Part Code': f'{prefix}-002',
+                'Minified Part Code': f'{prefix}002',
+                'Material': 'Stainless Steel',
+                'Database Status': 'Active',
+                'Family': prefix,
+                'Shell Type': '24 - Receptacle',
+                'Shell Size': '12',
+                'Insert Arrangement': 'B - 2',
+                'Socket Type': 'Type B',
+                'Keying': 'Keyed',
+                'E3 Project': project_name
+            }
+        ]
+
+
 # Singleton instance
 _e3_service_instance = None
 
@@ -1,7 +1,8 @@
-from PySide6.QtCore import QSortFilterProxyModel, Qt, Signal, QObject, QTimer
+from PySide6.QtCore import Signal, QObject, QTimer
 from .view import IdentifyBestEpdView
 from ..epd_config import DEFAULT_VISIBLE_COLUMNS
 from ...presenters.pandas_table_model import PandasTableModel
+from ...presenters.index_proxy_model import IndexProxyModel
 import pandas as pd
 
 
@@ -86,10 +87,8 @@ class IdentifyBestEpdPresenter(QObject):
 
     def _setup_ui_components(self):
         """Setup UI components that don't require data"""
-        # Create proxy model for sorting/filtering
-        self.proxy = QSortFilterProxyModel()
-        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy.setFilterKeyColumn(-1)
+        # Create index-array proxy model for sorting/filtering
+        self.proxy = IndexProxyModel()
 
         # Configure table view
         self.view.table.setModel(self.proxy)
@@ -2,15 +2,28 @@
 EPD Model - Data management for EPD analysis with proper threading support
 """
 from typing import Dict, List, Any, Optional
-from PySide6.QtCore import Signal, QThread, QMutex, QMutexLocker
+from PySide6.QtCore import Signal, QMutex, QMutexLocker
 from ..core.base_model import BaseModel
 from ..core.base_data_worker import BaseDataWorker
+from ..core.task_scheduler import TaskPriority, TaskScheduler
+from ..core.profiler import profile_span
 import pandas as pd
 import time
 
 
 class EpdDataWorker(BaseDataWorker):
-    """Worker class for loading EPD data in a separate thread"""
+    """Worker class for loading EPD data in a separate thread
+
+    When given a local data store, the loaded records are also written to it
+    here, so the write (and its full-text indexing) stays off the UI thread.
+    """
+
+    def __init__(self, store=None, table: str = 'epd_records',
+                 facet_columns: Optional[List[str]] = None):
+        super().__init__()
+        self._store = store
+        self._table = table
+        self._facet_columns = facet_columns
 
     def run(self):
         """Execute the data loading in background thread"""
@@ -33,6 +46,13 @@ class EpdDataWorker(BaseDataWorker):
             data = self._load_sample_data()
             time.sleep(0.2)  # Simulate processing time
 
+            if self._store is not None:
+                if not self.emit_progress(90, "Saving EPD data..."):
+                    return
+                self._store.replace_table(
+                    self._table, data.to_dict('records'),
+                    facet_columns=self._facet_columns)
+
             # Complete
             if not self.emit_progress(100, "EPD data loaded successfully"):
                 return
@@ -60,7 +80,18 @@ class EpdDataWorker(BaseDataWorker):
 
 
 class EpdModel(BaseModel):
-    """Model for managing EPD (Electronic Parts Data) with thread-safe async loading"""
+    """Model for managing EPD (Electronic Parts Data) with thread-safe async loading
+
+    When a local data store is registered in the context, loaded records are
+    also written to it. Text filtering and record lookups then run as indexed
+    store queries, and the next session starts from the stored records.
+    """
+
+    # Store table holding EPD records
+    STORE_TABLE = 'epd_records'
+
+    # Columns indexed for exact-match lookups in the store
+    FACET_COLUMNS = ['EPD', 'Cable']
 
     # Additional signals for loading process
     loading_progress = Signal(int, str)  # progress_percent, status_message
@@ -71,41 +102,73 @@ class EpdModel(BaseModel):
         super().__init__(context)
         self.data = None
         self.is_loading = False
+        self._load_complete = False
 
         # Thread-safe data access
         self._data_mutex = QMutex()
 
-        # Worker thread components
+        # Background load (runs on the shared task scheduler)
         self._worker = None
-        self._thread = None
+        self._task = None
+        self._load_span = None
+        self._scheduler = (context.get('task_scheduler') if context is not None
+                           else None) or TaskScheduler.shared()
+
+        # Shared local data store (optional)
+        self._store = context.get('data_store') if context is not None else None
+
+    def _use_store(self) -> bool:
+        """Check if EPD records are available from the local data store"""
+        return self._store is not None and self._store.has_table(self.STORE_TABLE)
 
     def load_async(self):
-        """Start asynchronous data loading in a separate thread"""
+        """Start asynchronous data loading on the task scheduler
+
+        Records persisted by a previous session are published immediately;
+        the background load then refreshes them. Once a load has completed
+        (e.g. a preload started by TabLoader), the data is republished for
+        late subscribers instead of being loaded again - use refresh_data()
+        to reload.
+        """
         if self.is_loading:
             print("Already loading data...")
             return
 
+        if self._load_complete:
+            self.data_loaded.emit(self.data)
+            return
+
+        self._load_from_store()
+
         self.is_loading = True
+        self._load_span = profile_span('epd.load', 'model')
         self.loading_progress.emit(0, "Starting EPD data load...")
 
-        # Create worker and thread
-        self._worker = EpdDataWorker()
-        self._thread = QThread()
-
-        # Move worker to thread
-        self._worker.moveToThread(self._thread)
+        # Create worker (it also writes the records to the store)
+        self._worker = EpdDataWorker(
+            self._store, self.STORE_TABLE, self.FACET_COLUMNS)
 
         # Connect signals
         self._worker.progress.connect(self._on_loading_progress)
         self._worker.finished.connect(self._on_loading_finished)
         self._worker.error.connect(self._on_loading_error)
 
-        # Connect thread lifecycle
-        self._thread.started.connect(self._worker.run)
-        self._thread.finished.connect(self._thread.deleteLater)
+        # Queue behind interactive work
+        self._task = self._scheduler.submit_worker(
+            self._worker, name='epd_load', key='epd_load',
+            priority=TaskPriority.BACKGROUND)
 
-        # Start the thread
-        self._thread.start()
+    def _load_from_store(self):
+        """Publish EPD records persisted by a previous session (warm start)"""
+        if self.data is not None or not self._use_store():
+            return
+
+        data = self._store.query_frame(self.STORE_TABLE)
+        with QMutexLocker(self._data_mutex):
+            self.data = data
+
+        print(f"EPD model: warm start from local store ({len(data)} records)")
+        self.data_loaded.emit(self.data)
 
     def _on_loading_progress(self, progress: int, message: str):
         """Handle progress updates from worker thread"""
@@ -118,29 +181,28 @@ class EpdModel(BaseModel):
             self.data = data
 
         self.is_loading = False
+        self._load_complete = True
 
         # Emit data_loaded signal from BaseModel
         self.data_loaded.emit(self.data)
+        self._load_span.finish(rows=len(data))
 
-        # Cleanup thread
-        self._cleanup_thread()
+        # Release worker
+        self._cleanup_task()
 
     def _on_loading_error(self, error_message: str):
         """Handle loading errors from worker thread"""
         self.is_loading = False
         self.loading_failed.emit(error_message)
+        self._load_span.finish(error=error_message)
         print(f"EPD Model loading error: {error_message}")
 
-        # Cleanup thread
-        self._cleanup_thread()
+        # Release worker
+        self._cleanup_task()
 
-    def _cleanup_thread(self):
-        """Cleanup worker thread after completion"""
-        if self._thread and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait()
-
-        self._thread = None
+    def _cleanup_task(self):
+        """Release the worker after completion"""
+        self._task = None
         self._worker = None
 
     def get_all(self):
@@ -152,6 +214,18 @@ class EpdModel(BaseModel):
 
     def filter(self, text: str):
         """Return filtered rows matching text in any column (thread-safe)."""
+        with profile_span('epd.filter', 'filter', text=text) as span:
+            filtered_data = self._filter(text)
+            span.finish(rows=len(filtered_data))
+        return filtered_data
+
+    def _filter(self, text: str):
+        if text and text.strip() and self._use_store():
+            filtered_data = self._store.query_frame(
+                self.STORE_TABLE, search_text=text)
+            self.data_filtered.emit(filtered_data)
+            return filtered_data
+
         with QMutexLocker(self._data_mutex):
             if self.data is None:
                 return pd.DataFrame()
@@ -174,6 +248,11 @@ class EpdModel(BaseModel):
 
     def get_record_by_epd(self, epd_id: str) -> Optional[Dict]:
         """Get a specific EPD record by ID (thread-safe)"""
+        if self._use_store():
+            rows = self._store.query(
+                self.STORE_TABLE, facets={'EPD': [epd_id]}, limit=1)
+            return rows[0] if rows else None
+
         with QMutexLocker(self._data_mutex):
             if self.data is None:
                 return None
@@ -189,6 +268,10 @@ class EpdModel(BaseModel):
 
     def get_records_by_cable(self, cable_type: str) -> pd.DataFrame:
         """Get all EPD records for a specific cable type (thread-safe)"""
+        if self._use_store():
+            return self._store.query_frame(
+                self.STORE_TABLE, facets={'Cable': [cable_type]})
+
         with QMutexLocker(self._data_mutex):
             if self.data is None:
                 return pd.DataFrame()
@@ -232,6 +315,7 @@ class EpdModel(BaseModel):
         # Clear existing data
         with QMutexLocker(self._data_mutex):
             self.data = None
+        self._load_complete = False
 
         # Reload
         self.load_async()
@@ -257,14 +341,9 @@ class EpdModel(BaseModel):
 
     def cleanup(self):
         """Cleanup resources before deletion"""
-        # Cancel any ongoing operations
-        if self._worker:
-            self._worker.cancel()
-
-        # Wait for thread to finish
-        if self._thread and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait(5000)  # Wait max 5 seconds
+        # Cancel any ongoing operations (also cancels the worker)
+        if self._task is not None:
+            self._scheduler.cancel(self._task)
 
 # class EpdModel(BaseModel):
 #     """Model for managing EPD (Electronic Parts Data) analysis data"""
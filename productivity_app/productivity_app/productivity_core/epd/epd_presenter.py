@@ -4,15 +4,17 @@ EPD Presenter - Main coordinator for EPD module with sub-tabs
 from .epd_model import EpdModel
 from ..core.base_presenter import BasePresenter
 from .epd_tab import EpdModuleView
+from ..tabs.tab_ids import TabId
 
 
 class EpdPresenter(BasePresenter):
     """Main EPD presenter coordinating SearchEpd and IdentifyBestEpd sub-modules"""
 
-    MODULE_ID = 'epd'
+    MODULE_ID = TabId.EPD
 
     def __init__(self, context):
-        self.model = EpdModel(context)
+        # Shared model, if TabLoader preloaded it before building the view
+        self.model = context.get('epd_model') or EpdModel(context)
         self.view = EpdModuleView(context, self.model)
         super().__init__(context, self.view, self.model, title="EPD Tools")
 
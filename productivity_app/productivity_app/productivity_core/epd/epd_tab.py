@@ -4,23 +4,14 @@ EPD Module - Electronic Parts Data analysis interface with multiple sub-tabs
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
 from .SearchEpd.presenter import SearchEpdPresenter
 from .IdentifyBestEpd.presenter import IdentifyBestEpdPresenter
+from ..tabs.tab_ids import EpdTabs
 
 
-class EpdModuleView(QWidget):
+class EpdModuleView(QWidget, EpdTabs):
     """Main EPD module containing SearchEpd and IdentifyBestEpd tabs"""
 
-    # ========================================================================
-    # Module Constants - Single source of truth for module identification
-    # ========================================================================
-    MODULE_ID = 'epd'
-    SUB_TAB_SEARCH = 'search'
-    SUB_TAB_IDENTIFY_BEST = 'identify_best'
-
-    SUB_TAB_ORDER = [SUB_TAB_SEARCH, SUB_TAB_IDENTIFY_BEST]
-    SUB_TAB_LABELS = {
-        SUB_TAB_SEARCH: 'Search',
-        SUB_TAB_IDENTIFY_BEST: 'Identify Best',
-    }
+    # Module and sub-tab identifiers (MODULE_ID, SUB_TAB_*) come from
+    # EpdTabs in tabs/tab_ids.py
 
     def __init__(self, context, epd_model):
         super().__init__()
@@ -13,8 +13,8 @@ class ConnectorsPresenter(BasePresenter):
     MODULE_ID = ConnectorModuleView.MODULE_ID
 
     def __init__(self, context):
-        # Create model
-        self.model = ConnectorModel(context)
+        # Shared model, if TabLoader preloaded it before building the view
+        self.model = context.get('connector_model') or ConnectorModel(context)
 
         # Create view (which contains sub-tabs)
         self.view = ConnectorModuleView(context, self.model)
@@ -1,11 +1,12 @@
 from ..models.fault_model import FaultFindingModel
 from ..tabs.fault_finding import FaultFindingView
 from ..core.base_presenter import BasePresenter
+from ..tabs.tab_ids import TabId
 
 
 class FaultFindingPresenter(BasePresenter):
 
-    MODULE_ID = 'fault_finding'
+    MODULE_ID = TabId.FAULT_FINDING
 
     def __init__(self, context, epd_model, contextualizers=None, title="Fault Finding"):
         self.context = context
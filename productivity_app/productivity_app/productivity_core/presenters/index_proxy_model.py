@@ -0,0 +1,248 @@
+import numpy as np
+from PySide6.QtCore import QAbstractProxyModel, QModelIndex, Qt
+
+from ..core.profiler import profiled
+from .pandas_table_model import PandasTableModel, _row_runs
+
+_ASCENDING = Qt.AscendingOrder
+_VERTICAL = Qt.Vertical
+
+
+class IndexProxyModel(QAbstractProxyModel):
+    """Sorting proxy over a PandasTableModel backed by an index array
+
+    Proxy row i shows source row _rows[i], and source row j is shown at proxy
+    row _proxy_rows[j] (-1 while not shown). Sorting is a vectorized sort of
+    the source column (PandasTableModel.sort_positions), so it does not call
+    data() per row like QSortFilterProxyModel does. Filtering is done by
+    updating the source model with the filtered frame.
+
+    Row removals/insertions in the source (PandasTableModel incremental
+    updates) are forwarded as proxy row ranges, keeping the view's selection;
+    inserted rows are placed once the source emits rows_updated. Values
+    changed in place do not re-sort.
+    """
+
+    # Above this many changed row ranges, source row changes reset the proxy
+    MAX_INCREMENTAL_RANGES = 64
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = np.arange(0, dtype=np.int64)
+        self._proxy_rows = np.arange(0, dtype=np.int64)
+        self._sort_column = -1
+        self._sort_order = _ASCENDING
+        self._source_connections = []
+
+    # ------------------------------------------------------------------
+    # Source model
+    # ------------------------------------------------------------------
+
+    def setSourceModel(self, source_model: PandasTableModel):
+        self.beginResetModel()
+        old_source = self.sourceModel()
+        if old_source is not None:
+            for signal, slot in self._source_connections:
+                signal.disconnect(slot)
+        self._source_connections = []
+
+        super().setSourceModel(source_model)
+
+        if source_model is not None:
+            self._source_connections = [
+                (source_model.modelReset, self._on_source_reset),
+                (source_model.layoutChanged, self._on_source_reset),
+                (source_model.rowsRemoved, self._on_source_rows_removed),
+                (source_model.rowsInserted, self._on_source_rows_inserted),
+                (source_model.rows_updated, self._on_source_rows_updated),
+                (source_model.dataChanged, self._on_source_data_changed),
+            ]
+            for signal, slot in self._source_connections:
+                signal.connect(slot)
+
+        self._set_rows(self._compute_rows())
+        self.endResetModel()
+
+    def _source_row_count(self) -> int:
+        source = self.sourceModel()
+        return source.rowCount() if source is not None else 0
+
+    def _compute_rows(self) -> np.ndarray:
+        """Source rows in display order"""
+        source = self.sourceModel()
+        if source is None:
+            return np.arange(0, dtype=np.int64)
+
+        if 0 <= self._sort_column < source.columnCount():
+            rows = source.sort_positions(
+                self._sort_column, self._sort_order == _ASCENDING)
+        else:
+            rows = np.arange(source.rowCount(), dtype=np.int64)
+        return rows.astype(np.int64, copy=False)
+
+    def _set_rows(self, rows: np.ndarray):
+        """Show source rows in this order, updating the inverse map"""
+        self._rows = rows
+        # Sized for source rows not renumbered yet during removals
+        size = max(self._source_row_count(), int(rows.max()) + 1 if len(rows) else 0)
+        self._proxy_rows = np.full(size, -1, dtype=np.int64)
+        self._proxy_rows[rows] = np.arange(len(rows))
+
+    def _refresh(self):
+        """Recompute the row order, moving persistent indexes with their rows"""
+        new_rows = self._compute_rows()
+
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_rows = self._rows
+        self._set_rows(new_rows)
+        new_indexes = []
+        for index in old_indexes:
+            new_row = int(self._proxy_rows[old_rows[index.row()]])
+            new_indexes.append(
+                self.index(new_row, index.column()) if new_row >= 0 else QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _reset(self):
+        self.beginResetModel()
+        self._set_rows(self._compute_rows())
+        self.endResetModel()
+
+    # ------------------------------------------------------------------
+    # Sorting
+    # ------------------------------------------------------------------
+
+    @profiled('proxy.sort', 'table')
+    def sort(self, column, order=_ASCENDING):
+        """Sort by a source column (-1 restores source order)"""
+        self._sort_column = column
+        self._sort_order = order
+        if self.sourceModel() is not None:
+            self._refresh()
+
+    # ------------------------------------------------------------------
+    # Source change handling
+    # ------------------------------------------------------------------
+
+    def _on_source_reset(self):
+        self._reset()
+
+    def _on_source_rows_removed(self, parent, first, last):
+        count = last - first + 1
+        removed = (self._rows >= first) & (self._rows <= last)
+        runs = _row_runs(removed)
+        if len(runs) > self.MAX_INCREMENTAL_RANGES:
+            # The source is between updates - drop rows, don't resort
+            self.beginResetModel()
+            rows = self._rows[~removed]
+            rows[rows > last] -= count
+            self._set_rows(rows)
+            self.endResetModel()
+            return
+
+        for run_first, run_last in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), run_first, run_last)
+            self._set_rows(np.delete(self._rows, np.s_[run_first:run_last + 1]))
+            self.endRemoveRows()
+        rows = self._rows.copy()
+        rows[rows > last] -= count
+        self._set_rows(rows)
+
+    def _on_source_rows_inserted(self, parent, first, last):
+        # The source's final order is only known after its last insertion,
+        # so just renumber here and place the new rows in
+        # _on_source_rows_updated
+        count = last - first + 1
+        rows = self._rows.copy()
+        rows[rows >= first] += count
+        self._set_rows(rows)
+
+    def _on_source_rows_updated(self):
+        # Stable sorting keeps existing rows in their relative order, so the
+        # new order is the current one with the inserted rows interleaved
+        new_rows = self._compute_rows()
+        if len(new_rows) == len(self._rows):
+            return
+
+        inserted = ~np.isin(new_rows, self._rows)
+        runs = _row_runs(inserted)
+        if (len(runs) > self.MAX_INCREMENTAL_RANGES
+                or not np.array_equal(new_rows[~inserted], self._rows)):
+            self._reset()
+            return
+
+        for run_first, run_last in runs:
+            self.beginInsertRows(QModelIndex(), run_first, run_last)
+            self._set_rows(np.insert(
+                self._rows, run_first, new_rows[run_first:run_last + 1]))
+            self.endInsertRows()
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        if len(self._rows):
+            self.dataChanged.emit(
+                self.index(0, top_left.column()),
+                self.index(len(self._rows) - 1, bottom_right.column()),
+                roles)
+
+    # ------------------------------------------------------------------
+    # QAbstractProxyModel interface
+    # ------------------------------------------------------------------
+
+    def mapToSource(self, proxy_index):
+        source = self.sourceModel()
+        if source is None or not proxy_index.isValid():
+            return QModelIndex()
+        row = proxy_index.row()
+        if row >= len(self._rows):
+            return QModelIndex()
+        return source.index(int(self._rows[row]), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if row >= len(self._proxy_rows) or self._proxy_rows[row] < 0:
+            return QModelIndex()
+        return self.index(int(self._proxy_rows[row]), source_index.column())
+
+    def source_rows(self) -> np.ndarray:
+        """Source row numbers in display order"""
+        return self._rows
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._rows)) \
+                or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        source = self.sourceModel()
+        if parent.isValid() or source is None:
+            return 0
+        return source.columnCount()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        source = self.sourceModel()
+        return source.data(
+            source.index(int(self._rows[index.row()]), index.column()), role)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        source = self.sourceModel()
+        if source is None:
+            return None
+        if orientation == _VERTICAL:
+            if not 0 <= section < len(self._rows):
+                return None
+            section = int(self._rows[section])
+        return source.headerData(section, orientation, role)
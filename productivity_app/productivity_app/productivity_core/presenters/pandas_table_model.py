@@ -1,74 +1,364 @@
-from PySide6.QtCore import QAbstractTableModel, Qt
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 from PySide6.QtGui import QColor, QBrush
 
+from ..core.profiler import profiled
+
+# Roles/orientations resolved once - PySide6 enum attribute lookups are slow
+# compared to the rest of data(), which runs for every visible cell
+_DISPLAY_ROLE = Qt.DisplayRole
+_BACKGROUND_ROLE = Qt.BackgroundRole
+_FOREGROUND_ROLE = Qt.ForegroundRole
+_HORIZONTAL = Qt.Horizontal
+_VERTICAL = Qt.Vertical
+_ASCENDING = Qt.AscendingOrder
+
+# Shared brushes for input columns
+INPUT_CELL_BACKGROUND = QBrush(QColor(230, 240, 255))  # Lighter blue
+INPUT_CELL_FOREGROUND = QBrush(QColor(0, 0, 0))  # Black text
+INPUT_HEADER_BACKGROUND = QBrush(QColor(100, 149, 237))  # Cornflower blue
+INPUT_HEADER_FOREGROUND = QBrush(QColor(255, 255, 255))  # White text
+
+
+def _timestamp_text(value) -> str:
+    return str(pd.Timestamp(value))
+
+
+def _timedelta_text(value) -> str:
+    return str(pd.Timedelta(value))
+
+
+def _row_runs(mask: np.ndarray) -> list:
+    """Contiguous runs of True in a boolean mask as (first, last) pairs"""
+    padded = np.concatenate(([False], mask, [False])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return [(int(start), int(stop) - 1)
+            for start, stop in zip(edges[::2], edges[1::2])]
+
+
+def _ordered_positions(index: pd.Index, labels: pd.Index):
+    """Positions of labels in index, or None unless all found and in order"""
+    positions = index.get_indexer(labels)
+    if len(positions) and (positions[0] < 0 or np.any(np.diff(positions) <= 0)):
+        return None
+    return positions
+
+
+def _column_formatter(dtype):
+    """Formatter turning one raw array value into its display text
+
+    Matches str() of the value DataFrame.iat would return for the column.
+    """
+    kind = getattr(dtype, 'kind', 'O')
+    if kind == 'M' and isinstance(dtype, np.dtype):
+        return _timestamp_text
+    if kind == 'm' and isinstance(dtype, np.dtype):
+        return _timedelta_text
+    return str
+
 
 class PandasTableModel(QAbstractTableModel):
-    """Adapter to show a Pandas DataFrame in a QTableView."""
+    """Adapter to show a Pandas DataFrame in a QTableView.
+
+    Column values are read from NumPy arrays (fetched lazily per column) and
+    formatted by a per-column formatter chosen once per frame. sort() reorders
+    the frame with a vectorized argsort, so views can sort without a proxy.
+
+    update() diffs the new frame against the current one by index label: a
+    narrowing or widening filter is reported as row removals/insertions, so
+    views keep their selection, scroll position and header sizes.
+    """
+
+    # Emitted once an incremental update() has replaced the frame; during the
+    # rowsRemoved/rowsInserted signals before it, the model holds the frame
+    # with the ranges reported so far applied (matching rowCount())
+    rows_updated = Signal()
+
+    # Above this many removed/inserted row ranges, update() resets instead
+    MAX_INCREMENTAL_RANGES = 64
 
     def __init__(self, df, input_column_prefix="Input: "):
         super().__init__()
-        self._data = df
         self.input_column_prefix = input_column_prefix
+        self._frame = df
+        self._frame_rows = None  # Rows of _frame held while ranges are applied
+        self._prepare_columns()
+
+    @property
+    def _data(self):
+        """The frame shown (cut from the update's frame on first read
+        between row range signals)"""
+        if self._frame_rows is not None:
+            self._frame = self._frame.iloc[self._frame_rows]
+            self._frame_rows = None
+        return self._frame
+
+    @_data.setter
+    def _data(self, df):
+        self._frame = df
+        self._frame_rows = None
+
+    def _prepare_columns(self):
+        """Precompute per-column arrays, formatters and input flags"""
+        columns = self._data.columns
+        self._column_names = [str(name) for name in columns]
+        self._input_flags = [name.startswith(self.input_column_prefix)
+                             for name in self._column_names]
+        self._formatters = [_column_formatter(dtype)
+                            for dtype in self._data.dtypes]
+        self._row_count = len(self._data)
+        self._clear_column_cache()
+
+    def _clear_column_cache(self):
+        """Drop arrays and sort orders derived from the current frame"""
+        self._arrays = [None] * len(self._column_names)
+        self._sort_orders = {}
+
+    def _column_array(self, column: int) -> np.ndarray:
+        """NumPy values of a column (converted on first use)"""
+        array = self._arrays[column]
+        if array is None:
+            series = self._data.iloc[:, column]
+            if isinstance(series.dtype, np.dtype):
+                array = series.to_numpy()
+            else:
+                # Extension dtypes (Int64, category, tz-aware...) keep their
+                # scalar types (pd.NA, Timestamp) as objects
+                array = series.to_numpy(dtype=object)
+            self._arrays[column] = array
+        return array
+
+    @profiled('table.update', 'table')
+    def update(self, df, incremental=True):
+        """Show a new frame
+
+        With incremental set, a frame whose rows are a subset or superset of
+        the current rows (same index labels, same order) is applied as
+        rowsRemoved/rowsInserted ranges; anything else resets the model.
 
-    def update(self, df):
+        Args:
+            df: New DataFrame
+            incremental: Try a diff-based update before resetting
+        """
+        if incremental and self._update_rows(df):
+            return
+
+        same_columns = self._same_columns(df)
         self.beginResetModel()
         self._data = df
+        if same_columns:
+            self._row_count = len(df)
+            self._clear_column_cache()
+        else:
+            self._prepare_columns()
         self.endResetModel()
 
+    def _same_columns(self, df) -> bool:
+        """Whether df has the current column labels and dtypes"""
+        return (self._data.columns.equals(df.columns)
+                and self._data.dtypes.equals(df.dtypes))
+
+    def _update_rows(self, df) -> bool:
+        """Apply df as row removals or insertions
+
+        Returns:
+            False if df is not a row subset/superset of the current frame
+        """
+        old_index, new_index = self._data.index, df.index
+        if (not self._same_columns(df) or not old_index.is_unique
+                or not new_index.is_unique):
+            return False
+
+        if len(new_index) <= len(old_index):
+            kept = _ordered_positions(old_index, new_index)
+            if kept is None:
+                return False
+            removed = np.ones(len(old_index), dtype=bool)
+            removed[kept] = False
+            runs = _row_runs(removed)
+            if len(runs) > self.MAX_INCREMENTAL_RANGES:
+                return False
+
+            # Remove from the bottom up so earlier ranges keep their rows;
+            # each range's rows leave the frame before endRemoveRows()
+            old, kept_rows = self._data, np.ones(len(old_index), dtype=bool)
+            for first, last in reversed(runs):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                kept_rows[first:last + 1] = False
+                self._set_rows(old, kept_rows)
+                self.endRemoveRows()
+        else:
+            existing = _ordered_positions(new_index, old_index)
+            if existing is None:
+                return False
+            inserted = np.ones(len(new_index), dtype=bool)
+            inserted[existing] = False
+            runs = _row_runs(inserted)
+            if len(runs) > self.MAX_INCREMENTAL_RANGES:
+                return False
+
+            # Insert from the top down so each range lands at its final row;
+            # each range's rows join the frame before endInsertRows()
+            shown_rows = ~inserted
+            for first, last in runs:
+                self.beginInsertRows(QModelIndex(), first, last)
+                shown_rows[first:last + 1] = True
+                self._set_rows(df, shown_rows)
+                self.endInsertRows()
+
+        self._data = df
+        self._row_count = len(df)
+        self._clear_column_cache()
+        self.rows_updated.emit()
+
+        # Labels can match while values differ - repaint what is visible
+        if self._row_count and self._column_names:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._row_count - 1, len(self._column_names) - 1))
+        return True
+
+    def _set_rows(self, df, mask: np.ndarray):
+        """Hold the rows of df selected by mask (between row range signals)
+
+        The frame is only cut if something reads the model before the next
+        range is applied.
+        """
+        self._frame = df
+        self._frame_rows = np.flatnonzero(mask)
+        self._row_count = len(self._frame_rows)
+        self._clear_column_cache()
+
     def rowCount(self, parent=None):
-        return len(self._data)
+        return self._row_count
 
     def columnCount(self, parent=None):
-        return len(self._data.columns)
+        return len(self._column_names)
 
-    def data(self, index, role):
+    def data(self, index, role=_DISPLAY_ROLE):
         if not index.isValid():
             return None
 
-        if role == Qt.DisplayRole:
-            return str(self._data.iat[index.row(), index.column()])
+        column = index.column()
+        if role == _DISPLAY_ROLE:
+            return self._formatters[column](self._column_array(column)[index.row()])
 
         # Color cells in input columns slightly differently
-        if role == Qt.BackgroundRole:
-            column_name = self._data.columns[index.column()]
-            if column_name.startswith(self.input_column_prefix):
-                # Light blue tint for input columns
-                return QBrush(QColor(230, 240, 255))  # Lighter blue
+        if role == _BACKGROUND_ROLE:
+            return INPUT_CELL_BACKGROUND if self._input_flags[column] else None
 
         # Ensure text is visible in input columns
-        if role == Qt.ForegroundRole:
-            column_name = self._data.columns[index.column()]
-            if column_name.startswith(self.input_column_prefix):
-                # Dark text for input columns
-                return QBrush(QColor(0, 0, 0))  # Black text
+        if role == _FOREGROUND_ROLE:
+            return INPUT_CELL_FOREGROUND if self._input_flags[column] else None
 
         return None
 
-    def headerData(self, section, orientation, role):
-        if orientation == Qt.Horizontal:
-            if role == Qt.DisplayRole:
-                return str(self._data.columns[section])
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if orientation == _HORIZONTAL:
+            if role == _DISPLAY_ROLE:
+                return self._column_names[section]
 
             # Color input column headers differently
-            if role == Qt.BackgroundRole:
-                column_name = self._data.columns[section]
-                if column_name.startswith(self.input_column_prefix):
-                    # Blue background for input column headers
-                    return QBrush(QColor(100, 149, 237))  # Cornflower blue
+            if role == _BACKGROUND_ROLE and self._input_flags[section]:
+                return INPUT_HEADER_BACKGROUND
 
             # White text for input column headers
-            if role == Qt.ForegroundRole:
-                column_name = self._data.columns[section]
-                if column_name.startswith(self.input_column_prefix):
-                    return QBrush(QColor(255, 255, 255))  # White text
+            if role == _FOREGROUND_ROLE and self._input_flags[section]:
+                return INPUT_HEADER_FOREGROUND
 
-        if role == Qt.DisplayRole and orientation == Qt.Vertical:
+        if role == _DISPLAY_ROLE and orientation == _VERTICAL:
             return str(section + 1)
 
         return None
 
+    def _ascending_order(self, column: int):
+        """Stable ascending order of a column's non-missing rows (cached)
+
+        Returns:
+            Tuple of (row positions, start of each run of equal values,
+            positions of missing rows)
+        """
+        cached = self._sort_orders.get(column)
+        if cached is not None:
+            return cached
+
+        series = self._data.iloc[:, column]
+        missing = series.isna().to_numpy()
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biufmM':
+            keys = series.to_numpy()
+            if dtype.kind in 'mM':
+                keys = keys.view(np.int64)
+        else:
+            # Sort small integer codes instead of Python objects
+            try:
+                keys, _ = pd.factorize(series, sort=True)
+            except TypeError:
+                # Mixed types (e.g. numbers and text) - fall back to text order
+                keys, _ = pd.factorize(series.astype(str), sort=True)
+            if len(keys) and keys.max() < np.iinfo(np.int16).max:
+                keys = keys.astype(np.int16)  # Radix sorted by NumPy
+
+        present = np.flatnonzero(~missing)
+        present_keys = keys[present]
+        ordering = np.argsort(present_keys, kind='stable')
+        order = present[ordering]
+        sorted_keys = present_keys[ordering]
+        run_starts = np.concatenate(
+            ([0], np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1))
+
+        cached = self._sort_orders[column] = (
+            order, run_starts, np.flatnonzero(missing))
+        return cached
+
+    def sort_positions(self, column: int, ascending: bool = True) -> np.ndarray:
+        """Row positions ordering the frame by a column (stable, missing last)
+
+        The ascending order is computed once per column; the descending one
+        is derived from it by reversing the runs of equal values.
+
+        Args:
+            column: Column number
+            ascending: Sort direction
+
+        Returns:
+            Array of row positions in sorted order
+        """
+        order, run_starts, missing = self._ascending_order(column)
+        if not ascending and len(order):
+            run_lengths = np.diff(np.append(run_starts, len(order)))[::-1]
+            run_offsets = np.cumsum(run_lengths) - run_lengths
+            order = order[np.repeat(run_starts[::-1] - run_offsets, run_lengths)
+                          + np.arange(len(order))]
+        return np.concatenate((order, missing))
+
+    def sort(self, column, order=_ASCENDING):
+        """Sort rows by a column, keeping selections on the same records"""
+        if not 0 <= column < len(self._column_names) or self._row_count == 0:
+            return
+
+        positions = self.sort_positions(column, order == _ASCENDING)
+
+        self.layoutAboutToBeChanged.emit()
+
+        self._data = self._data.iloc[positions]
+        self._clear_column_cache()
+
+        # Move persistent indexes (selection, current index) with their rows
+        new_row_of = np.empty(len(positions), dtype=np.int64)
+        new_row_of[positions] = np.arange(len(positions))
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(int(new_row_of[idx.row()]), idx.column())
+            for idx in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        self.layoutChanged.emit()
+
     def get_record(self, row):
         """Get a record as a dictionary for the given row"""
-        if 0 <= row < len(self._data):
+        if 0 <= row < self._row_count:
             return self._data.iloc[row].to_dict()
         return {}
@@ -3,15 +3,144 @@ Remote Docs Model
 
 Handles data management for remote document storage and retrieval.
 """
-from typing import List, Dict, Optional, Any
+import asyncio
+import os
+from typing import Callable, List, Dict, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
-import time
-from PySide6.QtCore import QObject, Signal, QThread, QTimer
+from urllib.parse import quote
+from PySide6.QtCore import QObject, Signal, QTimer
+
+from ..core import async_http
+from ..core.async_bridge import AsyncBridge, AsyncTask
+
+# Progress callback: (operation description, progress percentage)
+ProgressCallback = Callable[[str, int], None]
+
+
+class RemoteDocumentClient:
+    """Async client for the remote document store
+
+    With a base_url the operations talk to the document service over HTTP:
+        GET  {base_url}/documents                            -> JSON document list
+        PUT  {base_url}/documents/{name}                     <- file bytes
+        GET  {base_url}/documents/{name}/versions/{version}  -> file bytes
+    Without one they simulate the network delays, as before.
+    """
+
+    def __init__(self, base_url: Optional[str] = None,
+                 headers: Optional[Dict[str, str]] = None):
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.headers = headers or {}
+
+    def _document_url(self, doc_name: str) -> str:
+        return f"{self.base_url}/documents/{quote(doc_name, safe='')}"
+
+    async def list_documents(self, progress: ProgressCallback) -> List['Document']:
+        """Fetch the document list"""
+        progress("Connecting to remote server...", 20)
+        if self.base_url is None:
+            await asyncio.sleep(1)  # Simulate network delay
+            progress("Fetching document list...", 50)
+            await asyncio.sleep(2)  # Simulate remote query
+            progress("Processing documents...", 80)
+            await asyncio.sleep(0.5)  # Simulate processing
+            documents = []
+        else:
+            progress("Fetching document list...", 50)
+            payload = await async_http.get_json(
+                f"{self.base_url}/documents", headers=self.headers)
+            progress("Processing documents...", 80)
+            documents = [_parse_document(item) for item in payload or []]
+
+        progress("Refresh complete", 100)
+        return documents
+
+    async def upload(self, file_path: str, doc_name: str, category: str,
+                     description: Optional[str], tags: List[str],
+                     progress: ProgressCallback) -> str:
+        """Upload a file as a new document version"""
+        progress(f"Preparing {doc_name} for upload...", 10)
+        if self.base_url is None:
+            await asyncio.sleep(0.5)
+            progress(f"Uploading {doc_name}...", 30)
+            await asyncio.sleep(2)  # Simulate upload time
+            progress(f"Processing {doc_name}...", 80)
+            await asyncio.sleep(1)  # Simulate server processing
+        else:
+            # Read off the event loop, which other requests share
+            content = await asyncio.to_thread(_read_file, file_path)
+            progress(f"Uploading {doc_name}...", 30)
+            # Metadata may be any text: percent-encoded UTF-8 in the headers
+            response = await async_http.request(
+                'PUT', self._document_url(doc_name), body=content,
+                headers={**self.headers,
+                         'Content-Type': 'application/octet-stream',
+                         'X-Document-Category': async_http.header_value(category),
+                         'X-Document-Description': async_http.header_value(description or ''),
+                         'X-Document-Tags': async_http.header_value(','.join(tags))})
+            response.raise_for_status()
+
+        progress("Upload complete", 100)
+        return doc_name
+
+    async def download(self, doc_name: str, version: str, save_path: str,
+                       progress: ProgressCallback) -> str:
+        """Download one document version to save_path"""
+        progress(f"Locating {doc_name}...", 20)
+        if self.base_url is None:
+            await asyncio.sleep(0.5)
+            progress(f"Downloading {doc_name}...", 60)
+            await asyncio.sleep(1.5)  # Simulate download time
+            progress(f"Saving to {save_path}...", 90)
+            await asyncio.sleep(0.5)
+        else:
+            def on_bytes(received: int, total: Optional[int]):
+                if total:
+                    progress(f"Downloading {doc_name}...", 20 + 70 * received // total)
+
+            url = f"{self._document_url(doc_name)}/versions/{quote(version, safe='')}"
+            try:
+                await async_http.download(url, save_path, headers=self.headers,
+                                          progress=on_bytes)
+            except Exception:
+                if os.path.exists(save_path):
+                    os.remove(save_path)  # Don't leave a partial file behind
+                raise
+
+        progress("Download complete", 100)
+        return save_path
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def _parse_document(item: Dict[str, Any]) -> 'Document':
+    """Build a Document from the service's JSON representation"""
+    return Document(
+        name=item['name'],
+        category=item.get('category', ''),
+        description=item.get('description'),
+        tags=list(item.get('tags', [])),
+        versions=[
+            DocumentVersion(
+                version=str(version['version']),
+                upload_date=datetime.fromisoformat(version['upload_date']),
+                size_bytes=int(version.get('size_bytes', 0)),
+                checksum=version.get('checksum', ''),
+                uploader=version.get('uploader', ''),
+                description=version.get('description'))
+            for version in item.get('versions', [])])
+
 
+class RemoteDocumentWorker(QObject):
+    """Runs remote document operations as coroutines on the AsyncBridge
 
-class RemoteDocumentWorker(QThread):
-    """Worker thread for remote document operations to prevent UI blocking"""
+    Operations are network-bound, so they share the bridge's event loop
+    instead of holding a thread each while they wait.
+    """
 
     # Signals for different operations
     refresh_completed = Signal(list)  # List of documents
@@ -23,121 +152,57 @@ class RemoteDocumentWorker(QThread):
     # Operation description, progress percentage
     progress_updated = Signal(str, int)
 
-    def __init__(self):
+    def __init__(self, client: Optional[RemoteDocumentClient] = None,
+                 bridge: Optional[AsyncBridge] = None):
         super().__init__()
-        self._operation = None
-        self._operation_data = None
-
-    def refresh_documents(self):
+        self.client = client or RemoteDocumentClient()
+        self._bridge = bridge or AsyncBridge.shared()
+        self._tasks: List[AsyncTask] = []
+
+    def isRunning(self) -> bool:
+        """Whether any operation is still in flight"""
+        return any(task.is_active() for task in self._tasks)
+
+    def cancel(self):
+        """Cancel all in-flight operations"""
+        for task in self._tasks:
+            task.cancel()
+
+    def _submit(self, coro, name: str, on_finished: Callable[[Any], None],
+                on_error: Callable[[str], None]) -> AsyncTask:
+        self._tasks = [task for task in self._tasks if task.is_active()]
+        task = self._bridge.submit(coro, name=name)
+        task.finished.connect(on_finished)
+        task.error.connect(on_error)
+        self._tasks.append(task)
+        return task
+
+    def refresh_documents(self) -> AsyncTask:
         """Start document refresh operation"""
-        self._operation = "refresh"
-        self._operation_data = None
-        self.start()
+        return self._submit(
+            self.client.list_documents(self.progress_updated.emit),
+            'remote_docs_refresh',
+            self.refresh_completed.emit,
+            self.refresh_failed.emit)
 
     def upload_document(self, file_path: str, doc_name: str, category: str,
-                        description: str = None, tags: List[str] = None):
+                        description: str = None, tags: List[str] = None) -> AsyncTask:
         """Start document upload operation"""
-        self._operation = "upload"
-        self._operation_data = {
-            'file_path': file_path,
-            'doc_name': doc_name,
-            'category': category,
-            'description': description,
-            'tags': tags or []
-        }
-        self.start()
-
-    def download_document(self, doc_name: str, version: str, save_path: str):
+        return self._submit(
+            self.client.upload(file_path, doc_name, category, description,
+                               tags or [], self.progress_updated.emit),
+            'remote_docs_upload',
+            self.upload_completed.emit,
+            lambda message: self.upload_failed.emit(doc_name, message))
+
+    def download_document(self, doc_name: str, version: str, save_path: str) -> AsyncTask:
         """Start document download operation"""
-        self._operation = "download"
-        self._operation_data = {
-            'doc_name': doc_name,
-            'version': version,
-            'save_path': save_path
-        }
-        self.start()
-
-    def run(self):
-        """Execute the requested operation in background thread"""
-        try:
-            if self._operation == "refresh":
-                self._do_refresh()
-            elif self._operation == "upload":
-                self._do_upload()
-            elif self._operation == "download":
-                self._do_download()
-        except Exception as e:
-            # Emit appropriate error signal based on operation
-            if self._operation == "refresh":
-                self.refresh_failed.emit(str(e))
-            elif self._operation == "upload":
-                doc_name = self._operation_data.get('doc_name', 'Unknown')
-                self.upload_failed.emit(doc_name, str(e))
-            elif self._operation == "download":
-                doc_name = self._operation_data.get('doc_name', 'Unknown')
-                self.download_failed.emit(doc_name, str(e))
-
-    def _do_refresh(self):
-        """Perform document refresh (simulated remote operation)"""
-        self.progress_updated.emit("Connecting to remote server...", 20)
-        time.sleep(1)  # Simulate network delay
-
-        self.progress_updated.emit("Fetching document list...", 50)
-        time.sleep(2)  # Simulate remote query
-
-        self.progress_updated.emit("Processing documents...", 80)
-        time.sleep(0.5)  # Simulate processing
-
-        # TODO: Replace with actual remote API call
-        # For now, return sample updated data
-        from datetime import datetime
-        updated_docs = self._create_sample_documents()
-
-        self.progress_updated.emit("Refresh complete", 100)
-        self.refresh_completed.emit(updated_docs)
-
-    def _do_upload(self):
-        """Perform document upload (simulated remote operation)"""
-        data = self._operation_data
-        doc_name = data['doc_name']
-
-        self.progress_updated.emit(f"Preparing {doc_name} for upload...", 10)
-        time.sleep(0.5)
-
-        self.progress_updated.emit(f"Uploading {doc_name}...", 30)
-        time.sleep(2)  # Simulate upload time
-
-        self.progress_updated.emit(f"Processing {doc_name}...", 80)
-        time.sleep(1)  # Simulate server processing
-
-        # TODO: Replace with actual upload logic
-        self.progress_updated.emit(f"Upload complete", 100)
-        self.upload_completed.emit(doc_name)
-
-    def _do_download(self):
-        """Perform document download (simulated remote operation)"""
-        data = self._operation_data
-        doc_name = data['doc_name']
-        save_path = data['save_path']
-
-        self.progress_updated.emit(f"Locating {doc_name}...", 20)
-        time.sleep(0.5)
-
-        self.progress_updated.emit(f"Downloading {doc_name}...", 60)
-        time.sleep(1.5)  # Simulate download time
-
-        self.progress_updated.emit(f"Saving to {save_path}...", 90)
-        time.sleep(0.5)
-
-        # TODO: Replace with actual download logic
-        self.progress_updated.emit("Download complete", 100)
-        self.download_completed.emit(doc_name, save_path)
-
-    def _create_sample_documents(self):
-        """Create sample documents for testing (same as model's sample data)"""
-        # This would be replaced by actual remote data parsing
-        # For now, return the same sample structure as the model
-        return []  # Will be populated by the actual refresh logic
+        return self._submit(
+            self.client.download(doc_name, version, save_path,
+                                 self.progress_updated.emit),
+            'remote_docs_download',
+            lambda path: self.download_completed.emit(doc_name, path),
+            lambda message: self.download_failed.emit(doc_name, message))
 
 
 @dataclass
@@ -185,10 +250,16 @@ class RemoteDocsModel(QObject):
     operation_progress = Signal(str, int)  # operation description, progress %
     operation_completed = Signal()  # operation finished
 
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None,
+                 bridge: Optional[AsyncBridge] = None):
+        """
+        Args:
+            base_url: Document service URL (None simulates the remote store)
+            bridge: AsyncBridge to run operations on (defaults to the shared one)
+        """
         super().__init__()
         self._documents: List[Document] = []
-        self._worker = RemoteDocumentWorker()
+        self._worker = RemoteDocumentWorker(RemoteDocumentClient(base_url), bridge)
         self._is_refreshing = False
         self._initialize_sample_data()
         self._connect_worker_signals()
@@ -459,7 +530,8 @@ class RemoteDocsModel(QObject):
         """Handle successful refresh completion"""
         print(
             f"[RemoteDocsModel] Refresh completed, got {len(updated_documents)} documents")
-        # TODO: Update self._documents with the new data from remote
+        if updated_documents:
+            self._documents = list(updated_documents)
         self._is_refreshing = False
         self.operation_completed.emit()
         self.documents_updated.emit()
@@ -6,12 +6,13 @@ Handles business logic for remote document management.
 from PySide6.QtCore import QObject
 from .view import RemoteDocsView
 from .model import RemoteDocsModel
+from ..tabs.tab_ids import TabId
 
 
 class RemoteDocsPresenter(QObject):
     """Presenter for Remote Docs tab"""
 
-    MODULE_ID = 'remote_docs'
+    MODULE_ID = TabId.REMOTE_DOCS
 
     def __init__(self, context):
         super().__init__()
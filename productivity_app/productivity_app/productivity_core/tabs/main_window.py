@@ -35,9 +35,21 @@ class MainWindow(QMainWindow):
         # Convenience property for accessing tab registry
         self.tab_registry = self.tab_loader.get_tab_registry()
 
-        # Start lazy loading tabs in the background
-        print("[MainWindow] Window ready, starting lazy tab loading...")
-        self.tab_loader.start_loading()
+        # Hidden tabs are built the first time they are shown
+        if self.services.tab_visibility:
+            self.services.tab_visibility.set_tab_loader(self.tab_loader.load_tab)
+
+        # Tabs start loading after the window's first paint (see paintEvent),
+        # so no tab module (or its data libraries) is imported before then
+        self._tab_loading_started = False
+        print("[MainWindow] Window ready, tabs load after first paint...")
+
+    def paintEvent(self, event):
+        """Start lazy tab loading once the empty window has been painted"""
+        super().paintEvent(event)
+        if not self._tab_loading_started:
+            self._tab_loading_started = True
+            QTimer.singleShot(0, self.tab_loader.start_loading)
 
     def _on_tab_loaded(self, tab_id: str, presenter, view, title: str):
         """
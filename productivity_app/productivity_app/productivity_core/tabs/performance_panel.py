@@ -0,0 +1,135 @@
+"""
+Performance Panel - Settings section for the opt-in profiler
+
+Turns span recording on/off, lists the slowest recent operations from the
+profiler's ring buffer and exports the buffer as a Chrome trace.
+"""
+from typing import Optional
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QHeaderView, QFileDialog, QAbstractItemView
+)
+from PySide6.QtCore import Qt, QTimer
+from ..ui.components import (
+    StandardLabel, TextStyle,
+    StandardButton, ButtonRole,
+    StandardCheckBox
+)
+from ..core.profiler import Profiler
+
+
+class PerformancePanel(QWidget):
+    """Profiler controls and the slowest recent operations"""
+
+    # Rows shown in the slowest-operations table
+    SLOWEST_LIMIT = 25
+
+    # Table refresh interval while the panel is visible and recording
+    REFRESH_INTERVAL_MS = 2000
+
+    COLUMNS = ['Operation', 'Category', 'Duration (ms)', 'Thread', 'Details']
+
+    def __init__(self, profiler: Optional[Profiler] = None, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.profiler = profiler or Profiler.shared()
+
+        self._setup_ui()
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._on_refresh_timer)
+        self._refresh_timer.start()
+
+        self.refresh()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        help_label = StandardLabel(
+            "Record how long tab loading, data loads, searches, filters and "
+            "table updates take. Recording stays on across restarts, so "
+            "the next launch's startup is captured too. Export the recording "
+            "as a Chrome trace to view it in chrome://tracing or Perfetto.",
+            style=TextStyle.NOTES
+        )
+        help_label.setWordWrap(True)
+        layout.addWidget(help_label)
+
+        self.enabled_checkbox = StandardCheckBox("Record operation timings")
+        self.enabled_checkbox.setChecked(self.profiler.enabled)
+        self.enabled_checkbox.clicked.connect(self._on_enabled_clicked)
+        layout.addWidget(self.enabled_checkbox)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.Stretch)
+        self.table.setMinimumHeight(200)
+        layout.addWidget(self.table)
+
+        self.summary_label = StandardLabel("", style=TextStyle.NOTES)
+        layout.addWidget(self.summary_label)
+
+        button_layout = QHBoxLayout()
+        self.refresh_btn = StandardButton("Refresh", role=ButtonRole.SECONDARY)
+        self.refresh_btn.clicked.connect(self.refresh)
+        button_layout.addWidget(self.refresh_btn)
+
+        self.clear_btn = StandardButton("Clear", role=ButtonRole.SECONDARY)
+        self.clear_btn.clicked.connect(self._on_clear)
+        button_layout.addWidget(self.clear_btn)
+
+        self.export_btn = StandardButton(
+            "Export Chrome Trace...", role=ButtonRole.PRIMARY)
+        self.export_btn.clicked.connect(self._on_export)
+        button_layout.addWidget(self.export_btn)
+
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        """Show the slowest operations currently in the buffer"""
+        records = self.profiler.slowest(self.SLOWEST_LIMIT)
+        self.table.setRowCount(len(records))
+        for row, record in enumerate(records):
+            details = ', '.join(f"{key}={value}" for key, value in record.args.items())
+            duration = QTableWidgetItem(f"{record.duration_ms:.1f}")
+            duration.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.table.setItem(row, 0, QTableWidgetItem(record.name))
+            self.table.setItem(row, 1, QTableWidgetItem(record.category))
+            self.table.setItem(row, 2, duration)
+            self.table.setItem(row, 3, QTableWidgetItem(record.thread_name))
+            self.table.setItem(row, 4, QTableWidgetItem(details))
+
+        count = len(self.profiler.records())
+        state = "recording" if self.profiler.enabled else "not recording"
+        self.summary_label.setText(
+            f"{count} of the last {self.profiler.capacity} operations kept ({state})")
+        self.export_btn.setEnabled(count > 0)
+
+    def _on_refresh_timer(self):
+        if self.isVisible() and self.profiler.enabled:
+            self.refresh()
+
+    def _on_enabled_clicked(self, checked: bool):
+        self.profiler.set_enabled(checked)
+        self.refresh()
+
+    def _on_clear(self):
+        self.profiler.clear()
+        self.refresh()
+
+    def _on_export(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Chrome Trace",
+            "productivity_app_trace.json",
+            "Chrome Trace (*.json);;All Files (*)"
+        )
+        if file_path:
+            count = self.profiler.export_chrome_trace(file_path)
+            self.summary_label.setText(f"Exported {count} operations to {file_path}")
@@ -21,17 +21,15 @@ from .visibility_persistence import (
     _ensure_tab_visibility_config,
     SUB_TAB_VISIBILITY_CONFIG
 )
-from ..document_scanner.document_scanner_tab import DocumentScannerModuleView
-from ..connector.connector_tab import ConnectorModuleView
-from ..epd.epd_tab import EpdModuleView
-from ..devops.devops_tab import DevOpsModuleView
+from .tab_ids import TabId
+from .performance_panel import PerformancePanel
 
 
 class SettingsTab(QWidget):
     """Settings tab for application configuration"""
 
     TAB_TITLE = "⚙️ Settings"
-    MODULE_ID = 'settings'
+    MODULE_ID = TabId.SETTINGS
 
     # Signal emitted when tab visibility changes
     # Emits tuple: (tab_name: str, visible: bool)
@@ -242,6 +240,15 @@ class SettingsTab(QWidget):
         flags_group.setLayout(flags_layout)
         layout.addWidget(flags_group)
 
+        # Performance Section (opt-in profiler)
+        performance_group = StandardGroupBox("Performance", collapsible=True)
+        performance_layout = QVBoxLayout()
+        self.performance_panel = PerformancePanel(
+            self.services.get('profiler') if self.services else None)
+        performance_layout.addWidget(self.performance_panel)
+        performance_group.setLayout(performance_layout)
+        layout.addWidget(performance_group)
+
         # Action Buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -338,11 +345,6 @@ class SettingsTab(QWidget):
 
         # Notify the parent tab's presenter directly
         if self.tab_registry and parent_tab in self.tab_registry:
-            from ..document_scanner.document_scanner_tab import DocumentScannerModuleView
-            from ..connector.connector_tab import ConnectorModuleView
-            from ..epd.epd_tab import EpdModuleView
-            from ..devops.devops_tab import DevOpsModuleView
-
             # Get all visibility for the parent tab
             visibility = SubTabVisibilityConfig.get_all_sub_tab_visibility(
                 parent_tab)
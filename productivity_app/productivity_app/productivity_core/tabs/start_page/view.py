@@ -12,6 +12,7 @@ from ...core.config_manager import AppSettingsConfig
 from .data import get_tile_data
 from .components import create_tile
 from .theme import get_scrollbar_stylesheet, BACKGROUND, ACCENT_BLUE, TEXT_MUTED
+from ..tab_ids import TabId
 
 
 class StartPageView(QWidget):
@@ -24,7 +25,7 @@ class StartPageView(QWidget):
     """
 
     TAB_TITLE = "🏠 Start Page"
-    MODULE_ID = 'start_page'
+    MODULE_ID = TabId.START_PAGE
     CONFIG_KEY = 'start_page_closed'
 
     def __init__(self, services: Optional[AppContext] = None, parent: Optional[QWidget] = None):
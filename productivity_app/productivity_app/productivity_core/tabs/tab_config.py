@@ -10,12 +10,17 @@ Centralized configuration for all application tabs including:
 - Start page tile configuration
 
 Configuration Structure:
-    - id: Unique identifier for the tab (pulled from module's MODULE_ID)
-    - presenter_class: The presenter/view class to instantiate
+    - id: Unique identifier for the tab (a TabId constant from tab_ids.py)
+    - presenter_class: The presenter/view class to instantiate, as a dotted
+      path relative to productivity_core (imported on first load, so startup
+      does not import every module) or a class
     - init_args: Lambda function returning arguments for __init__ (services, deps)
-    - delay_ms: Milliseconds to wait before loading (for lazy loading)
+    - delay_ms: Earliest time after startup (ms) the tab's widgets are built;
+      the focused tab ignores it
     - dependencies: List of tab IDs that must be loaded first
-    - visible: Default visibility on startup
+    - preload: Optional function(services) that starts the tab's model data
+      loading on the background pool before any widgets are built
+    - visible: Default visibility on startup (hidden tabs load on first show)
     - view_from_presenter: Whether to get view from presenter.view property
     - default_focus: Whether this tab should be focused on startup
 
@@ -28,37 +33,83 @@ Tile Configuration (What is displayed on Start Page):
     - user_guide_url: Optional URL for user guide
 """
 
-from typing import Dict, List, Callable, Optional, Any
+import importlib
+from typing import Dict, List, Callable, Optional, Any, Union
 from ..core.app_context import AppContext
-from ..epd.epd_presenter import EpdPresenter
-from ..presenters.connectors_presenter import ConnectorsPresenter
-from ..presenters.fault_presenter import FaultFindingPresenter
-from ..document_scanner import DocumentScannerModuleView
-from ..remote_docs import RemoteDocsPresenter
-from ..devops import DevOpsPresenter
-from .settings_tab import SettingsTab
-from .start_page import StartPageView
+from .tab_ids import TabId
+
+# Package that lazy class references are relative to (productivity_core)
+_PACKAGE = __package__.rsplit('.', 1)[0]
+
+
+def resolve_class(ref: Union[str, type]) -> type:
+    """
+    Resolve a lazy class reference.
+
+    Args:
+        ref: Dotted path relative to productivity_core
+            (e.g. 'epd.epd_presenter.EpdPresenter'), or a class
+
+    Returns:
+        The class (importing its module on first use)
+    """
+    if not isinstance(ref, str):
+        return ref
+    module_path, _, class_name = ref.rpartition('.')
+    module = importlib.import_module(f"{_PACKAGE}.{module_path}")
+    return getattr(module, class_name)
+
+
+# ============================================================================
+# MODEL PRELOADING
+# ============================================================================
+
+
+def preload_model(services: AppContext, service_name: str,
+                  model_class: Union[str, type]) -> Any:
+    """
+    Create a tab's model and start its background data load.
+
+    The model is registered in AppContext under service_name; the tab's
+    presenter picks it up from there instead of creating its own.
+
+    Args:
+        services: Application context
+        service_name: Context key for the model (e.g. 'epd_model')
+        model_class: Model class (or lazy reference) taking the context,
+            with load_async()
+
+    Returns:
+        The (possibly already registered) model
+    """
+    model = services.get(service_name)
+    if model is None:
+        model = resolve_class(model_class)(services)
+        services.register(service_name, model)
+    model.load_async()
+    return model
 
 
 # ============================================================================
 # TAB CONFIGURATION
 # ============================================================================
 # To add a new tab:
-# 1. Import the presenter class above
-# 2. Add an entry to TAB_CONFIG list below with tile config
+# 1. Add its ID to TabId in tab_ids.py
+# 2. Add an entry to TAB_CONFIG list below with tile config, referencing the
+#    presenter by dotted path (don't import it here - that defeats lazy loading)
 # 3. Set default_focus=True on ONE tab to make it focused on startup
 #
 # init_args signature: lambda services, deps: [args...]
 #   - services: AppContext (service provider/dependency injection)
 #   - deps: Dict of loaded tab presenters this tab depends on
 #
-# MODULE_ID is pulled from the module's class definition (single source of truth)
+# IDs come from tab_ids.py (single source of truth, shared with MODULE_ID)
 # ============================================================================
 
 TAB_CONFIG: List[Dict[str, Any]] = [
     {
-        'id': StartPageView.MODULE_ID,
-        'presenter_class': StartPageView,
+        'id': TabId.START_PAGE,
+        'presenter_class': 'tabs.start_page.view.StartPageView',
         'init_args': lambda services, deps: [services],
         'delay_ms': 0,
         'view_from_presenter': False,
@@ -77,8 +128,8 @@ TAB_CONFIG: List[Dict[str, Any]] = [
         },
     },
     {
-        'id': SettingsTab.MODULE_ID,
-        'presenter_class': SettingsTab,
+        'id': TabId.SETTINGS,
+        'presenter_class': 'tabs.settings_tab.SettingsTab',
         'init_args': lambda services, deps: [services],
         'delay_ms': 0,
         'view_from_presenter': False,
@@ -97,9 +148,11 @@ TAB_CONFIG: List[Dict[str, Any]] = [
         },
     },
     {
-        'id': ConnectorsPresenter.MODULE_ID,
-        'presenter_class': ConnectorsPresenter,
+        'id': TabId.CONNECTORS,
+        'presenter_class': 'presenters.connectors_presenter.ConnectorsPresenter',
         'init_args': lambda services, deps: [services],
+        'preload': lambda services: preload_model(
+            services, 'connector_model', 'connector.connector_model.ConnectorModel'),
         'delay_ms': 50,
         'visible': True,
         'default_focus': False,
@@ -116,9 +169,11 @@ TAB_CONFIG: List[Dict[str, Any]] = [
         },
     },
     {
-        'id': EpdPresenter.MODULE_ID,
-        'presenter_class': EpdPresenter,
+        'id': TabId.EPD,
+        'presenter_class': 'epd.epd_presenter.EpdPresenter',
         'init_args': lambda services, deps: [services],
+        'preload': lambda services: preload_model(
+            services, 'epd_model', 'epd.epd_model.EpdModel'),
         'delay_ms': 100,
         'visible': True,
         'default_focus': False,
@@ -135,8 +190,8 @@ TAB_CONFIG: List[Dict[str, Any]] = [
         },
     },
     {
-        'id': DocumentScannerModuleView.MODULE_ID,
-        'presenter_class': DocumentScannerModuleView,
+        'id': TabId.DOCUMENT_SCANNER,
+        'presenter_class': 'document_scanner.document_scanner_tab.DocumentScannerModuleView',
         'init_args': lambda services, deps: [services],
         'delay_ms': 200,
         'view_from_presenter': False,
@@ -155,8 +210,8 @@ TAB_CONFIG: List[Dict[str, Any]] = [
         },
     },
     {
-        'id': FaultFindingPresenter.MODULE_ID,
-        'presenter_class': FaultFindingPresenter,
+        'id': TabId.FAULT_FINDING,
+        'presenter_class': 'presenters.fault_presenter.FaultFindingPresenter',
         'init_args': lambda services, deps: [services, deps['epd'].model],
         'delay_ms': 300,
         'dependencies': ['epd'],
@@ -174,8 +229,8 @@ TAB_CONFIG: List[Dict[str, Any]] = [
         },
     },
     {
-        'id': RemoteDocsPresenter.MODULE_ID,
-        'presenter_class': RemoteDocsPresenter,
+        'id': TabId.REMOTE_DOCS,
+        'presenter_class': 'remote_docs.presenter.RemoteDocsPresenter',
         'init_args': lambda services, deps: [services],
         'delay_ms': 400,
         'visible': True,
@@ -192,8 +247,8 @@ TAB_CONFIG: List[Dict[str, Any]] = [
         },
     },
     {
-        'id': DevOpsPresenter.MODULE_ID,
-        'presenter_class': DevOpsPresenter,
+        'id': TabId.DEVOPS,
+        'presenter_class': 'devops.devops_presenter.DevOpsPresenter',
         'init_args': lambda services, deps: [services],
         'delay_ms': 450,
         'visible': True,
@@ -218,7 +273,8 @@ def get_tab_title(tab_config: Dict[str, Any]) -> str:
     Extract tab title from presenter class.
 
     Tries to get title from:
-    1. presenter_class.title (class attribute)
+    1. presenter_class.title (class attribute), if presenter_class is a
+       class - lazy references are not imported just for a title
     2. Falls back to tab_config['id'] formatted as Title Case
 
     Args:
@@ -230,7 +286,7 @@ def get_tab_title(tab_config: Dict[str, Any]) -> str:
     presenter_class = tab_config['presenter_class']
 
     # Try to get title from class attribute
-    if hasattr(presenter_class, 'title'):
+    if not isinstance(presenter_class, str) and hasattr(presenter_class, 'title'):
         return presenter_class.title
 
     # Fall back to formatting the ID
@@ -0,0 +1,99 @@
+"""
+Tab Identifiers
+
+Module and sub-tab identifiers as plain constants. This module imports
+nothing, so tab configuration and visibility settings can use the IDs
+without importing any view, widget or data library.
+
+Module views mix in their sub-tab class, so existing references such as
+EpdModuleView.SUB_TAB_SEARCH keep working.
+"""
+
+
+class TabId:
+    """Top-level tab identifiers (MODULE_ID of each tab)"""
+    START_PAGE = 'start_page'
+    SETTINGS = 'settings'
+    CONNECTORS = 'connectors'
+    EPD = 'epd'
+    DOCUMENT_SCANNER = 'document_scanner'
+    FAULT_FINDING = 'fault_finding'
+    REMOTE_DOCS = 'remote_docs'
+    DEVOPS = 'devops'
+
+
+# ============================================================================
+# SUB-TAB IDENTIFIERS - Single source of truth
+# ============================================================================
+# All code that references sub-tabs should use these constants
+# When renaming: update here and everything else auto-updates
+# ============================================================================
+
+class DocumentScannerTabs:
+    """Document Scanner module and sub-tab identifiers"""
+    MODULE_ID = TabId.DOCUMENT_SCANNER
+
+    SUB_TAB_SEARCH = 'search'
+    SUB_TAB_CONFIGURATION = 'configuration'
+    SUB_TAB_HISTORY = 'history'
+    SUB_TAB_COMPARE_VERSIONS = 'compare_versions'
+
+    # Ordered list of all sub-tabs (used for iteration)
+    SUB_TAB_ORDER = [
+        SUB_TAB_SEARCH,
+        SUB_TAB_CONFIGURATION,
+        SUB_TAB_HISTORY,
+        SUB_TAB_COMPARE_VERSIONS,
+    ]
+
+    # Display names (for UI labels)
+    SUB_TAB_LABELS = {
+        SUB_TAB_SEARCH: 'Search',
+        SUB_TAB_CONFIGURATION: 'Configuration',
+        SUB_TAB_HISTORY: 'History',
+        SUB_TAB_COMPARE_VERSIONS: 'Compare Versions',
+    }
+
+
+class ConnectorTabs:
+    """Connector module and sub-tab identifiers"""
+    MODULE_ID = TabId.CONNECTORS
+
+    SUB_TAB_LOOKUP = 'lookup'
+    SUB_TAB_CHECK_MULTIPLE = 'check_multiple'
+
+    SUB_TAB_ORDER = [
+        SUB_TAB_LOOKUP,
+        SUB_TAB_CHECK_MULTIPLE,
+    ]
+
+    SUB_TAB_LABELS = {
+        SUB_TAB_LOOKUP: 'Lookup',
+        SUB_TAB_CHECK_MULTIPLE: 'Check Multiple',
+    }
+
+
+class EpdTabs:
+    """EPD module and sub-tab identifiers"""
+    MODULE_ID = TabId.EPD
+
+    SUB_TAB_SEARCH = 'search'
+    SUB_TAB_IDENTIFY_BEST = 'identify_best'
+
+    SUB_TAB_ORDER = [SUB_TAB_SEARCH, SUB_TAB_IDENTIFY_BEST]
+    SUB_TAB_LABELS = {
+        SUB_TAB_SEARCH: 'Search',
+        SUB_TAB_IDENTIFY_BEST: 'Identify Best',
+    }
+
+
+class DevOpsTabs:
+    """DevOps module and sub-tab identifiers"""
+    MODULE_ID = TabId.DEVOPS
+
+    SUB_TAB_QUERY_VIEWER = 'query_viewer'
+
+    SUB_TAB_ORDER = [SUB_TAB_QUERY_VIEWER]
+    SUB_TAB_LABELS = {
+        SUB_TAB_QUERY_VIEWER: 'Query Viewer',
+    }
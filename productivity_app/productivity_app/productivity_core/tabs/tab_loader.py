@@ -3,13 +3,44 @@ Tab Loader
 
 Handles lazy loading of tabs with dependency resolution and scheduling.
 Separates tab loading logic from MainWindow for better organization.
+
+Loading order:
+1. Every tab that will be built at startup has its model data load started
+   on the background pool first ('preload' in TAB_CONFIG), so data loads in
+   parallel while widgets are constructed.
+2. Widgets are built on the UI thread one tab per event-loop turn: the
+   focused tab first, then visible tabs in TAB_CONFIG order, each after its
+   dependencies (a DAG built from 'dependencies').
+3. Hidden tabs are not built at startup; load_tab() builds them (and any
+   missing dependencies) the first time they are shown.
 """
 
-from typing import Dict, List, Any, Callable, Optional
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
 from PySide6.QtWidgets import QTabWidget
 from PySide6.QtCore import QTimer, QObject, Signal
 from ..core.app_context import AppContext
-from .tab_config import TAB_CONFIG, get_tab_title
+from ..core.app_logging import get_logger
+from ..core.profiler import profile_span
+from .tab_config import TAB_CONFIG, get_tab_title, resolve_class
+
+logger = get_logger(__name__)
+
+# Load priorities (lower loads first); dependencies inherit their dependent's
+PRIORITY_FOCUSED = 0
+PRIORITY_VISIBLE = 1
+
+
+@dataclass
+class TabLoadTiming:
+    """Timing of one tab load"""
+    tab_id: str
+    reason: str  # 'focused', 'visible', 'dependency' or 'on_demand'
+    status: str  # 'loaded' or 'error'
+    preload_ms: float  # UI-thread time starting the model load (the load runs on the pool)
+    build_ms: float  # UI-thread time constructing the presenter and view
+    ready_at_ms: float  # Time since start_loading() when the tab was ready
 
 
 class TabLoader(QObject):
@@ -17,10 +48,11 @@ class TabLoader(QObject):
     Manages lazy loading of application tabs.
 
     Handles:
-    - Sequential loading with configurable delays
-    - Dependency resolution (loads dependencies first)
+    - Dependency resolution (a DAG over TAB_CONFIG 'dependencies')
+    - Prioritised loading (focused tab, then visible tabs; hidden tabs on demand)
+    - Starting model data loads on the background pool before widget construction
     - Tab instantiation and registration
-    - Progress tracking and error handling
+    - Per-tab load timings and error handling
 
     Emits signals for loading events to allow MainWindow to react.
     """
@@ -28,80 +60,254 @@ class TabLoader(QObject):
     # Signals
     # (tab_id, presenter, view, title)
     tab_loaded = Signal(str, object, object, str)
-    loading_complete = Signal()  # All tabs loaded
+    loading_complete = Signal()  # All startup tabs loaded (hidden tabs load on demand)
     loading_error = Signal(str, Exception)  # (tab_id, error)
 
-    def __init__(self, services: AppContext, tab_widget: QTabWidget):
+    def __init__(self, services: AppContext, tab_widget: QTabWidget,
+                 tab_config: Optional[List[Dict[str, Any]]] = None):
         """
         Initialize the tab loader.
 
         Args:
             services: Application service provider (dependency injection)
             tab_widget: The QTabWidget where tabs will be added
+            tab_config: Tab configuration list (defaults to TAB_CONFIG)
         """
         super().__init__()
         self.services = services
         self.tab_widget = tab_widget
         self.tab_registry: Dict[str, Dict[str, Any]] = {}
-        self._pending_tabs: List[Dict] = []
         self._loading_complete = False
 
+        if tab_config is None:
+            tab_config = TAB_CONFIG
+        self._configs: Dict[str, Dict] = {cfg['id']: cfg for cfg in tab_config}
+        self._order: Dict[str, int] = {
+            cfg['id']: i for i, cfg in enumerate(tab_config)}
+
+        # tab_id -> (priority, reason) of tabs to build at startup
+        self._requested: Dict[str, Tuple[int, str]] = {}
+        self._done: Set[str] = set()  # Built or failed
+        self._preloaded: Set[str] = set()
+        self._preload_ms: Dict[str, float] = {}
+        self._timings: List[TabLoadTiming] = []
+        self._started_at = time.perf_counter()
+        self._timer_pending = False
+
     def start_loading(self):
         """
         Start the lazy loading sequence.
 
-        Loads tabs in order defined by TAB_CONFIG with configured delays.
+        Starts model preloads for all startup tabs, then builds their widgets
+        in priority order.
         """
-        print("[TabLoader] Starting lazy tab loading...")
+        logger.debug("Starting lazy tab loading")
+        self._started_at = time.perf_counter()
+
+        for tab_id in self._find_cycles():
+            self._fail(tab_id, 'dependency', RuntimeError(
+                f"Circular dependency involving '{tab_id}'"))
 
-        # Create loading queue from config
-        self._pending_tabs = [config.copy() for config in TAB_CONFIG]
+        for tab_id, config in self._configs.items():
+            if tab_id in self._done:
+                continue
+            if config.get('default_focus', False):
+                self._request(tab_id, PRIORITY_FOCUSED, 'focused')
+            elif self._is_visible(tab_id):
+                self._request(tab_id, PRIORITY_VISIBLE, 'visible')
+
+        # Start data loads before any widget is built, most urgent first
+        for tab_id in sorted(self._requested, key=self._rank):
+            self._preload(tab_id)
 
-        # Schedule the first tab to load
         self._schedule_next_tab()
 
+    # ------------------------------------------------------------------
+    # Dependency graph
+    # ------------------------------------------------------------------
+
+    def _dependencies(self, tab_id: str) -> List[str]:
+        return self._configs[tab_id].get('dependencies', [])
+
+    def _find_cycles(self) -> List[str]:
+        """Tab IDs that are part of (or depend on) a dependency cycle"""
+        # Kahn's algorithm: whatever cannot be ordered sits on a cycle
+        remaining = {
+            tab_id: {dep for dep in self._dependencies(tab_id) if dep in self._configs}
+            for tab_id in self._configs}
+        ready = [tab_id for tab_id, deps in remaining.items() if not deps]
+        while ready:
+            tab_id = ready.pop()
+            del remaining[tab_id]
+            for other, deps in remaining.items():
+                if tab_id in deps:
+                    deps.discard(tab_id)
+                    if not deps:
+                        ready.append(other)
+        return sorted(remaining, key=self._order.get)
+
+    def _request(self, tab_id: str, priority: int, reason: str):
+        """Queue a tab (and its dependencies) for startup loading"""
+        if tab_id not in self._configs or tab_id in self._done:
+            return
+        existing = self._requested.get(tab_id)
+        if existing is not None and existing[0] <= priority:
+            return
+        self._requested[tab_id] = (
+            priority, existing[1] if existing is not None else reason)
+        for dep_id in self._dependencies(tab_id):
+            self._request(dep_id, priority, 'dependency')
+
+    def _is_visible(self, tab_id: str) -> bool:
+        """Whether a tab is shown at startup (user setting, else config default)"""
+        visibility = getattr(self.services, 'tab_visibility', None)
+        if visibility is not None:
+            return visibility.is_tab_visible(tab_id)
+        return self._configs[tab_id].get('visible', True)
+
+    def _rank(self, tab_id: str) -> Tuple[int, int]:
+        return (self._requested[tab_id][0], self._order[tab_id])
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started_at) * 1000
+
+    def _not_before_ms(self, tab_id: str) -> int:
+        if self._requested[tab_id][0] == PRIORITY_FOCUSED:
+            return 0
+        return self._configs[tab_id].get('delay_ms', 0)
+
     def _schedule_next_tab(self):
-        """Schedule the next tab in the queue to load."""
-        if not self._pending_tabs:
-            # All tabs loaded
-            self._on_loading_complete()
+        """Schedule a build of the most urgent tab whose dependencies are loaded."""
+        if self._timer_pending:
+            return
+
+        pending = [tab_id for tab_id in self._requested if tab_id not in self._done]
+        if not pending:
+            if not self._loading_complete:
+                self._on_loading_complete()
             return
 
-        tab_config = self._pending_tabs.pop(0)
+        ready = [tab_id for tab_id in pending
+                 if all(dep in self._done or dep not in self._configs
+                        for dep in self._dependencies(tab_id))]
+        if not ready:
+            # Only reachable if a dependency was never requested
+            for tab_id in pending:
+                self._fail(tab_id, self._requested[tab_id][1], RuntimeError(
+                    f"Dependencies of '{tab_id}' could not be scheduled"))
+            self._schedule_next_tab()
+            return
+
+        elapsed = self._elapsed_ms()
+        wait_ms = 0 if any(self._not_before_ms(t) <= elapsed for t in ready) \
+            else min(self._not_before_ms(t) for t in ready) - elapsed
+
+        # One tab per event-loop turn keeps the UI responsive while loading
+        self._timer_pending = True
+        QTimer.singleShot(max(0, int(wait_ms)), self._load_next_tab)
+
+    def _load_next_tab(self):
+        self._timer_pending = False
+        elapsed = self._elapsed_ms()
+        ready = [tab_id for tab_id in self._requested
+                 if tab_id not in self._done
+                 and self._not_before_ms(tab_id) <= elapsed
+                 and all(dep in self._done or dep not in self._configs
+                         for dep in self._dependencies(tab_id))]
+        if ready:
+            tab_id = min(ready, key=self._rank)
+            self._load_tab(tab_id, self._requested[tab_id][1])
+        self._schedule_next_tab()
 
-        # Schedule this tab to load after its configured delay
-        QTimer.singleShot(
-            tab_config['delay_ms'],
-            lambda: self._load_tab(tab_config)
-        )
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
 
-    def _load_tab(self, tab_config: Dict):
+    def load_tab(self, tab_id: str) -> bool:
+        """
+        Load a tab now (used when a hidden tab is first shown).
+
+        Missing dependencies are loaded first.
+
+        Args:
+            tab_id: Tab identifier
+
+        Returns:
+            True if the tab is loaded
+        """
+        if tab_id in self.tab_registry:
+            return True
+        if tab_id not in self._configs:
+            logger.error("Tab '%s' not found in TAB_CONFIG", tab_id)
+            return False
+        if tab_id in self._done:
+            return False  # Failed earlier
+
+        self._load_with_dependencies(tab_id, 'on_demand')
+        return tab_id in self.tab_registry
+
+    def _load_with_dependencies(self, tab_id: str, reason: str):
+        for dep_id in self._dependencies(tab_id):
+            if dep_id in self._configs and dep_id not in self._done:
+                self._load_with_dependencies(dep_id, 'dependency')
+        if tab_id not in self._done:
+            self._load_tab(tab_id, reason)
+
+    def _preload(self, tab_id: str):
+        """Start a tab's model data load (runs once per tab)"""
+        preload = self._configs[tab_id].get('preload')
+        if preload is None or tab_id in self._preloaded:
+            return
+        self._preloaded.add(tab_id)
+
+        started = time.perf_counter()
+        try:
+            with profile_span(f'tab.preload:{tab_id}', 'tabs'):
+                preload(self.services)
+        except Exception as e:
+            # The presenter will load its own data instead
+            logger.exception("Preload failed for %s: %s", tab_id, e)
+        self._preload_ms[tab_id] = (time.perf_counter() - started) * 1000
+
+    def _load_tab(self, tab_id: str, reason: str):
         """
         Load a single tab from configuration.
 
-        Handles dependency resolution, instantiation, and registration.
+        Handles instantiation and registration; dependencies must already be
+        loaded.
 
         Args:
-            tab_config: Tab configuration dict from TAB_CONFIG
+            tab_id: Tab identifier
+            reason: Why the tab is loading (for timing reports)
         """
-        tab_id = tab_config['id']
-        print(f"[TabLoader] Loading {tab_id} tab...")
+        tab_config = self._configs[tab_id]
+        logger.debug("Loading %s tab", tab_id)
+        self._preload(tab_id)
+        started = time.perf_counter()
+        span = profile_span(f'tab.build:{tab_id}', 'tabs', reason=reason)
 
         try:
-            # Check and resolve dependencies
-            self._resolve_dependencies(tab_config)
+            dependencies = tab_config.get('dependencies', [])
+            missing = [dep_id for dep_id in dependencies
+                       if dep_id not in self.tab_registry]
+            if missing:
+                raise RuntimeError(
+                    f"Dependencies not loaded: {', '.join(missing)}")
 
             # Build dependency map for init_args
-            dependencies = tab_config.get('dependencies', [])
             dep_map = {dep_id: self.tab_registry[dep_id]['presenter']
-                       for dep_id in dependencies if dep_id in self.tab_registry}
+                       for dep_id in dependencies}
 
             # Get init arguments
             init_args_func = tab_config['init_args']
             init_args = init_args_func(self.services, dep_map)
 
-            # Instantiate presenter/view
-            presenter_class = tab_config['presenter_class']
+            # Instantiate presenter/view (lazy references import the module now)
+            presenter_class = resolve_class(tab_config['presenter_class'])
             presenter = presenter_class(*init_args)
 
             # Get view (some classes are the view, others have .view property)
@@ -112,60 +318,58 @@ class TabLoader(QObject):
                 view = presenter
                 title = get_tab_title(tab_config)
 
-            # Store in registry
-            self.tab_registry[tab_id] = {
-                'presenter': presenter,
-                'view': view,
-                'title': title
-            }
-
-            # Emit signal that tab was loaded
-            self.tab_loaded.emit(tab_id, presenter, view, title)
-
-            print(f"[TabLoader] ✓ {tab_id} tab loaded")
-
         except Exception as e:
-            print(f"[TabLoader] ✗ Error loading {tab_id} tab: {e}")
-            import traceback
-            traceback.print_exc()
-
-            # Emit error signal
-            self.loading_error.emit(tab_id, e)
-
-        # Schedule next tab
-        self._schedule_next_tab()
-
-    def _resolve_dependencies(self, tab_config: Dict):
-        """
-        Ensure all dependencies for a tab are loaded.
-
-        If a dependency is not loaded, loads it immediately before continuing.
-
-        Args:
-            tab_config: Tab configuration dict
-        """
-        dependencies = tab_config.get('dependencies', [])
-        if not dependencies:
+            logger.exception("Error loading %s tab: %s", tab_id, e)
+            span.finish(error=type(e).__name__)
+            self._fail(tab_id, reason, e, started)
             return
 
-        for dep_id in dependencies:
-            if dep_id not in self.tab_registry:
-                print(
-                    f"[TabLoader] Warning: Dependency '{dep_id}' not loaded, loading now...")
-
-                # Find and load dependency immediately
-                dep_config = next(
-                    (cfg for cfg in TAB_CONFIG if cfg['id'] == dep_id), None)
-
-                if dep_config:
-                    self._load_tab(dep_config)
-                else:
-                    print(
-                        f"[TabLoader] ERROR: Dependency '{dep_id}' not found in TAB_CONFIG")
+        # Store in registry
+        self.tab_registry[tab_id] = {
+            'presenter': presenter,
+            'view': view,
+            'title': title
+        }
+        self._done.add(tab_id)
+        span.finish()
+        timing = self._record_timing(tab_id, reason, 'loaded', started)
+
+        # Emit signal that tab was loaded
+        self.tab_loaded.emit(tab_id, presenter, view, title)
+
+        logger.info("%s tab loaded in %.0f ms (%s, ready at %.0f ms)",
+                    tab_id, timing.build_ms, reason, timing.ready_at_ms)
+
+    def _fail(self, tab_id: str, reason: str, error: Exception,
+              started: Optional[float] = None):
+        """Mark a tab as failed and report it"""
+        self._done.add(tab_id)
+        self._record_timing(tab_id, reason, 'error', started or time.perf_counter())
+        self.loading_error.emit(tab_id, error)
+
+    def _record_timing(self, tab_id: str, reason: str, status: str,
+                       started: float) -> TabLoadTiming:
+        now = time.perf_counter()
+        timing = TabLoadTiming(
+            tab_id=tab_id,
+            reason=reason,
+            status=status,
+            preload_ms=self._preload_ms.get(tab_id, 0.0),
+            build_ms=(now - started) * 1000,
+            ready_at_ms=(now - self._started_at) * 1000)
+        self._timings.append(timing)
+        return timing
 
     def _on_loading_complete(self):
-        """Called when all tabs have been loaded."""
-        print("[TabLoader] ✓ All tabs loaded successfully")
+        """Called when all startup tabs have been loaded."""
+        logger.info("All tabs loaded successfully")
+        for timing in self._timings:
+            logger.debug("  %-20s %-10s preload %6.1f ms  build %6.1f ms  ready at %7.1f ms",
+                         timing.tab_id, timing.reason, timing.preload_ms,
+                         timing.build_ms, timing.ready_at_ms)
+        deferred = [tab_id for tab_id in self._configs if tab_id not in self._done]
+        if deferred:
+            logger.debug("Hidden tabs load on first show: %s", ', '.join(deferred))
         self._loading_complete = True
 
         # Emit completion signal
@@ -180,8 +384,12 @@ class TabLoader(QObject):
         """
         return self.tab_registry
 
+    def get_load_timings(self) -> List[TabLoadTiming]:
+        """Timings of loaded (and failed) tabs, in load order"""
+        return list(self._timings)
+
     def is_loading_complete(self) -> bool:
-        """Check if all tabs have been loaded."""
+        """Check if all startup tabs have been loaded."""
         return self._loading_complete
 
     def get_presenter(self, tab_id: str) -> Optional[Any]:
@@ -7,9 +7,10 @@ Handles both UI state (through TabVisibilityManager) and persistence (through co
 This service is registered in AppContext and can be accessed by any component.
 """
 
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from PySide6.QtWidgets import QTabWidget
 from PySide6.QtCore import QObject, Signal
+from ..core.config_manager import AppSettingsConfig, ConfigManager
 from .tab_visibility_manager import TabVisibilityManager
 from .visibility_persistence import TabVisibilityPersistence, _ensure_tab_visibility_config
 
@@ -40,6 +41,12 @@ class TabVisibilityService(QObject):
         super().__init__()
         self._ui_manager: Optional[TabVisibilityManager] = None
         self._initialized = False
+        self._load_tab: Optional[Callable[[str], bool]] = None
+
+        # Persisted visibility, kept current by config change notifications
+        self._visibility: Dict[str, bool] = dict(
+            TabVisibilityPersistence.get_visibility_settings())
+        ConfigManager.subscribe(AppSettingsConfig.CONFIG_NAME, self._on_settings_changed)
 
     def initialize(self, tab_widget: QTabWidget, tab_registry: Dict[str, Dict[str, Any]]):
         """
@@ -59,6 +66,40 @@ class TabVisibilityService(QObject):
         self._initialized = True
         print("[TabVisibilityService] Initialized with UI manager")
 
+    def set_tab_loader(self, load_tab: Callable[[str], bool]):
+        """
+        Set the function that loads a tab that has not been loaded yet.
+
+        Hidden tabs are not built at startup; showing one loads it first.
+
+        Args:
+            load_tab: Function taking a tab ID, returning True if loaded
+                (e.g. TabLoader.load_tab)
+        """
+        self._load_tab = load_tab
+
+    def _ensure_loaded(self, tab_id: str):
+        """Load a tab on first show, if a tab loader is set"""
+        if tab_id not in self._ui_manager.tab_registry and self._load_tab is not None:
+            self._load_tab(tab_id)
+
+    def _on_settings_changed(self, changed_keys):
+        """Apply visibility persisted elsewhere (e.g. Settings reset) to the UI"""
+        if TabVisibilityPersistence.CONFIG_KEY not in changed_keys:
+            return
+        settings = TabVisibilityPersistence.get_visibility_settings()
+        for tab_id, visible in settings.items():
+            if self._visibility.get(tab_id) == visible:
+                continue
+            self._visibility[tab_id] = visible
+            if self._initialized:
+                if visible:
+                    self._ensure_loaded(tab_id)
+                    self._ui_manager.show_tab(tab_id)
+                else:
+                    self._ui_manager.hide_tab(tab_id)
+            self.tab_visibility_changed.emit(tab_id, visible)
+
     def set_tab_as_visible(self, tab_id: str, persist: bool = False) -> bool:
         """
         Show a tab and optionally persist the change.
@@ -75,11 +116,13 @@ class TabVisibilityService(QObject):
                 f"[TabVisibilityService] Not initialized, cannot show tab '{tab_id}'")
             return False
 
-        # Update UI
+        # Update UI (loading the tab if this is its first show)
+        self._ensure_loaded(tab_id)
         success = self._ui_manager.show_tab(tab_id)
 
         if success and persist:
             # Persist to config
+            self._visibility[tab_id] = True
             TabVisibilityPersistence.set_tab_visibility(tab_id, True)
             # Emit signal
             self.tab_visibility_changed.emit(tab_id, True)
@@ -107,6 +150,7 @@ class TabVisibilityService(QObject):
 
         if success and persist:
             # Persist to config
+            self._visibility[tab_id] = False
             TabVisibilityPersistence.set_tab_visibility(tab_id, False)
             # Emit signal
             self.tab_visibility_changed.emit(tab_id, False)
@@ -127,8 +171,8 @@ class TabVisibilityService(QObject):
         if check_ui and self._initialized:
             return self._ui_manager.is_tab_visible(tab_id)
         else:
-            # Check persisted config
-            return TabVisibilityPersistence.get_tab_visibility(tab_id)
+            # Persisted config (cached, updated on change)
+            return self._visibility.get(tab_id, True)
 
     def set_focus(self, tab_id: str) -> bool:
         """
@@ -178,7 +222,7 @@ class TabVisibilityService(QObject):
         Returns:
             Dict mapping tab_id -> visible (True/False)
         """
-        return TabVisibilityPersistence.get_visibility_settings()
+        return dict(self._visibility)
 
     def set_all_visibility_settings(self, settings: Dict[str, bool]) -> bool:
         """
@@ -191,12 +235,14 @@ class TabVisibilityService(QObject):
             True if successful, False otherwise
         """
         # Save to config
+        self._visibility.update(settings)
         success = TabVisibilityPersistence.set_visibility_settings(settings)
 
         if success and self._initialized:
             # Apply each setting to UI
             for tab_id, visible in settings.items():
                 if visible:
+                    self._ensure_loaded(tab_id)
                     self._ui_manager.show_tab(tab_id)
                 else:
                     self._ui_manager.hide_tab(tab_id)
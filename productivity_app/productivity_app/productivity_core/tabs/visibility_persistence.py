@@ -12,10 +12,7 @@ All settings are persisted to JSON via AppSettingsConfig.
 
 from typing import Dict, List
 from ..core.config_manager import AppSettingsConfig
-from ..document_scanner.document_scanner_tab import DocumentScannerModuleView
-from ..connector.connector_tab import ConnectorModuleView
-from ..epd.epd_tab import EpdModuleView
-from ..devops.devops_tab import DevOpsModuleView
+from .tab_ids import DocumentScannerTabs, ConnectorTabs, EpdTabs, DevOpsTabs
 
 
 # ============================================================================
@@ -74,35 +71,36 @@ def _ensure_tab_visibility_config():
 # SUB-TAB VISIBILITY CONFIGURATION
 # ============================================================================
 # Define sub-tabs for modules that have internal tabs
-# References constants from module views to avoid magic strings
+# References constants from tab_ids (not the module views, which pull in
+# every widget and data library) to avoid magic strings
 # Structure: {parent_tab_id: [{'id': 'subtab_id', 'label': 'Display Name', 'default': True}, ...]}
 # ============================================================================
 
 SUB_TAB_VISIBILITY_CONFIG = {
-    DocumentScannerModuleView.MODULE_ID: [
-        {'id': DocumentScannerModuleView.SUB_TAB_SEARCH,
+    DocumentScannerTabs.MODULE_ID: [
+        {'id': DocumentScannerTabs.SUB_TAB_SEARCH,
             'label': 'Search', 'default': True},
-        {'id': DocumentScannerModuleView.SUB_TAB_CONFIGURATION,
+        {'id': DocumentScannerTabs.SUB_TAB_CONFIGURATION,
             'label': 'Configuration', 'default': True},
-        {'id': DocumentScannerModuleView.SUB_TAB_HISTORY,
+        {'id': DocumentScannerTabs.SUB_TAB_HISTORY,
             'label': 'History', 'default': True},
-        {'id': DocumentScannerModuleView.SUB_TAB_COMPARE_VERSIONS,
+        {'id': DocumentScannerTabs.SUB_TAB_COMPARE_VERSIONS,
             'label': 'Compare Versions', 'default': False},
     ],
-    ConnectorModuleView.MODULE_ID: [
-        {'id': ConnectorModuleView.SUB_TAB_LOOKUP,
+    ConnectorTabs.MODULE_ID: [
+        {'id': ConnectorTabs.SUB_TAB_LOOKUP,
             'label': 'Lookup', 'default': True},
-        {'id': ConnectorModuleView.SUB_TAB_CHECK_MULTIPLE,
+        {'id': ConnectorTabs.SUB_TAB_CHECK_MULTIPLE,
             'label': 'Check Multiple', 'default': True},
     ],
-    EpdModuleView.MODULE_ID: [
-        {'id': EpdModuleView.SUB_TAB_SEARCH,
+    EpdTabs.MODULE_ID: [
+        {'id': EpdTabs.SUB_TAB_SEARCH,
             'label': 'Search', 'default': True},
-        {'id': EpdModuleView.SUB_TAB_IDENTIFY_BEST,
+        {'id': EpdTabs.SUB_TAB_IDENTIFY_BEST,
             'label': 'Identify Best', 'default': True},
     ],
-    DevOpsModuleView.MODULE_ID: [
-        {'id': DevOpsModuleView.SUB_TAB_QUERY_VIEWER,
+    DevOpsTabs.MODULE_ID: [
+        {'id': DevOpsTabs.SUB_TAB_QUERY_VIEWER,
             'label': 'Query Viewer', 'default': True},
     ],
 }
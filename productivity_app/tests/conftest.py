@@ -1,10 +1,23 @@
 """
 Pytest fixtures and configuration for productivity_app tests
 """
+import os
+
 import pytest
 import pandas as pd
 from typing import Dict, List, Any
 
+# Widget tests run without a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """One QApplication for the whole run (widgets need it, and Qt allows
+    only one application object per process)"""
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
 
 @pytest.fixture
 def sample_connector_data() -> List[Dict[str, Any]]:
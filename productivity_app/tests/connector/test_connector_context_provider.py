@@ -0,0 +1,45 @@
+"""
+Tests for the Connector context provider's lookup cache
+"""
+import pytest
+
+from productivity_app.productivity_core.connector.connector_context_provider import (
+    ConnectorContextProvider)
+from productivity_app.productivity_core.connector.connector_model import ConnectorModel
+from productivity_app.productivity_core.core.task_scheduler import TaskScheduler
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = TaskScheduler(max_threads=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def model(scheduler, sample_connector_data):
+    model = ConnectorModel({'task_scheduler': scheduler})
+    model.data = {'connectors': sample_connector_data}
+    return model
+
+
+def test_lookups_are_cached_with_a_bound(model, monkeypatch):
+    provider = ConnectorContextProvider(model)
+    monkeypatch.setattr(ConnectorContextProvider, 'LOOKUP_CACHE_SIZE', 2)
+
+    assert provider._lookup_connector('D38999-26WA35PN')['Part Number'] == 'D38999/26WA35PN'
+    provider._lookup_connector('VALUE-1')
+    provider._lookup_connector('D38999-26WA35PN')  # Most recently used again
+    provider._lookup_connector('VALUE-2')
+
+    assert list(provider._lookup_cache) == ['D38999-26WA35PN', 'VALUE-2']
+
+
+def test_cache_is_cleared_when_connectors_reload(model):
+    provider = ConnectorContextProvider(model)
+    provider._lookup_connector('D38999-26WA35PN')
+    assert provider._lookup_cache
+
+    model.data_loaded.emit(model.get_all())
+
+    assert not provider._lookup_cache
@@ -0,0 +1,107 @@
+"""
+Tests for ConnectorModel's use of the local data store
+"""
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from productivity_app.productivity_core.connector import connector_model
+from productivity_app.productivity_core.connector.connector_model import ConnectorModel
+from productivity_app.productivity_core.core.local_data_store import LocalDataStore
+from productivity_app.productivity_core.core.task_scheduler import TaskScheduler
+
+
+def _wait_for(condition, timeout=10.0):
+    """Process queued signals until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = TaskScheduler(max_threads=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def store():
+    store = LocalDataStore(':memory:')
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def model(scheduler, store):
+    return ConnectorModel({'task_scheduler': scheduler, 'data_store': store})
+
+
+def test_rows_are_written_to_the_store_off_the_ui_thread(model, store, monkeypatch):
+    monkeypatch.setattr(connector_model.time, 'sleep', lambda seconds: None)
+    writers = []
+    replace_table = store.replace_table
+
+    def recording_replace_table(*args, **kwargs):
+        writers.append(threading.get_ident())
+        return replace_table(*args, **kwargs)
+
+    monkeypatch.setattr(store, 'replace_table', recording_replace_table)
+    loaded = []
+    model.data_loaded.connect(loaded.append)
+
+    model.load_async()
+    _wait_for(lambda: loaded)
+
+    assert len(writers) == 1
+    assert writers[0] != threading.get_ident()
+    assert store.count(ConnectorModel.STORE_TABLE) == len(loaded[0]['connectors'])
+    assert 'connectors' not in model.data
+    assert model.get_families() == loaded[0]['families']
+
+
+def test_connectors_are_streamed_from_the_store(model, store, sample_connector_data,
+                                                monkeypatch):
+    store.replace_table(ConnectorModel.STORE_TABLE, sample_connector_data,
+                        metadata={'families': ['D38999', 'VG']})
+    model.data = store.get_metadata(ConnectorModel.STORE_TABLE)
+
+    def fetch_all(table):
+        raise AssertionError("every row fetched at once")
+
+    monkeypatch.setattr(store, 'fetch_all', fetch_all)
+
+    assert list(model.iter_connectors()) == sample_connector_data
+    matches = model.match_part_number('d38999-26wa35pn', fuzzy=False)
+    assert [(c['Part Number'], d) for c, d in matches] == [('D38999/26WA35PN', 0)]
+    assert model.get_all(limit=2)['connectors'] == sample_connector_data[:2]
+    assert model.get_all()['families'] == ['D38999', 'VG']
+
+
+def test_part_number_index_is_built_once_by_concurrent_callers(model, store,
+                                                                sample_connector_data,
+                                                                monkeypatch):
+    store.replace_table(ConnectorModel.STORE_TABLE, sample_connector_data)
+    builds = []
+    iter_connectors = model.iter_connectors
+
+    def slow_iter_connectors():
+        builds.append(threading.get_ident())
+        time.sleep(0.05)
+        return iter_connectors()
+
+    monkeypatch.setattr(model, 'iter_connectors', slow_iter_connectors)
+    indexes = []
+    threads = [threading.Thread(target=lambda: indexes.append(model.part_number_index()))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(index is indexes[0] for index in indexes)
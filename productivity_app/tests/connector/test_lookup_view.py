@@ -0,0 +1,70 @@
+"""
+Tests for the Connector Lookup view's recent searches
+"""
+import pytest
+from PySide6.QtWidgets import QMessageBox
+
+from productivity_app.productivity_core.connector.Lookup.view import LookupConnectorView
+from productivity_app.productivity_core.core.search_history import SearchHistoryStore
+
+SCOPE = LookupConnectorView.HISTORY_SCOPE
+
+
+@pytest.fixture
+def history():
+    store = SearchHistoryStore(':memory:')
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def view(qapp, history):
+    return LookupConnectorView({'search_history': history})
+
+
+def _search(view, result_count, first_result=None, **filters):
+    view.add_search_to_history(filters, result_count, first_result)
+    view._close_modification_window()
+
+
+def test_history_records_the_query_not_the_description(view, history):
+    _search(view, 25, {'Part Number': 'P1', 'Part Code': 'C1'}, search_text='D38999')
+    _search(view, 30, search_text='d38999 ')
+    _search(view, 4, search_text='D38999', material=['Aluminum'])
+
+    assert [entry.term for entry in history.recent(SCOPE)] == [
+        'D38999 + Aluminum', 'd38999']
+    assert history.get(SCOPE, 'D38999').result_count == 30
+    assert sorted(history.complete(SCOPE, 'd38')) == ['D38999 + Aluminum', 'd38999']
+    assert list(view.recent_searches) == [
+        'D38999 + Aluminum (4 results)', 'd38999 (30 results)']
+
+
+def test_recent_searches_are_restored_in_a_new_session(view, history, qapp):
+    _search(view, 25, {'Part Number': 'P1', 'Part Code': 'C1'}, search_text='D38999')
+
+    restored = LookupConnectorView({'search_history': history})
+
+    assert list(restored.recent_searches) == ['D38999 (25 results) | P1 - C1']
+    assert restored.recent_searches_data['D38999 (25 results) | P1 - C1'] == {
+        'search_text': 'D38999'}
+
+
+def test_reset_keeps_history(view, history):
+    _search(view, 25, search_text='D38999')
+
+    view._on_reset_clicked()
+
+    assert history.count(SCOPE) == 1
+    assert list(view.recent_searches) == ['D38999 (25 results)']
+
+
+@pytest.mark.parametrize('answer, remaining', [(QMessageBox.No, 1), (QMessageBox.Yes, 0)])
+def test_clear_history_asks_first(view, history, monkeypatch, answer, remaining):
+    _search(view, 25, search_text='D38999')
+    monkeypatch.setattr(QMessageBox, 'question', lambda *args: answer)
+
+    view._on_clear_history_clicked()
+
+    assert history.count(SCOPE) == remaining
+    assert len(view.recent_searches) == remaining
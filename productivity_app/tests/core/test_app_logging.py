@@ -0,0 +1,57 @@
+"""
+Tests for leveled, sampled, queue-based application logging
+"""
+import json
+import logging
+
+import pytest
+from productivity_app.productivity_core.core import app_logging
+from productivity_app.productivity_core.core.app_logging import (
+    configure_logging, fields, get_logger, parse_level_spec, sample,
+    shutdown_logging)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / 'app.jsonl'
+    configure_logging('WARNING,document_scanner=DEBUG', json_file=path)
+    yield path
+    shutdown_logging()
+    for name in ('productivity_app', 'productivity_app.productivity_core.document_scanner'):
+        logging.getLogger(name).setLevel(logging.NOTSET)
+
+
+def _records(path):
+    shutdown_logging()  # Flushes the queue
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_parse_level_spec():
+    default, modules = parse_level_spec('info, connector=WARNING ,bogus=LOUD')
+    assert default == logging.INFO
+    assert modules == {'productivity_app.productivity_core.connector': logging.WARNING}
+
+
+def test_module_levels_and_structured_fields(log_file):
+    scanner = get_logger('productivity_app.productivity_core.document_scanner.searchable_document')
+    connector = get_logger('productivity_app.productivity_core.connector.connector_model')
+
+    scanner.debug("Found %d match(es)", 3, extra=fields(column='Part'))
+    connector.info("not shown")
+    connector.warning("shown")
+
+    records = _records(log_file)
+    assert [r['message'] for r in records] == ['Found 3 match(es)', 'shown']
+    assert records[0]['column'] == 'Part'
+    assert records[0]['level'] == 'DEBUG'
+
+
+def test_hot_path_messages_are_sampled(log_file):
+    logger = get_logger('document_scanner.threaded_context_manager')
+    assert logger.name.startswith(app_logging.CORE_PACKAGE)
+    for i in range(250):
+        logger.debug("item %d", i, extra=sample(100))
+
+    records = _records(log_file)
+    assert [r['message'] for r in records] == ['item 0', 'item 100', 'item 200']
+    assert records[0]['sampled'] == 100
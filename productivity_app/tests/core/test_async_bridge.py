@@ -0,0 +1,256 @@
+"""
+Tests for the asyncio bridge and the network clients built on it
+
+A local ThreadingHTTPServer stands in for the remote services.
+"""
+import concurrent.futures
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+from productivity_app.productivity_core.core import async_http
+from productivity_app.productivity_core.core.async_bridge import AsyncBridge
+from productivity_app.productivity_core.devops.QueryViewer.model import QueryViewerModel
+from productivity_app.productivity_core.remote_docs.model import (
+    RemoteDocumentClient, RemoteDocumentWorker)
+
+DOCUMENTS = [{
+    'name': 'User Manual',
+    'category': 'Documentation',
+    'description': 'Manual',
+    'tags': ['manual'],
+    'versions': [{'version': '1.0', 'upload_date': '2024-10-01T10:00:00',
+                  'size_bytes': 11, 'checksum': 'abc', 'uploader': 'jd'}],
+}]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Routes for the remote docs service and the Azure DevOps WIQL API"""
+
+    uploads = []  # (path, headers, body) of PUT requests
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type='application/json'):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if url.path.startswith('/slow'):
+            time.sleep(0.3)
+            self._send(200, {'ok': True})
+        elif url.path.startswith('/trickle'):
+            # Four parts, 0.1s apart (or one 1s stall)
+            pause = 1.0 if url.path.endswith('/stall') else 0.1
+            self.send_response(200)
+            self.send_header('Content-Length', '4')
+            self.end_headers()
+            for part in b'abcd':
+                time.sleep(pause)
+                self.wfile.write(bytes([part]))
+                self.wfile.flush()
+                if pause > 0.5:
+                    break
+        elif url.path == '/docs/documents':
+            self._send(200, DOCUMENTS)
+        elif url.path == '/docs/documents/User%20Manual/versions/1.0':
+            self._send(200, b'hello world', 'application/octet-stream')
+        elif url.path.endswith('/_apis/wit/workitems'):
+            ids = [int(i) for i in query['ids'][0].split(',')]
+            self._send(200, {'value': [
+                {'id': i, 'fields': {'System.Id': i,
+                                     'System.Title': f"Item {i}",
+                                     'System.AssignedTo': {'displayName': 'Jo'}}}
+                for i in ids]})
+        else:
+            self._send(404, {'message': 'not found'})
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        StubHandler.uploads.append((self.path, dict(self.headers), body))
+        self._send(200, {'ok': True})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if self.path.startswith('/org/proj/_apis/wit/wiql') and \
+                self.headers.get('Authorization', '').startswith('Basic '):
+            assert 'SELECT' in body['query']
+            self._send(200, {
+                'columns': [{'referenceName': 'System.Id', 'name': 'ID'},
+                            {'referenceName': 'System.Title', 'name': 'Title'},
+                            {'referenceName': 'System.AssignedTo', 'name': 'Assigned To'}],
+                'workItems': [{'id': i} for i in range(1, 251)]})
+        else:
+            self._send(401, {'message': 'unauthorized'})
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 64  # Accept all concurrent test connections at once
+
+
+@pytest.fixture(scope='module')
+def qt_app(qapp):
+    return qapp
+
+
+@pytest.fixture(scope='module')
+def server():
+    httpd = StubServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def bridge(qt_app):
+    bridge = AsyncBridge()
+    yield bridge
+    bridge.shutdown()
+
+
+def _wait_for(condition, timeout=5.0):
+    """Process queued signals until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+def test_concurrent_requests_share_one_loop_thread(bridge, server):
+    started = time.perf_counter()
+    tasks = [bridge.submit(async_http.get_json(f"{server}/slow/{i}"))
+             for i in range(20)]
+    results = [task.result(5) for task in tasks]
+    elapsed = time.perf_counter() - started
+
+    assert results == [{'ok': True}] * 20
+    # 20 x 0.3s requests overlapped rather than running one after another
+    assert elapsed < 2.0
+    assert bridge.active_count() == 0
+
+
+def test_error_and_cancel_reach_qt_signals(bridge, server):
+    errors, cancelled = [], []
+    failing = bridge.submit(async_http.get_json(f"{server}/missing"))
+    failing.error.connect(errors.append)
+    slow = bridge.submit(async_http.get_json(f"{server}/slow/cancel"))
+    slow.cancelled.connect(lambda: cancelled.append(True))
+    slow.cancel()
+
+    _wait_for(lambda: errors and cancelled)
+
+    assert 'HTTP 404' in errors[0]
+    assert slow.status == 'cancelled'
+
+
+def test_signals_connected_after_completion_are_not_missed(bridge):
+    """A coroutine finishing before the caller connects still reaches it"""
+    async def instant():
+        return 'done'
+
+    async def failing():
+        raise ValueError('bad query')
+
+    task = bridge.submit(instant())
+    failed = bridge.submit(failing())
+    # Both are done on the loop thread before anything is connected
+    concurrent.futures.wait([task._future, failed._future])
+    _wait_for(lambda: task.status != 'running' and failed.status != 'running')
+    results, errors = [], []
+    task.finished.connect(results.append)
+    failed.error.connect(errors.append)
+
+    _wait_for(lambda: results and errors)
+    assert results == ['done']
+    assert errors == ['bad query']
+
+
+def test_remote_document_worker_lists_and_downloads(bridge, server, tmp_path):
+    worker = RemoteDocumentWorker(RemoteDocumentClient(f"{server}/docs"), bridge)
+    documents, downloads, progress = [], [], []
+    worker.refresh_completed.connect(documents.extend)
+    worker.download_completed.connect(lambda name, path: downloads.append((name, path)))
+    worker.progress_updated.connect(lambda message, percent: progress.append(percent))
+
+    save_path = str(tmp_path / 'manual.txt')
+    worker.refresh_documents()
+    worker.download_document('User Manual', '1.0', save_path)
+    assert worker.isRunning()
+
+    _wait_for(lambda: documents and downloads)
+
+    assert documents[0].name == 'User Manual'
+    assert documents[0].latest_version.size_bytes == 11
+    assert downloads == [('User Manual', save_path)]
+    assert open(save_path, 'rb').read() == b'hello world'
+    assert progress[-1] == 100
+    assert not worker.isRunning()
+
+
+def test_wiql_query_fetches_work_items_in_batches(bridge, server):
+    model = QueryViewerModel(api_base_url=server, bridge=bridge)
+    model.connect_to_azure_devops('org', 'proj', 'secret')
+    results = []
+    model.query_executed.connect(lambda headers, rows: results.append((headers, rows)))
+
+    model.execute_query("SELECT [System.Id] FROM WorkItems")
+    _wait_for(lambda: results)
+
+    headers, rows = results[0]
+    assert headers == ['ID', 'Title', 'Assigned To']
+    assert len(rows) == 250
+    assert rows[0] == ['1', 'Item 1', 'Jo']
+    assert rows[-1][0] == '250'
+
+
+def test_upload_sends_any_metadata_text(bridge, server, tmp_path):
+    path = tmp_path / 'spec.pdf'
+    path.write_bytes(b'%PDF')
+    client = RemoteDocumentClient(f"{server}/docs")
+    description = 'Stecker für 5V\r\nX-Injected: 1'
+
+    task = bridge.submit(client.upload(str(path), 'Spec', 'Données', description,
+                                       ['étiquette', '100%'], lambda *args: None))
+    assert task.result(5) == 'Spec'
+
+    _, headers, body = StubHandler.uploads[-1]
+    assert body == b'%PDF'
+    assert 'X-Injected' not in headers
+    assert unquote(headers['X-Document-Description']) == description
+    assert unquote(headers['X-Document-Category']) == 'Données'
+    assert unquote(headers['X-Document-Tags']) == 'étiquette,100%'
+
+
+def test_invalid_headers_are_rejected(bridge, server):
+    for headers in ({'X-Note': 'a\r\nX-Injected: 1'}, {'X-Note': 'für'},
+                    {'X Note': 'a'}):
+        task = bridge.submit(async_http.get_json(f"{server}/slow/0", headers=headers))
+        with pytest.raises(ValueError):
+            task.result(5)
+
+
+def test_timeout_applies_to_each_read(bridge, server, tmp_path):
+    path = str(tmp_path / 'body')
+    # 0.4s in total, but never 0.25s without data
+    task = bridge.submit(async_http.download(f"{server}/trickle/ok", path, timeout=0.25))
+    assert task.result(5) == 4
+    assert open(path, 'rb').read() == b'abcd'
+
+    stalled = bridge.submit(async_http.download(f"{server}/trickle/stall", path, timeout=0.25))
+    with pytest.raises(TimeoutError):
+        stalled.result(5)
@@ -0,0 +1,92 @@
+"""
+Tests for write-behind, atomic ConfigManager persistence
+"""
+import json
+import os
+import time
+
+import pytest
+from productivity_app.productivity_core.core import config
+from productivity_app.productivity_core.core.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    ConfigManager.flush()
+    monkeypatch.setattr(config, 'CONFIG_DIR', tmp_path)
+    ConfigManager.clear_cache()
+    yield tmp_path
+    ConfigManager.flush()
+    ConfigManager.clear_cache()
+
+
+def test_saves_are_coalesced_into_one_atomic_write(config_dir, monkeypatch):
+    writes = []
+    original = ConfigManager._write_file.__func__
+    monkeypatch.setattr(ConfigManager, '_write_file', classmethod(
+        lambda cls, name, text: writes.append(name) or original(cls, name, text)))
+
+    started = time.perf_counter()
+    for i in range(20):
+        assert ConfigManager.save_config('settings.json', {'count': i})
+    assert time.perf_counter() - started < 0.5
+    assert ConfigManager.load_config('settings.json') == {'count': 19}
+
+    deadline = time.monotonic() + 5
+    while not writes:
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+    assert ConfigManager.flush()
+
+    assert writes == ['settings.json']
+    assert json.loads((config_dir / 'settings.json').read_text()) == {'count': 19}
+    assert [p.name for p in config_dir.iterdir()] == ['settings.json']
+
+
+def test_external_edit_is_reloaded_and_published(config_dir):
+    changes = []
+    ConfigManager.subscribe('app.json', changes.append)
+    try:
+        ConfigManager.save_config('app.json', {'theme': 'dark', 'zoom': 1})
+        ConfigManager.flush()
+        assert changes == [{'theme', 'zoom'}]
+
+        path = config_dir / 'app.json'
+        path.write_text(json.dumps({'theme': 'light', 'zoom': 1}))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert ConfigManager.load_config('app.json') == {'theme': 'light', 'zoom': 1}
+        assert changes[-1] == {'theme'}
+
+        # Saving identical data writes nothing and notifies nobody
+        ConfigManager.save_config('app.json', {'theme': 'light', 'zoom': 1})
+        assert len(changes) == 2
+    finally:
+        ConfigManager.unsubscribe('app.json', changes.append)
+
+
+def test_delete_and_missing_configs_use_default(config_dir):
+    assert ConfigManager.load_config('gone.json', default={'a': 1}) == {'a': 1}
+    ConfigManager.save_config('gone.json', {'a': 2})
+    ConfigManager.flush()
+    assert ConfigManager.delete_config('gone.json')
+    assert ConfigManager.load_config('gone.json', default=[]) == []
+    ConfigManager.flush()
+    assert not (config_dir / 'gone.json').exists()
+
+
+def test_loaded_data_is_a_copy(config_dir):
+    settings = {'recent': ['a']}
+    ConfigManager.save_config('copy.json', settings)
+    settings['recent'].append('unsaved')
+
+    loaded = ConfigManager.load_config('copy.json')
+    loaded['recent'].append('also unsaved')
+
+    assert ConfigManager.load_config('copy.json') == {'recent': ['a']}
+    ConfigManager.flush()
+    ConfigManager.clear_cache()
+    reloaded = ConfigManager.load_config('copy.json')
+    reloaded['recent'].clear()
+    assert ConfigManager.load_config('copy.json') == {'recent': ['a']}
@@ -0,0 +1,74 @@
+"""
+Tests for the streaming Excel reader
+"""
+import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from productivity_app.productivity_core.core.excel_reader import (
+    compact_dtypes, read_excel_sheet)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """Sheet with a title, blank and duplicate headers and gaps in the data"""
+    book = Workbook()
+    sheet = book.active
+    for row in [
+        ['Parts list'],
+        [None],
+        ['Part', 'Qty', None, 'Part', None, 'Note'],
+        ['D38999/20', 1.0, None, 2.5],
+        [None],
+        ['VG95234', 'NA', '', 3, datetime.datetime(2024, 1, 1)],
+        ['EN2997', 4, 'x', None, True],
+        [None, None],
+    ]:
+        sheet.append(row)
+    book.create_sheet('Other').append(['only'])
+    path = tmp_path / 'parts.xlsx'
+    book.save(path)
+    return path
+
+
+class TestReadExcelSheet:
+    """Tests for read_excel_sheet"""
+
+    @pytest.mark.parametrize('header, nrows', [
+        (None, None), (0, None), (1, None), (2, None), (0, 2), (2, 2), (2, 3)])
+    def test_matches_pandas(self, workbook, header, nrows):
+        """Streaming gives the frame pd.read_excel gives"""
+        expected = pd.read_excel(workbook, header=header, nrows=nrows)
+        result = read_excel_sheet(workbook, header=header, nrows=nrows, engine='openpyxl')
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_reads_only_wanted_columns(self, workbook):
+        result = read_excel_sheet(workbook, header=2, usecols=['Note', 'Part.1', 'Missing'],
+                                  engine='openpyxl')
+        assert list(result.columns) == ['Part.1', 'Note']
+        assert result['Part.1'].tolist()[:1] == [2.5]
+
+    def test_sheet_by_name(self, workbook):
+        assert read_excel_sheet(workbook, 'Other', header=None).iloc[0, 0] == 'only'
+
+    def test_reports_progress(self, workbook, monkeypatch):
+        from productivity_app.productivity_core.core import excel_reader
+        monkeypatch.setattr(excel_reader, 'PROGRESS_ROWS', 2)
+        calls = []
+        read_excel_sheet(workbook, header=2, engine='openpyxl',
+                         progress=lambda rows, total: calls.append((rows, total)))
+        assert calls == [(2, 5), (4, 5), (4, 4)]
+
+
+def test_compact_dtypes():
+    df = pd.DataFrame({
+        'Qty': [1, 2, 3, 4],
+        'Type': ['plug', 'plug', 'receptacle', None],
+        'Part': ['a', 'b', 'c', 'd'],
+    })
+    compact_dtypes(df)
+    assert df['Qty'].dtype == 'int8'
+    assert df['Type'].dtype == 'category'
+    assert df['Part'].dtype == object
@@ -0,0 +1,118 @@
+"""
+Tests for the SQLite-backed local data store
+
+Uses an in-memory database so no files are written.
+"""
+import pytest
+from productivity_app.productivity_core.core.local_data_store import LocalDataStore
+
+
+@pytest.fixture
+def store(sample_connector_data):
+    """In-memory store populated with the sample connectors"""
+    store = LocalDataStore(':memory:')
+    store.replace_table(
+        'connectors',
+        sample_connector_data,
+        facet_columns=['Family', 'Material'],
+        metadata={'families': ['D38999', 'VG', 'MS', 'EN']})
+    yield store
+    store.close()
+
+
+class TestLocalDataStore:
+    """Tests for LocalDataStore"""
+
+    def test_replace_table_round_trip(self, store, sample_connector_data):
+        """Rows come back unchanged and in insertion order"""
+        assert store.has_table('connectors')
+        assert store.count('connectors') == len(sample_connector_data)
+        assert store.fetch_all('connectors') == sample_connector_data
+        assert store.columns('connectors') == list(sample_connector_data[0].keys())
+
+    def test_metadata_is_kept_with_table(self, store):
+        """Extra metadata is stored alongside the table"""
+        assert store.get_metadata('connectors') == {
+            'families': ['D38999', 'VG', 'MS', 'EN']}
+
+    def test_text_search_is_case_insensitive_substring(self, store):
+        """Free-text search keeps 'contains' semantics"""
+        results = store.query('connectors', search_text='26wa')
+
+        assert [r['Part Number'] for r in results] == ['D38999/26WA35PN']
+
+    def test_text_search_treats_wildcards_literally(self, store):
+        """LIKE wildcards in user text must not match everything"""
+        assert store.query('connectors', search_text='%') == []
+        assert store.query('connectors', search_text='_') == []
+
+    def test_facet_filter(self, store):
+        """Facet filters match any of the given values"""
+        results = store.query('connectors', facets={'Family': ['VG', 'EN']})
+
+        assert {r['Family'] for r in results} == {'VG', 'EN'}
+        assert len(results) == 3
+
+    def test_text_and_facets_combined(self, store):
+        """Text search and facets are ANDed"""
+        results = store.query(
+            'connectors', search_text='plug', facets={'Material': ['Aluminum']})
+
+        assert all(r['Material'] == 'Aluminum' for r in results)
+        assert all('Plug' in r['Shell Type'] for r in results)
+        assert len(results) == 2
+
+    def test_distinct_values_respects_facets(self, store):
+        """Distinct values are sorted and restricted by facets"""
+        assert store.distinct_values('connectors', 'Family') == [
+            'D38999', 'EN', 'MS', 'VG']
+        assert store.distinct_values(
+            'connectors', 'Material', {'Family': ['MS']}) == ['Aluminum']
+
+    def test_delete_and_append_rows(self, store):
+        """Rows can be replaced per key without rewriting the table"""
+        deleted = store.delete_rows('connectors', 'Family', ['D38999'])
+        store.append_rows('connectors', [{'Part Number': 'NEW-1', 'Family': 'D38999'}])
+
+        assert deleted == 3
+        results = store.query('connectors', search_text='d38999')
+        assert [r['Part Number'] for r in results] == ['NEW-1']
+
+    def test_replace_rows_is_one_transaction(self, store, monkeypatch):
+        """Rows are swapped together, or not at all when the insert fails"""
+        written = store.replace_rows(
+            'connectors', 'Family', ['VG'], [{'Part Number': 'VG-NEW', 'Family': 'VG'}])
+        assert written == 1
+        assert [r['Part Number'] for r in store.query('connectors', facets={'Family': ['VG']})] == [
+            'VG-NEW']
+
+        def failing_insert(*args):
+            raise RuntimeError("disk full")
+
+        before = store.fetch_all('connectors')
+        monkeypatch.setattr(store, '_insert_rows', failing_insert)
+        with pytest.raises(RuntimeError):
+            store.replace_rows('connectors', 'Family', ['D38999'], [{'Family': 'D38999'}])
+        assert store.fetch_all('connectors') == before
+
+    def test_replace_rows_creates_missing_table(self, store):
+        store.replace_rows('e3', 'Project', ['A'], [{'Project': 'A', 'Part': 'x'}],
+                           facet_columns=['Project'])
+        assert store.query('e3', facets={'Project': ['A']}) == [{'Project': 'A', 'Part': 'x'}]
+
+    def test_iter_rows_reads_pages(self, store, sample_connector_data):
+        """Rows stream in insertion order across page boundaries"""
+        assert list(store.iter_rows('connectors', batch_size=2)) == sample_connector_data
+
+        rows = store.iter_rows('connectors', columns=['Part Number', 'Nope'], batch_size=2)
+        assert [r for r in rows] == [
+            {'Part Number': r['Part Number']} for r in sample_connector_data]
+        assert list(store.iter_rows('nothing')) == []
+
+    def test_missing_table_returns_empty(self):
+        """Queries against unknown tables return empty results"""
+        store = LocalDataStore(':memory:')
+
+        assert not store.has_table('nothing')
+        assert store.query('nothing', search_text='x') == []
+        assert store.count('nothing') == 0
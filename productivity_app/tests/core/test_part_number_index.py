@@ -0,0 +1,66 @@
+"""
+Tests for normalized and fuzzy part number matching
+"""
+import random
+
+from productivity_app.productivity_core.core.part_number_index import (
+    PartNumberIndex, canonical_part_number, edit_distance)
+
+
+def make_index(max_distance=1):
+    index = PartNumberIndex(max_distance=max_distance)
+    for part in ['D38999/26WA35PN', 'D38999/26WA35SN', 'D38999/20WC10PN',
+                 'VG95234F10A001PN', 'MS3470L1610P']:
+        index.add(part, part)
+    return index
+
+
+class TestPartNumberIndex:
+    """Tests for PartNumberIndex"""
+
+    def test_spellings_share_a_canonical_key(self):
+        assert canonical_part_number('D38999/26WA35PN') == 'd3899926wa35pn'
+        assert canonical_part_number(' d38999-26 wa35pn ') == 'd3899926wa35pn'
+        assert canonical_part_number(None) == ''
+
+    def test_exact_match_ignores_punctuation_and_case(self):
+        index = make_index()
+        for spelling in ['D38999-26WA35PN', 'd3899926wa35pn', 'D38999 26 WA35PN']:
+            matches = index.match(spelling)
+            assert [m.values for m in matches] == [['D38999/26WA35PN']]
+            assert matches[0].exact
+
+    def test_close_matches_are_one_edit_away(self):
+        index = make_index()
+        # Substitution, transposition, missing character
+        assert [m.text for m in index.match('D38999/20WC1OPN')] == ['D38999/20WC10PN']
+        assert [m.text for m in index.match('MS3470L1601P')] == ['MS3470L1610P']
+        assert [m.text for m in index.match('VG95234F10A01PN')] == ['VG95234F10A001PN']
+        # Two edits away, or too short to guess
+        assert index.match('D38999/20WC11SN') == []
+        assert index.match('MS347') == []
+
+    def test_ambiguous_spelling_returns_every_closest_match(self):
+        index = make_index()
+        matches = index.match('D38999/26WA35XN')
+        assert sorted(m.text for m in matches) == ['D38999/26WA35PN', 'D38999/26WA35SN']
+        assert all(m.distance == 1 for m in matches)
+
+    def test_fuzzy_agrees_with_brute_force(self):
+        rng = random.Random(7)
+        keys = {''.join(rng.choices('ab12', k=rng.randint(6, 9))) for _ in range(100)}
+        index = PartNumberIndex(max_distance=2)
+        for key in keys:
+            index.add(key)
+
+        for _ in range(50):
+            query = ''.join(rng.choices('ab12', k=rng.randint(6, 9)))
+            expected = {key for key in keys if edit_distance(query, key) <= 2}
+            assert {m.key for m in index.fuzzy(query)} == expected
+
+    def test_match_many_queries_each_spelling(self):
+        index = make_index()
+        results = index.match_many(['D38999-26WA35PN', 'd3899926wa35pn', 'unknown'])
+        assert results['D38999-26WA35PN'][0].text == 'D38999/26WA35PN'
+        assert results['d3899926wa35pn'][0].text == 'D38999/26WA35PN'
+        assert results['unknown'] == []
@@ -0,0 +1,67 @@
+"""
+Tests for the opt-in span profiler
+"""
+import json
+import threading
+
+import pytest
+from productivity_app.productivity_core.core.profiler import Profiler, profiled
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    profiler = Profiler(capacity=3, enabled=True)
+    monkeypatch.setattr(Profiler, '_shared', profiler)
+    return profiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler(enabled=False)
+    with profiler.span('load', 'model') as span:
+        span.finish(rows=1)
+    assert profiler.records() == []
+
+
+def test_ring_buffer_keeps_latest_spans(profiler):
+    for i in range(5):
+        with profiler.span(f'op{i}', 'test', index=i):
+            pass
+    assert [r.name for r in profiler.records()] == ['op2', 'op3', 'op4']
+
+    span = profiler.span('late', 'test')
+    span.finish(rows=10)
+    span.finish(rows=20)  # Ignored
+    assert profiler.records()[-1].args == {'rows': 10}
+
+
+def test_decorator_records_errors_and_reraises(profiler):
+    @profiled('work', 'test')
+    def work(fail):
+        if fail:
+            raise ValueError('bad')
+        return 42
+
+    assert work(False) == 42
+    with pytest.raises(ValueError):
+        work(True)
+    assert [r.args for r in profiler.records()] == [{}, {'error': 'ValueError'}]
+
+
+def test_chrome_trace_export(profiler, tmp_path):
+    with profiler.span('ui', 'tabs'):
+        pass
+    thread = threading.Thread(
+        target=lambda: profiler.span('load', 'model').finish(rows=3), name='Pool-1')
+    thread.start()
+    thread.join()
+
+    path = tmp_path / 'trace.json'
+    assert profiler.export_chrome_trace(str(path)) == 2
+
+    events = json.loads(path.read_text())['traceEvents']
+    spans = [e for e in events if e['ph'] == 'X']
+    assert [(e['name'], e['cat']) for e in spans] == [('ui', 'tabs'), ('load', 'model')]
+    assert spans[1]['args'] == {'rows': 3}
+    assert spans[0]['tid'] != spans[1]['tid']
+    thread_names = {e['args']['name'] for e in events if e['ph'] == 'M'}
+    assert 'Pool-1' in thread_names
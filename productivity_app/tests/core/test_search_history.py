@@ -0,0 +1,86 @@
+"""
+Tests for the shared search history store
+
+Uses an in-memory database so no files are written.
+"""
+import pytest
+from productivity_app.productivity_core.core.search_history import (
+    SearchHistoryStore, RANK_HALF_LIFE_SECONDS)
+
+SCOPE = 'document_scanner'
+DAY = 24 * 3600
+NOW = 1_800_000_000.0
+
+
+@pytest.fixture
+def history():
+    store = SearchHistoryStore(':memory:')
+    yield store
+    store.close()
+
+
+class TestSearchHistoryStore:
+    """Tests for SearchHistoryStore"""
+
+    def test_recent_lists_distinct_terms_newest_first(self, history):
+        """Repeated terms move to the front instead of being listed twice"""
+        history.record(SCOPE, 'D38999', searched_at=NOW)
+        history.record(SCOPE, 'VG95234', searched_at=NOW + 1)
+        history.record(SCOPE, 'd38999 ', searched_at=NOW + 2)
+
+        assert [e.term for e in history.recent(SCOPE)] == ['d38999', 'VG95234']
+        assert history.count(SCOPE) == 2
+        assert history.log_size(SCOPE) == 3
+
+    def test_result_count_is_kept_for_rerun(self, history):
+        """The latest known result count is returned without re-searching"""
+        history.record(SCOPE, 'D38999', result_count=25, searched_at=NOW)
+        history.record(SCOPE, 'D38999', searched_at=NOW + 1)
+
+        entry = history.get(SCOPE, 'd38999')
+        assert entry.uses == 2
+        assert entry.result_count == 25
+
+    def test_ranked_prefers_frequent_then_recent(self, history):
+        """Frequent terms outrank one-off ones until their uses age"""
+        for i in range(3):
+            history.record(SCOPE, 'frequent', searched_at=NOW + i)
+        history.record(SCOPE, 'once', searched_at=NOW + 10)
+        assert [e.term for e in history.ranked(SCOPE)] == ['frequent', 'once']
+
+        # Three uses two half-lives ago weigh less than one use now
+        history.record(SCOPE, 'new', searched_at=NOW + 2 * RANK_HALF_LIFE_SECONDS)
+        assert history.ranked(SCOPE, limit=1)[0].term == 'new'
+
+    def test_complete_matches_prefix_case_insensitively(self, history):
+        """Completion returns terms starting with the prefix, best first"""
+        history.record(SCOPE, 'D38999/20', searched_at=NOW)
+        history.record(SCOPE, 'D38999/26', searched_at=NOW + DAY)
+        history.record(SCOPE, 'D38990', searched_at=NOW + DAY)
+        history.record(SCOPE, 'VG95234', searched_at=NOW + DAY)
+
+        assert history.complete(SCOPE, 'd38999') == ['D38999/26', 'D38999/20']
+        assert history.complete(SCOPE, 'x') == []
+
+    def test_scopes_are_separate(self, history):
+        """Each feature only sees its own history"""
+        history.record(SCOPE, 'D38999', searched_at=NOW)
+        history.record('connector_lookup', 'D38999', payload={'filters': {'search_text': 'D38999'}},
+                       searched_at=NOW)
+
+        history.clear(SCOPE)
+        assert history.recent(SCOPE) == []
+        entry = history.get('connector_lookup', 'D38999')
+        assert entry.payload == {'filters': {'search_text': 'D38999'}}
+
+    def test_import_terms_keeps_order(self, history):
+        """Older most-recent-first lists keep their order"""
+        assert history.import_terms(SCOPE, ['newest', 'middle', 'oldest', ' '], NOW) == 3
+        assert [e.term for e in history.recent(SCOPE)] == ['newest', 'middle', 'oldest']
+
+    def test_remove_forgets_term(self, history):
+        history.record(SCOPE, 'D38999', searched_at=NOW)
+        assert history.remove(SCOPE, 'D38999')
+        assert not history.remove(SCOPE, 'D38999')
+        assert history.get(SCOPE, 'D38999') is None
+        assert history.log_size(SCOPE) == 0
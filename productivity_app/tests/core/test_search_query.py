@@ -0,0 +1,90 @@
+"""
+Tests for the boolean search query language
+"""
+import pandas as pd
+import pytest
+
+from productivity_app.productivity_core.core.search_query import (
+    TextColumns, compile_query)
+
+
+@pytest.fixture
+def source():
+    return TextColumns(pd.DataFrame({
+        'Part Number': ['D38999/26WA35PN', 'D38999/20WC10PN', 'VG95234F10A001PN', 'MS3470L16-10P'],
+        'Material': ['Aluminum', 'Stainless Steel', 'Aluminum', 'Composite'],
+        'Shell Type': ['26 - Plug', '20 - Receptacle', 'Plug', '26 - Plug'],
+    }))
+
+
+def rows(query, source, **options):
+    return compile_query(query, **options).mask(source).nonzero()[0].tolist()
+
+
+class TestSearchQuery:
+    """Tests for compile_query and SearchQuery.mask"""
+
+    def test_plain_text_is_one_substring(self, source):
+        """Words, spaces and dashes without operators keep their meaning"""
+        assert rows('26 - plug', source) == [0, 3]
+        assert rows('ALUMINUM', source) == [0, 2]
+        assert compile_query('26 - Plug').plain_text == '26 - plug'
+
+    def test_boolean_operators(self, source):
+        assert rows('aluminum AND plug', source) == [0, 2]
+        assert rows('vg OR ms', source) == [2, 3]
+        assert rows('vg | ms', source) == [2, 3]
+        assert rows('plug NOT aluminum', source) == [3]
+        assert rows('plug AND -aluminum', source) == [3]
+        assert rows('(d38999 OR vg) AND NOT receptacle', source) == [0, 2]
+
+    def test_commas_are_alternatives_only_when_enabled(self, source):
+        assert rows('d38999, vg', source, comma_or=True) == [0, 1, 2]
+        assert rows('d38999, vg', source) == []
+
+    def test_column_scoped_terms(self, source):
+        assert rows('Material:steel', source) == [1]
+        assert rows('"Shell Type":plug', source) == [0, 2, 3]
+        assert rows('ShellType:"26 - plug"', source) == [0, 3]
+        # Unknown columns are searched as text
+        assert rows('Colour:red', source) == []
+
+    def test_regex(self, source):
+        assert rows('/^d38999.*pn$/', source) == [0, 1]
+        assert rows('Material:/alu|comp/', source) == [0, 2, 3]
+        # Text outside /.../ is never a pattern
+        assert rows('D38999.*PN', source) == []
+
+    def test_bare_terms_are_literal(self):
+        source = TextColumns(pd.DataFrame({
+            'Part': ['Plug (Male)', 'Plug', 'Male', '1.5 mm', '105 mm', 'a+b'],
+        }))
+        assert rows('1.5', source) == [3]
+        assert rows('Plug (Male)', source) == [0]
+        assert rows('a+b', source) == [5]
+        assert compile_query('Plug (Male)').plain_text == 'plug (male)'
+        # Parentheses still group in queries with operators
+        assert rows('(plug OR male) AND NOT "(male)"', source) == [1, 2]
+
+    def test_dashes_negate_only_with_operators(self):
+        source = TextColumns(pd.DataFrame({
+            'Part': ['MS3470L16-10P', 'D38999 -26WA', 'D38999/26', '-5V supply'],
+        }))
+        assert compile_query('-10P').plain_text == '-10p'
+        assert rows('-10P', source) == [0]
+        assert rows('D38999 -26', source) == [1]
+        assert rows('-5V supply', source) == [3]
+        assert rows('d38999, -10p', source, comma_or=True) == [0, 1, 2]
+        assert rows('d38999 AND -"-26"', source) == [2]
+
+    def test_shared_terms_are_compiled_once(self):
+        query = compile_query('(plug AND aluminum) OR (plug AND composite)')
+        assert sorted(term.value for term in query.terms) == ['aluminum', 'composite', 'plug']
+
+    def test_unparsable_query_is_plain_text(self, source):
+        assert compile_query('(plug').plain_text == '(plug'
+        assert rows('', source) == [0, 1, 2, 3]
+
+    def test_part_number_spellings_in_key_columns(self, source):
+        source.key_columns = {'Part Number'}
+        assert rows('d38999-26wa35pn OR ms3470l1610p', source) == [0, 3]
@@ -0,0 +1,183 @@
+"""
+Tests for the shared background task scheduler
+"""
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+from productivity_app.productivity_core.core.base_data_worker import BaseDataWorker
+from productivity_app.productivity_core.core.task_scheduler import (
+    TaskPriority, TaskScheduler)
+
+
+@pytest.fixture(scope='module')
+def qt_app(qapp):
+    return qapp
+
+
+@pytest.fixture
+def scheduler(qt_app):
+    scheduler = TaskScheduler(max_threads=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def _wait_for(condition, timeout=5.0):
+    """Process queued signals until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+def _blocker(scheduler):
+    """Occupy the single pool thread until the returned event is set"""
+    release = threading.Event()
+    scheduler.submit(release.wait, name='blocker')
+    return release
+
+
+def test_result_and_timing_are_reported(scheduler):
+    results = []
+    task = scheduler.submit(sum, [1, 2, 3], name='sum')
+    task.finished.connect(results.append)
+
+    _wait_for(lambda: results)
+
+    assert results == [6]
+    timing = scheduler.timings()[-1]
+    assert (timing.name, timing.status) == ('sum', 'finished')
+    assert timing.run_ms >= 0
+
+
+def test_interactive_tasks_run_before_background(scheduler):
+    release = _blocker(scheduler)
+    order = []
+    scheduler.submit(order.append, 'load', priority=TaskPriority.BACKGROUND)
+    scheduler.submit(order.append, 'search', priority=TaskPriority.INTERACTIVE)
+
+    release.set()
+    scheduler.wait_for_done()
+
+    assert order == ['search', 'load']
+
+
+def test_duplicate_key_is_coalesced_or_replaced(scheduler):
+    release = _blocker(scheduler)
+    calls = []
+    first = scheduler.submit(calls.append, 1, key='load')
+    assert scheduler.submit(calls.append, 2, key='load') is first
+
+    cancelled = []
+    first.cancelled.connect(lambda: cancelled.append(True))
+    scheduler.submit(calls.append, 3, key='load', replace=True)
+
+    release.set()
+    scheduler.wait_for_done()
+    _wait_for(lambda: cancelled)
+    assert calls == [3]
+
+
+def test_cancellation_token_reaches_running_task(scheduler):
+    started = threading.Event()
+
+    def work(task):
+        started.set()
+        while not task.is_cancelled:
+            time.sleep(0.005)
+        return 'ignored'
+
+    task = scheduler.submit(work, pass_task=True)
+    started.wait(5)
+    scheduler.cancel(task)
+    scheduler.wait_for_done()
+
+    assert task.status == 'cancelled'
+    assert scheduler.active_count() == 0
+
+
+def test_worker_error_is_reported(scheduler):
+    errors = []
+    task = scheduler.submit(lambda: 1 / 0, name='broken')
+    task.error.connect(errors.append)
+
+    _wait_for(lambda: errors)
+
+    assert 'division by zero' in errors[0]
+    assert scheduler.timings()[-1].status == 'error'
+
+
+def test_signals_connected_after_submit_are_not_missed(scheduler):
+    """A task finishing before the caller connects still reaches it"""
+    task = scheduler.submit(lambda: 'done', name='instant')
+    failing = scheduler.submit(lambda: 1 / 0, name='instant_error')
+    # Both have finished on the pool thread before anything is connected
+    scheduler.wait_for_done()
+    assert (task.status, failing.status) == ('finished', 'error')
+
+    results, errors = [], []
+    task.finished.connect(results.append)
+    failing.error.connect(errors.append)
+    _wait_for(lambda: results and errors)
+
+    assert results == ['done']
+    assert 'division by zero' in errors[0]
+
+
+class _Worker(BaseDataWorker):
+    """Worker recording the end signals it emits"""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+        self.ends = []
+        self.finished.connect(lambda data: self.ends.append(('finished', data)))
+        self.error.connect(lambda message: self.ends.append(('error', message)))
+        self.cancelled.connect(lambda: self.ends.append(('cancelled',)))
+
+    def run(self):
+        self.body(self)
+
+
+def test_worker_reports_how_the_task_ended(scheduler):
+    release = _blocker(scheduler)
+    started = threading.Event()
+
+    def wait_for_cancel(worker):
+        started.set()
+        while worker.emit_progress(0, ''):
+            time.sleep(0.005)
+
+    def report_cancel(worker):
+        worker.cancelled.emit()
+
+    queued = _Worker(lambda worker: worker.finished.emit('never'))
+    queued_task = scheduler.submit_worker(queued)
+    scheduler.cancel(queued_task)
+    release.set()
+
+    raising = _Worker(lambda worker: 1 / 0)
+    scheduler.submit_worker(raising)
+    returning = _Worker(wait_for_cancel)
+    returning_task = scheduler.submit_worker(returning)
+    started.wait(5)
+    scheduler.cancel(returning_task)
+    reporting = _Worker(report_cancel)
+    scheduler.cancel(scheduler.submit_worker(reporting))
+    done = _Worker(lambda worker: worker.finished.emit('data'))
+    scheduler.submit_worker(done)
+
+    workers = [queued, raising, returning, reporting, done]
+    _wait_for(lambda: all(worker.ends for worker in workers))
+    scheduler.wait_for_done()
+    for _ in range(10):
+        QCoreApplication.processEvents()
+
+    assert queued.ends == [('cancelled',)]
+    assert [end[0] for end in raising.ends] == ['error']
+    assert 'division by zero' in raising.ends[0][1]
+    assert returning.ends == [('cancelled',)]
+    assert reporting.ends == [('cancelled',)]
+    assert done.ends == [('finished', 'data')]
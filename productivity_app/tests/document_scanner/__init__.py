@@ -0,0 +1,3 @@
+"""
+Tests for document_scanner module
+"""
@@ -0,0 +1,135 @@
+"""
+Tests for the Add Document dialog's background reads
+"""
+import time
+
+import pytest
+from openpyxl import Workbook
+from PySide6.QtCore import QCoreApplication
+
+from productivity_app.productivity_core.core.task_scheduler import TaskScheduler
+from productivity_app.productivity_core.document_scanner.Configuration.view import (
+    AddDocumentDialog)
+from productivity_app.productivity_core.document_scanner.document_preview import (
+    DocumentPreviewService)
+
+
+def _wait_for(condition, timeout=5.0):
+    """Process queued signals until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+def make_workbook(path, header, rows=5):
+    book = Workbook()
+    sheet = book.active
+    sheet.title = 'Parts'
+    sheet.append(header)
+    for i in range(rows):
+        sheet.append([f'D38999/{i}', i])
+    book.create_sheet('Notes').append(['Note'])
+    book.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = TaskScheduler(max_threads=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def submitted(scheduler, monkeypatch):
+    """Names of tasks the dialog submits"""
+    names = []
+    submit = scheduler.submit
+
+    def recording_submit(func, *args, name=None, **kwargs):
+        names.append(name)
+        return submit(func, *args, name=name, **kwargs)
+
+    monkeypatch.setattr(scheduler, 'submit', recording_submit)
+    return names
+
+
+def make_dialog(previews, scheduler):
+    dialog = AddDocumentDialog(preview_service=previews, scheduler=scheduler)
+    dialog.header_row_spin.setMaximum(50)
+    return dialog
+
+
+def shown_columns(dialog):
+    return [dialog.search_columns_list.item(i).text()
+            for i in range(dialog.search_columns_list.count())]
+
+
+def test_cached_file_is_shown_without_background_reads(tmp_path, scheduler, submitted):
+    path = make_workbook(tmp_path / 'parts.xlsx', ['Part', 'Qty'])
+    previews = DocumentPreviewService()
+    previews.sheet_names(path)
+    previews.preview(path, 'Parts', 0)
+    dialog = make_dialog(previews, scheduler)
+
+    dialog._on_file_selected(path)
+
+    # Shown before control returns to the event loop
+    assert submitted == []
+    assert dialog.available_sheets == ['Parts', 'Notes']
+    assert shown_columns(dialog) == ['Part', 'Qty']
+    assert dialog.preview_table.model().rowCount() == 5
+    assert dialog.step1_ok_btn.isEnabled()
+
+    dialog.header_row_spin.setValue(1)
+    assert submitted == []
+    assert shown_columns(dialog) == ['D38999/0', '0']
+
+
+def test_uncached_file_is_read_in_the_background(tmp_path, scheduler, submitted):
+    path = make_workbook(tmp_path / 'parts.xlsx', ['Part', 'Qty'])
+    dialog = make_dialog(DocumentPreviewService(), scheduler)
+
+    dialog._on_file_selected(path)
+    assert not dialog.step1_ok_btn.isEnabled()
+    _wait_for(lambda: dialog.df is not None)
+
+    assert submitted == ['add_document_sheets', 'add_document_preview']
+    assert dialog.available_sheets == ['Parts', 'Notes']
+    assert shown_columns(dialog) == ['Part', 'Qty']
+    assert dialog.step1_ok_btn.isEnabled()
+
+    # Another sheet is read once, then cut from cached rows
+    dialog.sheet_combo.setCurrentText('Notes')
+    _wait_for(lambda: shown_columns(dialog) == ['Note'])
+    dialog.sheet_combo.setCurrentText('Parts')
+    assert shown_columns(dialog) == ['Part', 'Qty']
+    assert submitted.count('add_document_preview') == 2
+
+
+def test_replaced_preview_is_ignored(tmp_path, scheduler):
+    first = make_workbook(tmp_path / 'first.xlsx', ['First'], rows=100)
+    second = make_workbook(tmp_path / 'second.xlsx', ['Second'])
+    previews = DocumentPreviewService(sample_rows=20)
+    for path in (second, first):
+        previews.sheet_names(path)
+        previews.preview(path, 'Parts', 0)
+    dialog = make_dialog(previews, scheduler)
+    dialog._on_file_selected(first)
+
+    # A header row past the cached rows is read in the background; the
+    # read finishes, but its result is not delivered before the header row
+    # is reset and another file is selected
+    dialog.header_row_spin.setValue(40)
+    stale = dialog._preview_task
+    scheduler.wait_for_done()
+    assert stale.status == 'finished'
+    dialog.header_row_spin.setValue(0)
+    dialog._on_file_selected(second)
+    assert shown_columns(dialog) == ['Second', 'Unnamed: 1']
+
+    for _ in range(10):
+        QCoreApplication.processEvents()
+    assert shown_columns(dialog) == ['Second', 'Unnamed: 1']
@@ -0,0 +1,116 @@
+"""
+Tests for the vectorized CompareVersions diff engine
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from productivity_app.productivity_core.document_scanner.CompareVersions.diff_engine import (
+    compare_versions,
+    compare_versions_chunked,
+)
+
+
+CONFIG = {
+    'key_column': 'Part',
+    'compare_columns': ['Material', 'Size'],
+    'show_columns': ['Material', 'Size'],
+}
+
+
+@pytest.fixture
+def versions():
+    df1 = pd.DataFrame({
+        'Part': ['A', 'B', 'C', 'D'],
+        'Material': ['Steel', 'Brass', None, 'Zinc'],
+        'Size': [10, 12, 14, 16],
+    })
+    df2 = pd.DataFrame({
+        'Part': ['A', 'B', 'C', 'E'],
+        'Material': ['Steel', 'Bronze', '', 'Zinc'],
+        'Size': [10, 13, 14, 18],
+    })
+    return df1, df2
+
+
+def _by_key(results):
+    return results.set_index('Part')
+
+
+def test_verdicts(versions):
+    results = _by_key(compare_versions(*versions, CONFIG))
+
+    assert results.loc['A', 'Verdict'] == 'Same'
+    assert results.loc['B', 'Verdict'] == 'Different'
+    assert results.loc['D', 'Verdict'] == 'Only in Version 1'
+    assert results.loc['E', 'Verdict'] == 'Only in Version 2'
+
+
+def test_missing_and_empty_values_are_equal(versions):
+    results = _by_key(compare_versions(*versions, CONFIG))
+    assert results.loc['C', 'Verdict'] == 'Same'
+
+
+def test_changed_columns_and_layout(versions):
+    results = compare_versions(*versions, CONFIG)
+
+    assert list(results.columns) == [
+        'Part', 'Verdict', 'Changed_Columns',
+        'Material_V1', 'Material_V2', 'Size_V1', 'Size_V2']
+    indexed = _by_key(results)
+    assert indexed.loc['B', 'Changed_Columns'] == 'Material, Size'
+    assert pd.isna(indexed.loc['A', 'Changed_Columns'])
+    assert pd.isna(indexed.loc['E', 'Material_V1'])
+    assert indexed.loc['E', 'Size_V2'] == 18
+
+
+def test_no_changed_columns_when_identical(versions):
+    df1, _ = versions
+    results = compare_versions(df1, df1.copy(), CONFIG)
+
+    assert 'Changed_Columns' not in results.columns
+    assert (results['Verdict'] == 'Same').all()
+
+
+def test_duplicate_keys_paired_by_occurrence():
+    df1 = pd.DataFrame({'Part': ['A', 'A', 'B'], 'Material': ['x', 'y', 'z'], 'Size': [1, 2, 3]})
+    df2 = pd.DataFrame({'Part': ['A', 'B'], 'Material': ['x', 'z'], 'Size': [1, 3]})
+
+    results = compare_versions(df1, df2, CONFIG)
+
+    assert sorted(results['Verdict']) == ['Only in Version 1', 'Same', 'Same']
+    assert results.attrs['duplicate_keys'] == {'Version 1': 1, 'Version 2': 0}
+
+
+def test_numeric_and_string_forms_compare_by_text():
+    df1 = pd.DataFrame({'Part': ['A'], 'Material': ['1'], 'Size': [np.nan]})
+    df2 = pd.DataFrame({'Part': ['A'], 'Material': [1], 'Size': ['']})
+
+    results = compare_versions(df1, df2, CONFIG)
+    assert results['Verdict'].tolist() == ['Same']
+
+
+def test_missing_column_raises(versions):
+    df1, df2 = versions
+    with pytest.raises(ValueError):
+        compare_versions(df1, df2.drop(columns=['Size']), CONFIG)
+
+
+def test_chunked_comparison_matches_direct(versions):
+    df1, df2 = versions
+    expected = compare_versions(df1, df2, CONFIG)
+    result = compare_versions_chunked(df1, df2, CONFIG, chunk_size=1)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_chunked_comparison_reports_progress_and_cancels(versions):
+    updates = []
+
+    def progress(percent, message):
+        updates.append(percent)
+        return percent < 50
+
+    assert compare_versions_chunked(*versions, CONFIG, chunk_size=1,
+                                    progress_callback=progress) is None
+    assert updates == sorted(updates)
+    assert updates[-1] >= 50
@@ -0,0 +1,54 @@
+"""
+Tests for the Compare Versions presenter's background comparison
+"""
+import threading
+import time
+
+import pandas as pd
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from productivity_app.productivity_core.core.task_scheduler import TaskScheduler
+from productivity_app.productivity_core.document_scanner.CompareVersions.presenter import (
+    CompareVersionsPresenter)
+
+
+def _wait_for(condition, timeout=5.0):
+    """Process queued signals until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = TaskScheduler(max_threads=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def presenter(scheduler):
+    return CompareVersionsPresenter({'task_scheduler': scheduler}, None)
+
+
+def test_cancelled_queued_comparison_resets_the_view(presenter, scheduler):
+    release = threading.Event()
+    scheduler.submit(release.wait, name='blocker')
+    frame = pd.DataFrame({'Part': ['A', 'B'], 'Qty': [1, 2]})
+    view = presenter.view
+
+    presenter._start_comparison(frame, frame, {'key_columns': ['Part']})
+    task = presenter._compare_task
+    assert not view.compare_btn.isEnabled()
+    assert not view.cancel_compare_btn.isHidden()
+
+    presenter.on_cancel_compare()
+    release.set()
+    _wait_for(lambda: presenter._compare_task is None)
+
+    assert task.status == 'cancelled'
+    assert view.compare_btn.isEnabled()
+    assert view.cancel_compare_btn.isHidden()
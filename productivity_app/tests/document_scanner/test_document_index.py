@@ -0,0 +1,98 @@
+"""
+Tests for the cross-document search index
+"""
+import pandas as pd
+import pytest
+
+from productivity_app.productivity_core.document_scanner.document_index import DocumentIndex
+from productivity_app.productivity_core.document_scanner.searchable_document import (
+    SearchableDocument)
+
+
+def make_document(tmp_path, name, frame, search_columns, **config):
+    path = tmp_path / name
+    frame.to_csv(path, index=False)
+    return SearchableDocument({
+        'file_path': str(path), 'file_name': name, 'doc_type': 'Parts',
+        'header_row': 0, 'search_columns': search_columns,
+        'return_columns': list(frame.columns), **config,
+    })
+
+
+@pytest.fixture
+def documents(tmp_path):
+    parts = make_document(tmp_path, 'parts.csv', pd.DataFrame({
+        'Part Number': ['D38999/20', 'VG95234', 'D38999/26'],
+        'Description': ['Connector', 'Plug', 'Receptacle'],
+    }), ['Part Number', 'Description'])
+    stock = make_document(tmp_path, 'stock.csv', pd.DataFrame({
+        'Part': ['D38999-26', 'EN2997', 'Plug D38999/20'],
+        'Store': ['A', 'B', 'C'],
+    }), ['Part'])
+    return [parts, stock]
+
+
+def hits(result_sets):
+    """(document, first column) of each hit"""
+    return [(r.document_name, next(iter(r.matched_row_data.values())))
+            for results in result_sets for r in results]
+
+
+class TestDocumentIndex:
+    """Tests for DocumentIndex"""
+
+    @pytest.mark.parametrize('term', [
+        'd38999', 'plug', '2', 'D38999/2', '/^d.*6$/', '1.5', 'Plug (M)', 'nothing',
+        'd38999 AND NOT Description:receptacle', 'plug OR en2997', 'Store:c',
+    ])
+    def test_matches_per_document_search(self, documents, term):
+        """The index gives the same hits, in the same order, as each document"""
+        index = DocumentIndex()
+        index.sync(documents)
+
+        expected = [doc.search(term) for doc in documents]
+        assert hits(index.search(term)) == hits(r for r in expected if len(r))
+
+    def test_normalized_and_refined_terms(self, documents):
+        index = DocumentIndex()
+        index.sync(documents)
+
+        assert hits(index.search('d38999-2', normalized=True)) == [
+            ('parts.csv', 'D38999/20'), ('parts.csv', 'D38999/26'),
+            ('stock.csv', 'D38999-26'), ('stock.csv', 'Plug D38999/20')]
+        # Extends the last term, so only its values are checked again
+        assert hits(index.search('d38999-26', normalized=True)) == [
+            ('parts.csv', 'D38999/26'), ('stock.csv', 'D38999-26')]
+        assert hits(index.search('d38999-26')) == [('stock.csv', 'D38999-26')]
+
+    def test_add_and_remove_are_incremental(self, documents):
+        index = DocumentIndex()
+        index.sync(documents[:1])
+        assert hits(index.search('en2997')) == []
+
+        index.add(documents[1])
+        assert hits(index.search('en2997')) == [('stock.csv', 'EN2997')]
+
+        index.sync(documents[1:])
+        assert documents[0] not in index
+        assert hits(index.search('d38999/26')) == []
+        # Values only the removed document used are dropped
+        assert index.value_count == len(set(
+            documents[1].df['Part'].str.lower()))
+
+    def test_reloaded_document_is_reindexed(self, documents):
+        index = DocumentIndex()
+        index.sync(documents)
+        documents[1].df = pd.DataFrame({'Part': ['EN3645'], 'Store': ['D']})
+
+        index.sync(documents)
+        assert hits(index.search('en')) == [('stock.csv', 'EN3645')]
+
+    def test_precondition_is_checked_per_document(self, tmp_path, documents):
+        gated = make_document(tmp_path, 'gated.csv', pd.DataFrame({'Part': ['D38999/26']}),
+                              ['Part'], precondition_enabled=True,
+                              precondition="search_term.startswith('VG')")
+        index = DocumentIndex()
+        index.sync(documents + [gated])
+
+        assert 'gated.csv' not in {name for name, _ in hits(index.search('d38999/26'))}
@@ -0,0 +1,96 @@
+"""
+Tests for the Add Document dialog's preview service
+"""
+import os
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from productivity_app.productivity_core.document_scanner import document_preview
+from productivity_app.productivity_core.document_scanner.document_preview import (
+    DocumentPreviewService)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    book = Workbook()
+    sheet = book.active
+    sheet.title = 'Parts'
+    sheet.append(['Parts list'])
+    sheet.append(['Part', 'Qty'])
+    for i in range(30):
+        sheet.append([f'D38999/{i}', i])
+    book.create_sheet('Notes').append(['Note'])
+    path = tmp_path / 'parts.xlsx'
+    book.save(path)
+    return path
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Rows requested from files, per read"""
+    calls = []
+    read = DocumentPreviewService._read
+
+    def counting_read(path, sheet, rows):
+        calls.append(rows)
+        return read(path, sheet, rows)
+
+    monkeypatch.setattr(DocumentPreviewService, '_read', staticmethod(counting_read))
+    return calls
+
+
+class TestDocumentPreviewService:
+    """Tests for DocumentPreviewService"""
+
+    @pytest.mark.parametrize('header_row', [0, 1, 5])
+    def test_matches_read_excel(self, workbook, header_row):
+        previews = DocumentPreviewService()
+        expected = pd.read_excel(workbook, header=header_row, nrows=20)
+        pd.testing.assert_frame_equal(previews.preview(workbook, header_row=header_row),
+                                      expected)
+
+    def test_header_row_changes_reuse_cached_rows(self, workbook, reads):
+        previews = DocumentPreviewService(sample_rows=20)
+        assert previews.cached_preview(workbook, 'Parts', 1, nrows=5) is None
+
+        assert list(previews.preview(workbook, 'Parts', 1, nrows=5).columns) == ['Part', 'Qty']
+        preview = previews.cached_preview(workbook, 'Parts', 2, nrows=5)
+        assert list(preview.columns) == ['D38999/0', 0]
+        assert reads == [20]
+
+        # Past the cached rows: read again with more rows
+        assert previews.cached_preview(workbook, 'Parts', 16, nrows=5) is None
+        assert previews.preview(workbook, 'Parts', 16, nrows=5).columns[0] == 'D38999/14'
+        assert reads == [20, 44]
+
+    def test_changed_file_is_read_again(self, workbook, reads):
+        previews = DocumentPreviewService()
+        previews.preview(workbook, 'Notes', 0)
+        stat = workbook.stat()
+        os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert previews.cached_preview(workbook, 'Notes', 0) is None
+        previews.preview(workbook, 'Notes', 0)
+        assert len(reads) == 2
+
+    def test_sheet_names(self, workbook, tmp_path):
+        previews = DocumentPreviewService()
+        assert previews.sheet_names(workbook) == ['Parts', 'Notes']
+        assert previews.sheet_names(tmp_path / 'parts.csv') == []
+
+    def test_csv_preview(self, tmp_path):
+        path = tmp_path / 'parts.csv'
+        path.write_text('title\nPart,Qty\nD38999/20,1\nVG95234,2\n')
+        preview = DocumentPreviewService().preview(path, header_row=1)
+        assert list(preview.columns) == ['Part', 'Qty']
+        assert preview['Qty'].tolist() == [1, 2]
+
+    def test_cache_is_bounded(self, workbook, monkeypatch):
+        monkeypatch.setattr(document_preview, 'MAX_CACHED_SHEETS', 1)
+        previews = DocumentPreviewService()
+        previews.preview(workbook, 'Parts')
+        previews.preview(workbook, 'Notes')
+        assert previews.cached_preview(workbook, 'Parts') is None
+        assert previews.cached_preview(workbook, 'Notes') is not None
@@ -0,0 +1,163 @@
+"""
+Tests for the Document Scanner's lazily fetched search results model
+"""
+import time
+
+import pandas as pd
+import pytest
+from PySide6.QtCore import QCoreApplication, QModelIndex, Qt
+
+from productivity_app.productivity_core.document_scanner.Search.results_model import (
+    DOCUMENT_HEADER, ItemTypeRole, SearchResultsModel)
+from productivity_app.productivity_core.document_scanner.search_result import (
+    Context, SearchResultSet)
+
+ROWS = 1200
+
+
+@pytest.fixture
+def result_sets():
+    frame = pd.DataFrame({
+        'Part Number': [f'D38999/{i}' for i in range(ROWS)],
+        'Qty': range(ROWS),
+    })
+    parts = SearchResultSet.from_frame(
+        'd38999', 'parts.xlsx', 'Parts', frame, ['Part Number', 'Qty'], range(ROWS))
+    notes = SearchResultSet.from_rows('d38999', 'notes.csv', 'Notes', [{'Note': 'Plug'}])
+    empty = SearchResultSet.from_rows('d38999', 'empty.csv', 'Notes', [])
+    return [parts, notes, empty]
+
+
+@pytest.fixture
+def model(qapp, result_sets):
+    model = SearchResultsModel()
+    model.set_results(result_sets)
+    return model
+
+
+def group(model, row):
+    return model.index(row, 0)
+
+
+class TestFetching:
+    """Result rows are exposed in FETCH_BATCH_SIZE batches"""
+
+    def test_first_batch_is_loaded(self, model):
+        # Documents without hits get no group
+        assert model.rowCount() == 2
+        # Header row plus the first batch
+        assert model.rowCount(group(model, 0)) == 1 + SearchResultsModel.FETCH_BATCH_SIZE
+        assert model.rowCount(group(model, 1)) == 1 + 1
+        assert model.canFetchMore(group(model, 0))
+        assert not model.canFetchMore(group(model, 1))
+        assert not model.canFetchMore(QModelIndex())
+
+    def test_fetch_more_grows_row_count_by_batches(self, model):
+        parent = group(model, 0)
+        inserted = []
+        model.rowsInserted.connect(lambda index, first, last: inserted.append((first, last)))
+
+        model.fetchMore(parent)
+        assert model.rowCount(parent) == 1 + 1000
+        model.fetchMore(parent)
+        assert model.rowCount(parent) == 1 + ROWS
+        assert not model.canFetchMore(parent)
+        model.fetchMore(parent)
+
+        assert inserted == [(501, 1000), (1001, ROWS)]
+
+    def test_rows_past_the_loaded_ones_have_no_index(self, model):
+        parent = group(model, 0)
+        assert not model.index(502, 0, parent).isValid()
+        model.fetchMore(parent)
+        assert model.index(502, 0, parent).isValid()
+
+
+class TestData:
+    """Cell data of document, header and result rows"""
+
+    def test_document_rows(self, model):
+        index = group(model, 0)
+        assert model.data(index) == f'📄 parts.xlsx ({ROWS} results)'
+        assert model.data(group(model, 1)) == '📄 notes.csv (1 result)'
+        assert model.data(index, Qt.UserRole) == 'parts.xlsx'
+        assert model.data(index, ItemTypeRole) == DOCUMENT_HEADER
+        assert model.data(index, Qt.FontRole).bold()
+        assert model.data(model.index(0, 1)) is None
+
+    def test_header_and_result_rows(self, model):
+        parent = group(model, 0)
+        assert model.columnCount() == 3
+        assert [model.data(model.index(0, c, parent)) for c in range(3)] == [
+            '#', 'Part Number', 'Qty']
+        assert [model.data(model.index(8, c, parent)) for c in range(3)] == [
+            '8', 'D38999/7', '7']
+        # Narrower documents have empty cells on the right
+        assert model.data(model.index(1, 2, group(model, 1))) == ''
+
+    def test_fetched_rows_read_their_results(self, model):
+        parent = group(model, 0)
+        model.fetchMore(parent)
+        index = model.index(1000, 1, parent)
+        assert model.data(index) == 'D38999/999'
+        result = model.data(index, Qt.UserRole)
+        assert result.matched_row_data == {'Part Number': 'D38999/999', 'Qty': 999}
+        assert model.result_at(index).search_id == result.search_id
+        assert model.result_at(parent) is None
+
+    def test_context_marker_and_tooltip(self, model, result_sets):
+        result_sets[0][4].add_context(Context(term='D38999/4', context_owner='Connector'))
+        index = model.index(5, 0, group(model, 0))
+        assert model.data(index) == '5 🔍'
+        assert model.data(index, Qt.ToolTipRole) == 'This result has 1 context item(s)'
+        assert model.data(model.index(6, 0, group(model, 0)), Qt.ToolTipRole) is None
+
+
+class TestUpdates:
+    """Coalesced repaints after enrichment"""
+
+    def test_updates_find_the_group_of_their_result_set(self, model, result_sets):
+        parts, notes, empty = result_sets
+        assert model._group_position(parts) == 0
+        assert model._group_position(notes) == 1
+        # Sets without hits and sets of an earlier search are not shown
+        assert model._group_position(empty) is None
+        other = SearchResultSet.from_rows('d38999', 'notes.csv', 'Notes', [{'Note': 'Plug'}])
+        assert not model.update_result(other[0])
+
+        model.set_results([notes])
+        assert model._group_position(notes) == 0
+        assert not model.update_result(parts[0])
+
+    def test_updates_are_flushed_as_one_data_changed_per_document(self, model, result_sets):
+        parts, notes, _ = result_sets
+        changed = []
+        model.dataChanged.connect(
+            lambda first, last, roles: changed.append(
+                (first.parent().row(), first.row(), last.row(), last.column())))
+
+        for position in (40, 7, 12):
+            assert model.update_result(parts[position])
+        assert model.update_result(notes[0])
+        # Not fetched yet: read fresh once fetched, nothing to repaint
+        assert model.update_result(parts[900])
+        assert changed == []
+        assert model._update_timer.isActive()
+        assert model._update_timer.interval() == SearchResultsModel.UPDATE_COALESCE_MS
+
+        deadline = time.monotonic() + 5
+        while model._update_timer.isActive():
+            assert time.monotonic() < deadline, "timed out"
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+        # One span per document, from its first to its last updated row
+        assert sorted(changed) == [(0, 8, 41, 2), (1, 1, 1, 2)]
+
+        changed.clear()
+        model.flush_updates()
+        assert changed == []
+
+    def test_updates_for_other_results_are_ignored(self, model):
+        other = SearchResultSet.from_rows('x', 'other.csv', 'Notes', [{'Note': 'x'}])
+        assert not model.update_result(other[0])
+        assert not model._update_timer.isActive()
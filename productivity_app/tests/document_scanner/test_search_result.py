@@ -0,0 +1,151 @@
+"""
+Tests for the column-wise search result set and its row views
+"""
+import pandas as pd
+import pytest
+
+from productivity_app.productivity_core.document_scanner.search_result import (
+    Context, SearchResult, SearchResultSet)
+from productivity_app.productivity_core.document_scanner.searchable_document import (
+    SearchableDocument)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'Part Number': ['D38999/20', 'VG95234', 'D38999/26'],
+        'Description': ['Connector', 'Plug', 'Receptacle'],
+        'Qty': [1, 2, 3],
+    })
+
+
+class TestSearchResultSet:
+    """Tests for SearchResultSet and SearchResult views"""
+
+    def test_views_read_rows_of_the_frame(self, frame):
+        """Views expose the return columns of the matched rows"""
+        results = SearchResultSet.from_frame(
+            'd38', 'parts.csv', 'Parts', frame,
+            ['Part Number', 'Qty', 'Missing'], [2, 0])
+
+        assert len(results) == 2
+        assert results.columns == ['Part Number', 'Qty']
+        assert results[0].matched_row_data == {'Part Number': 'D38999/26', 'Qty': 3}
+        assert results.value(1, 0) == 'D38999/20'
+        assert [r.document_name for r in results] == ['parts.csv', 'parts.csv']
+        assert isinstance(results[-1], SearchResult)
+
+    def test_search_ids_are_unique_and_map_back(self, frame):
+        """Each set reserves its own block of ids"""
+        first = SearchResultSet.from_frame('a', 'doc', 'T', frame, ['Qty'], [0, 1])
+        second = SearchResultSet.from_frame('a', 'doc', 'T', frame, ['Qty'], [2])
+
+        ids = [r.search_id for r in first] + [r.search_id for r in second]
+        assert len(set(ids)) == 3
+        assert first.position_of(first[1].search_id) == 1
+        assert first.position_of(second[0].search_id) is None
+
+    def test_contexts_are_kept_only_for_enriched_hits(self, frame):
+        """Contexts added through a view are visible from new views"""
+        results = SearchResultSet.from_frame('a', 'doc', 'T', frame, ['Qty'], [0, 1, 2])
+        results[1].add_context(Context(term='VG95234', context_owner='Connector'))
+
+        assert results[1].has_contexts()
+        assert not results[0].has_contexts()
+        assert results[1].contexts[0].context_owner == 'Connector'
+        assert results.context_count() == 1
+
+    def test_from_rows(self):
+        results = SearchResultSet.from_rows(
+            'x', 'doc', 'T', [{'A': 1, 'B': 'x'}, {'A': 2, 'B': 'y'}])
+        assert results[1].get_formatted_data() == 'A: 2, B: y'
+
+
+def test_document_search_returns_result_set(tmp_path, frame):
+    """A hit is returned per matching search column, in column order"""
+    path = tmp_path / 'parts.csv'
+    frame.to_csv(path, index=False)
+    document = SearchableDocument({
+        'file_path': str(path), 'file_name': 'parts.csv', 'doc_type': 'Parts',
+        'header_row': 0, 'search_columns': ['Part Number', 'Description'],
+        'return_columns': ['Part Number'],
+    })
+
+    # '2' is in every part number and in no description
+    results = document.search('2')
+    assert [r.matched_row_data['Part Number'] for r in results] == [
+        'D38999/20', 'VG95234', 'D38999/26']
+    # 'c' matches two descriptions
+    assert [r.matched_row_data['Part Number'] for r in document.search('c')] == [
+        'D38999/20', 'D38999/26']
+    assert len(document.search('nothing')) == 0
+
+
+def test_successive_searches_are_independent(tmp_path, frame):
+    """Each search finds its rows whatever was searched before"""
+    path = tmp_path / 'parts.csv'
+    frame.to_csv(path, index=False)
+    document = SearchableDocument({
+        'file_path': str(path), 'file_name': 'parts.csv', 'doc_type': 'Parts',
+        'header_row': 0, 'search_columns': ['Part Number', 'Description'],
+        'return_columns': ['Part Number'],
+    })
+
+    def part_numbers(term):
+        return [r.matched_row_data['Part Number'] for r in document.search(term)]
+
+    assert part_numbers('d38') == ['D38999/20', 'D38999/26']
+    assert part_numbers('D38999/2') == ['D38999/20', 'D38999/26']
+    assert part_numbers('d38999/26') == ['D38999/26']
+    # A term that does not extend the last one
+    assert part_numbers('plug') == ['VG95234']
+    assert part_numbers('/^D.*6$/') == ['D38999/26']
+
+
+def test_search_stops_when_cancelled(tmp_path, frame):
+    from productivity_app.productivity_core.core.task_scheduler import (
+        CancellationToken, TaskCancelled)
+
+    path = tmp_path / 'parts.csv'
+    frame.to_csv(path, index=False)
+    document = SearchableDocument({
+        'file_path': str(path), 'file_name': 'parts.csv', 'doc_type': 'Parts',
+        'header_row': 0, 'search_columns': ['Part Number'], 'return_columns': [],
+    })
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(TaskCancelled):
+        document.search('d38', token=token)
+    # A cancelled search does not affect the next one
+    assert len(document.search('d38999')) == 2
+
+
+def test_normalized_search_matches_other_spellings(tmp_path, frame):
+    """Part numbers match regardless of punctuation when normalized"""
+    path = tmp_path / 'parts.csv'
+    frame.to_csv(path, index=False)
+    document = SearchableDocument({
+        'file_path': str(path), 'file_name': 'parts.csv', 'doc_type': 'Parts',
+        'header_row': 0, 'search_columns': ['Part Number'], 'return_columns': [],
+    })
+
+    assert len(document.search('D38999-26')) == 0
+    assert [r.position for r in document.search('D38999-26', normalized=True)] == [0]
+    assert len(document.search('d3899926', normalized=True)) == 1
+    assert len(document.search('d38999 2', normalized=True)) == 2
+
+
+def test_boolean_query_gives_each_row_once(tmp_path, frame):
+    path = tmp_path / 'parts.csv'
+    frame.to_csv(path, index=False)
+    document = SearchableDocument({
+        'file_path': str(path), 'file_name': 'parts.csv', 'doc_type': 'Parts',
+        'header_row': 0, 'search_columns': ['Part Number', 'Description'],
+        'return_columns': ['Part Number'],
+    })
+
+    results = document.search('d38999 AND NOT Description:receptacle')
+    assert [r.matched_row_data['Part Number'] for r in results] == ['D38999/20']
+    results = document.search('plug OR "d38999/2"')
+    assert [r.matched_row_data['Part Number'] for r in results] == [
+        'D38999/20', 'VG95234', 'D38999/26']
@@ -0,0 +1,3 @@
+"""
+Tests for e3 module
+"""
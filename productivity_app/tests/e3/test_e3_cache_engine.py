@@ -0,0 +1,64 @@
+"""
+Tests for merging and diffing E3 cache snapshots
+"""
+import pandas as pd
+import pytest
+from productivity_app.productivity_core.e3.e3_cache_engine import E3CacheEngine
+
+
+def _rows(*rows):
+    return pd.DataFrame(
+        [{'Part Code': code, 'E3 Project': project, 'Material': material}
+         for code, project, material in rows])
+
+
+@pytest.fixture
+def engine():
+    return E3CacheEngine()
+
+
+def test_merge_deduplicates_on_part_code_and_project(engine):
+    first = _rows(('A-1', 'Alpha', 'Aluminum'), ('A-2', 'Alpha', 'Steel'))
+    second = _rows(('A-1', 'Alpha', 'Brass'), ('A-1', 'Beta', 'Aluminum'))
+
+    merged = engine.merge([first, second])
+
+    assert len(merged) == 3
+    row = merged[(merged['Part Code'] == 'A-1') & (merged['E3 Project'] == 'Alpha')]
+    assert row['Material'].tolist() == ['Brass']
+
+
+def test_merge_reads_csv_files(engine, tmp_path):
+    path = tmp_path / 'e3_connector_cache_1.csv'
+    _rows(('A-1', 'Alpha', 'Aluminum'), ('A-1', 'Alpha', 'Steel')).to_csv(path, index=False)
+
+    merged = engine.merge_files([path])
+
+    assert merged['Material'].tolist() == ['Steel']
+
+
+def test_diff_reports_added_removed_and_changed(engine):
+    old = _rows(('A-1', 'Alpha', 'Aluminum'), ('A-2', 'Alpha', 'Steel'), ('A-3', 'Alpha', 'Brass'))
+    new = _rows(('A-1', 'Alpha', 'Aluminum'), ('A-2', 'Alpha', 'Titanium'), ('A-4', 'Alpha', 'Brass'))
+
+    diff = engine.diff(old, new)
+
+    assert diff.added['Part Code'].tolist() == ['A-4']
+    assert diff.removed['Part Code'].tolist() == ['A-3']
+    assert diff.changed['Part Code'].tolist() == ['A-2']
+    assert diff.changed_columns == {('A-2', 'Alpha'): ['Material']}
+    assert diff.unchanged_count == 1
+    assert diff.touched()['Part Code'].tolist() == ['A-4', 'A-2']
+
+
+def test_diff_of_identical_snapshots_is_empty(engine):
+    rows = _rows(('A-1', 'Alpha', 'Aluminum'), ('A-2', 'Beta', None))
+    diff = engine.diff(rows, rows.iloc[::-1])
+
+    assert diff.is_empty
+    assert diff.unchanged_count == 2
+
+
+def test_missing_key_column_raises(engine):
+    with pytest.raises(ValueError):
+        engine.merge([pd.DataFrame({'Part Code': ['A-1']})])
@@ -0,0 +1,120 @@
+"""
+Tests for parallel E3 project extraction and the per-project cache
+
+Uses MockE3Service with no extraction delay and a temporary cache directory.
+"""
+import threading
+
+import pytest
+from productivity_app.productivity_core.core.local_data_store import LocalDataStore
+from productivity_app.productivity_core.e3.e3_model import E3DataWorker
+from productivity_app.productivity_core.e3.e3_service import MockE3Service
+from productivity_app.productivity_core.e3.e3_project_cache import E3ProjectCache
+from productivity_app.productivity_core.e3.e3_extraction import extract_projects
+
+
+PROJECTS = ["Project_Alpha_Rev3", "Project_Beta_Final", "Connector_Library_Master"]
+
+
+class RecordingFactory:
+    """Service factory sharing stamps and recording extracted projects"""
+
+    def __init__(self, stamps=None):
+        self.stamps = stamps or {}
+        self.extracted = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        factory = self
+
+        class _Service(MockE3Service):
+            def get_connectors_from_project(self, project_name):
+                with factory._lock:
+                    factory.extracted.append(project_name)
+                return super().get_connectors_from_project(project_name)
+
+        return _Service(stamps=self.stamps, extraction_delay=0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return E3ProjectCache(str(tmp_path / 'projects'), use_parquet=False)
+
+
+def test_extracts_all_projects_in_order(cache):
+    factory = RecordingFactory()
+    result = extract_projects(PROJECTS, factory, cache=cache, max_workers=2)
+
+    assert result['count'] == 6
+    assert sorted(factory.extracted) == sorted(PROJECTS)
+    assert [c['E3 Project'] for c in result['connectors'][::2]] == PROJECTS
+    assert result['extracted_projects'] == PROJECTS
+    assert result['reused_projects'] == []
+
+
+def test_unchanged_projects_are_reused(cache):
+    stamps = {p: 'stamp-1' for p in PROJECTS}
+    extract_projects(PROJECTS, RecordingFactory(stamps), cache=cache)
+
+    stamps['Project_Beta_Final'] = 'stamp-2'
+    factory = RecordingFactory(stamps)
+    result = extract_projects(PROJECTS, factory, cache=cache)
+
+    assert factory.extracted == ['Project_Beta_Final']
+    assert result['extracted_projects'] == ['Project_Beta_Final']
+    assert result['reused_projects'] == ['Project_Alpha_Rev3', 'Connector_Library_Master']
+    assert result['count'] == 6
+
+
+def test_stale_entries_are_replaced(cache):
+    cache.save('Project_Alpha_Rev3', 'old', [{'Part Code': 'A'}])
+    cache.save('Project_Alpha_Rev3', 'new', [{'Part Code': 'B'}])
+
+    assert len(cache.list_entries()) == 1
+    assert cache.load('Project_Alpha_Rev3', 'old') is None
+    assert cache.load('Project_Alpha_Rev3', 'new')['Part Code'].tolist() == ['B']
+
+
+def test_version_mismatch_invalidates(tmp_path):
+    directory = str(tmp_path / 'projects')
+    E3ProjectCache(directory, version=1, use_parquet=False).save(
+        'Project_Alpha_Rev3', 'stamp', [{'Part Code': 'A'}])
+
+    assert E3ProjectCache(directory, version=2, use_parquet=False).load(
+        'Project_Alpha_Rev3', 'stamp') is None
+
+
+def test_projects_without_stamp_are_not_cached(cache):
+    factory = RecordingFactory({p: None for p in PROJECTS})
+    extract_projects(PROJECTS, factory, cache=cache)
+    extract_projects(PROJECTS, factory, cache=cache)
+
+    assert len(factory.extracted) == 2 * len(PROJECTS)
+    assert cache.list_entries() == []
+
+
+def test_cancel_returns_none(cache):
+    result = extract_projects(PROJECTS, RecordingFactory(), cache=cache,
+                              max_workers=1, is_cancelled=lambda: True)
+    assert result is None
+
+
+def test_worker_replaces_loaded_projects_in_store(cache):
+    store = LocalDataStore(':memory:')
+    worker = E3DataWorker(PROJECTS, operation='load_connectors',
+                          service_factory=RecordingFactory(), store=store,
+                          facet_columns=['E3 Project'])
+    worker.run()
+    store.append_rows('e3_connectors', [{'Part Code': 'KEEP', 'E3 Project': 'Other'}])
+
+    reload = E3DataWorker(PROJECTS[:1], operation='load_connectors',
+                          service_factory=RecordingFactory(), store=store)
+    results = []
+    reload.finished.connect(results.append)
+    reload.run()
+
+    assert results[0]['count'] == 2
+    rows = store.fetch_all('e3_connectors')
+    assert len(rows) == 7
+    assert sum(r['E3 Project'] == PROJECTS[0] for r in rows) == 2
+    assert rows[-1]['E3 Project'] == PROJECTS[0]
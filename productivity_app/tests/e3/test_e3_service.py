@@ -0,0 +1,27 @@
+"""
+Tests for E3Service's project modification stamps
+"""
+import os
+
+from productivity_app.productivity_core.e3.e3_service import E3Service
+
+
+def test_stamp_follows_project_file(tmp_path):
+    path = tmp_path / 'Harness.e3s'
+    path.write_bytes(b'project')
+    service = E3Service()
+
+    stamp = service.get_project_stamp(str(path))
+    assert stamp is not None
+    assert service.get_project_stamp(str(path)) == stamp
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert service.get_project_stamp(str(path)) not in (None, stamp)
+
+
+def test_unresolved_project_has_no_stamp(tmp_path):
+    service = E3Service()
+    assert service.get_project_path('Project_Alpha_Rev3') is None
+    assert service.get_project_stamp('Project_Alpha_Rev3') is None
+    assert service.get_project_stamp(str(tmp_path / 'missing.e3s')) is None
@@ -0,0 +1,3 @@
+"""
+Tests for epd module
+"""
@@ -0,0 +1,60 @@
+"""
+Tests for EpdModel's use of the local data store
+"""
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from productivity_app.productivity_core.core.local_data_store import LocalDataStore
+from productivity_app.productivity_core.core.task_scheduler import TaskScheduler
+from productivity_app.productivity_core.epd import epd_model
+from productivity_app.productivity_core.epd.epd_model import EpdModel
+
+
+def _wait_for(condition, timeout=10.0):
+    """Process queued signals until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = TaskScheduler(max_threads=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def store():
+    store = LocalDataStore(':memory:')
+    yield store
+    store.close()
+
+
+def test_records_are_written_to_the_store_off_the_ui_thread(scheduler, store, monkeypatch):
+    monkeypatch.setattr(epd_model.time, 'sleep', lambda seconds: None)
+    writers = []
+    replace_table = store.replace_table
+
+    def recording_replace_table(*args, **kwargs):
+        writers.append(threading.get_ident())
+        return replace_table(*args, **kwargs)
+
+    monkeypatch.setattr(store, 'replace_table', recording_replace_table)
+    model = EpdModel({'task_scheduler': scheduler, 'data_store': store})
+    loaded = []
+    model.data_loaded.connect(loaded.append)
+
+    model.load_async()
+    _wait_for(lambda: loaded)
+
+    assert len(writers) == 1
+    assert writers[0] != threading.get_ident()
+    # Written before the load is reported
+    assert store.count(EpdModel.STORE_TABLE) == len(loaded[0])
+    assert model.get_record_by_epd('EPD-002')['Cable'] == 'Cable 200'
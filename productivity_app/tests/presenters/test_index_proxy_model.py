@@ -0,0 +1,80 @@
+"""
+Tests for the index-array sorting proxy
+"""
+import pytest
+from PySide6.QtCore import Qt
+from productivity_app.productivity_core.presenters.index_proxy_model import IndexProxyModel
+from productivity_app.productivity_core.presenters.pandas_table_model import PandasTableModel
+
+
+@pytest.fixture
+def source(connector_df):
+    return PandasTableModel(connector_df)
+
+
+@pytest.fixture
+def proxy(source):
+    proxy = IndexProxyModel()
+    proxy.setSourceModel(source)
+    return proxy
+
+
+def _column(proxy, name):
+    column = proxy.sourceModel()._column_names.index(name)
+    return [proxy.data(proxy.index(row, column)) for row in range(proxy.rowCount())]
+
+
+def test_sort_is_stable_in_both_directions(proxy, connector_df):
+    material = connector_df.columns.get_loc('Material')
+
+    proxy.sort(material, Qt.DescendingOrder)
+
+    expected = connector_df.sort_values(
+        'Material', ascending=False, kind='stable')['Part Number'].tolist()
+    assert _column(proxy, 'Part Number') == expected
+
+
+def test_map_to_source_follows_sort(proxy, source, connector_df):
+    proxy.sort(connector_df.columns.get_loc('Shell Size'))
+
+    source_row = proxy.mapToSource(proxy.index(0, 0)).row()
+
+    assert source.get_record(source_row)['Shell Size'] == '10'
+    assert proxy.mapFromSource(source.index(source_row, 0)).row() == 0
+
+
+def _assert_maps_match(proxy, source):
+    """mapFromSource inverts mapToSource for every row"""
+    for row in range(proxy.rowCount()):
+        source_index = proxy.mapToSource(proxy.index(row, 1))
+        assert proxy.mapFromSource(source_index).row() == row
+    assert proxy.rowCount() == source.rowCount()
+
+
+def test_map_from_source_follows_row_changes(proxy, source, connector_df):
+    proxy.sort(connector_df.columns.get_loc('Part Number'), Qt.DescendingOrder)
+    _assert_maps_match(proxy, source)
+
+    source.update(connector_df[connector_df['Material'] == 'Aluminum'])
+    _assert_maps_match(proxy, source)
+
+    source.update(connector_df)
+    _assert_maps_match(proxy, source)
+
+    source.update(connector_df.iloc[::-1])
+    _assert_maps_match(proxy, source)
+    assert not proxy.mapFromSource(source.index(len(connector_df), 0)).isValid()
+
+
+def test_source_row_changes_keep_sort_order(proxy, source, connector_df):
+    proxy.sort(connector_df.columns.get_loc('Part Number'))
+    removed = []
+    proxy.rowsRemoved.connect(lambda _, first, last: removed.append((first, last)))
+
+    source.update(connector_df[connector_df['Material'] == 'Aluminum'])
+    assert removed
+    assert _column(proxy, 'Part Number') == sorted(
+        connector_df.loc[connector_df['Material'] == 'Aluminum', 'Part Number'])
+
+    source.update(connector_df)
+    assert _column(proxy, 'Part Number') == sorted(connector_df['Part Number'])
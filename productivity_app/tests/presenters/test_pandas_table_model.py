@@ -0,0 +1,133 @@
+"""
+Tests for PandasTableModel incremental updates, sorting and cell text
+"""
+import pandas as pd
+import pytest
+from PySide6.QtCore import QPersistentModelIndex, Qt
+from productivity_app.productivity_core.presenters.pandas_table_model import PandasTableModel
+
+
+@pytest.fixture
+def model(connector_df):
+    model = PandasTableModel(connector_df)
+    events = []
+    model.rowsRemoved.connect(lambda _, first, last: events.append(('removed', first, last)))
+    model.rowsInserted.connect(lambda _, first, last: events.append(('inserted', first, last)))
+    model.modelReset.connect(lambda: events.append(('reset',)))
+    model.events = events
+    return model
+
+
+def _column(model, name):
+    column = model._column_names.index(name)
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+def test_narrowing_filter_removes_row_ranges(model, connector_df):
+    model.update(connector_df[connector_df['Material'] == 'Aluminum'])
+
+    assert model.events == [('removed', 7, 7), ('removed', 3, 4), ('removed', 1, 1)]
+    assert _column(model, 'Material') == ['Aluminum'] * 4
+
+
+def test_widening_filter_inserts_row_ranges(model, connector_df):
+    model.update(connector_df.iloc[[0, 5]])
+    model.events.clear()
+
+    model.update(connector_df)
+
+    assert model.events == [('inserted', 1, 4), ('inserted', 6, 7)]
+    assert _column(model, 'Part Number') == connector_df['Part Number'].tolist()
+
+
+def test_reordered_or_reshaped_frames_reset(model, connector_df):
+    model.update(connector_df.iloc[::-1])
+    model.update(connector_df[['Part Number', 'Material']])
+
+    assert model.events == [('reset',), ('reset',)]
+    assert model.columnCount() == 2
+
+
+def test_incremental_can_be_disabled(model, connector_df):
+    model.update(connector_df.iloc[:3], incremental=False)
+
+    assert model.events == [('reset',)]
+    assert model.rowCount() == 3
+
+
+def test_rows_match_row_count_during_range_signals(model, connector_df):
+    """Views reading the model in rowsRemoved/rowsInserted see each range applied"""
+    seen = []
+    model.rowsRemoved.connect(lambda *_: seen.append(_column(model, 'Part Number')))
+    model.rowsInserted.connect(lambda *_: seen.append(_column(model, 'Part Number')))
+    parts = connector_df['Part Number'].tolist()
+
+    model.update(connector_df.iloc[[0, 5]])
+    model.update(connector_df)
+
+    assert seen == [parts[:6], [parts[0], parts[5]], parts[:6], parts]
+
+
+@pytest.fixture
+def mixed_df():
+    return pd.DataFrame({
+        'Part': ['c', 'a', 'd', 'b', 'e'],
+        'Size': [2.5, None, 1.0, 2.5, float('nan')],
+        'Mixed': [3, 'x', None, 1, 'a'],
+        'Count': pd.array([2, None, 1, 2, 3], dtype='Int64'),
+        'Updated': pd.to_datetime(['2024-03-01 00:00', None, '2023-01-02 10:30', '2024-03-01 00:00',
+                                   '2022-12-31 00:00']),
+    })
+
+
+def _sorted(model, column, order):
+    model.sort(model._column_names.index(column), order)
+    return _column(model, 'Part')
+
+
+@pytest.mark.parametrize('column, ascending, expected', [
+    ('Part', ['a', 'b', 'c', 'd', 'e'], ['e', 'd', 'c', 'b', 'a']),
+    # Missing values last in both directions; ties keep their order
+    ('Size', ['d', 'c', 'b', 'a', 'e'], ['c', 'b', 'd', 'a', 'e']),
+    ('Count', ['d', 'c', 'b', 'e', 'a'], ['e', 'c', 'b', 'd', 'a']),
+    ('Updated', ['e', 'd', 'c', 'b', 'a'], ['c', 'b', 'd', 'e', 'a']),
+    # Numbers and text together sort by their text
+    ('Mixed', ['b', 'c', 'e', 'a', 'd'], ['a', 'e', 'c', 'b', 'd']),
+])
+def test_sort(mixed_df, column, ascending, expected):
+    model = PandasTableModel(mixed_df)
+    assert _sorted(model, column, Qt.AscendingOrder) == ascending
+    assert _sorted(model, column, Qt.DescendingOrder) == expected
+
+
+def test_sort_keeps_selection_on_its_record(mixed_df):
+    model = PandasTableModel(mixed_df)
+    selected = QPersistentModelIndex(model.index(1, 0))  # 'a'
+
+    model.sort(0, Qt.DescendingOrder)
+
+    assert selected.row() == 4
+    assert model.data(model.index(selected.row(), 0)) == 'a'
+
+
+def test_data_matches_cell_text(mixed_df):
+    """Cells show str() of the value the frame holds"""
+    model = PandasTableModel(mixed_df)
+    for row in range(len(mixed_df)):
+        for column in range(len(mixed_df.columns)):
+            assert model.data(model.index(row, column)) == str(mixed_df.iat[row, column])
+
+    assert _column(model, 'Size') == ['2.5', 'nan', '1.0', '2.5', 'nan']
+    assert _column(model, 'Mixed')[2] == 'None'
+    assert _column(model, 'Count')[1] == '<NA>'
+    assert _column(model, 'Updated')[:3] == [
+        '2024-03-01 00:00:00', 'NaT', '2023-01-02 10:30:00']
+
+
+def test_data_after_sort_matches_sorted_frame(mixed_df):
+    model = PandasTableModel(mixed_df)
+    model.sort(model._column_names.index('Updated'), Qt.DescendingOrder)
+
+    expected = mixed_df.sort_values('Updated', ascending=False, kind='stable')
+    assert _column(model, 'Updated') == [str(value) for value in expected['Updated']]
+    assert _column(model, 'Size') == [str(value) for value in expected['Size']]
@@ -0,0 +1,26 @@
+"""
+Tests for lazy presenter references in TAB_CONFIG
+"""
+import subprocess
+import sys
+
+from productivity_app.productivity_core.tabs.tab_config import TAB_CONFIG, resolve_class
+
+
+def test_presenter_references_resolve_to_classes():
+    for config in TAB_CONFIG:
+        ref = config['presenter_class']
+        assert isinstance(ref, str)
+        assert resolve_class(ref).__name__ == ref.rsplit('.', 1)[1]
+
+
+def test_main_window_import_does_not_load_tab_modules():
+    # Fresh interpreter: this process has already imported everything
+    script = (
+        "import sys\n"
+        "import productivity_app.productivity_core.tabs.main_window\n"
+        "print(','.join(sys.modules))\n")
+    loaded = subprocess.run([sys.executable, '-c', script], capture_output=True,
+                            text=True, check=True).stdout.strip().split(',')
+    assert 'pandas' not in loaded
+    assert not [m for m in loaded if m.endswith(('_presenter', '_tab', '_view'))]
@@ -0,0 +1,103 @@
+"""
+Tests for dependency-aware, prioritised tab loading
+"""
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+from productivity_app.productivity_core.tabs.tab_loader import TabLoader
+
+
+class FakePresenter:
+    def __init__(self, log, tab_id, *deps):
+        log.append(('build', tab_id))
+        self.view = object()
+        self.title = tab_id.title()
+        self.deps = deps
+
+
+def _tab(log, tab_id, dependencies=(), visible=True, focus=False):
+    return {
+        'id': tab_id,
+        'presenter_class': FakePresenter,
+        'init_args': lambda services, deps: [log, tab_id, *deps.values()],
+        'preload': lambda services: log.append(('preload', tab_id)),
+        'delay_ms': 0,
+        'dependencies': list(dependencies),
+        'visible': visible,
+        'default_focus': focus,
+    }
+
+
+@pytest.fixture(scope='module')
+def qt_app(qapp):
+    return qapp
+
+
+def _run(loader):
+    """Start loading and process events until startup tabs are built"""
+    complete = []
+    loader.loading_complete.connect(lambda: complete.append(True))
+    loader.start_loading()
+    deadline = time.monotonic() + 5
+    while not complete:
+        assert time.monotonic() < deadline, "timed out"
+        QCoreApplication.processEvents()
+
+
+def test_focused_first_dependencies_first_hidden_deferred(qt_app):
+    log = []
+    config = [
+        _tab(log, 'reports', dependencies=['data']),
+        _tab(log, 'data', visible=False),
+        _tab(log, 'archive', visible=False),
+        _tab(log, 'home', focus=True),
+    ]
+    loader = TabLoader(None, None, config)
+    _run(loader)
+
+    preloads = [tab for step, tab in log if step == 'preload']
+    builds = [tab for step, tab in log if step == 'build']
+    # All startup data loads start before any widget is built
+    assert log[:len(preloads)] == [('preload', tab) for tab in preloads]
+    assert preloads == ['home', 'reports', 'data']
+    assert builds == ['home', 'data', 'reports']
+    assert 'archive' not in loader.get_tab_registry()
+    assert loader.get_presenter('reports').deps == (loader.get_presenter('data'),)
+
+    reasons = {t.tab_id: t.reason for t in loader.get_load_timings()}
+    assert reasons == {'home': 'focused', 'data': 'dependency', 'reports': 'visible'}
+
+
+def test_hidden_tab_loads_on_first_show(qt_app):
+    log = []
+    config = [
+        _tab(log, 'home', focus=True),
+        _tab(log, 'base', visible=False),
+        _tab(log, 'extra', dependencies=['base'], visible=False),
+    ]
+    loader = TabLoader(None, None, config)
+    _run(loader)
+    assert list(loader.get_tab_registry()) == ['home']
+
+    assert loader.load_tab('extra')
+
+    assert log[-4:] == [('preload', 'base'), ('build', 'base'),
+                        ('preload', 'extra'), ('build', 'extra')]
+    assert loader.get_load_timings()[-1].reason == 'on_demand'
+
+
+def test_dependency_cycle_is_reported(qt_app):
+    log = []
+    config = [
+        _tab(log, 'home', focus=True),
+        _tab(log, 'a', dependencies=['b']),
+        _tab(log, 'b', dependencies=['a']),
+    ]
+    loader = TabLoader(None, None, config)
+    errors = []
+    loader.loading_error.connect(lambda tab_id, error: errors.append(tab_id))
+    _run(loader)
+
+    assert sorted(errors) == ['a', 'b']
+    assert list(loader.get_tab_registry()) == ['home']